@@ -12,6 +12,8 @@ from matilda_voice.hooks import (
     PROVIDERS_REGISTRY,
     get_engine,
     handle_provider_shortcuts,
+    # Batch
+    on_batch,
     on_config,
     # Document
     on_document,
@@ -61,6 +63,8 @@ __all__ = [
     "on_config",
     # Document
     "on_document",
+    # Batch
+    "on_batch",
     # Config
     "load_config",
     "save_config",
@@ -1,8 +1,10 @@
 """Abstract base class for TTS providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
+from .internal.iter_bridge import iterate_in_thread
 from .internal.types import ProviderInfo
 
 
@@ -12,8 +14,56 @@ class TTSProvider(ABC):
     This class defines the interface that all TTS providers must implement
     to be compatible with the TTS CLI system. Providers handle the actual
     text-to-speech synthesis using their respective APIs or engines.
+
+    Attributes:
+        MAX_TEXT_CHARS: Longest text (in characters) one request may carry, or
+            None if the provider has no hard limit
+        MAX_TEXT_BYTES: Longest text (in UTF-8 bytes) one request may carry, or
+            None if the provider has no hard limit
+        CONCURRENT_SYNTHESIS: Whether several instances may synthesize at once.
+            Local model providers set this to False so long text is not split
+            across multiple model copies.
+        CONCURRENT_ASYNC_SYNTHESIS: Whether one instance may run many
+            synthesize_async() calls at once on an event loop. Providers with
+            a native async implementation set this to True so concurrent
+            requests share a pooled instance instead of queueing for one.
+        STREAM_FORMAT: Encoding of the chunks iter_audio() yields (e.g. "mp3"),
+            or None if the provider cannot stream audio as it is generated
+        NATIVE_FORMATS: Output formats the provider's API encodes itself,
+            mapped to the API's name for each (e.g. {"mp3": "MP3"}). These are
+            written, and streamed when passed as output_format to iter_audio(),
+            without ffmpeg. The first entry is what the API returns for any
+            other format, which is then converted.
+        CIRCUIT_BREAKER: Name of the http_retry circuit breaker guarding the
+            provider's API, or None for providers without one. The engine
+            skips providers whose breaker is open when failing over.
     """
 
+    MAX_TEXT_CHARS: Optional[int] = None
+    MAX_TEXT_BYTES: Optional[int] = None
+    CONCURRENT_SYNTHESIS: bool = True
+    CONCURRENT_ASYNC_SYNTHESIS: bool = False
+    STREAM_FORMAT: Optional[str] = None
+    NATIVE_FORMATS: Dict[str, str] = {}
+    CIRCUIT_BREAKER: Optional[str] = None
+
+    @classmethod
+    def native_encoding(cls, output_format: Optional[str]) -> Tuple[str, str]:
+        """Pick the encoding to request from the API for an output format.
+
+        Args:
+            output_format: Requested output format, or None for the default
+
+        Returns:
+            Tuple of (format the API will return, API name for it). The format
+            differs from output_format when it has to be converted afterwards.
+        """
+        if output_format and output_format.lower() in cls.NATIVE_FORMATS:
+            audio_format = output_format.lower()
+        else:
+            audio_format = next(iter(cls.NATIVE_FORMATS))
+        return audio_format, cls.NATIVE_FORMATS[audio_format]
+
     @abstractmethod
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
         """Synthesize speech from text and save to output path.
@@ -42,6 +92,55 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def synthesize_async(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech without blocking the event loop.
+
+        Takes the same arguments and raises the same errors as synthesize().
+        The default implementation runs synthesize() in a worker thread so any
+        provider can be awaited. Network providers override it to await their
+        API directly, so a pending request does not hold a thread.
+
+        Args:
+            text: The text to synthesize into speech
+            output_path: Path where the audio file should be saved
+            **kwargs: Provider-specific options, as for synthesize()
+        """
+        await asyncio.to_thread(self.synthesize, text, output_path, **kwargs)
+
+    def iter_audio(self, text: str, **kwargs: Any) -> Iterator[bytes]:
+        """Yield encoded audio chunks as the provider produces them.
+
+        Only called on providers that set STREAM_FORMAT; chunks are encoded in
+        that format. The engine falls back to synthesize() for the others.
+
+        Args:
+            text: The text to synthesize into speech
+            **kwargs: Provider-specific options, as for synthesize()
+
+        Yields:
+            Audio bytes in STREAM_FORMAT, in playback order
+
+        Raises:
+            NotImplementedError: If the provider does not stream
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not stream audio chunks")
+
+    async def iter_audio_async(self, text: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Async counterpart of iter_audio().
+
+        The default implementation pulls iter_audio() from a worker thread.
+        Providers with an async client override it to stream on the event loop.
+
+        Args:
+            text: The text to synthesize into speech
+            **kwargs: Provider-specific options, as for synthesize()
+
+        Yields:
+            Audio bytes in STREAM_FORMAT, in playback order
+        """
+        async for chunk in iterate_in_thread(self.iter_audio(text, **kwargs)):
+            yield chunk
+
     def get_info(self) -> Optional[ProviderInfo]:
         """Get provider information including available voices and capabilities.
 
@@ -59,3 +158,22 @@ class TTSProvider(ABC):
             Returns None if provider info is not available.
         """
         return None
+
+    def warm(self) -> None:  # noqa: B027 - optional lifecycle hook, not every provider needs it
+        """Prepare the provider for low-latency use.
+
+        Called by the engine's provider pool before an instance is first needed.
+        Providers with expensive lazy initialization (SDK clients, local models)
+        should perform it here. The default implementation does nothing.
+
+        Raises:
+            TTSError: If warming fails; the pool logs it and keeps the instance
+        """
+
+    def close(self) -> None:  # noqa: B027 - optional lifecycle hook, not every provider needs it
+        """Release resources held by the provider.
+
+        Called when the provider pool evicts an instance or shuts down. Providers
+        owning thread pools, network clients or loaded models should free them
+        here. The default implementation does nothing.
+        """
@@ -235,8 +235,9 @@ def cli(ctx, verbose, debug, config):
 @click.option("--rate", default=None, help="⚡ Speech rate adjustment (e.g., +20%, -50%, 150%)")
 @click.option("--pitch", default=None, help="🎵 Pitch adjustment (e.g., +5Hz, -10Hz)")
 @click.option("--debug", is_flag=True, default=None, help="🐞 Display debug information during processing")
+@click.option("--timings", is_flag=True, default=None, help="⏱️ Show where synthesis time was spent")
 @click.pass_obj
-def speak(ctx, text, options, voice, rate, pitch, debug):
+def speak(ctx, text, options, voice, rate, pitch, debug, timings):
     """Speak text aloud"""
     try:
         if hooks and hasattr(hooks, "on_speak"):
@@ -247,6 +248,7 @@ def speak(ctx, text, options, voice, rate, pitch, debug):
                 "rate": rate,
                 "pitch": pitch,
                 "debug": debug,
+                "timings": timings,
             }
             hooks.on_speak(ctx=ctx, **kwargs)
         else:
@@ -266,8 +268,9 @@ def speak(ctx, text, options, voice, rate, pitch, debug):
 @click.option("--debug", is_flag=True, default=None, help="🐞 Display debug information during processing")
 @click.option("--rate", default=None, help="⚡ Speech rate adjustment (e.g., +20%, -50%, 150%)")
 @click.option("--pitch", default=None, help="🎵 Pitch adjustment (e.g., +5Hz, -10Hz)")
+@click.option("--timings", is_flag=True, default=None, help="⏱️ Show where synthesis time was spent")
 @click.pass_obj
-def save(ctx, text, options, output, format, voice, json, debug, rate, pitch):
+def save(ctx, text, options, output, format, voice, json, debug, rate, pitch, timings):
     """Save text as an audio file"""
     try:
         if hooks and hasattr(hooks, "on_save"):
@@ -281,6 +284,7 @@ def save(ctx, text, options, output, format, voice, json, debug, rate, pitch):
                 "debug": debug,
                 "rate": rate,
                 "pitch": pitch,
+                "timings": timings,
             }
             hooks.on_save(ctx=ctx, **kwargs)
         else:
@@ -419,6 +423,36 @@ def document(
         handle_error(e, ctx.verbose)
 
 
+@cli.command("batch")
+@click.argument("manifest", type=click.STRING)
+@click.option("--output-dir", "-d", default=None, help="📁 Directory for relative output paths")
+@click.option("--format", "-f", default=None, help="🔧 Default audio format for items without one")
+@click.option("--voice", "-v", default=None, help="🎤 Default voice for items without one")
+@click.option("--workers", "-w", type=click.INT, default=None, help="⚙️ Items synthesized concurrently")
+@click.option("--json", is_flag=True, default=None, help="🔧 Output results as JSON")
+@click.option("--debug", is_flag=True, default=None, help="🐞 Display debug information during processing")
+@click.pass_obj
+def batch(ctx, manifest, output_dir, format, voice, workers, json, debug):
+    """Render many prompts from a JSONL manifest"""
+    try:
+        if hooks and hasattr(hooks, "on_batch"):
+            kwargs = {
+                "manifest": manifest,
+                "output_dir": output_dir,
+                "format": format,
+                "voice": voice,
+                "workers": workers,
+                "json": json,
+                "debug": debug,
+            }
+            hooks.on_batch(ctx=ctx, **kwargs)
+        else:
+            logger.error("Hook 'on_batch' not implemented in cli_hooks.py")
+            sys.exit(1)
+    except Exception as e:
+        handle_error(e, ctx.verbose)
+
+
 @cli.group("voice")
 @click.pass_obj
 def voice_group(ctx):
@@ -1,14 +1,77 @@
 """Core TTS engine functionality separated from CLI concerns."""
 
+import asyncio
+import contextvars
+import hashlib
+import json
 import logging
 import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, Optional, Tuple, Type
 
 from .base import TTSProvider
-from .exceptions import ProviderLoadError, ProviderNotFoundError, TTSError
-from .internal.config import get_api_key, load_config, parse_voice_setting
-from .internal.types import ProviderInfo
+from .exceptions import (
+    AuthenticationError,
+    DependencyError,
+    NetworkError,
+    ProviderError,
+    ProviderLoadError,
+    ProviderNotFoundError,
+    QuotaError,
+    RateLimitError,
+    ServerError,
+    TTSError,
+)
+from .exceptions import TimeoutError as TTSTimeoutError
+from .internal.audio_cache import AudioCache
+from .internal.audio_utils import (
+    CONCAT_FORMATS,
+    PIPE_FORMATS,
+    StreamingPlayer,
+    get_mime_type,
+    iter_file_chunks,
+    iter_transcoded,
+    iter_transcoded_async,
+    iter_wav_stream,
+    join_wav_chunks,
+    stream_audio_file,
+)
+from .internal.config import (
+    get_api_key,
+    get_config_snapshot,
+    get_config_value,
+    load_config,
+    parse_failover_chain,
+    parse_voice_setting,
+)
+from .internal.http_clients import aclose_http_clients, close_http_clients
+from .internal.http_retry import get_circuit_breaker
+from .internal.iter_bridge import iterate_async_in_thread, iterate_in_thread
+from .internal.latency import LatencyTracker
+from .internal.provider_pool import ProviderPool
+from .internal.rate_limiter import RateLimiter
+from .internal.single_flight import SingleFlight
+from .internal.text_chunker import split_text
+from .internal.timings import SynthesisTimings, collect_timings, set_timing_fields, timing_span
+from .internal.types import AudioChunk, BatchItem, BatchResult, ProviderInfo
+from .internal.voice_catalog import VoiceCatalog
+
+# Errors meaning a provider cannot serve right now, as opposed to a bad request
+_FAILOVER_ERRORS = (
+    AuthenticationError,
+    DependencyError,
+    NetworkError,
+    ProviderError,
+    QuotaError,
+    RateLimitError,
+    ServerError,
+    TTSTimeoutError,
+)
 
 
 class TTSEngine:
@@ -23,6 +86,13 @@ class TTSEngine:
         self.providers_registry = providers_registry
         self.logger = logging.getLogger(__name__)
         self._loaded_providers: Dict[str, Type[TTSProvider]] = {}
+        self._provider_pool = ProviderPool()
+        self._audio_cache = AudioCache()
+        self._latency = LatencyTracker(get_config_value("hedging_latency_window"))
+        self._rate_limiter = RateLimiter()
+        # Identical concurrent requests share one synthesis; the shared temp file goes with the last caller
+        self._flights = SingleFlight(cleanup=lambda path: Path(path).unlink(missing_ok=True))
+        self._voice_catalog = VoiceCatalog(providers_registry.keys(), self.get_provider_info)
 
     def load_provider(self, name: str) -> Type[TTSProvider]:
         """Load a TTS provider by name using the existing loader.
@@ -72,37 +142,403 @@ class TTSEngine:
         except (AttributeError, TypeError, ValueError) as e:
             raise ProviderLoadError(f"Failed to load provider {name}: {e}") from e
 
-    def get_available_providers(self) -> list[str]:
-        """Get list of available provider names."""
-        return list(self.providers_registry.keys())
+    def _config_fingerprint(self, provider_name: str) -> str:
+        """Fingerprint the configuration a provider instance was built against.
 
-    def synthesize_text(
+        Pooled instances are only reused while the API key and tunables they
+        captured are unchanged.
+
+        Args:
+            provider_name: Provider registry name
+
+        Returns:
+            Short hex digest of the provider-relevant configuration
+        """
+        api_key = None
+        if self._provider_needs_api_key(provider_name):
+            api_key = get_api_key(self._get_api_key_provider_name(provider_name))
+        payload = json.dumps({"api_key": api_key, "config": get_config_snapshot().fingerprint})
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def lease_provider(self, provider_name: str) -> Any:
+        """Lease a pooled provider instance.
+
+        Args:
+            provider_name: Provider registry name
+
+        Returns:
+            Context manager yielding a provider instance that is returned to the
+            pool on exit
+
+        Raises:
+            ProviderNotFoundError: If provider not found in registry
+            ProviderLoadError: If provider module cannot be loaded
+        """
+        provider_class = self.load_provider(provider_name)
+        return self._provider_pool.lease(provider_name, provider_class, self._config_fingerprint(provider_name))
+
+    def lease_provider_async(self, provider_name: str) -> Any:
+        """Lease a pooled provider instance from a coroutine.
+
+        Providers that declare CONCURRENT_ASYNC_SYNTHESIS share one instance
+        between concurrent leases; others are leased exclusively as with
+        lease_provider().
+
+        Args:
+            provider_name: Provider registry name
+
+        Returns:
+            Async context manager yielding a provider instance
+
+        Raises:
+            ProviderNotFoundError: If provider not found in registry
+            ProviderLoadError: If provider module cannot be loaded
+        """
+        provider_class = self.load_provider(provider_name)
+        return self._provider_pool.lease_async(
+            provider_name,
+            provider_class,
+            self._config_fingerprint(provider_name),
+            shared=provider_class.CONCURRENT_ASYNC_SYNTHESIS,
+        )
+
+    def warm_provider(self, provider_name: str, count: int = 1) -> int:
+        """Pre-create and warm pooled instances of a provider.
+
+        Args:
+            provider_name: Provider registry name
+            count: Number of instances to warm
+
+        Returns:
+            Number of instances warmed
+        """
+        provider_class = self.load_provider(provider_name)
+        return self._provider_pool.warm(
+            provider_name, provider_class, self._config_fingerprint(provider_name), count=count
+        )
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get provider pool statistics."""
+        return self._provider_pool.get_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get audio cache statistics."""
+        return self._audio_cache.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-provider rate limiter statistics."""
+        return self._rate_limiter.get_stats()
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get counts of synthesis calls run and identical requests that joined them."""
+        return self._flights.get_stats()
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get recent time-to-first-chunk percentiles per provider."""
+        return self._latency.get_stats()
+
+    def get_voice_catalog(self) -> VoiceCatalog:
+        """Get the persistent voice catalog shared by voice listing and validation."""
+        return self._voice_catalog
+
+    def close(self) -> None:
+        """Close all pooled provider instances and shared HTTP clients."""
+        self._provider_pool.close()
+        close_http_clients()
+
+    def split_for_provider(self, provider_name: str, text: str) -> List[str]:
+        """Split text into pieces a provider can synthesize in one request each.
+
+        Providers with a hard request limit are always split below it. Providers
+        that allow concurrent synthesis are also split at long_text_chunk_chars so
+        long text can be synthesized in parallel.
+
+        Args:
+            provider_name: Provider registry name
+            text: Text to split
+
+        Returns:
+            Chunks in reading order; a single element when no split is needed
+        """
+        provider_class = self.load_provider(provider_name)
+        max_chars = provider_class.MAX_TEXT_CHARS
+        max_bytes = provider_class.MAX_TEXT_BYTES
+        if provider_class.CONCURRENT_SYNTHESIS:
+            target = get_config_value("long_text_chunk_chars")
+            if target:
+                max_chars = min(max_chars, target) if max_chars else target
+
+        if max_chars is None and max_bytes is None:
+            return [text]
+        return split_text(text, max_chars=max_chars, max_bytes=max_bytes) or [text]
+
+    def _synthesize_chunked(
+        self, provider_name: str, chunks: List[str], output_path: Optional[str], synthesis_kwargs: Dict[str, Any]
+    ) -> None:
+        """Synthesize chunks concurrently and reassemble them in order.
+
+        Each chunk is rendered to PCM WAV on its own pooled provider instance.
+        Saved output is joined sample-accurately (then converted if another format
+        was requested); streamed output is played through a single ffplay process
+        as soon as the first chunk is ready.
+
+        Args:
+            provider_name: Provider registry name
+            chunks: Text chunks in reading order
+            output_path: Destination file, or None when streaming
+            synthesis_kwargs: Provider options for the whole request
+        """
+        stream = synthesis_kwargs.get("stream", False)
+        output_format = (synthesis_kwargs.get("output_format") or "wav").lower()
+        chunk_kwargs = {**synthesis_kwargs, "stream": False, "output_format": "wav"}
+
+        workers = 1
+        if self.load_provider(provider_name).CONCURRENT_SYNTHESIS:
+            workers = max(1, min(len(chunks), get_config_value("long_text_max_concurrency", 4)))
+
+        chunk_dir = tempfile.mkdtemp(prefix="voice_chunks_")
+        chunk_paths = [os.path.join(chunk_dir, f"chunk_{index:04d}.wav") for index in range(len(chunks))]
+
+        def synthesize_chunk(index: int) -> str:
+            self._rate_limiter.acquire(provider_name, len(chunks[index]))
+            with self.lease_provider(provider_name) as provider, timing_span("synthesize"):
+                provider.synthesize(chunks[index], chunk_paths[index], **chunk_kwargs)
+            return chunk_paths[index]
+
+        self.logger.info(f"Synthesizing {len(chunks)} chunks with {provider_name} provider ({workers} concurrent)")
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="voice_chunk")
+        futures: List[Future] = []
+        try:
+            # Each worker runs in a copy of this context so its spans reach the request's timing record
+            futures = [
+                executor.submit(contextvars.copy_context().run, synthesize_chunk, index) for index in range(len(chunks))
+            ]
+
+            if stream:
+                player = StreamingPlayer(provider_name, format_args=["-f", "wav"])
+                player.play_chunks(iter_wav_stream(future.result() for future in futures))
+                return
+
+            ready = [future.result() for future in futures]
+            self._join_chunks(ready, chunk_dir, str(output_path), output_format)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    def _join_chunks(self, chunk_paths: List[str], chunk_dir: str, output_path: str, output_format: str) -> None:
+        """Join chunk WAVs into the output file, converting if another format was requested."""
+        join_wav_chunks(chunk_paths, chunk_dir, output_path, output_format)
+
+    def _run_synthesis(
         self,
+        provider_name: str,
+        provider_lease: Any,
         text: str,
-        output_path: Optional[str] = None,
-        provider_name: Optional[str] = None,
-        voice: Optional[str] = None,
-        stream: bool = True,
-        output_format: str = "wav",
-        **kwargs: Any,
-    ) -> Optional[str]:
-        """Synthesize text to speech.
+        chunks: List[str],
+        output_path: Optional[str],
+        synthesis_kwargs: Dict[str, Any],
+    ) -> None:
+        """Synthesize in one request, or chunked when the text was split."""
+        if len(chunks) > 1:
+            self._synthesize_chunked(provider_name, chunks, output_path, synthesis_kwargs)
+        else:
+            self._rate_limiter.acquire(provider_name, len(text))
+            with provider_lease as provider, timing_span("synthesize"):
+                provider.synthesize(text, output_path, **synthesis_kwargs)
+
+    async def _synthesize_chunked_async(
+        self, provider_name: str, chunks: List[str], output_path: Optional[str], synthesis_kwargs: Dict[str, Any]
+    ) -> None:
+        """Async counterpart of _synthesize_chunked.
+
+        Chunks are awaited concurrently on the event loop; joining and any
+        format conversion run in a worker thread. Streamed output needs one
+        ffplay process fed in order, so it uses the threaded implementation.
+        """
+        if synthesis_kwargs.get("stream", False):
+            await asyncio.to_thread(self._synthesize_chunked, provider_name, chunks, output_path, synthesis_kwargs)
+            return
+
+        output_format = (synthesis_kwargs.get("output_format") or "wav").lower()
+        chunk_kwargs = {**synthesis_kwargs, "stream": False, "output_format": "wav"}
+
+        workers = 1
+        if self.load_provider(provider_name).CONCURRENT_SYNTHESIS:
+            workers = max(1, min(len(chunks), get_config_value("long_text_max_concurrency", 4)))
+        semaphore = asyncio.Semaphore(workers)
+
+        chunk_dir = tempfile.mkdtemp(prefix="voice_chunks_")
+        chunk_paths = [os.path.join(chunk_dir, f"chunk_{index:04d}.wav") for index in range(len(chunks))]
+
+        async def synthesize_chunk(index: int) -> None:
+            async with semaphore:
+                await self._rate_limiter.acquire_async(provider_name, len(chunks[index]))
+                async with self.lease_provider_async(provider_name) as provider:
+                    with timing_span("synthesize"):
+                        await provider.synthesize_async(chunks[index], chunk_paths[index], **chunk_kwargs)
+
+        self.logger.info(f"Synthesizing {len(chunks)} chunks with {provider_name} provider ({workers} concurrent)")
+        tasks = [asyncio.create_task(synthesize_chunk(index)) for index in range(len(chunks))]
+        try:
+            await asyncio.gather(*tasks)
+            await asyncio.to_thread(self._join_chunks, chunk_paths, chunk_dir, str(output_path), output_format)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled chunks hand back their leases before the files go away
+            await asyncio.gather(*tasks, return_exceptions=True)
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    async def _run_synthesis_async(
+        self,
+        provider_name: str,
+        provider_lease: Any,
+        text: str,
+        chunks: List[str],
+        output_path: Optional[str],
+        synthesis_kwargs: Dict[str, Any],
+    ) -> None:
+        """Async counterpart of _run_synthesis."""
+        if len(chunks) > 1:
+            await self._synthesize_chunked_async(provider_name, chunks, output_path, synthesis_kwargs)
+        else:
+            await self._rate_limiter.acquire_async(provider_name, len(text))
+            async with provider_lease as provider:
+                with timing_span("synthesize"):
+                    await provider.synthesize_async(text, output_path, **synthesis_kwargs)
+
+    def _synthesize_to_file(
+        self,
+        provider_name: str,
+        provider_lease: Any,
+        text: str,
+        chunks: List[str],
+        output_path: Optional[str],
+        synthesis_kwargs: Dict[str, Any],
+        cache_key: Optional[str],
+    ) -> str:
+        """Synthesize into output_path, verify it was written and store it in the cache."""
+        self._run_synthesis(provider_name, provider_lease, text, chunks, output_path, synthesis_kwargs)
+
+        # Verify output file was created
+        if not (output_path and Path(output_path).exists()):
+            raise TTSError("Synthesis completed but output file not found")
+        file_size = Path(output_path).stat().st_size
+        self.logger.info(f"Synthesis completed. File: {output_path} ({file_size} bytes)")
+        if cache_key:
+            with timing_span("cache_store"):
+                self._audio_cache.put(cache_key, output_path)
+        return output_path
+
+    async def _synthesize_to_file_async(
+        self,
+        provider_name: str,
+        provider_lease: Any,
+        text: str,
+        chunks: List[str],
+        output_path: Optional[str],
+        synthesis_kwargs: Dict[str, Any],
+        cache_key: Optional[str],
+    ) -> str:
+        """Async counterpart of _synthesize_to_file."""
+        await self._run_synthesis_async(provider_name, provider_lease, text, chunks, output_path, synthesis_kwargs)
+
+        if not (output_path and Path(output_path).exists()):
+            raise TTSError("Synthesis completed but output file not found")
+        file_size = Path(output_path).stat().st_size
+        self.logger.info(f"Synthesis completed. File: {output_path} ({file_size} bytes)")
+        if cache_key:
+            with timing_span("cache_store"):
+                await asyncio.to_thread(self._audio_cache.put, cache_key, output_path)
+        return output_path
+
+    def _shared_output_path(self, output_format: Optional[str]) -> str:
+        """Create the temporary file a coalesced synthesis writes for all its callers."""
+        suffix = f".{output_format or 'wav'}"
+        with tempfile.NamedTemporaryFile(suffix=suffix, prefix="voice_shared_", delete=False) as tmp:
+            return tmp.name
+
+    def _flight_key(
+        self, provider_name: str, text: str, voice: Optional[str], output_format: Optional[str], kwargs: Dict[str, Any]
+    ) -> str:
+        """Identify identical requests for coalescing; the same address the audio cache uses."""
+        return self._audio_cache.make_key(provider_name, text, voice=voice, output_format=output_format, **kwargs)
+
+    def get_failover_chain(self, provider_name: str, voice: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+        """List the providers a request tries, in order.
+
+        The requested provider comes first, followed by the failover_chain
+        entries for other providers. Entries naming unknown providers are
+        ignored.
 
         Args:
-            text: Text to synthesize
-            output_path: Path to save audio file (if None and stream=False, auto-generate)
-            provider_name: Specific provider to use (if None, auto-detect from voice)
-            voice: Voice to use (provider:voice format or just voice name)
-            stream: Whether to stream audio to speakers
-            output_format: Audio output format
-            **kwargs: Additional provider-specific options
+            provider_name: Resolved provider for the request
+            voice: Resolved voice for the request
 
         Returns:
-            Path to generated audio file if saved, None if streamed
+            List of (provider_name, voice) tuples
+        """
+        chain: List[Tuple[str, Optional[str]]] = [(provider_name, voice)]
+        for entry_provider, entry_voice in parse_failover_chain(get_config_value("failover_chain")):
+            if any(entry_provider == name for name, _ in chain):
+                continue
+            if entry_provider not in self.providers_registry:
+                self.logger.warning(f"Ignoring unknown provider '{entry_provider}' in failover_chain")
+                continue
+            chain.append((entry_provider, entry_voice))
+        return chain
+
+    def is_provider_tripped(self, provider_name: str) -> bool:
+        """Return True if the provider's circuit breaker is currently rejecting requests."""
+        try:
+            breaker_name = self.load_provider(provider_name).CIRCUIT_BREAKER
+        except (ProviderNotFoundError, ProviderLoadError):
+            return False
+        return breaker_name is not None and get_circuit_breaker(breaker_name).is_open()
+
+    def _failover_targets(self, provider_name: str, voice: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+        """Order the providers to try, skipping those with an open circuit breaker.
 
         Raises:
-            TTSError: If synthesis fails
-            ProviderNotFoundError: If specified provider not found
+            ProviderError: If every provider in the chain is tripped
+        """
+        chain = self.get_failover_chain(provider_name, voice)
+        if len(chain) == 1:
+            # No fallback configured: let the provider report its own breaker state
+            return chain
+
+        targets = []
+        for name, target_voice in chain:
+            if self.is_provider_tripped(name):
+                self.logger.info(f"Skipping {name}: circuit breaker is open")
+            else:
+                targets.append((name, target_voice))
+        if not targets:
+            names = ", ".join(name for name, _ in chain)
+            raise ProviderError(f"All providers in the failover chain are unavailable (circuit open): {names}")
+        return targets
+
+    def _log_failover(self, failed: str, next_provider: str, error: Exception) -> None:
+        self.logger.warning(f"{failed} failed ({error}); failing over to {next_provider}")
+
+    def get_available_providers(self) -> list[str]:
+        """Get list of available provider names."""
+        return list(self.providers_registry.keys())
+
+    def resolve_provider_and_voice(
+        self, provider_name: Optional[str] = None, voice: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Work out which provider and voice a request should use.
+
+        Args:
+            provider_name: Explicit provider (takes precedence over a voice prefix)
+            voice: Voice to use (provider:voice format or just voice name)
+
+        Returns:
+            Tuple of (provider_name, voice); voice is None when the provider's
+            own default should be used
         """
         # Load configuration
         config = load_config()
@@ -139,13 +575,81 @@ class TTSEngine:
             # Fallback to edge_tts if no provider detected
             provider_name = "edge_tts"
 
-        # Load and instantiate provider
+        return provider_name, voice
+
+    def synthesize_text(
+        self,
+        text: str,
+        output_path: Optional[str] = None,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        stream: bool = True,
+        output_format: str = "wav",
+        timings: Optional[SynthesisTimings] = None,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Synthesize text to speech.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save audio file (if None and stream=False, auto-generate)
+            provider_name: Specific provider to use (if None, auto-detect from voice)
+            voice: Voice to use (provider:voice format or just voice name)
+            stream: Whether to stream audio to speakers
+            output_format: Audio output format
+            timings: Record to fill with per-stage timings for this request
+            **kwargs: Additional provider-specific options
+
+        Returns:
+            Path to generated audio file if saved, None if streamed
+
+        Raises:
+            TTSError: If synthesis fails
+            ProviderNotFoundError: If specified provider not found
+        """
+        with collect_timings(timings):
+            with timing_span("config_load"):
+                provider_name, voice = self.resolve_provider_and_voice(provider_name, voice)
+            set_timing_fields(chars=len(text), stream=stream, output_format=output_format)
+
+            # Generate output path if needed
+            if not stream and not output_path:
+                suffix = f".{output_format}" if output_format else ".wav"
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                    output_path = tmp.name
+
+            targets = self._failover_targets(provider_name, voice)
+            for attempt, (target_name, target_voice) in enumerate(targets):
+                try:
+                    return self._synthesize_with_provider(
+                        text, output_path, target_name, target_voice, stream, output_format, **kwargs
+                    )
+                except _FAILOVER_ERRORS as e:
+                    if attempt == len(targets) - 1:
+                        raise
+                    self._log_failover(target_name, targets[attempt + 1][0], e)
+            return None
+
+    def _synthesize_with_provider(
+        self,
+        text: str,
+        output_path: Optional[str],
+        provider_name: str,
+        voice: Optional[str],
+        stream: bool,
+        output_format: str,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Synthesize with one resolved provider; see synthesize_text()."""
+        set_timing_fields(provider=provider_name, voice=voice, cache_hit=False)
+
+        # Lease a pooled provider instance
         try:
-            provider_class = self.load_provider(provider_name)
-            provider = provider_class()
+            with timing_span("provider_load"):
+                provider_lease = self.lease_provider(provider_name)
         except (ProviderNotFoundError, ProviderLoadError) as e:
             self.logger.error(f"Failed to load provider {provider_name}: {e}")
-            raise TTSError(f"Provider {provider_name} unavailable: {e}") from e
+            raise ProviderError(f"Provider {provider_name} unavailable: {e}") from e
 
         # Prepare synthesis parameters
         synthesis_kwargs = {"stream": stream, "output_format": output_format, **kwargs}
@@ -153,36 +657,803 @@ class TTSEngine:
         if voice is not None:
             synthesis_kwargs["voice"] = voice
 
-        # Generate output path if needed
-        if not stream and not output_path:
-            import tempfile
+        # Serve repeated requests straight from disk: no provider, ffmpeg or network
+        cache_key = None
+        if self._audio_cache.enabled:
+            cache_key = self._audio_cache.make_key(
+                provider_name, text, voice=voice, output_format=output_format, **kwargs
+            )
+            if stream:
+                with timing_span("cache_lookup"):
+                    cached_path = self._audio_cache.lookup(cache_key)
+                if cached_path is not None:
+                    self.logger.info(f"Streaming cached audio for {provider_name} provider")
+                    set_timing_fields(cache_hit=True)
+                    stream_audio_file(str(cached_path))
+                    return None
+            else:
+                with timing_span("cache_lookup"):
+                    hit = self._audio_cache.get(cache_key, output_path) if output_path else False
+                if hit:
+                    self.logger.info(f"Served {output_path} from audio cache")
+                    set_timing_fields(cache_hit=True)
+                    return output_path
 
-            suffix = f".{output_format}" if output_format else ".wav"
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                output_path = tmp.name
+        # Long text is split at sentence boundaries and synthesized in parallel
+        with timing_span("preprocess"):
+            chunks = self.split_for_provider(provider_name, text)
+        set_timing_fields(chunks=len(chunks))
 
         # Perform synthesis
         try:
-            if stream:
+            if stream and cache_key and get_config_value("audio_cache_fill_on_stream"):
+                # Synthesize to a file first so the result can be cached, then play it
+                self.logger.info(f"Synthesizing with {provider_name} provider to fill audio cache")
+                with tempfile.NamedTemporaryFile(suffix=f".{output_format or 'wav'}", delete=False) as tmp:
+                    fill_path = tmp.name
+                try:
+                    self._run_synthesis(
+                        provider_name,
+                        provider_lease,
+                        text,
+                        chunks,
+                        fill_path,
+                        {**synthesis_kwargs, "stream": False},
+                    )
+                    with timing_span("cache_store"):
+                        cached_path = self._audio_cache.put(cache_key, fill_path)
+                    stream_audio_file(str(cached_path or fill_path))
+                finally:
+                    Path(fill_path).unlink(missing_ok=True)
+                return None
+            elif stream:
                 self.logger.info(f"Streaming synthesis with {provider_name} provider")
-                provider.synthesize(text, None, **synthesis_kwargs)
+                self._run_synthesis(provider_name, provider_lease, text, chunks, None, synthesis_kwargs)
                 return None
             else:
                 self.logger.info(f"Synthesizing audio to {output_path} with {provider_name} provider")
-                provider.synthesize(text, output_path, **synthesis_kwargs)
+                if not (output_path and get_config_value("single_flight_enabled")):
+                    return self._synthesize_to_file(
+                        provider_name, provider_lease, text, chunks, output_path, synthesis_kwargs, cache_key
+                    )
+
+                led = False
+
+                def lead() -> str:
+                    nonlocal led
+                    led = True
+                    shared_path = self._shared_output_path(output_format)
+                    return self._synthesize_to_file(
+                        provider_name, provider_lease, text, chunks, shared_path, synthesis_kwargs, cache_key
+                    )
+
+                flight_key = cache_key or self._flight_key(provider_name, text, voice, output_format, kwargs)
+                with self._flights.join(flight_key, lead) as (shared_path, shared):
+                    if not led:
+                        self.logger.info(f"Joined in-flight synthesis for {output_path}")
+                        set_timing_fields(coalesced=True)
+                    if shared:
+                        shutil.copyfile(shared_path, output_path)
+                    else:
+                        shutil.move(shared_path, output_path)
+                return output_path
+
+        except (IOError, OSError, RuntimeError, ValueError) as e:
+            self.logger.error(f"Synthesis failed: {e}")
+            raise TTSError(f"Synthesis failed: {e}") from e
 
-                # Verify output file was created
-                if output_path and Path(output_path).exists():
-                    file_size = Path(output_path).stat().st_size
-                    self.logger.info(f"Synthesis completed. File: {output_path} ({file_size} bytes)")
+    async def synthesize_text_async(
+        self,
+        text: str,
+        output_path: Optional[str] = None,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        stream: bool = True,
+        output_format: str = "wav",
+        timings: Optional[SynthesisTimings] = None,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Synthesize text to speech without blocking the event loop.
+
+        Async counterpart of synthesize_text() with the same caching and long
+        text chunking. Providers are awaited through synthesize_async(), so
+        network providers hold no thread while a request is in flight; cache
+        file I/O, ffmpeg and speaker playback run in worker threads.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save audio file (if None and stream=False, auto-generate)
+            provider_name: Specific provider to use (if None, auto-detect from voice)
+            voice: Voice to use (provider:voice format or just voice name)
+            stream: Whether to stream audio to speakers
+            output_format: Audio output format
+            timings: Record to fill with per-stage timings for this request
+            **kwargs: Additional provider-specific options
+
+        Returns:
+            Path to generated audio file if saved, None if streamed
+
+        Raises:
+            TTSError: If synthesis fails
+            ProviderNotFoundError: If specified provider not found
+        """
+        with collect_timings(timings):
+            with timing_span("config_load"):
+                provider_name, voice = self.resolve_provider_and_voice(provider_name, voice)
+            set_timing_fields(chars=len(text), stream=stream, output_format=output_format)
+
+            if not stream and not output_path:
+                suffix = f".{output_format}" if output_format else ".wav"
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                    output_path = tmp.name
+
+            targets = self._failover_targets(provider_name, voice)
+            for attempt, (target_name, target_voice) in enumerate(targets):
+                try:
+                    return await self._synthesize_with_provider_async(
+                        text, output_path, target_name, target_voice, stream, output_format, **kwargs
+                    )
+                except _FAILOVER_ERRORS as e:
+                    if attempt == len(targets) - 1:
+                        raise
+                    self._log_failover(target_name, targets[attempt + 1][0], e)
+            return None
+
+    async def _synthesize_with_provider_async(
+        self,
+        text: str,
+        output_path: Optional[str],
+        provider_name: str,
+        voice: Optional[str],
+        stream: bool,
+        output_format: str,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Synthesize with one resolved provider; see synthesize_text_async()."""
+        set_timing_fields(provider=provider_name, voice=voice, cache_hit=False)
+
+        try:
+            with timing_span("provider_load"):
+                provider_lease = self.lease_provider_async(provider_name)
+        except (ProviderNotFoundError, ProviderLoadError) as e:
+            self.logger.error(f"Failed to load provider {provider_name}: {e}")
+            raise ProviderError(f"Provider {provider_name} unavailable: {e}") from e
+
+        synthesis_kwargs = {"stream": stream, "output_format": output_format, **kwargs}
+        if voice is not None:
+            synthesis_kwargs["voice"] = voice
+
+        cache_key = None
+        if self._audio_cache.enabled:
+            cache_key = self._audio_cache.make_key(
+                provider_name, text, voice=voice, output_format=output_format, **kwargs
+            )
+            if stream:
+                with timing_span("cache_lookup"):
+                    cached_path = await asyncio.to_thread(self._audio_cache.lookup, cache_key)
+                if cached_path is not None:
+                    self.logger.info(f"Streaming cached audio for {provider_name} provider")
+                    set_timing_fields(cache_hit=True)
+                    await asyncio.to_thread(stream_audio_file, str(cached_path))
+                    return None
+            else:
+                with timing_span("cache_lookup"):
+                    hit = (
+                        await asyncio.to_thread(self._audio_cache.get, cache_key, output_path) if output_path else False
+                    )
+                if hit:
+                    self.logger.info(f"Served {output_path} from audio cache")
+                    set_timing_fields(cache_hit=True)
                     return output_path
-                else:
-                    raise TTSError("Synthesis completed but output file not found")
+
+        with timing_span("preprocess"):
+            chunks = self.split_for_provider(provider_name, text)
+        set_timing_fields(chunks=len(chunks))
+
+        try:
+            if stream and cache_key and get_config_value("audio_cache_fill_on_stream"):
+                self.logger.info(f"Synthesizing with {provider_name} provider to fill audio cache")
+                with tempfile.NamedTemporaryFile(suffix=f".{output_format or 'wav'}", delete=False) as tmp:
+                    fill_path = tmp.name
+                try:
+                    await self._run_synthesis_async(
+                        provider_name,
+                        provider_lease,
+                        text,
+                        chunks,
+                        fill_path,
+                        {**synthesis_kwargs, "stream": False},
+                    )
+                    with timing_span("cache_store"):
+                        cached_path = await asyncio.to_thread(self._audio_cache.put, cache_key, fill_path)
+                    await asyncio.to_thread(stream_audio_file, str(cached_path or fill_path))
+                finally:
+                    Path(fill_path).unlink(missing_ok=True)
+                return None
+            elif stream:
+                self.logger.info(f"Streaming synthesis with {provider_name} provider")
+                await self._run_synthesis_async(provider_name, provider_lease, text, chunks, None, synthesis_kwargs)
+                return None
+            else:
+                self.logger.info(f"Synthesizing audio to {output_path} with {provider_name} provider")
+                if not (output_path and get_config_value("single_flight_enabled")):
+                    return await self._synthesize_to_file_async(
+                        provider_name, provider_lease, text, chunks, output_path, synthesis_kwargs, cache_key
+                    )
+
+                led = False
+
+                async def lead() -> str:
+                    nonlocal led
+                    led = True
+                    shared_path = self._shared_output_path(output_format)
+                    return await self._synthesize_to_file_async(
+                        provider_name, provider_lease, text, chunks, shared_path, synthesis_kwargs, cache_key
+                    )
+
+                flight_key = cache_key or self._flight_key(provider_name, text, voice, output_format, kwargs)
+                async with self._flights.join_async(flight_key, lead) as (shared_path, shared):
+                    if not led:
+                        self.logger.info(f"Joined in-flight synthesis for {output_path}")
+                        set_timing_fields(coalesced=True)
+                    place = shutil.copyfile if shared else shutil.move
+                    await asyncio.to_thread(place, shared_path, output_path)
+                return output_path
 
         except (IOError, OSError, RuntimeError, ValueError) as e:
             self.logger.error(f"Synthesis failed: {e}")
             raise TTSError(f"Synthesis failed: {e}") from e
 
+    def _stream_plan(
+        self,
+        provider_name: str,
+        text: str,
+        voice: Optional[str],
+        output_format: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Type[TTSProvider], Optional[str], str, Dict[str, Any]]:
+        """Decide how synthesize_iter() produces a provider's audio.
+
+        Returns:
+            Tuple of (provider class, format to stream from the provider or
+            None to synthesize to a file, output format, provider options)
+        """
+        try:
+            provider_class = self.load_provider(provider_name)
+        except (ProviderNotFoundError, ProviderLoadError) as e:
+            self.logger.error(f"Failed to load provider {provider_name}: {e}")
+            raise ProviderError(f"Provider {provider_name} unavailable: {e}") from e
+
+        parts = len(self.split_for_provider(provider_name, text))
+        native = self.negotiate_stream_format(provider_class, output_format, parts)
+        audio_format = output_format or native or "wav"
+
+        options = dict(kwargs)
+        if voice is not None:
+            options["voice"] = voice
+        if native is not None:
+            options["output_format"] = native
+        return provider_class, native, audio_format, options
+
+    @staticmethod
+    def negotiate_stream_format(
+        provider_class: Type[TTSProvider], output_format: Optional[str], parts: int = 1
+    ) -> Optional[str]:
+        """Pick the encoding a provider should stream for a requested format.
+
+        The requested format itself is streamed when the provider's API
+        encodes it (NATIVE_FORMATS). Otherwise the provider's STREAM_FORMAT is
+        streamed and piped through ffmpeg, so only formats without any native
+        or pipeable path pay for a full synthesis to a file first.
+
+        Text split into several requests is streamed as the parts' audio one
+        after another, which only CONCAT_FORMATS survive; a container such as
+        WAV is then converted from STREAM_FORMAT or synthesized to a file.
+
+        Args:
+            provider_class: Provider to stream from
+            output_format: Requested format, or None for the provider's default
+            parts: Number of requests the text is split into
+
+        Returns:
+            Format to request from iter_audio(), or None if the provider has to
+            synthesize to a file in output_format instead
+        """
+        native = provider_class.STREAM_FORMAT
+        if native is None or output_format in (None, native):
+            choice = native
+        elif output_format in provider_class.NATIVE_FORMATS:
+            choice = output_format
+        else:
+            choice = native if output_format in PIPE_FORMATS else None
+
+        if parts > 1 and choice is not None and choice not in CONCAT_FORMATS:
+            if native in CONCAT_FORMATS and output_format in PIPE_FORMATS:
+                return native
+            return None
+        return choice
+
+    def synthesize_iter(
+        self,
+        text: str,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        output_format: Optional[str] = None,
+        hedge: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Generator[AudioChunk, None, None]:
+        """Synthesize text and yield the audio as it is produced.
+
+        Providers with a STREAM_FORMAT hand over chunks as they arrive from the
+        service, so the first bytes are available long before synthesis is
+        complete. Other providers, or a format different from the native one,
+        are synthesized to a temporary file that is then yielded in chunks.
+
+        With hedging, a request whose provider has not produced audio within
+        its usual first-chunk latency is also sent to the next provider in the
+        failover chain; the stream that starts first is used.
+
+        Args:
+            text: Text to synthesize
+            provider_name: Specific provider to use (if None, auto-detect from voice)
+            voice: Voice to use (provider:voice format or just voice name)
+            output_format: Audio format (None for the provider's native stream format)
+            hedge: Hedge slow first chunks (None uses the hedging_enabled setting)
+            **kwargs: Additional provider-specific options
+
+        Yields:
+            AudioChunk objects in playback order
+
+        Raises:
+            TTSError: If synthesis fails
+            ProviderNotFoundError: If specified provider not found
+        """
+        provider_name, voice = self.resolve_provider_and_voice(provider_name, voice)
+        targets = self._failover_targets(provider_name, voice)
+
+        if self._should_hedge(hedge, targets):
+            # Racing needs cancellation, so hedged streams run on a private event loop; the
+            # async HTTP clients opened on it are closed with it
+            yield from iterate_async_in_thread(
+                lambda: self._hedged_iter_async(text, targets, output_format, kwargs), cleanup=aclose_http_clients
+            )
+            return
+
+        # A provider can be failed over until it has produced its first chunk
+        for attempt, (target_name, target_voice) in enumerate(targets):
+            chunks = self._iter_with_provider(text, target_name, target_voice, output_format, **kwargs)
+            try:
+                first = next(chunks)
+            except StopIteration:
+                return
+            except _FAILOVER_ERRORS as e:
+                if attempt == len(targets) - 1:
+                    raise
+                self._log_failover(target_name, targets[attempt + 1][0], e)
+                continue
+            yield first
+            yield from chunks
+            return
+
+    def _iter_with_provider(
+        self, text: str, provider_name: str, voice: Optional[str], output_format: Optional[str], **kwargs: Any
+    ) -> Generator[AudioChunk, None, None]:
+        """Stream with one resolved provider; see synthesize_iter()."""
+        _, native, audio_format, options = self._stream_plan(provider_name, text, voice, output_format, kwargs)
+        mime_type = get_mime_type(audio_format)
+        started = time.monotonic()
+
+        if native is None:
+            with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", delete=False) as tmp:
+                tmp_path = tmp.name
+            try:
+                self._synthesize_with_provider(text, tmp_path, provider_name, voice, False, audio_format, **kwargs)
+                self._latency.record(provider_name, time.monotonic() - started)
+                for index, data in enumerate(iter_file_chunks(tmp_path)):
+                    yield AudioChunk(data, index, audio_format, mime_type, provider_name)
+            finally:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        audio = self._iter_native(text, provider_name, voice, native, options, kwargs, started)
+        if native != audio_format:
+            # No native encoding for the requested format; convert the stream on the fly
+            audio = iter_transcoded(audio, native, audio_format)
+        try:
+            for index, data in enumerate(audio):
+                yield AudioChunk(data, index, audio_format, mime_type, provider_name)
+        finally:
+            audio.close()
+
+    def _iter_native(
+        self,
+        text: str,
+        provider_name: str,
+        voice: Optional[str],
+        native: str,
+        options: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        started: float,
+    ) -> Generator[bytes, None, None]:
+        """Yield a provider's audio stream in a format it encodes itself, via the audio cache."""
+        index = 0
+        cache_key = None
+        if self._audio_cache.enabled:
+            cache_key = self._audio_cache.make_key(provider_name, text, voice=voice, output_format=native, **kwargs)
+            cached_path = self._audio_cache.lookup(cache_key)
+            if cached_path is not None:
+                self.logger.info(f"Streaming cached audio for {provider_name} provider")
+                yield from iter_file_chunks(str(cached_path))
+                return
+
+        # Keep a copy of the stream so a completed utterance can be cached
+        tee: Optional[List[bytes]] = [] if cache_key else None
+        try:
+            with self.lease_provider(provider_name) as provider:
+                for part in self.split_for_provider(provider_name, text):
+                    self._rate_limiter.acquire(provider_name, len(part))
+                    for data in provider.iter_audio(part, **options):
+                        if index == 0:
+                            self._latency.record(provider_name, time.monotonic() - started)
+                        if tee is not None:
+                            tee.append(data)
+                        yield data
+                        index += 1
+        except (IOError, OSError, RuntimeError, ValueError) as e:
+            self.logger.error(f"Streaming synthesis failed: {e}")
+            raise TTSError(f"Synthesis failed: {e}") from e
+
+        if tee and cache_key:
+            self._cache_bytes(cache_key, b"".join(tee), native)
+
+    async def synthesize_iter_async(
+        self,
+        text: str,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        output_format: Optional[str] = None,
+        hedge: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Async counterpart of synthesize_iter().
+
+        Native streams are read through iter_audio_async(), so network
+        providers hold no thread while waiting for the next chunk; file and
+        cache I/O run in worker threads.
+
+        Args:
+            text: Text to synthesize
+            provider_name: Specific provider to use (if None, auto-detect from voice)
+            voice: Voice to use (provider:voice format or just voice name)
+            output_format: Audio format (None for the provider's native stream format)
+            hedge: Hedge slow first chunks (None uses the hedging_enabled setting)
+            **kwargs: Additional provider-specific options
+
+        Yields:
+            AudioChunk objects in playback order
+
+        Raises:
+            TTSError: If synthesis fails
+            ProviderNotFoundError: If specified provider not found
+        """
+        provider_name, voice = self.resolve_provider_and_voice(provider_name, voice)
+        targets = self._failover_targets(provider_name, voice)
+
+        def start() -> AsyncGenerator[AudioChunk, None]:
+            if self._should_hedge(hedge, targets):
+                return self._hedged_iter_async(text, targets, output_format, kwargs)
+            return self._failover_iter_async(text, targets, output_format, kwargs)
+
+        if get_config_value("single_flight_enabled"):
+            # Identical concurrent streams share one provider request and receive the same chunks
+            flight_key = self._flight_key(provider_name, text, voice, output_format, kwargs)
+            chunks_iter = self._flights.join_stream(flight_key, start)
+        else:
+            chunks_iter = start()
+        try:
+            async for chunk in chunks_iter:
+                yield chunk
+        finally:
+            await chunks_iter.aclose()
+
+    async def _failover_iter_async(
+        self,
+        text: str,
+        targets: List[Tuple[str, Optional[str]]],
+        output_format: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Stream from the first target that starts, failing over before the first chunk."""
+        for attempt, (target_name, target_voice) in enumerate(targets):
+            chunks = self._iter_with_provider_async(text, target_name, target_voice, output_format, **kwargs)
+            try:
+                try:
+                    first = await chunks.__anext__()
+                except StopAsyncIteration:
+                    return
+                except _FAILOVER_ERRORS as e:
+                    if attempt == len(targets) - 1:
+                        raise
+                    self._log_failover(target_name, targets[attempt + 1][0], e)
+                    continue
+                yield first
+                async for chunk in chunks:
+                    yield chunk
+                return
+            finally:
+                await chunks.aclose()
+
+    def _should_hedge(self, hedge: Optional[bool], targets: List[Tuple[str, Optional[str]]]) -> bool:
+        enabled = get_config_value("hedging_enabled") if hedge is None else hedge
+        return bool(enabled) and len(targets) > 1
+
+    def get_hedge_delay(self, provider_name: str) -> float:
+        """Seconds to wait for a provider's first chunk before hedging.
+
+        The delay is the provider's observed first-chunk latency at the
+        hedging_percentile, so only its slowest requests are duplicated. Until
+        enough samples exist, hedging_default_delay_seconds is used.
+
+        Args:
+            provider_name: Provider registry name
+
+        Returns:
+            Delay in seconds
+        """
+        observed = self._latency.percentile(
+            provider_name, get_config_value("hedging_percentile"), get_config_value("hedging_min_samples")
+        )
+        if observed is None:
+            return float(get_config_value("hedging_default_delay_seconds"))
+        return max(float(get_config_value("hedging_min_delay_seconds")), observed)
+
+    async def _hedged_iter_async(
+        self,
+        text: str,
+        targets: List[Tuple[str, Optional[str]]],
+        output_format: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Race the first two targets for the first chunk, then fail over through the rest."""
+        try:
+            chunks, first = await self._race_first_chunk(text, targets[0], targets[1], output_format, kwargs)
+        except _FAILOVER_ERRORS as e:
+            if len(targets) <= 2:
+                raise
+            self._log_failover(targets[1][0], targets[2][0], e)
+            async for chunk in self._failover_iter_async(text, targets[2:], output_format, kwargs):
+                yield chunk
+            return
+
+        try:
+            if first is not None:
+                yield first
+                async for chunk in chunks:
+                    yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def _race_first_chunk(
+        self,
+        text: str,
+        primary: Tuple[str, Optional[str]],
+        backup: Tuple[str, Optional[str]],
+        output_format: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[AsyncGenerator[AudioChunk, None], Optional[AudioChunk]]:
+        """Start the primary stream, adding the backup if its first chunk is late.
+
+        Returns:
+            Tuple of (winning stream, its first chunk or None if it was empty)
+
+        Raises:
+            TTSError: The last provider error if neither stream started
+        """
+
+        async def start(
+            target: Tuple[str, Optional[str]]
+        ) -> Tuple[AsyncGenerator[AudioChunk, None], Optional[AudioChunk]]:
+            chunks = self._iter_with_provider_async(text, target[0], target[1], output_format, **kwargs)
+            try:
+                return chunks, await chunks.__anext__()
+            except StopAsyncIteration:
+                return chunks, None
+            except BaseException:
+                await chunks.aclose()
+                raise
+
+        delay = self.get_hedge_delay(primary[0])
+        primary_task = asyncio.create_task(start(primary))
+        done, _ = await asyncio.wait({primary_task}, timeout=delay)
+        if done:
+            error = primary_task.exception()
+            if error is None:
+                return primary_task.result()
+            if not isinstance(error, _FAILOVER_ERRORS):
+                raise error
+            self._log_failover(primary[0], backup[0], error)
+            return await start(backup)
+
+        self.logger.info(f"No audio from {primary[0]} after {delay:.2f}s; hedging with {backup[0]}")
+        names = {primary_task: primary[0], asyncio.create_task(start(backup)): backup[0]}
+        pending = set(names)
+        winner: Optional["asyncio.Task[Tuple[AsyncGenerator[AudioChunk, None], Optional[AudioChunk]]]"] = None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        winner = winner or task
+                    elif not isinstance(error, _FAILOVER_ERRORS):
+                        raise error
+                    else:
+                        self.logger.warning(f"Hedged request to {names[task]} failed: {error}")
+                        last_error = error
+        finally:
+            # Cancel the slower request, and close a stream that also started
+            losers = [task for task in names if task is not winner]
+            for task in losers:
+                task.cancel()
+            for result in await asyncio.gather(*losers, return_exceptions=True):
+                if isinstance(result, tuple):
+                    await result[0].aclose()
+
+        if winner is None:
+            raise last_error or ProviderError("Hedged request failed")
+        self.logger.info(f"Hedged request won by {names[winner]}")
+        return winner.result()
+
+    async def _iter_with_provider_async(
+        self, text: str, provider_name: str, voice: Optional[str], output_format: Optional[str], **kwargs: Any
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Stream with one resolved provider; see synthesize_iter_async()."""
+        _, native, audio_format, options = self._stream_plan(provider_name, text, voice, output_format, kwargs)
+        mime_type = get_mime_type(audio_format)
+        index = 0
+        started = time.monotonic()
+
+        if native is None:
+            with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", delete=False) as tmp:
+                tmp_path = tmp.name
+            try:
+                await self._synthesize_with_provider_async(
+                    text, tmp_path, provider_name, voice, False, audio_format, **kwargs
+                )
+                self._latency.record(provider_name, time.monotonic() - started)
+                async for data in iterate_in_thread(iter_file_chunks(tmp_path)):
+                    yield AudioChunk(data, index, audio_format, mime_type, provider_name)
+                    index += 1
+            finally:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        audio = self._iter_native_async(text, provider_name, voice, native, options, kwargs, started)
+        if native != audio_format:
+            # No native encoding for the requested format; convert the stream on the fly
+            audio = iter_transcoded_async(audio, native, audio_format)
+        try:
+            async for data in audio:
+                yield AudioChunk(data, index, audio_format, mime_type, provider_name)
+                index += 1
+        finally:
+            await audio.aclose()
+
+    async def _iter_native_async(
+        self,
+        text: str,
+        provider_name: str,
+        voice: Optional[str],
+        native: str,
+        options: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        started: float,
+    ) -> AsyncGenerator[bytes, None]:
+        """Async counterpart of _iter_native()."""
+        index = 0
+        cache_key = None
+        if self._audio_cache.enabled:
+            cache_key = self._audio_cache.make_key(provider_name, text, voice=voice, output_format=native, **kwargs)
+            cached_path = await asyncio.to_thread(self._audio_cache.lookup, cache_key)
+            if cached_path is not None:
+                self.logger.info(f"Streaming cached audio for {provider_name} provider")
+                async for data in iterate_in_thread(iter_file_chunks(str(cached_path))):
+                    yield data
+                return
+
+        tee: Optional[List[bytes]] = [] if cache_key else None
+        try:
+            async with self.lease_provider_async(provider_name) as provider:
+                for part in self.split_for_provider(provider_name, text):
+                    await self._rate_limiter.acquire_async(provider_name, len(part))
+                    async for data in provider.iter_audio_async(part, **options):
+                        if index == 0:
+                            self._latency.record(provider_name, time.monotonic() - started)
+                        if tee is not None:
+                            tee.append(data)
+                        yield data
+                        index += 1
+        except (IOError, OSError, RuntimeError, ValueError) as e:
+            self.logger.error(f"Streaming synthesis failed: {e}")
+            raise TTSError(f"Synthesis failed: {e}") from e
+
+        if tee and cache_key:
+            await asyncio.to_thread(self._cache_bytes, cache_key, b"".join(tee), native)
+
+    def _cache_bytes(self, cache_key: str, audio_data: bytes, audio_format: str) -> None:
+        """Store in-memory audio in the audio cache via a temporary file."""
+        with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", delete=False) as tmp:
+            tmp.write(audio_data)
+        try:
+            self._audio_cache.put(cache_key, tmp.name)
+        finally:
+            Path(tmp.name).unlink(missing_ok=True)
+
+    def synthesize_batch(
+        self,
+        items: List[BatchItem],
+        max_workers: Optional[int] = None,
+        provider_concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+    ) -> List[BatchResult]:
+        """Synthesize many items to files in one process.
+
+        Items run on a bounded worker pool, with a separate cap on how many
+        requests hit any single provider at once. A failing item is recorded
+        and does not stop the rest of the batch.
+
+        Args:
+            items: Items to synthesize
+            max_workers: Total concurrent items (default from batch_max_workers)
+            provider_concurrency: Concurrent items per provider (default from
+                batch_provider_concurrency)
+            on_result: Called with each result as it completes, for progress reporting
+
+        Returns:
+            Results in the same order as items
+        """
+        if not items:
+            return []
+
+        workers = max(1, min(len(items), max_workers or get_config_value("batch_max_workers", 8)))
+        per_provider = max(1, provider_concurrency or get_config_value("batch_provider_concurrency", 4))
+        resolved = [self.resolve_provider_and_voice(item.provider_name, item.voice) for item in items]
+        semaphores = {provider_name: threading.BoundedSemaphore(per_provider) for provider_name, _ in set(resolved)}
+        results: List[Optional[BatchResult]] = [None] * len(items)
+
+        def run_item(index: int, item: BatchItem) -> BatchResult:
+            start = time.monotonic()
+            provider_name, voice = resolved[index]
+            try:
+                output_format = item.output_format or Path(item.output_path).suffix.lstrip(".").lower() or "wav"
+                with semaphores[provider_name]:
+                    output_path = self.synthesize_text(
+                        item.text,
+                        output_path=item.output_path,
+                        provider_name=provider_name,
+                        voice=voice,
+                        stream=False,
+                        output_format=output_format,
+                        **item.options,
+                    )
+                return BatchResult(index, item, True, output_path=output_path, duration=time.monotonic() - start)
+            except Exception as e:
+                # Any failure, provider bugs included, belongs to this item alone
+                self.logger.warning(f"Batch item {index} failed: {type(e).__name__}: {e}")
+                return BatchResult(index, item, False, error=str(e), duration=time.monotonic() - start)
+
+        self.logger.info(f"Synthesizing batch of {len(items)} items with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="voice_batch") as executor:
+            futures = [executor.submit(run_item, index, item) for index, item in enumerate(items)]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.index] = result
+                if on_result:
+                    on_result(result)
+
+        return [result for result in results if result is not None]
+
     def get_provider_info(self, provider_name: str) -> Optional[ProviderInfo]:
         """Get information about a specific provider.
 
@@ -193,9 +1464,9 @@ class TTSEngine:
             Provider info dictionary or None if provider unavailable
         """
         try:
-            provider_class = self.load_provider(provider_name)
-            provider = provider_class()
-            return provider.get_info()
+            with self.lease_provider(provider_name) as provider:
+                info: Optional[ProviderInfo] = provider.get_info()
+                return info
         except (ProviderNotFoundError, ProviderLoadError, AttributeError, RuntimeError) as e:
             self.logger.warning(f"Could not get info for provider {provider_name}: {e}")
             return None
@@ -203,26 +1474,13 @@ class TTSEngine:
     def get_all_voices(self) -> Dict[str, list]:
         """Get all available voices from all providers.
 
+        Voices come from the voice catalog, which queries stale providers
+        concurrently and otherwise answers from its on-disk index.
+
         Returns:
             Dictionary mapping provider names to lists of available voices
         """
-        all_voices = {}
-
-        for provider_name in self.providers_registry.keys():
-            try:
-                info = self.get_provider_info(provider_name)
-                if info:
-                    voices = info.get("all_voices") or info.get("sample_voices", [])
-                    if not isinstance(voices, list):
-                        voices = []
-                    all_voices[provider_name] = voices
-                else:
-                    all_voices[provider_name] = []
-            except (AttributeError, KeyError, ValueError, RuntimeError) as e:
-                self.logger.warning(f"Error getting voices for {provider_name}: {e}")
-                all_voices[provider_name] = []
-
-        return all_voices
+        return self._voice_catalog.get_all_voices()
 
     def validate_voice(self, voice: str, provider_name: Optional[str] = None) -> bool:
         """Validate that a voice is available.
@@ -240,18 +1498,7 @@ class TTSEngine:
         if not provider_name:
             return False
 
-        try:
-            info = self.get_provider_info(provider_name)
-            if not info:
-                return False
-
-            voices = info.get("all_voices") or info.get("sample_voices", [])
-            if not isinstance(voices, list):
-                voices = []
-            return voice in voices
-
-        except (AttributeError, KeyError, ValueError):
-            return False
+        return self._voice_catalog.has_voice(provider_name, voice)
 
     def get_provider_status(self, provider_name: str) -> Dict[str, Any]:
         """Get defensive status information for a provider without throwing exceptions.
@@ -272,7 +1519,7 @@ class TTSEngine:
 
         try:
             # Try to load the provider class (checks if module exists)
-            provider_class = self.load_provider(provider_name)
+            self.load_provider(provider_name)
             status["installed"] = True
 
             # Check if provider needs API key and if it's configured
@@ -291,8 +1538,8 @@ class TTSEngine:
             else:
                 # Try basic provider instantiation without network calls
                 try:
-                    provider_class()
-                    status["available"] = True
+                    with self.lease_provider(provider_name):
+                        status["available"] = True
                 except Exception as e:
                     self.logger.exception(f"Provider instantiation failed for {provider_name}")
                     status["error"] = f"Provider instantiation failed: {str(e)}"
@@ -433,9 +1680,8 @@ class TTSEngine:
         result = {"provider": provider_name, "available": False, "error": None, "voice_count": 0, "sample_voices": []}
 
         try:
-            provider_class = self.load_provider(provider_name)
-            provider = provider_class()
-            info = provider.get_info()
+            with self.lease_provider(provider_name) as provider:
+                info = provider.get_info()
 
             if info:
                 voices = info.get("all_voices") or info.get("sample_voices", [])
@@ -128,6 +128,29 @@ class DependencyError(TTSError):
     pass
 
 
+class OverloadedError(TTSError):
+    """Exception raised when the server cannot admit more synthesis work.
+
+    retry_after is the estimated number of seconds until capacity frees up.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QueueFullError(OverloadedError):
+    """Exception raised when the synthesis wait queue is already full."""
+
+    pass
+
+
+class DeadlineExceededError(OverloadedError):
+    """Exception raised when a request's deadline passes before it could start."""
+
+    pass
+
+
 def map_http_error(status_code: int, response_text: str = "", provider: str = "") -> TTSError:
     """Map HTTP status codes to appropriate exception types.
 
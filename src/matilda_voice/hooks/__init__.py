@@ -8,9 +8,11 @@ This module provides all hook handlers for the CLI commands:
 - voice: on_voice_load, on_voice_unload, on_voice_status
 - system: on_status, on_config
 - document: on_document
+- batch: on_batch
 - utils: helper functions and registries
 """
 
+from .batch import on_batch
 from .core import on_save, on_speak
 from .document import on_document
 from .providers import on_info, on_install, on_providers, on_voices
@@ -49,4 +51,6 @@ __all__ = [
     "on_config",
     # Document
     "on_document",
+    # Batch
+    "on_batch",
 ]
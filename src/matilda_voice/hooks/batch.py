@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Hook handler for the voice batch command: render a JSONL manifest of prompts to files."""
+
+import json as json_module
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from matilda_voice.internal.types import BatchItem, BatchResult
+
+from .utils import PROVIDER_SHORTCUTS, get_engine, handle_provider_shortcuts
+
+# Manifest fields mapped onto BatchItem; anything else is passed to the provider
+_ITEM_FIELDS = {"text", "output", "output_path", "voice", "provider", "format"}
+
+
+def _parse_manifest(
+    manifest_path: Path, output_dir: Optional[str], default_format: Optional[str], default_voice: Optional[str]
+) -> List[BatchItem]:
+    """Read a JSONL manifest into batch items.
+
+    Each non-empty line is a JSON object with ``text`` and optionally ``output``,
+    ``voice``, ``provider`` (registry name or @shortcut), ``format`` and extra
+    provider options such as ``rate`` or ``pitch``. Lines starting with ``#``
+    are ignored.
+
+    Raises:
+        ValueError: If a line is not valid JSON or lacks text
+    """
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    items: List[BatchItem] = []
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                entry = json_module.loads(line)
+            except json_module.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: invalid JSON: {e.msg}") from e
+            if not isinstance(entry, dict) or not str(entry.get("text", "")).strip():
+                raise ValueError(f"{manifest_path}:{line_number}: each line needs a non-empty 'text' field")
+
+            output_format = entry.get("format") or default_format
+            output = entry.get("output") or entry.get("output_path")
+            if not output:
+                output = f"{len(items) + 1:05d}.{output_format or 'mp3'}"
+            output_path = Path(output).expanduser()
+            if not output_path.is_absolute():
+                output_path = base_dir / output_path
+
+            provider_name = handle_provider_shortcuts(entry.get("provider"))
+            if provider_name and provider_name.startswith("@"):
+                raise ValueError(
+                    f"{manifest_path}:{line_number}: unknown provider shortcut '{provider_name}'. "
+                    f"Available: {', '.join('@' + k for k in PROVIDER_SHORTCUTS)}"
+                )
+
+            items.append(
+                BatchItem(
+                    text=str(entry["text"]),
+                    output_path=str(output_path),
+                    voice=entry.get("voice") or default_voice,
+                    provider_name=provider_name,
+                    output_format=output_format,
+                    options={k: v for k, v in entry.items() if k not in _ITEM_FIELDS},
+                )
+            )
+
+    return items
+
+
+def on_batch(
+    manifest: str,
+    output_dir: Optional[str],
+    format: Optional[str],
+    voice: Optional[str],
+    workers: Optional[int],
+    json: bool,
+    debug: bool,
+    **kwargs: Any,
+) -> int:
+    """Handle the batch command"""
+    manifest_path = Path(manifest)
+    if not manifest_path.exists():
+        print(f"Error: Manifest file not found: {manifest}")
+        return 1
+
+    try:
+        items = _parse_manifest(manifest_path, output_dir, format, voice)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if not items:
+        print("Warning: Manifest contains no items")
+        return 1
+
+    for item in items:
+        Path(item.output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    engine = get_engine()
+    total = len(items)
+    completed = 0
+    start = time.monotonic()
+
+    def report(result: BatchResult) -> None:
+        nonlocal completed
+        completed += 1
+        if json:
+            return
+        if result.success:
+            line = f"[{completed}/{total}] ✅ {result.output_path} ({result.duration:.1f}s)"
+        else:
+            line = f"[{completed}/{total}] ❌ item {result.index + 1}: {result.error}"
+        print(line, file=sys.stderr)
+
+    results = engine.synthesize_batch(items, max_workers=workers, on_result=report)
+    elapsed = time.monotonic() - start
+    failed = [result for result in results if not result.success]
+
+    if json:
+        summary: Dict[str, Any] = {
+            "total": total,
+            "succeeded": total - len(failed),
+            "failed": len(failed),
+            "elapsed_seconds": round(elapsed, 3),
+            "results": [
+                {
+                    "index": result.index,
+                    "success": result.success,
+                    "output": result.output_path or result.item.output_path,
+                    "error": result.error,
+                    "duration_seconds": round(result.duration, 3),
+                }
+                for result in results
+            ],
+        }
+        print(json_module.dumps(summary, indent=2))
+    else:
+        print(f"Batch complete: {total - len(failed)} succeeded, {len(failed)} failed in {elapsed:.1f}s")
+        for result in failed:
+            print(f"  ❌ item {result.index + 1} ({result.item.output_path}): {result.error}")
+        if debug:
+            print(f"Provider pool: {engine.get_pool_stats()}")
+
+    return 1 if failed else 0
@@ -4,6 +4,7 @@
 import sys
 from typing import Any, Dict, Optional
 
+from ..internal.timings import SynthesisTimings
 from .utils import (
     PROVIDER_SHORTCUTS,
     get_engine,
@@ -18,6 +19,7 @@ def on_speak(
     rate: Optional[str],
     pitch: Optional[str],
     debug: bool,
+    timings: Optional[bool] = None,
     **kwargs,
 ) -> int:
     """Handle the speak command"""
@@ -79,13 +81,19 @@ def on_speak(
             output_params["pitch"] = pitch
 
         # Synthesize the text
-        result = engine.synthesize_text(
-            text=final_text,
-            voice=voice,
-            provider_name=provider_name,
-            output_path=None,  # None means stream to speakers
-            **output_params,
-        )
+        record = SynthesisTimings() if timings else None
+        try:
+            result = engine.synthesize_text(
+                text=final_text,
+                voice=voice,
+                provider_name=provider_name,
+                output_path=None,  # None means stream to speakers
+                timings=record,
+                **output_params,
+            )
+        finally:
+            if record is not None:
+                print(record.format_table(), file=sys.stderr)
 
         return 0 if result else 1
 
@@ -118,6 +126,7 @@ def on_save(
     debug: bool,
     rate: Optional[str],
     pitch: Optional[str],
+    timings: Optional[bool] = None,
     **kwargs,
 ) -> int:
     """Handle the save command"""
@@ -173,9 +182,19 @@ def on_save(
             output_params["format"] = format
 
         # Synthesize the text
-        result = engine.synthesize_text(
-            text=final_text, voice=voice, provider_name=provider_name, output_path=output, **output_params
-        )
+        record = SynthesisTimings() if timings else None
+        try:
+            result = engine.synthesize_text(
+                text=final_text,
+                voice=voice,
+                provider_name=provider_name,
+                output_path=output,
+                timings=record,
+                **output_params,
+            )
+        finally:
+            if record is not None:
+                print(record.format_table(), file=sys.stderr)
 
         if result:
             print(f"Audio saved to: {output}")
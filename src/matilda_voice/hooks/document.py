@@ -59,7 +59,8 @@ def on_document(
             print("Warning: No text content extracted from document")
             return 1
 
-        final_text = " ".join(text_parts)
+        # Keep element boundaries as paragraph breaks so long documents split cleanly
+        final_text = "\n\n".join(text_parts)
 
         if debug:
             print(f"Extracted {len(semantic_elements)} elements")
@@ -22,7 +22,7 @@ def on_voices(args: tuple, **kwargs) -> int:
         engine = get_engine()
 
         # Create and launch voice browser
-        browser = VoiceBrowser(PROVIDERS_REGISTRY, engine.load_provider)
+        browser = VoiceBrowser(PROVIDERS_REGISTRY, engine.load_provider, engine.get_voice_catalog())
 
         # Try to reset terminal state before launching curses
         try:
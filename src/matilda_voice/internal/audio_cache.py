@@ -0,0 +1,359 @@
+"""Content-addressed cache of synthesized audio.
+
+Deployments re-speak the same notification and status phrases over and over,
+and every one of those is a billed cloud request. This cache sits in front of
+TTSEngine.synthesize_text so a repeated request is served straight from disk:
+
+- Keys are a SHA-256 over provider, voice, rate, pitch, output format, model,
+  the remaining provider options, whitespace-normalized text and the config
+  fingerprint, so defaults a provider reads from config (model, stability,
+  speed, ...) also select the entry
+- Entries are written atomically (temp file + rename) so concurrent readers
+  never see a partial file
+- Entries expire after a TTL (file mtime) and the directory is kept under a
+  size budget by evicting least recently used entries (file atime, refreshed
+  explicitly on every hit)
+- Hit, miss, store and eviction counters are exposed via get_stats(), with
+  entry and byte totals kept as running counts rather than rescanned
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_config_snapshot, get_config_value
+
+logger = logging.getLogger(__name__)
+
+# Options that change how audio is delivered, not what it sounds like
+_NON_AUDIO_OPTIONS = frozenset({"stream", "debug", "output_path"})
+
+
+def get_audio_cache_dir() -> Path:
+    """Get the audio cache directory, using XDG standard with fallback."""
+    configured = get_config_value("audio_cache_dir", "")
+    if configured:
+        return Path(configured).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "voice" / "audio"
+    return Path.home() / ".cache" / "voice" / "audio"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so formatting-only differences share an entry."""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class AudioCache:
+    """On-disk LRU/TTL cache of synthesized audio files.
+
+    Usage:
+        cache = AudioCache()
+        key = cache.make_key("openai_tts", "hello", voice="nova", output_format="mp3")
+        if not cache.get(key, "out.mp3"):
+            synthesize("hello", "out.mp3")
+            cache.put(key, "out.mp3")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_mb: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached audio (default from config/XDG)
+            max_size_mb: Size budget in megabytes
+            ttl_seconds: Seconds an entry stays valid after it was written
+            enabled: Whether lookups and stores are performed
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_audio_cache_dir()
+        size_mb = max_size_mb if max_size_mb is not None else get_config_value("audio_cache_max_size_mb", 512)
+        self.max_size = int(float(size_mb) * 1024 * 1024)
+        self.ttl = float(
+            ttl_seconds if ttl_seconds is not None else get_config_value("audio_cache_ttl_seconds", 604800)
+        )
+        self.enabled = bool(enabled if enabled is not None else get_config_value("audio_cache_enabled", True))
+
+        self._lock = threading.Lock()
+        # Running totals; None until the directory is first scanned
+        self._total_size: Optional[int] = None
+        self._entries: Optional[int] = None
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def make_key(
+        self,
+        provider_name: str,
+        text: str,
+        voice: Optional[str] = None,
+        output_format: Optional[str] = None,
+        **options: Any,
+    ) -> str:
+        """Build the content address for a synthesis request.
+
+        Args:
+            provider_name: Provider registry name
+            text: Text to synthesize
+            voice: Resolved voice name
+            output_format: Requested audio format
+            **options: Remaining provider options (rate, pitch, model, ...); defaults the
+                provider reads from config are covered by the config fingerprint
+
+        Returns:
+            Hex digest identifying the audio
+        """
+        audio_options = {k: v for k, v in options.items() if k not in _NON_AUDIO_OPTIONS and v is not None}
+
+        # Reference-audio voices (voice cloning) change when the file changes
+        voice_stamp = None
+        if voice and os.path.isfile(voice):
+            stat = os.stat(voice)
+            voice_stamp = [stat.st_size, stat.st_mtime_ns]
+
+        payload = json.dumps(
+            {
+                "provider": provider_name,
+                "voice": voice,
+                "voice_stamp": voice_stamp,
+                "output_format": (output_format or "").lower(),
+                "options": audio_options,
+                "text": normalize_text(text),
+                "config": get_config_snapshot().fingerprint,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.audio"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the cached file for a key, refreshing its LRU position.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Path of the cached audio, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            self._count("misses")
+            return None
+
+        now = time.time()
+        if now - stat.st_mtime > self.ttl:
+            self._remove(path, stat.st_size)
+            self._count("misses")
+            return None
+
+        try:
+            # Record the access explicitly; relatime/noatime mounts don't
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+        self._count("hits")
+        return path
+
+    def get(self, key: str, output_path: str) -> bool:
+        """Copy a cached entry to output_path.
+
+        Args:
+            key: Key from make_key()
+            output_path: Destination file
+
+        Returns:
+            True on a hit, False on a miss
+        """
+        cached = self.lookup(key)
+        if cached is None:
+            return False
+        try:
+            shutil.copyfile(cached, output_path)
+        except FileNotFoundError:
+            # Evicted by another process between lookup and copy
+            return False
+        logger.debug(f"Audio cache hit {key[:12]} -> {output_path}")
+        return True
+
+    def put(self, key: str, source_path: str) -> Optional[Path]:
+        """Store a synthesized file under a key.
+
+        The cache is non-critical: failures are logged and swallowed.
+
+        Args:
+            key: Key from make_key()
+            source_path: Audio file to copy into the cache
+
+        Returns:
+            Path of the cached entry, or None if it was not stored
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            size = os.path.getsize(source_path)
+            if size == 0 or size > self.max_size:
+                return None
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._entry_path(key)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".audio")
+            try:
+                with os.fdopen(fd, "wb") as tmp, open(source_path, "rb") as src:
+                    shutil.copyfileobj(src, tmp)
+                existed = path.exists()
+                previous = path.stat().st_size if existed else 0
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Audio cache write failed for {key[:12]}: {e}")
+            return None
+
+        with self._lock:
+            self._stats["stores"] += 1
+            if self._total_size is not None:
+                self._total_size += size - previous
+            if self._entries is not None and not existed:
+                self._entries += 1
+        self._evict_if_needed()
+        return path
+
+    def _scan(self) -> List[Tuple[Path, os.stat_result]]:
+        """List cache entries with their stat results."""
+        entries = []
+        try:
+            for path in self.cache_dir.glob("*.audio"):
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    entries.append((path, path.stat()))
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Drop expired entries, then least recently used ones until under budget."""
+        with self._lock:
+            if self._total_size is not None and self._total_size <= self.max_size:
+                return
+
+        entries = self._scan()
+        now = time.time()
+        total = sum(stat.st_size for _, stat in entries)
+        evicted = 0
+
+        if total > self.max_size:
+            live = []
+            for path, stat in entries:
+                if now - stat.st_mtime > self.ttl:
+                    total -= self._unlink(path, stat.st_size)
+                    evicted += 1
+                else:
+                    live.append((path, stat))
+
+            for path, stat in sorted(live, key=lambda entry: entry[1].st_atime):
+                if total <= self.max_size:
+                    break
+                total -= self._unlink(path, stat.st_size)
+                evicted += 1
+
+        with self._lock:
+            self._total_size = total
+            self._entries = len(entries) - evicted
+            self._stats["evictions"] += evicted
+        if evicted:
+            logger.debug(f"Audio cache evicted {evicted} entries")
+
+    def _unlink(self, path: Path, size: int) -> int:
+        """Delete a file, returning the number of bytes freed."""
+        try:
+            path.unlink()
+            return size
+        except OSError:
+            return 0
+
+    def _ensure_totals(self) -> None:
+        """Scan the directory once to seed the running entry and byte totals."""
+        with self._lock:
+            if self._total_size is not None and self._entries is not None:
+                return
+        entries = self._scan()
+        with self._lock:
+            self._total_size = sum(stat.st_size for _, stat in entries)
+            self._entries = len(entries)
+
+    def _remove(self, path: Path, size: int) -> None:
+        freed = self._unlink(path, size)
+        with self._lock:
+            self._stats["evictions"] += 1
+            if self._total_size is not None:
+                self._total_size -= freed
+            if self._entries is not None and freed:
+                self._entries -= 1
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def clear(self) -> int:
+        """Delete every cached entry.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path, stat in self._scan():
+            if self._unlink(path, stat.st_size):
+                removed += 1
+        with self._lock:
+            self._total_size = 0
+            self._entries = 0
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/store/eviction counters, entry count and size
+        """
+        self._ensure_totals()
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            entries = self._entries or 0
+            size = self._total_size or 0
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+                "entries": entries,
+                "size_bytes": size,
+                "max_size_bytes": self.max_size,
+                "cache_dir": str(self.cache_dir),
+            }
+        )
+        return stats
@@ -0,0 +1,320 @@
+"""Long-lived audio output for back-to-back utterances.
+
+Starting ffplay for every utterance costs a process spawn and an audio device
+open each time, and leaves an audible gap between consecutive sentences. An
+AudioSink stays open instead and is fed decoded PCM (16-bit mono at
+PCM_SAMPLE_RATE, the "pcm" output format):
+
+- write() queues a buffer; a writer thread hands buffers to the output in
+  order, so one utterance runs straight into the next
+- The queue is bounded, so write() blocks while it is full (backpressure)
+- wait() returns once everything written has (nearly) played; clear() drops
+  queued audio and silences what is playing (barge-in)
+
+FfplaySink keeps one ffplay process reading raw PCM on stdin. NullSink and
+FileSink stand in for it in tests and on machines without speakers.
+"""
+
+import logging
+import queue
+import subprocess
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from ..exceptions import AudioPlaybackError
+from .audio_utils import PCM_BYTES_PER_SECOND, PCM_SAMPLE_RATE, create_ffplay_process
+
+logger = logging.getLogger(__name__)
+
+
+class AudioSink(ABC):
+    """Ordered, gapless output of PCM buffers on a writer thread.
+
+    Subclasses implement _output(), which runs on the writer thread, and may
+    override _stop_output() and _close_output(), called by clear() and close().
+
+    Usage:
+        sink = FfplaySink()
+        for buffer in pcm_buffers:
+            sink.write(buffer)
+        sink.wait()
+        sink.close()
+    """
+
+    # Whether the output consumes audio at playback speed; wait() only has
+    # to wait for the audio to play out on real-time outputs
+    REALTIME = True
+
+    def __init__(self, max_buffers: int = 64) -> None:
+        """Initialize an idle sink; the writer thread starts on the first write.
+
+        Args:
+            max_buffers: Buffers queued before write() blocks
+        """
+        self._queue: "queue.Queue[Optional[Tuple[int, bytes]]]" = queue.Queue(max(1, max_buffers))
+        self._cond = threading.Condition()
+        self._generation = 0  # Bumped by clear(); buffers from older generations are dropped
+        self._output_generation = 0  # Generation of the buffer being output
+        self._pending = 0  # Buffers written but not output yet
+        self._play_until = 0.0  # time.monotonic() at which the output runs dry
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, pcm: bytes) -> None:
+        """Queue a PCM buffer behind everything written before it.
+
+        Raises:
+            AudioPlaybackError: If the sink is closed or the output failed
+        """
+        with self._cond:
+            if self._closed:
+                raise AudioPlaybackError("Audio sink is closed")
+            self._raise_error()
+            if not pcm:
+                return
+            self._pending += 1
+            generation = self._generation
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="voice_audio_sink", daemon=True)
+                self._thread.start()
+        self._queue.put((generation, pcm))
+
+    def wait(self, lead: float = 0.0, timeout: Optional[float] = None) -> bool:
+        """Block until written audio has played, or until clear() drops it.
+
+        Args:
+            lead: Return this many seconds before the audio runs out, so the
+                next utterance can be queued without a gap
+            timeout: Longest wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the audio played (or was cleared), False on timeout
+
+        Raises:
+            AudioPlaybackError: If the output failed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            generation = self._generation
+
+            def settled() -> bool:
+                if self._generation != generation or self._closed or self._error is not None:
+                    return True
+                if self._pending:
+                    return False
+                return not self.REALTIME or self._play_until - lead <= time.monotonic()
+
+            while not settled():
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    return False
+                # Woken by the writer thread, or when the remaining audio should have played
+                until = self._play_until - lead if not self._pending else now + 0.05
+                limit = until if deadline is None else min(until, deadline)
+                self._cond.wait(max(0.001, limit - now))
+            if self._generation == generation:
+                self._raise_error()
+            return True
+
+    def remaining(self) -> float:
+        """Seconds of written audio that have not finished playing (an estimate)."""
+        with self._cond:
+            queued = sum(len(item[1]) for item in list(self._queue.queue) if item is not None)
+            playing = max(0.0, self._play_until - time.monotonic()) if self.REALTIME else 0.0
+            return playing + queued / PCM_BYTES_PER_SECOND
+
+    def clear(self) -> None:
+        """Drop queued audio and stop what is playing; the sink stays usable."""
+        with self._cond:
+            self._generation += 1
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self._pending -= 1
+            self._play_until = 0.0
+            self._error = None
+            self._cond.notify_all()
+        self._stop_output()
+
+    def close(self) -> None:
+        """Stop the writer thread and release the output."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        self._close_output()
+
+    def _cleared(self) -> bool:
+        """Whether clear() was called since the buffer being output was written."""
+        with self._cond:
+            return self._output_generation != self._generation
+
+    def _raise_error(self) -> None:
+        """Report (once) an output error from the writer thread; call with _cond held."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise AudioPlaybackError(f"Audio output failed: {error}") from error
+
+    def _run(self) -> None:
+        """Output queued buffers in order until close()."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            generation, pcm = item
+            with self._cond:
+                current = generation == self._generation
+                self._output_generation = generation
+            try:
+                if current:
+                    self._output(pcm)
+            except Exception as e:
+                with self._cond:
+                    if generation == self._generation:  # Errors from cleared audio are expected
+                        logger.warning(f"Audio sink output failed: {e}")
+                        self._error = e
+            with self._cond:
+                # Buffers still queued at a clear() are counted off there; this one was not
+                self._pending -= 1
+                if current and generation == self._generation:
+                    start = max(self._play_until, time.monotonic())
+                    self._play_until = start + len(pcm) / PCM_BYTES_PER_SECOND
+                self._cond.notify_all()
+
+    @abstractmethod
+    def _output(self, pcm: bytes) -> None:
+        """Hand one buffer to the output device, blocking while it is busy."""
+
+    def _stop_output(self) -> None:  # noqa: B027 - optional hook, outputs without a device buffer skip it
+        """Silence audio the output has already accepted."""
+
+    def _close_output(self) -> None:  # noqa: B027 - optional hook, outputs without a device skip it
+        """Release the output device."""
+
+
+class FfplaySink(AudioSink):
+    """One resident ffplay process playing raw PCM from its stdin.
+
+    ffplay keeps its own buffer, so clear() ends the process to silence it at
+    once; the next write starts a new one.
+    """
+
+    def __init__(self, max_buffers: int = 64) -> None:
+        super().__init__(max_buffers)
+        self._process: Optional[subprocess.Popen] = None
+        self._process_lock = threading.Lock()
+
+    def _output(self, pcm: bytes) -> None:
+        with self._process_lock:
+            if self._cleared():
+                return  # Do not start a new ffplay for audio that was just dropped
+            process = self._process
+            if process is None or process.poll() is not None:
+                # Raw PCM is mono by default; only the rate needs to be given
+                process = self._process = create_ffplay_process(
+                    logger=logger, format_args=["-f", "s16le", "-sample_rate", str(PCM_SAMPLE_RATE)]
+                )
+                logger.debug("Started resident ffplay for the audio sink")
+        assert process.stdin is not None
+        try:
+            process.stdin.write(pcm)
+            process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise AudioPlaybackError("ffplay stopped reading audio") from e
+
+    def _stop_output(self) -> None:
+        with self._process_lock:
+            process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def _close_output(self) -> None:
+        with self._process_lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+        except OSError:
+            pass
+        try:
+            # Let the buffered tail play out
+            process.wait(timeout=max(1.0, self.remaining()) + 1.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+class NullSink(AudioSink):
+    """Discard audio, counting what was written."""
+
+    REALTIME = False
+
+    def __init__(self, max_buffers: int = 64) -> None:
+        super().__init__(max_buffers)
+        self.bytes_written = 0
+
+    def _output(self, pcm: bytes) -> None:
+        self.bytes_written += len(pcm)
+
+
+class FileSink(AudioSink):
+    """Record audio to a WAV file instead of playing it."""
+
+    REALTIME = False
+
+    def __init__(self, path: str, max_buffers: int = 64) -> None:
+        """Initialize the sink; the file is created on the first write.
+
+        Args:
+            path: WAV file to write
+            max_buffers: Buffers queued before write() blocks
+        """
+        super().__init__(max_buffers)
+        self.path = path
+        self._file: Optional[wave.Wave_write] = None
+
+    def _output(self, pcm: bytes) -> None:
+        if self._file is None:
+            self._file = wave.open(self.path, "wb")
+            self._file.setnchannels(1)
+            self._file.setsampwidth(2)
+            self._file.setframerate(PCM_SAMPLE_RATE)
+        self._file.writeframes(pcm)
+
+    def _close_output(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def create_audio_sink(spec: str) -> AudioSink:
+    """Create a sink from its configured name.
+
+    Args:
+        spec: "ffplay", "null", or "file:<path>" for a WAV recording
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if spec == "ffplay":
+        return FfplaySink()
+    if spec == "null":
+        return NullSink()
+    if spec.startswith("file:") and len(spec) > len("file:"):
+        return FileSink(spec[len("file:") :])
+    raise ValueError(f"Unknown audio sink '{spec}' (expected ffplay, null or file:<path>)")
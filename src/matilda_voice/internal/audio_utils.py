@@ -1,15 +1,33 @@
 """Shared audio utilities for TTS providers to avoid code duplication."""
 
+import asyncio
 import logging
 import os
+import struct
 import subprocess
 import tempfile
 import threading
 import time
-from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+import wave
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from ..exceptions import AudioPlaybackError, DependencyError
 from .config import get_config_value
+from .timings import record_timing, timing_span
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -57,6 +75,118 @@ def parse_bool_param(value: Any, default: bool = False) -> bool:
 # =============================================================================
 
 
+class JitterBuffer:
+    """Bounded FIFO of audio chunks between a network reader and a pipe writer.
+
+    The reader put()s chunks as they arrive; a writer thread get()s them,
+    joined into larger writes. This decouples the two sides, so a slow pipe
+    write does not stall the network read and a network hiccup does not starve
+    the player while buffered audio remains:
+
+    - get() holds back the first audio until start_threshold chunks arrived
+      (pre-roll), so playback does not start on a nearly empty buffer
+    - put() blocks while max_bytes are buffered (backpressure on the reader)
+    - abort() wakes both sides, e.g. once the player process has gone
+    """
+
+    def __init__(self, max_bytes: int = 262144, start_threshold: int = 3) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            max_bytes: Buffered bytes at which put() blocks
+            start_threshold: Chunks to buffer before get() returns the first audio
+        """
+        self.max_bytes = max(1, max_bytes)
+        self.start_threshold = max(1, start_threshold)
+        self._chunks: Deque[bytes] = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._started = False
+        self._closed = False
+        self._aborted = False
+
+    @property
+    def aborted(self) -> bool:
+        """Whether abort() was called."""
+        return self._aborted
+
+    def buffered_bytes(self) -> int:
+        """Bytes waiting for the writer."""
+        with self._cond:
+            return self._size
+
+    def put(self, chunk: bytes, block: bool = True) -> bool:
+        """Add a chunk, waiting while the buffer is full.
+
+        Args:
+            chunk: Audio bytes
+            block: Wait for room; if False, return False at once when full
+
+        Returns:
+            True once the chunk is buffered, False if it was not (full without
+            block, or aborted)
+        """
+        with self._cond:
+            while self._size >= self.max_bytes and not self._aborted:
+                if not block:
+                    return False
+                self._cond.wait(0.1)  # Wake up now and then so KeyboardInterrupt gets through
+            if self._aborted:
+                return False
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            self._cond.notify_all()
+            return True
+
+    async def put_async(self, chunk: bytes) -> bool:
+        """put() from the event loop; only waits in a thread while the buffer is full."""
+        if self.put(chunk, block=False):
+            return True
+        if self._aborted:
+            return False
+        return await asyncio.to_thread(self.put, chunk)
+
+    def get(self, max_bytes: int) -> bytes:
+        """Take buffered chunks, joined up to about max_bytes, waiting for pre-roll first.
+
+        Returns:
+            Audio bytes, or b"" once the buffer is closed and empty, or aborted
+        """
+        with self._cond:
+            while not self._aborted:
+                if not self._started:
+                    self._started = (
+                        len(self._chunks) >= self.start_threshold or self._size >= self.max_bytes or self._closed
+                    )
+                if self._started and (self._chunks or self._closed):
+                    break
+                self._cond.wait()
+            if self._aborted or not self._chunks:
+                return b""
+            parts = [self._chunks.popleft()]
+            size = len(parts[0])
+            while self._chunks and size + len(self._chunks[0]) <= max_bytes:
+                parts.append(self._chunks.popleft())
+                size += len(parts[-1])
+            self._size -= size
+            self._cond.notify_all()
+        return b"".join(parts)
+
+    def close(self) -> None:
+        """Mark the end of the stream; get() drains what is left, then returns b""."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def abort(self) -> None:
+        """Drop buffered audio and release both sides."""
+        with self._cond:
+            self._aborted = True
+            self._chunks.clear()
+            self._size = 0
+            self._cond.notify_all()
+
+
 class StreamingPlayer:
     """Handles real-time audio streaming with progress tracking.
 
@@ -67,6 +197,8 @@ class StreamingPlayer:
     - Chunk counting and byte tracking
     - First-chunk latency measurement
     - Progress logging at configurable intervals
+    - A JitterBuffer between the caller and a pipe-writer thread, with pre-roll,
+      coalesced writes and backpressure
     - Broken pipe handling
     - Proper process cleanup
     - Keyboard interrupt handling
@@ -92,6 +224,8 @@ class StreamingPlayer:
         format_args: Optional[List[str]] = None,
         progress_interval: Optional[int] = None,
         pulse_available: bool = False,
+        start_threshold: Optional[int] = None,
+        buffer_bytes: Optional[int] = None,
     ):
         """Initialize the streaming player.
 
@@ -100,6 +234,8 @@ class StreamingPlayer:
             format_args: FFplay format arguments (e.g., ["-f", "mp3"])
             progress_interval: Log progress every N chunks (default from config)
             pulse_available: Whether PulseAudio is available (for format selection)
+            start_threshold: Chunks to buffer before playback starts (default from config)
+            buffer_bytes: Buffered bytes at which reading pauses (default from config)
         """
         self.provider_name = provider_name
         self.format_args = format_args or []
@@ -110,7 +246,12 @@ class StreamingPlayer:
         self.first_chunk_time: Optional[float] = None
         self.start_time: Optional[float] = None
         self.progress_interval = progress_interval or get_config_value("streaming_progress_interval", 100)
+        self.start_threshold = start_threshold or get_config_value("streaming_playback_start_threshold", 3)
+        self.buffer_bytes = buffer_bytes or get_config_value("streaming_buffer_max_bytes", 262144)
+        self.write_size = get_config_value("streaming_write_coalesce_bytes", 16384)
         self._ffplay_process: Optional[subprocess.Popen] = None
+        self._buffer: Optional[JitterBuffer] = None
+        self._writer: Optional[threading.Thread] = None
 
     def _create_process(self) -> subprocess.Popen:
         """Create the ffplay process with appropriate format args."""
@@ -129,20 +270,20 @@ class StreamingPlayer:
             DependencyError: If ffplay is not available
             AudioPlaybackError: If streaming fails
         """
-        self.start_time = time.time()
-        self._ffplay_process = self._create_process()
+        buffer = self._start()
 
         try:
             for chunk in chunks:
-                if not self._process_chunk(chunk, self._ffplay_process):
+                if not self._process_chunk(chunk) or not buffer.put(chunk):
                     break
         except KeyboardInterrupt:
             self._terminate_process()
             raise
-        except BrokenPipeError:
-            self._handle_broken_pipe(self._ffplay_process)
         finally:
-            self._cleanup(self._ffplay_process)
+            self._finish()
+
+    # Name used by older StreamPlayer call sites
+    play = play_chunks
 
     async def play_chunks_async(self, chunks: AsyncIterator[bytes]) -> None:
         """Stream audio chunks to ffplay asynchronously.
@@ -154,20 +295,17 @@ class StreamingPlayer:
             DependencyError: If ffplay is not available
             AudioPlaybackError: If streaming fails
         """
-        self.start_time = time.time()
-        self._ffplay_process = self._create_process()
+        buffer = self._start()
 
         try:
             async for chunk in chunks:
-                if not self._process_chunk(chunk, self._ffplay_process):
+                if not self._process_chunk(chunk) or not await buffer.put_async(chunk):
                     break
         except KeyboardInterrupt:
             self._terminate_process()
             raise
-        except BrokenPipeError:
-            self._handle_broken_pipe(self._ffplay_process)
         finally:
-            self._cleanup(self._ffplay_process)
+            self._finish()
 
     async def play_async(
         self,
@@ -180,23 +318,20 @@ class StreamingPlayer:
             chunks: Async iterator of source chunks.
             transform: Optional transformer to extract bytes from each chunk.
         """
-        self.start_time = time.time()
-        self._ffplay_process = self._create_process()
+        buffer = self._start()
 
         try:
             async for chunk in chunks:
                 data = transform(chunk) if transform else chunk
                 if not data:
                     continue
-                if not self._process_chunk(data, self._ffplay_process):
+                if not self._process_chunk(data) or not await buffer.put_async(data):
                     break
         except KeyboardInterrupt:
             self._terminate_process()
             raise
-        except BrokenPipeError:
-            self._handle_broken_pipe(self._ffplay_process)
         finally:
-            self._cleanup(self._ffplay_process)
+            self._finish()
 
     async def play_edge_tts_stream(self, stream: AsyncIterator[Dict[str, Any]]) -> None:
         """Stream Edge TTS audio chunks (dict format with 'type' and 'data' keys).
@@ -211,24 +346,46 @@ class StreamingPlayer:
             DependencyError: If ffplay is not available
             AudioPlaybackError: If streaming fails
         """
+        await self.play_async(stream, transform=lambda chunk: chunk["data"] if chunk.get("type") == "audio" else None)
+
+    def _start(self) -> JitterBuffer:
+        """Start ffplay and the thread writing buffered audio to it."""
         self.start_time = time.time()
         self._ffplay_process = self._create_process()
+        self._buffer = JitterBuffer(max_bytes=self.buffer_bytes, start_threshold=self.start_threshold)
+        self._writer = threading.Thread(
+            target=self._write_loop, args=(self._buffer, self._ffplay_process), name="voice_stream_writer", daemon=True
+        )
+        self._writer.start()
+        return self._buffer
 
+    def _write_loop(self, buffer: JitterBuffer, process: subprocess.Popen) -> None:
+        """Write buffered audio to ffplay until the stream ends (writer thread)."""
         try:
-            async for chunk in stream:
-                if chunk.get("type") == "audio":
-                    if not self._process_chunk(chunk["data"], self._ffplay_process):
-                        break
-        except KeyboardInterrupt:
-            self._terminate_process()
-            raise
-        except BrokenPipeError:
-            self._handle_broken_pipe(self._ffplay_process)
-        finally:
-            self._cleanup(self._ffplay_process)
+            while True:
+                data = buffer.get(self.write_size)
+                if not data:
+                    return
+                if process.stdin is not None:
+                    process.stdin.write(data)
+                    process.stdin.flush()
+                    self.bytes_written += len(data)
+        except (BrokenPipeError, ValueError):
+            # ffplay ended early (or its stdin was closed by an interrupt); stop the reader too
+            self._handle_broken_pipe(process)
+            buffer.abort()
+
+    def _finish(self) -> None:
+        """Let the writer drain the buffer, then clean up ffplay."""
+        assert self._buffer is not None and self._writer is not None and self._ffplay_process is not None
+        self._buffer.close()
+        self._writer.join()
+        self._cleanup(self._ffplay_process)
 
     def _terminate_process(self) -> None:
         """Terminate the ffplay process gracefully."""
+        if self._buffer is not None:
+            self._buffer.abort()
         if self._ffplay_process and self._ffplay_process.poll() is None:
             self._ffplay_process.terminate()
             try:
@@ -236,43 +393,31 @@ class StreamingPlayer:
             except subprocess.TimeoutExpired:
                 self._ffplay_process.kill()
 
-    def _process_chunk(self, chunk: bytes, process: subprocess.Popen) -> bool:
-        """Process a single audio chunk.
+    def _process_chunk(self, chunk: bytes) -> bool:
+        """Account for a chunk received from the provider.
 
         Args:
             chunk: Audio data bytes
-            process: FFplay subprocess
 
         Returns:
-            True to continue, False to stop
+            True to continue, False to stop (the writer has given up)
         """
         self.chunk_count += 1
 
         # Track first chunk latency
         if self.chunk_count == 1:
             self.first_chunk_time = time.time()
+            if self.start_time:
+                record_timing("playback_start", self.first_chunk_time - self.start_time)
             self.logger.debug(f"[{self.provider_name}] First audio chunk received - starting playback")
 
-        try:
-            if process.stdin is not None:
-                process.stdin.write(chunk)
-                process.stdin.flush()
-                self.bytes_written += len(chunk)
-
-            # Log progress periodically
-            if self.chunk_count % self.progress_interval == 0:
-                self.logger.debug(
-                    f"[{self.provider_name}] Streamed {self.chunk_count} chunks, " f"{self.bytes_written} bytes"
-                )
-
-            return True
+        # Log progress periodically
+        if self.chunk_count % self.progress_interval == 0:
+            self.logger.debug(
+                f"[{self.provider_name}] Streamed {self.chunk_count} chunks, " f"{self.bytes_written} bytes"
+            )
 
-        except BrokenPipeError:
-            # Check if ffplay ended early
-            if process.poll() is not None:
-                self._handle_broken_pipe(process)
-                return False
-            raise
+        return self._buffer is None or not self._buffer.aborted
 
     def _handle_broken_pipe(self, process: subprocess.Popen) -> None:
         """Handle broken pipe error from ffplay.
@@ -290,6 +435,8 @@ class StreamingPlayer:
             self.logger.warning(
                 f"[{self.provider_name}] FFplay ended early " f"(exit code: {process.returncode}): {stderr}"
             )
+            # The audio device may have gone away; probe again next time
+            invalidate_audio_environment()
 
     def _cleanup(self, process: subprocess.Popen) -> None:
         """Clean up ffplay process and log metrics.
@@ -694,12 +841,53 @@ def handle_ffplay_process_error(process: subprocess.Popen, logger: logging.Logge
             logger.debug(f"FFplay {context} completed successfully")
 
 
-def check_audio_environment() -> Dict[str, Any]:
+# Probe result shared by every streaming call: (monotonic time, PULSE_SERVER, result)
+_audio_environment: Optional[Tuple[float, Optional[str], Dict[str, Any]]] = None
+_audio_environment_generation = 0  # Bumped by invalidate_audio_environment()
+_audio_environment_lock = threading.Lock()
+
+
+def check_audio_environment(refresh: bool = False) -> Dict[str, Any]:
     """Check if audio streaming is available in current environment.
 
+    The probe can spawn `aplay`, so its result is cached process-wide for
+    audio_environment_ttl_seconds (and until PULSE_SERVER changes or
+    invalidate_audio_environment() is called).
+
+    Args:
+        refresh: Probe again even if a cached result is still fresh
+
     Returns:
         Dict with 'available' (bool), 'reason' (str), and device availability flags
     """
+    global _audio_environment
+    pulse_server = os.environ.get("PULSE_SERVER")
+    ttl = get_config_value("audio_environment_ttl_seconds", 300)
+    with _audio_environment_lock:
+        cached = _audio_environment
+        generation = _audio_environment_generation
+    if not (refresh or cached is None or cached[1] != pulse_server or time.monotonic() - cached[0] >= ttl):
+        return dict(cached[2])
+
+    # The probe can take seconds, so it runs unlocked; checks meanwhile see the old result
+    result = _probe_audio_environment()
+    with _audio_environment_lock:
+        # A probe that started before invalidate_audio_environment() is not published
+        if _audio_environment_generation == generation:
+            _audio_environment = (time.monotonic(), pulse_server, result)
+    return dict(result)
+
+
+def invalidate_audio_environment() -> None:
+    """Forget the cached probe result, e.g. after an audio device came or went."""
+    global _audio_environment, _audio_environment_generation
+    with _audio_environment_lock:
+        _audio_environment = None
+        _audio_environment_generation += 1
+
+
+def _probe_audio_environment() -> Dict[str, Any]:
+    """Probe for PulseAudio, ALSA devices or a responsive audio system."""
     result = {"available": False, "reason": "Unknown", "pulse_available": False, "alsa_available": False}
 
     # Check for PulseAudio
@@ -711,7 +899,8 @@ def check_audio_environment() -> Dict[str, Any]:
 
     # Check for ALSA devices
     try:
-        if os.path.exists("/proc/asound/cards") and os.path.getsize("/proc/asound/cards") > 0:
+        cards = "/proc/asound/cards"
+        if os.path.exists(cards) and os.path.getsize(cards) > get_config_value("audio_cards_min_size", 0):
             result["alsa_available"] = True
             result["available"] = True
             result["reason"] = "ALSA devices available"
@@ -721,7 +910,12 @@ def check_audio_environment() -> Dict[str, Any]:
 
     # Check if we can reach audio system
     try:
-        subprocess.run(["aplay", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
+        subprocess.run(
+            ["aplay", "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=get_config_value("audio_check_timeout", 2),
+        )
         result["available"] = True
         result["reason"] = "Audio system responsive"
         return result
@@ -743,7 +937,8 @@ def stream_audio_file(audio_path: str) -> None:
         AudioPlaybackError: If playback fails
     """
     manager = get_audio_manager()
-    manager.play_and_forget(audio_path)
+    with timing_span("playback"):
+        manager.play_and_forget(audio_path)
 
 
 def convert_audio(input_path: str, output_path: str, output_format: str) -> None:
@@ -759,7 +954,8 @@ def convert_audio(input_path: str, output_path: str, output_format: str) -> None
         ProviderError: If conversion fails
     """
     try:
-        subprocess.run(["ffmpeg", "-i", input_path, "-y", output_path], stderr=subprocess.DEVNULL, check=True)
+        with timing_span("convert"):
+            subprocess.run(["ffmpeg", "-i", input_path, "-y", output_path], stderr=subprocess.DEVNULL, check=True)
     except FileNotFoundError as e:
         raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
     except subprocess.CalledProcessError as e:
@@ -790,6 +986,451 @@ def convert_with_cleanup(input_path: str, output_path: str, output_format: str)
         cleanup_file(input_path, logger)
 
 
+def save_audio_bytes(audio_data: bytes, output_path: str, source_format: str, output_format: str) -> None:
+    """Write provider audio to a file, converting when the formats differ.
+
+    Args:
+        audio_data: Encoded audio as returned by the provider
+        output_path: Destination file
+        source_format: Format of audio_data (e.g. "mp3", "wav")
+        output_format: Requested output format
+
+    Raises:
+        DependencyError: If conversion is needed and ffmpeg is not found
+        ProviderError: If conversion fails
+    """
+    if output_format.lower() == source_format.lower():
+        with timing_span("file_write"), open(output_path, "wb") as f:
+            f.write(audio_data)
+        return
+
+    transcode_chunks([audio_data], source_format, output_path, output_format)
+
+
+# Raw "pcm" audio is 16-bit little-endian mono at this rate, as OpenAI and
+# ElevenLabs (pcm_24000) return it
+PCM_SAMPLE_RATE = 24000
+PCM_BYTES_PER_SECOND = PCM_SAMPLE_RATE * 2
+
+# ffmpeg muxer/demuxer names; pipes cannot be probed by file extension
+FFMPEG_FORMATS = {
+    "pcm": "s16le",
+    "mp3": "mp3",
+    "wav": "wav",
+    "ogg": "ogg",
+    "opus": "ogg",
+    "flac": "flac",
+    "aac": "adts",
+    "m4a": "ipod",
+}
+
+# Formats ffmpeg can write to a pipe; MP4 containers need a seekable output
+PIPE_FORMATS = frozenset(FFMPEG_FORMATS) - {"m4a"}
+
+# Formats whose streams can be joined byte for byte; other containers carry a
+# header per file, so separately synthesized parts cannot simply be appended
+CONCAT_FORMATS = frozenset({"mp3", "aac", "pcm"})
+
+
+def _format_args(audio_format: str) -> List[str]:
+    """ffmpeg arguments naming a format; raw PCM also needs its layout spelled out."""
+    name = FFMPEG_FORMATS.get(audio_format.lower())
+    if name is None:
+        return []
+    if name == "s16le":
+        return ["-f", name, "-ar", str(PCM_SAMPLE_RATE), "-ac", "1"]
+    return ["-f", name]
+
+
+def _transcode_command(source_format: str, output_format: str, output: str) -> List[str]:
+    """Build an ffmpeg command reading source_format on stdin and writing output."""
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *_format_args(source_format), "-i", "pipe:0", "-y"]
+    cmd.extend(_format_args(output_format))
+    cmd.append(output)
+    return cmd
+
+
+def _check_transcode(returncode: Optional[int]) -> None:
+    """Raise ProviderError if an ffmpeg transcoder exited unsuccessfully."""
+    if returncode:
+        from ..exceptions import ProviderError
+
+        raise ProviderError(f"Audio conversion failed: ffmpeg exited with status {returncode}")
+
+
+def _start_transcoder(cmd: List[str], stdout: Any) -> subprocess.Popen:
+    try:
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=stdout, stderr=subprocess.DEVNULL)
+    except FileNotFoundError as e:
+        raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+
+
+def transcode_chunks(chunks: Iterable[bytes], source_format: str, output_path: str, output_format: str) -> None:
+    """Convert encoded audio to another format through ffmpeg's stdin, as it arrives.
+
+    Chunks are piped to ffmpeg while it encodes straight into output_path, so
+    conversion overlaps the download and no intermediate file is written.
+
+    Args:
+        chunks: Encoded audio in source_format, e.g. a provider's response stream
+        source_format: Format of the chunks (e.g. "mp3", "wav")
+        output_path: Destination file
+        output_format: Requested output format
+
+    Raises:
+        DependencyError: If ffmpeg is not found
+        ProviderError: If conversion fails
+    """
+    with timing_span("convert"):
+        process = _start_transcoder(_transcode_command(source_format, output_format, output_path), subprocess.DEVNULL)
+        assert process.stdin is not None
+        try:
+            for chunk in chunks:
+                if chunk:
+                    process.stdin.write(chunk)
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg stopped reading; its exit status says why
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        _check_transcode(process.wait())
+
+
+async def transcode_chunks_async(
+    chunks: AsyncIterator[bytes], source_format: str, output_path: str, output_format: str
+) -> None:
+    """Async counterpart of transcode_chunks(); ffmpeg is fed without blocking the event loop."""
+    with timing_span("convert"):
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *_transcode_command(source_format, output_format, output_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+        assert process.stdin is not None
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    process.stdin.write(chunk)
+                    await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg stopped reading; its exit status says why
+        except BaseException:
+            process.kill()
+            await process.wait()
+            raise
+        _check_transcode(await process.wait())
+
+
+def iter_transcoded(
+    chunks: Iterable[bytes], source_format: str, output_format: str, chunk_size: Optional[int] = None
+) -> Generator[bytes, None, None]:
+    """Convert encoded audio through ffmpeg's pipes, yielding output as it is encoded.
+
+    A feeder thread writes chunks to ffmpeg's stdin while the caller reads its
+    stdout, so the first converted bytes are available before the source ends.
+    Formats that need a seekable output (m4a) cannot be produced this way.
+
+    Args:
+        chunks: Encoded audio in source_format
+        source_format: Format of the chunks
+        output_format: Requested output format
+        chunk_size: Largest piece to yield (default: http_streaming_chunk_size)
+
+    Yields:
+        Encoded audio in output_format
+
+    Raises:
+        DependencyError: If ffmpeg is not found
+        ProviderError: If conversion fails
+    """
+    size = chunk_size or get_config_value("http_streaming_chunk_size", 65536)
+    process = _start_transcoder(_transcode_command(source_format, output_format, "pipe:1"), subprocess.PIPE)
+    assert process.stdin is not None and process.stdout is not None
+    feed_error: List[BaseException] = []
+
+    def feed() -> None:
+        assert process.stdin is not None
+        try:
+            for chunk in chunks:
+                if chunk:
+                    process.stdin.write(chunk)
+        except BrokenPipeError:
+            pass
+        except BaseException as e:  # Reported to the reader below
+            feed_error.append(e)
+            process.kill()
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+    feeder = threading.Thread(target=feed, name="voice_transcode_feed", daemon=True)
+    feeder.start()
+    finished = False
+    try:
+        while True:
+            data = process.stdout.read1(size)  # type: ignore[attr-defined]
+            if not data:
+                break
+            yield data
+        finished = True
+    finally:
+        if not finished:
+            # The consumer stopped early; nobody will read the rest
+            process.kill()
+        process.stdout.close()
+        returncode = process.wait()
+        feeder.join()
+    if feed_error:
+        raise feed_error[0]
+    _check_transcode(returncode)
+
+
+async def iter_transcoded_async(
+    chunks: AsyncIterator[bytes], source_format: str, output_format: str, chunk_size: Optional[int] = None
+) -> AsyncGenerator[bytes, None]:
+    """Async counterpart of iter_transcoded(); ffmpeg is fed and read on the event loop."""
+    size = chunk_size or get_config_value("http_streaming_chunk_size", 65536)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_transcode_command(source_format, output_format, "pipe:1"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError as e:
+        raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+    assert process.stdin is not None and process.stdout is not None
+
+    async def feed() -> None:
+        assert process.stdin is not None
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    process.stdin.write(chunk)
+                    await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except BaseException:
+            process.kill()  # Ends the reader below, which then re-raises
+            raise
+        finally:
+            process.stdin.close()
+
+    feeder = asyncio.ensure_future(feed())
+    try:
+        while True:
+            data = await process.stdout.read(size)
+            if not data:
+                break
+            yield data
+        await feeder
+    finally:
+        if not feeder.done():
+            # The consumer stopped early; nobody will read the rest
+            process.kill()
+            feeder.cancel()
+        await asyncio.gather(feeder, return_exceptions=True)
+        returncode = await process.wait()
+    _check_transcode(returncode)
+
+
+def concatenate_wav_files(input_paths: List[str], output_path: str) -> None:
+    """Join PCM WAV files end to end without re-encoding.
+
+    Samples are copied verbatim, so there is no encoder padding or silence
+    between the parts. All inputs must share channels, sample width and rate.
+
+    Args:
+        input_paths: WAV files in playback order
+        output_path: Path for the joined WAV file
+
+    Raises:
+        ValueError: If no inputs are given or their formats differ
+        wave.Error: If an input is not a PCM WAV file
+    """
+    if not input_paths:
+        raise ValueError("No WAV files to concatenate")
+
+    with wave.open(input_paths[0], "rb") as first:
+        expected = (first.getnchannels(), first.getsampwidth(), first.getframerate())
+
+    with timing_span("file_write"), wave.open(output_path, "wb") as out:
+        out.setnchannels(expected[0])
+        out.setsampwidth(expected[1])
+        out.setframerate(expected[2])
+        for path in input_paths:
+            with wave.open(path, "rb") as src:
+                params = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+                if params != expected:
+                    raise ValueError(f"WAV format mismatch in {path}: {params} != {expected}")
+                out.writeframes(src.readframes(src.getnframes()))
+
+
+def concatenate_audio_ffmpeg(input_paths: List[str], output_path: str) -> None:
+    """Join audio files of any format with ffmpeg's concat filter (re-encodes).
+
+    Args:
+        input_paths: Audio files in playback order
+        output_path: Path for the joined file (format from extension)
+
+    Raises:
+        DependencyError: If ffmpeg is not found
+        ProviderError: If concatenation fails
+    """
+    cmd = ["ffmpeg", "-y"]
+    for path in input_paths:
+        cmd.extend(["-i", path])
+    streams = "".join(f"[{i}:a]" for i in range(len(input_paths)))
+    cmd.extend(["-filter_complex", f"{streams}concat=n={len(input_paths)}:v=0:a=1[out]", "-map", "[out]"])
+    cmd.append(output_path)
+
+    try:
+        with timing_span("convert"):
+            subprocess.run(cmd, stderr=subprocess.DEVNULL, check=True)
+    except FileNotFoundError as e:
+        raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+    except subprocess.CalledProcessError as e:
+        from ..exceptions import ProviderError
+
+        raise ProviderError(f"Audio concatenation failed: {e}") from e
+
+
+def join_wav_chunks(chunk_paths: List[str], work_dir: str, output_path: str, output_format: str) -> None:
+    """Join chunk WAVs into output_path, converting if another format was requested.
+
+    Chunks are joined sample-accurately when their formats match, and with
+    ffmpeg's concat filter otherwise.
+
+    Args:
+        chunk_paths: Chunk WAV files in playback order
+        work_dir: Directory for the intermediate joined WAV
+        output_path: Destination file
+        output_format: Format of the destination file
+    """
+    try:
+        if output_format == "wav":
+            concatenate_wav_files(chunk_paths, output_path)
+        else:
+            joined_path = os.path.join(work_dir, "joined.wav")
+            concatenate_wav_files(chunk_paths, joined_path)
+            convert_audio(joined_path, output_path, output_format)
+    except (wave.Error, ValueError, EOFError) as e:
+        logger.warning(f"Sample-level join failed ({e}), concatenating with ffmpeg")
+        concatenate_audio_ffmpeg(chunk_paths, output_path)
+
+
+def wav_stream_header(nchannels: int, sampwidth: int, framerate: int) -> bytes:
+    """Build a WAV header for a PCM stream whose length is not known yet.
+
+    The RIFF and data sizes are set to 0xFFFFFFFF, which ffmpeg/ffplay treat as
+    "read until end of input".
+
+    Args:
+        nchannels: Number of channels
+        sampwidth: Bytes per sample
+        framerate: Samples per second
+
+    Returns:
+        44-byte canonical WAV header
+    """
+    block_align = nchannels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        0xFFFFFFFF,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        nchannels,
+        framerate,
+        framerate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        0xFFFFFFFF,
+    )
+
+
+def iter_wav_stream(paths: Iterable[str], frames_per_chunk: int = 4096) -> Iterator[bytes]:
+    """Yield one continuous WAV byte stream built from several WAV files.
+
+    The header comes from the first file; every file then contributes only its
+    samples. Paths are consumed lazily, so a generator that blocks until each
+    part is synthesized starts playback as soon as the first part is ready.
+
+    Args:
+        paths: WAV files in playback order
+        frames_per_chunk: Frames read per yielded chunk
+
+    Yields:
+        WAV header followed by raw PCM chunks
+
+    Raises:
+        AudioPlaybackError: If a file's format differs from the first one
+    """
+    expected = None
+    for path in paths:
+        with wave.open(path, "rb") as src:
+            params = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+            if expected is None:
+                expected = params
+                yield wav_stream_header(*params)
+            elif params != expected:
+                raise AudioPlaybackError(f"Cannot stream {path}: WAV format {params} differs from {expected}")
+            while True:
+                data = src.readframes(frames_per_chunk)
+                if not data:
+                    break
+                yield data
+
+
+# MIME types for the formats providers and ffmpeg produce
+AUDIO_MIME_TYPES = {
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "ogg": "audio/ogg",
+    "opus": "audio/ogg",
+    "flac": "audio/flac",
+    "aac": "audio/aac",
+    "m4a": "audio/mp4",
+    "pcm": "audio/L16",
+}
+
+
+def get_mime_type(audio_format: str) -> str:
+    """Return the MIME type for an audio format, or application/octet-stream."""
+    return AUDIO_MIME_TYPES.get(audio_format.lower(), "application/octet-stream")
+
+
+def iter_file_chunks(path: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """Yield a file's bytes in fixed-size chunks.
+
+    Args:
+        path: File to read
+        chunk_size: Bytes per chunk (defaults to http_streaming_chunk_size)
+
+    Yields:
+        Consecutive chunks of the file
+    """
+    size = chunk_size or get_config_value("http_streaming_chunk_size")
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(size)
+            if not data:
+                break
+            yield data
+
+
 def create_ffplay_process_simple(args: Optional[List[str]] = None, **kwargs: Any) -> subprocess.Popen[Any]:
     """Create and start an ffplay process with common settings (simple version).
 
@@ -5,16 +5,25 @@ This module provides a lightweight configuration system that supports:
 - Environment variable overrides (TTS_<KEY>)
 - Simple function-based access pattern
 
+Both config files are read into one immutable snapshot shared by all threads.
+Each access only stats the files; they are parsed again when their mtime,
+size or inode changes, or after reload_config().
+
 Usage:
     from .config import get_config_value
     port = get_config_value('chatterbox_server_port')  # Returns 12345 or env override
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 # Try to import TOML library
 try:
@@ -65,6 +74,7 @@ CONFIG_DEFAULTS = {
     "audio_channels": 1,
     "audio_sample_width": 2,
     "audio_cards_min_size": 0,
+    "audio_environment_ttl_seconds": 300,  # How long a check_audio_environment() probe is reused
     # Provider Defaults - ElevenLabs
     "elevenlabs_default_stability": 0.5,
     "elevenlabs_default_similarity_boost": 0.5,
@@ -95,7 +105,9 @@ CONFIG_DEFAULTS = {
     "openai_api_key_max_length": 51,
     # Streaming & Progress
     "streaming_progress_interval": 10,
-    "streaming_playback_start_threshold": 3,
+    "streaming_playback_start_threshold": 3,  # Chunks buffered before playback starts (pre-roll)
+    "streaming_buffer_max_bytes": 262144,  # Buffered audio at which reading the stream pauses
+    "streaming_write_coalesce_bytes": 16384,  # Largest single write to the player
     # Voice & Sample Management
     "provider_sample_voices_count": 5,
     "voice_list_max_display": 15,
@@ -104,6 +116,68 @@ CONFIG_DEFAULTS = {
     # System Resources
     "thread_pool_max_workers": 1,
     "memory_gb_conversion_factor": 1024,
+    # HTTP Connection Pool
+    "http_pool_max_connections": 20,
+    "http_pool_max_keepalive_connections": 10,
+    "http_pool_keepalive_expiry_seconds": 60,
+    "http_pool_http2": False,  # Requires the h2 package
+    # Voice Catalog
+    "voice_catalog_path": "",  # Empty = $XDG_CACHE_HOME/voice/voices.json
+    "voice_catalog_ttl_seconds": 86400,  # 24 hours
+    "voice_catalog_provider_timeout_seconds": 10,
+    # Provider Pool
+    "provider_pool_max_instances": 4,
+    "provider_pool_idle_timeout_seconds": 300,
+    "provider_pool_acquire_timeout_seconds": 30,
+    # Audio Cache
+    "audio_cache_enabled": True,
+    "audio_cache_dir": "",  # Empty = $XDG_CACHE_HOME/voice/audio
+    "audio_cache_max_size_mb": 512,
+    "audio_cache_ttl_seconds": 604800,  # 7 days
+    "audio_cache_fill_on_stream": False,
+    # Long Text
+    "long_text_chunk_chars": 2000,
+    "long_text_max_concurrency": 4,
+    # Synthesis Jobs (voice serve: POST /jobs)
+    "jobs_dir": "",  # Empty = $XDG_CACHE_HOME/voice/jobs
+    "jobs_chunk_chars": 2000,  # Text per resumable chunk
+    "jobs_max_concurrent": 2,  # Jobs rendering at once
+    "jobs_retention_seconds": 604800,  # Finished jobs are deleted after 7 days
+    "jobs_queue_retries": 8,  # Full-queue retries per chunk (with backoff) before the job fails
+    "jobs_queue_backoff_max_seconds": 60,
+    # Batch Synthesis
+    "batch_max_workers": 8,
+    "batch_provider_concurrency": 4,
+    # Request Coalescing
+    "single_flight_enabled": True,  # Identical concurrent requests share one provider call
+    # Failover
+    "failover_chain": "",  # e.g. "elevenlabs:rachel -> openai_tts:nova -> edge_tts:en-US-JennyNeural"
+    # Rate Limits (0 = unlimited; callers queue for up to rate_limit_max_wait_seconds)
+    "rate_limit_max_wait_seconds": 30,
+    "rate_limit_openai_tts_requests_per_second": 0,
+    "rate_limit_openai_tts_chars_per_minute": 0,
+    "rate_limit_elevenlabs_requests_per_second": 0,
+    "rate_limit_elevenlabs_chars_per_minute": 0,
+    "rate_limit_google_tts_requests_per_second": 0,
+    "rate_limit_google_tts_chars_per_minute": 0,
+    # Hedged Requests
+    "hedging_enabled": False,
+    "hedging_percentile": 95,  # First-chunk latency percentile used as the hedge deadline
+    "hedging_min_samples": 20,
+    "hedging_default_delay_seconds": 1.5,  # Deadline until enough samples exist
+    "hedging_min_delay_seconds": 0.25,
+    "hedging_latency_window": 200,  # Recent first-chunk latencies kept per provider
+    # Server
+    "server_log_timings": True,  # Log a JSON timing record for every synthesis request
+    "server_max_concurrent_jobs": 8,  # Synthesis jobs running at once
+    "server_max_queued_jobs": 32,  # Jobs waiting for a slot; more are rejected with 429
+    "server_queue_timeout_seconds": 30,  # Longest wait for a slot (requests may lower it with deadline_ms)
+    "server_stream_buffer_chunks": 64,  # /synthesize/stream: chunks read ahead of a slow client before synthesis waits
+    "server_speak_queue_size": 16,  # /speak jobs waiting behind the one playing; more are rejected with 429
+    "server_speak_sink": "",  # /speak output: "" (ffplay per job), "ffplay" (one resident), "null", "file:<path>"
+    "server_ws_clause_min_chars": 40,  # /ws/speak: shortest text cut at a comma instead of a sentence end
+    "server_ws_max_segment_chars": 400,  # /ws/speak: longest text held waiting for punctuation
+    "server_ws_segment_concurrency": 2,  # /ws/speak: segments synthesized ahead of playback order
     # Cache Settings
     "cache_file_ttl_seconds": 86400,  # 24 hours
     "cache_recent_access_window_seconds": 3600,  # 1 hour
@@ -136,19 +210,65 @@ DEFAULT_CONFIG = {
     },
 }
 
-_config_cache = None
+# Identity of a file as (mtime_ns, size, inode), or None if it does not exist
+FileStamp = Optional[Tuple[int, int, int]]
 
 
-def load_toml_config() -> Dict[str, Any]:
-    """Load configuration from TOML file and environment variables."""
-    global _config_cache
-    if _config_cache is not None:
-        return _config_cache
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable view of the TOML and JSON configuration at one point in time."""
+
+    values: Mapping[str, Any]  # Flat TOML settings with env overrides (get_config_value)
+    settings: Mapping[str, Any]  # JSON settings merged over DEFAULT_CONFIG (load_config)
+    fingerprint: str  # Digest of values, for detecting configuration changes
+    stamp: Tuple[str, FileStamp, FileStamp]  # (JSON path, JSON stamp, TOML stamp)
+
+
+_snapshot: Optional[ConfigSnapshot] = None
+_snapshot_lock = threading.Lock()
 
+
+def _file_stamp(path: Path) -> FileStamp:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """Get the current configuration snapshot, rebuilding it if a config file changed."""
+    global _snapshot
+
+    json_path = get_config_path()
+    toml_path = json_path.with_suffix(".toml")
+    # Stat before reading, so a write racing the rebuild leaves a stale stamp and is picked up next call
+    stamp = (str(json_path), _file_stamp(json_path), _file_stamp(toml_path))
+
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.stamp == stamp:
+        return snapshot
+
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if snapshot is None or snapshot.stamp != stamp:
+            values = _read_toml_config(toml_path)
+            fingerprint = hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+            snapshot = ConfigSnapshot(
+                values=MappingProxyType(values),
+                settings=MappingProxyType(_read_json_config(json_path)),
+                fingerprint=fingerprint,
+                stamp=stamp,
+            )
+            _snapshot = snapshot
+        return snapshot
+
+
+def _read_toml_config(config_file: Path) -> Dict[str, Any]:
+    """Read the TOML config file and environment variables over CONFIG_DEFAULTS."""
     config = CONFIG_DEFAULTS.copy()
 
     # Load from single TOML config file location
-    config_file = get_config_path().with_suffix(".toml")
     if config_file.exists() and TOML_AVAILABLE:
         try:
             with open(config_file, "rb") as f:
@@ -176,10 +296,14 @@ def load_toml_config() -> Dict[str, Any]:
             config[key] = _parse_env_value(env_value, type(config[key]))
             logger.debug(f"Override from env: {key} = {config[key]}")
 
-    _config_cache = config
     return config
 
 
+def load_toml_config() -> Dict[str, Any]:
+    """Load configuration from TOML file and environment variables."""
+    return dict(get_config_snapshot().values)
+
+
 def _parse_env_value(value: str, expected_type: type) -> Any:
     """Parse environment variable value to appropriate type."""
     if expected_type is bool:
@@ -205,14 +329,14 @@ def _parse_env_value(value: str, expected_type: type) -> Any:
 
 def get_config_value(key: str, default: Any = None) -> Any:
     """Get a configuration value. Simple function - no classes needed."""
-    config = load_toml_config()
-    return config.get(key, default)
+    return get_config_snapshot().values.get(key, default)
 
 
 def reload_config() -> None:
-    """Reload configuration from files (useful for testing)."""
-    global _config_cache
-    _config_cache = None
+    """Reload configuration from files and environment variables on next access."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
 
 
 # Configuration file management
@@ -246,8 +370,11 @@ def load_config() -> Dict[str, Any]:
 
     Returns defaults if file doesn't exist or is corrupt.
     """
-    config_path = get_config_path()
+    return copy.deepcopy(dict(get_config_snapshot().settings))
+
 
+def _read_json_config(config_path: Path) -> Dict[str, Any]:
+    """Read the JSON config file merged over the defaults."""
     try:
         if config_path.exists():
             with open(config_path, "r") as f:
@@ -281,6 +408,7 @@ def save_config(config: Dict[str, Any]) -> bool:
 
         # Atomic rename
         temp_path.rename(config_path)
+        reload_config()
         logger.info(f"Configuration saved to {config_path}")
         return True
 
@@ -289,6 +417,31 @@ def save_config(config: Dict[str, Any]) -> bool:
         return False
 
 
+def parse_failover_chain(chain: Any) -> List[Tuple[str, Optional[str]]]:
+    """Parse a failover chain into (provider, voice) entries.
+
+    Args:
+        chain: String like "elevenlabs:rachel -> openai_tts:nova -> edge_tts"
+            (entries may also be separated by commas), or a list of entries
+
+    Returns:
+        List of (provider, voice) tuples in order; voice is None when an entry
+        names only a provider
+    """
+    if not chain:
+        return []
+    entries = chain if isinstance(chain, list) else str(chain).replace("->", ",").split(",")
+
+    parsed: List[Tuple[str, Optional[str]]] = []
+    for entry in entries:
+        entry = str(entry).strip()
+        if not entry:
+            continue
+        provider, _, voice = entry.partition(":")
+        parsed.append((provider.strip(), voice.strip() or None))
+    return parsed
+
+
 def parse_voice_setting(voice_str: str) -> Tuple[Optional[str], str]:
     """Parse voice setting, returning (provider, voice) tuple.
 
@@ -354,8 +507,7 @@ def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_setting(key: str, default: Any = None) -> Any:
     """Get a single setting from configuration."""
-    config = load_config()
-    return config.get(key, default)
+    return copy.deepcopy(get_config_snapshot().settings.get(key, default))
 
 
 def set_setting(key: str, value: Any) -> bool:
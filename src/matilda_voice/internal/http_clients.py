@@ -0,0 +1,151 @@
+"""Shared keep-alive HTTP clients for provider APIs.
+
+One httpx.Client per provider keeps TCP and TLS connections open between
+requests, so only the first synthesis to a host pays for the handshake.
+AsyncClients are bound to the event loop they were created on, so async
+clients are kept per provider and per loop. While a timing record is active,
+requests add connect, TLS, time-to-first-byte and download spans to it.
+
+Usage:
+    client = get_http_client("ElevenLabs")
+    response = client.post(url, json=payload)
+
+    client = get_async_http_client("ElevenLabs")  # inside a coroutine
+    response = await client.post(url, json=payload)
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Any, Dict
+
+import httpx
+
+from .config import get_config_value
+from .timings import current_timings
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[str, httpx.Client] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+_http2_warned = False
+
+
+def _http2_available() -> bool:
+    """Return True if HTTP/2 is enabled and the h2 package is installed."""
+    global _http2_warned
+
+    if not get_config_value("http_pool_http2"):
+        return False
+    if importlib.util.find_spec("h2") is None:
+        if not _http2_warned:
+            logger.warning("http_pool_http2 is enabled but h2 is not installed; using HTTP/1.1")
+            _http2_warned = True
+        return False
+    return True
+
+
+def _trace_request(request: httpx.Request) -> None:
+    """Request hook attaching the active timing record's trace callback."""
+    timings = current_timings()
+    if timings is not None:
+        request.extensions["trace"] = timings.http_trace()
+
+
+async def _atrace_request(request: httpx.Request) -> None:
+    """Async request hook; see _trace_request()."""
+    timings = current_timings()
+    if timings is not None:
+        request.extensions["trace"] = timings.http_trace().atrace
+
+
+def _client_options() -> Dict[str, Any]:
+    """Build the keyword arguments shared by sync and async clients."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=get_config_value("http_pool_max_connections"),
+            max_keepalive_connections=get_config_value("http_pool_max_keepalive_connections"),
+            keepalive_expiry=get_config_value("http_pool_keepalive_expiry_seconds"),
+        ),
+        "http2": _http2_available(),
+    }
+
+
+def get_http_client(provider_name: str) -> httpx.Client:
+    """Get the shared client for a provider, creating it on first use.
+
+    Args:
+        provider_name: Provider name, as used for its circuit breaker
+
+    Returns:
+        A long-lived httpx.Client; callers must not close it
+    """
+    with _lock:
+        client = _clients.get(provider_name)
+        if client is None or client.is_closed:
+            client = httpx.Client(event_hooks={"request": [_trace_request]}, **_client_options())
+            _clients[provider_name] = client
+            logger.debug(f"Created HTTP client for {provider_name}")
+        return client
+
+
+def get_async_http_client(provider_name: str) -> httpx.AsyncClient:
+    """Get the shared async client for a provider on the running event loop.
+
+    Args:
+        provider_name: Provider name, as used for its circuit breaker
+
+    Returns:
+        A long-lived httpx.AsyncClient; callers must not close it
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(provider_name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(event_hooks={"request": [_atrace_request]}, **_client_options())
+            clients[provider_name] = client
+            logger.debug(f"Created async HTTP client for {provider_name}")
+        return client
+
+
+def close_http_clients() -> None:
+    """Close all sync clients and forget all async clients.
+
+    Async clients can only be closed on their own loop; call
+    aclose_http_clients() from that loop first to close them cleanly.
+    """
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _async_clients.clear()
+
+    for client in clients:
+        try:
+            client.close()
+        except (RuntimeError, OSError) as e:
+            logger.debug(f"Error closing HTTP client: {e}")
+
+
+async def aclose_http_clients() -> None:
+    """Close the async clients of the running event loop."""
+    with _lock:
+        clients = list(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+
+    for client in clients:
+        try:
+            await client.aclose()
+        except (RuntimeError, OSError) as e:
+            logger.debug(f"Error closing async HTTP client: {e}")
+
+
+atexit.register(close_http_clients)
@@ -5,18 +5,23 @@ This module provides retry logic for HTTP requests to external APIs:
 - Configurable retry limits and status codes
 - Circuit breaker pattern (optional, for future use)
 - Safe defaults to avoid duplicate charges on non-idempotent endpoints
+
+Requests go through the provider's shared keep-alive client (see
+http_clients) unless an explicit client is passed.
 """
 
+import asyncio
 import contextlib
 import logging
 import random
 import threading
 import time
-from typing import Any, Callable, Iterable, Optional, Set, Tuple, Type
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Set, Tuple, Type
 
 import httpx
 
 from ..exceptions import NetworkError, ProviderError
+from .http_clients import get_async_http_client, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +109,7 @@ def should_retry(status_code: int) -> Tuple[bool, Optional[str]]:
 def request_with_retry(
     method: str,
     url: str,
+    client: Optional[httpx.Client] = None,
     max_retries: int = DEFAULT_MAX_RETRIES,
     base_delay: float = DEFAULT_BASE_DELAY,
     max_delay: float = DEFAULT_MAX_DELAY,
@@ -114,12 +120,13 @@ def request_with_retry(
 ) -> httpx.Response:
     """Make an HTTP request with retry logic.
 
-    This function wraps httpx.request with automatic retries for transient failures.
+    This function sends the request with automatic retries for transient failures.
     It uses exponential backoff with jitter to avoid thundering herd problems.
 
     Args:
         method: HTTP method (GET, POST, etc.)
         url: Request URL
+        client: Client to send with (defaults to the provider's shared client)
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Base delay between retries in seconds (default: 1.0)
         max_delay: Maximum delay cap in seconds (default: 30.0)
@@ -127,7 +134,7 @@ def request_with_retry(
         idempotent: If False, only retry on connection errors, not HTTP errors.
                    This prevents duplicate charges on non-idempotent endpoints.
         provider_name: Name of the provider for logging
-        **kwargs: Additional arguments passed to httpx.request
+        **kwargs: Additional arguments passed to httpx.Client.request
 
     Returns:
         httpx.Response object
@@ -146,6 +153,8 @@ def request_with_retry(
             idempotent=False,  # TTS synthesis creates new audio each time
         )
     """
+    if client is None:
+        client = get_http_client(provider_name)
     last_exception: Optional[Exception] = None
     last_response: Optional[httpx.Response] = None
     breaker = get_circuit_breaker(provider_name)
@@ -155,7 +164,7 @@ def request_with_retry(
         if not breaker.allow_request():
             raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
         try:
-            response = httpx.request(method, url, **kwargs)
+            response = client.request(method, url, **kwargs)
 
             # Check if we should retry based on status code
             retry, reason = should_retry(response.status_code)
@@ -230,6 +239,7 @@ def request_with_retry(
 def stream_with_retry(
     method: str,
     url: str,
+    client: Optional[httpx.Client] = None,
     max_retries: int = DEFAULT_MAX_RETRIES,
     base_delay: float = DEFAULT_BASE_DELAY,
     max_delay: float = DEFAULT_MAX_DELAY,
@@ -238,7 +248,12 @@ def stream_with_retry(
     provider_name: str = "API",
     **kwargs: Any,
 ):
-    """Context manager for streaming HTTP requests with retry logic."""
+    """Context manager for streaming HTTP requests with retry logic.
+
+    Uses the provider's shared client unless client is given.
+    """
+    if client is None:
+        client = get_http_client(provider_name)
     last_exception: Optional[Exception] = None
     breaker = get_circuit_breaker(provider_name)
 
@@ -246,7 +261,7 @@ def stream_with_retry(
         if not breaker.allow_request():
             raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
         try:
-            with httpx.stream(method, url, **kwargs) as response:
+            with client.stream(method, url, **kwargs) as response:
                 retry, reason = should_retry(response.status_code)
 
                 if not retry:
@@ -323,7 +338,7 @@ def call_with_retry(
 
     This is for SDK calls that don't expose HTTP status codes.
     """
-    last_exception: Optional[Exception] = None
+    last_exception: Optional[BaseException] = None
     breaker = get_circuit_breaker(provider_name)
     retryable = tuple(retry_on) if retry_on is not None else (ConnectionError, TimeoutError)
 
@@ -363,6 +378,235 @@ def call_with_retry(
     raise NetworkError(f"{provider_name} call failed after {max_retries + 1} attempts")
 
 
+async def async_request_with_retry(
+    method: str,
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    idempotent: bool = True,
+    provider_name: str = "API",
+    **kwargs: Any,
+) -> httpx.Response:
+    """Make an HTTP request on the event loop with retry logic.
+
+    Async counterpart of request_with_retry: same retry rules and circuit
+    breaker, but waits with asyncio.sleep so no thread is held while backing off.
+
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        url: Request URL
+        client: AsyncClient to send with (defaults to the provider's shared client)
+        max_retries: Maximum number of retry attempts (default: 3)
+        base_delay: Base delay between retries in seconds (default: 1.0)
+        max_delay: Maximum delay cap in seconds (default: 30.0)
+        backoff_factor: Multiplier for exponential backoff (default: 2.0)
+        idempotent: If False, only retry on connection errors and 429, not other HTTP errors
+        provider_name: Name of the provider for logging
+        **kwargs: Additional arguments passed to AsyncClient.request
+
+    Returns:
+        httpx.Response object (body already read)
+
+    Raises:
+        NetworkError: If all retries are exhausted due to connection errors
+        ProviderError: If the provider's circuit breaker is open
+    """
+    if client is None:
+        client = get_async_http_client(provider_name)
+    last_exception: Optional[Exception] = None
+    last_response: Optional[httpx.Response] = None
+    breaker = get_circuit_breaker(provider_name)
+
+    effective_retries = 1 if not idempotent else max_retries
+    for attempt in range(effective_retries + 1):
+        if not breaker.allow_request():
+            raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
+        try:
+            response = await client.request(method, url, **kwargs)
+            retry, reason = should_retry(response.status_code)
+
+            if not retry:
+                if 200 <= response.status_code < 300:
+                    breaker.record_success()
+                return response
+
+            if not idempotent and response.status_code not in {429}:
+                logger.warning(f"[{provider_name}] HTTP {response.status_code} on non-idempotent request, not retrying")
+                return response
+
+            last_response = response
+            breaker.record_failure()
+            if attempt < effective_retries:
+                delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                logger.warning(
+                    f"[{provider_name}] {reason}. Attempt {attempt + 1}/{effective_retries + 1}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{provider_name}] {reason}. All {effective_retries + 1} attempts exhausted.")
+
+        except httpx.RequestError as e:
+            last_exception = e
+            breaker.record_failure()
+            if attempt < effective_retries:
+                delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                logger.warning(
+                    f"[{provider_name}] Network error: {e}. Attempt {attempt + 1}/{effective_retries + 1}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{provider_name}] Network error: {e}. All {effective_retries + 1} attempts exhausted.")
+
+    if last_exception:
+        raise NetworkError(
+            f"{provider_name} request failed after {effective_retries + 1} attempts: {last_exception}"
+        ) from last_exception
+
+    if last_response is not None:
+        return last_response
+
+    raise NetworkError(f"{provider_name} request failed after {effective_retries + 1} attempts")
+
+
+@contextlib.asynccontextmanager
+async def async_stream_with_retry(
+    method: str,
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    idempotent: bool = True,
+    provider_name: str = "API",
+    **kwargs: Any,
+) -> AsyncIterator[httpx.Response]:
+    """Async context manager for streaming HTTP requests with retry logic.
+
+    Async counterpart of stream_with_retry. Only the request is retried; once
+    the response is yielded its body is streamed as-is.
+    """
+    if client is None:
+        client = get_async_http_client(provider_name)
+    last_exception: Optional[Exception] = None
+    breaker = get_circuit_breaker(provider_name)
+    yielded = False
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow_request():
+            raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
+        try:
+            async with client.stream(method, url, **kwargs) as response:
+                retry, reason = should_retry(response.status_code)
+
+                if not retry or (not idempotent and response.status_code not in {429}):
+                    if 200 <= response.status_code < 300:
+                        breaker.record_success()
+                    elif retry:
+                        logger.warning(
+                            f"[{provider_name}] HTTP {response.status_code} on non-idempotent stream, not retrying"
+                        )
+                    yielded = True
+                    yield response
+                    return
+
+                breaker.record_failure()
+                if attempt < max_retries:
+                    delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                    logger.warning(
+                        f"[{provider_name}] {reason}. Attempt {attempt + 1}/{max_retries + 1}. "
+                        f"Retrying in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                logger.error(f"[{provider_name}] {reason}. All {max_retries + 1} attempts exhausted.")
+                raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
+
+        except httpx.RequestError as e:
+            if yielded:
+                # Failed while the caller was reading the body; not retryable here
+                raise
+            last_exception = e
+            breaker.record_failure()
+            if attempt < max_retries:
+                delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                logger.warning(
+                    f"[{provider_name}] Stream network error: {e}. Attempt {attempt + 1}/{max_retries + 1}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{provider_name}] Stream network error: {e}. All {max_retries + 1} attempts exhausted.")
+
+    if last_exception:
+        raise NetworkError(
+            f"{provider_name} stream failed after {max_retries + 1} attempts: {last_exception}"
+        ) from last_exception
+
+    raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[Any]],
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    idempotent: bool = True,
+    provider_name: str = "API",
+    retry_on: Optional[Iterable[Type[BaseException]]] = None,
+) -> Any:
+    """Await an SDK coroutine with retry + circuit breaker.
+
+    Async counterpart of call_with_retry. func is called again on each attempt,
+    since a coroutine can only be awaited once.
+    """
+    last_exception: Optional[BaseException] = None
+    breaker = get_circuit_breaker(provider_name)
+    retryable = tuple(retry_on) if retry_on is not None else (ConnectionError, TimeoutError)
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow_request():
+            raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
+
+        try:
+            result = await func()
+            breaker.record_success()
+            return result
+        except retryable as e:
+            last_exception = e
+            breaker.record_failure()
+            if not idempotent and attempt == 0:
+                logger.warning(f"[{provider_name}] Non-idempotent call failed ({e}); retrying once.")
+            if attempt < max_retries:
+                delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                logger.warning(
+                    f"[{provider_name}] Call failed: {e}. Attempt {attempt + 1}/{max_retries + 1}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{provider_name}] Call failed: {e}. All {max_retries + 1} attempts exhausted.")
+        except Exception as e:
+            logger.exception(f"[{provider_name}] Unexpected error during call")
+            last_exception = e
+            breaker.record_failure()
+            raise
+
+    if last_exception:
+        raise NetworkError(
+            f"{provider_name} call failed after {max_retries + 1} attempts: {last_exception}"
+        ) from last_exception
+
+    raise NetworkError(f"{provider_name} call failed after {max_retries + 1} attempts")
+
+
 class CircuitBreaker:
     """Basic circuit breaker to prevent cascading failures."""
 
@@ -396,6 +640,20 @@ class CircuitBreaker:
                 return False
             return True
 
+    def is_open(self) -> bool:
+        """Return True if requests would currently be rejected, without changing state."""
+        with self._lock:
+            if self._state != "open":
+                return False
+            if self._last_failure_time is None:
+                return True
+            return (time.time() - self._last_failure_time) < self._recovery_timeout
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the breaker state ("closed", "open" or "half_open") and failure count."""
+        with self._lock:
+            return {"state": self._state, "failures": self._failure_count}
+
     def record_success(self) -> None:
         """Record a successful request."""
         with self._lock:
@@ -438,3 +696,10 @@ def get_circuit_breaker(provider_name: str) -> CircuitBreaker:
             breaker = CircuitBreaker()
             _circuit_breakers[provider_name] = breaker
         return breaker
+
+
+def get_circuit_breaker_stats() -> dict[str, dict[str, Any]]:
+    """Get the state of every circuit breaker created so far, keyed by provider name."""
+    with _circuit_lock:
+        breakers = dict(_circuit_breakers)
+    return {name: breaker.get_stats() for name, breaker in breakers.items()}
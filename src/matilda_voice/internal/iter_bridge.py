@@ -0,0 +1,96 @@
+"""Move chunk iterators between threads and event loops.
+
+Providers produce audio chunks either from blocking SDK iterators or from
+async generators, while callers consume them from plain threads (CLI, batch)
+or from the server's event loop. These helpers adapt one side to the other
+without buffering the whole stream.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_EXHAUSTED = object()
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncGenerator[T, None]:
+    """Consume a blocking iterator from a coroutine.
+
+    Each next() runs in a worker thread, so the event loop is never blocked
+    and the producer advances only as fast as the consumer pulls.
+
+    Args:
+        iterator: Blocking iterator to consume
+
+    Yields:
+        Items of the iterator, in order
+    """
+    try:
+        while True:
+            item: Any = await asyncio.to_thread(next, iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            try:
+                await asyncio.to_thread(close)
+            except ValueError:
+                # Cancelled while next() was still running in its thread; the
+                # generator is finalized once that call returns
+                pass
+
+
+async def _anext(iterator: AsyncIterator[T]) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+async def _await(func: Callable[[], Awaitable[None]]) -> None:
+    await func()
+
+
+def iterate_async_in_thread(
+    iterator_factory: Callable[[], AsyncIterator[T]], cleanup: Optional[Callable[[], Awaitable[None]]] = None
+) -> Iterator[T]:
+    """Consume an async iterator from blocking code.
+
+    The async iterator runs on a private event loop in a background thread.
+    Items are pulled one at a time, and closing the returned generator early
+    closes the async iterator on its loop.
+
+    Args:
+        iterator_factory: Creates the async iterator, e.g. an async generator
+            function with its arguments bound
+        cleanup: Awaited on the private loop before it is closed, to release
+            loop-bound resources such as async HTTP clients
+
+    Yields:
+        Items of the async iterator, in order
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="voice_async_iter", daemon=True)
+    thread.start()
+    iterator = iterator_factory()
+    try:
+        while True:
+            item = asyncio.run_coroutine_threadsafe(_anext(iterator), loop).result()
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        try:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                asyncio.run_coroutine_threadsafe(aclose(), loop).result()
+            if cleanup is not None:
+                asyncio.run_coroutine_threadsafe(_await(cleanup), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -0,0 +1,349 @@
+"""Persistent, resumable synthesis jobs for long documents.
+
+Synthesizing a long document inside one HTTP request holds the connection for
+minutes and throws all progress away on any timeout. A job instead:
+
+- Is split into chunks up front and recorded, chunks included, in a SQLite
+  database (jobs_dir/jobs.sqlite3), so it outlives the server process
+- Renders chunks one by one to WAV files next to the database; each finished
+  chunk is marked in the same database
+- Resumes after a restart from the first unfinished chunk, then joins the
+  chunks into the requested format (see join_wav_chunks) and deletes them
+
+Finished and failed jobs are purged after jobs_retention_seconds.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from .audio_utils import join_wav_chunks
+from .config import get_config_value
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "error"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    output_format TEXT NOT NULL,
+    options TEXT NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+
+def get_jobs_dir() -> Path:
+    """Get the synthesis jobs directory, using XDG standard with fallback."""
+    configured = get_config_value("jobs_dir", "")
+    if configured:
+        return Path(configured).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "voice" / "jobs"
+    return Path.home() / ".cache" / "voice" / "jobs"
+
+
+def extract_document_text(content: str, doc_format: str = "auto", cache_dir: Optional[Path] = None) -> str:
+    """Turn a document into speakable text, one paragraph per semantic element.
+
+    Args:
+        content: Document source (markdown, HTML or JSON)
+        doc_format: Format hint, or "auto" to detect it
+        cache_dir: Where parsed documents are cached (default: under the jobs directory)
+
+    Returns:
+        The document's text, or an empty string if it has none
+    """
+    from ..document_processing.performance_cache import PerformanceOptimizer
+
+    optimizer = PerformanceOptimizer(cache_dir=str(cache_dir or get_jobs_dir() / "documents"))
+    elements = optimizer.process_document(content, doc_format)
+    return "\n\n".join(element.content for element in elements if element.content)
+
+
+@dataclass
+class SynthesisJob:
+    """A job's record, with chunk progress."""
+
+    id: str
+    state: str
+    output_format: str
+    options: Dict[str, Any]
+    created_at: float
+    updated_at: float
+    chunks_total: int
+    chunks_done: int
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the job for API responses."""
+        result: Dict[str, Any] = {
+            "id": self.id,
+            "state": self.state,
+            "format": self.output_format,
+            "chunks_total": self.chunks_total,
+            "chunks_done": self.chunks_done,
+            "progress": round(self.chunks_done / self.chunks_total, 3) if self.chunks_total else 0.0,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
+class JobStore:
+    """SQLite record of synthesis jobs and their chunk files.
+
+    Usage:
+        store = JobStore()
+        job = store.create(["First chunk.", "Second chunk."], "mp3", {"voice": "nova"})
+        for index, text, done in store.chunks(job.id):
+            ...
+            store.mark_chunk_done(job.id, index)
+    """
+
+    def __init__(self, jobs_dir: Optional[Path] = None) -> None:
+        """Open (creating if needed) the job database.
+
+        Args:
+            jobs_dir: Directory holding the database and job audio (default from config/XDG)
+        """
+        self.jobs_dir = Path(jobs_dir) if jobs_dir is not None else get_jobs_dir()
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.jobs_dir / "jobs.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def job_dir(self, job_id: str) -> Path:
+        """Directory holding a job's chunk files and result."""
+        return self.jobs_dir / job_id
+
+    def chunk_path(self, job_id: str, index: int) -> Path:
+        """WAV file a job's chunk is rendered to."""
+        return self.job_dir(job_id) / f"chunk_{index:04d}.wav"
+
+    def audio_path(self, job_id: str, output_format: str) -> Path:
+        """File holding a finished job's audio."""
+        return self.job_dir(job_id) / f"audio.{output_format}"
+
+    def create(self, chunks: List[str], output_format: str, options: Dict[str, Any]) -> SynthesisJob:
+        """Record a new queued job.
+
+        Args:
+            chunks: Text chunks in reading order
+            output_format: Format of the joined result
+            options: Synthesis options (provider, voice, ...) to render every chunk with
+
+        Returns:
+            The new job
+        """
+        job_id = secrets.token_hex(8)
+        now = time.time()
+        self.job_dir(job_id).mkdir(parents=True, exist_ok=True)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO jobs (id, state, output_format, options, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, output_format, json.dumps(options), now, now),
+            )
+            self._db.executemany(
+                "INSERT INTO chunks (job_id, idx, text) VALUES (?, ?, ?)",
+                [(job_id, index, text) for index, text in enumerate(chunks)],
+            )
+        job = self.get(job_id)
+        assert job is not None
+        return job
+
+    def get(self, job_id: str) -> Optional[SynthesisJob]:
+        """Get a job by id, or None if it does not exist."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, state, output_format, options, created_at, updated_at, error,"
+                " (SELECT COUNT(*) FROM chunks WHERE job_id = jobs.id),"
+                " (SELECT COUNT(*) FROM chunks WHERE job_id = jobs.id AND done)"
+                " FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return SynthesisJob(
+            id=row[0],
+            state=row[1],
+            output_format=row[2],
+            options=json.loads(row[3]),
+            created_at=row[4],
+            updated_at=row[5],
+            error=row[6],
+            chunks_total=row[7],
+            chunks_done=row[8],
+        )
+
+    def chunks(self, job_id: str) -> List[Any]:
+        """Get a job's chunks as (index, text, done) tuples in reading order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idx, text, done FROM chunks WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        return [(index, text, bool(done)) for index, text, done in rows]
+
+    def unfinished(self) -> List[str]:
+        """Get ids of jobs that are queued or were interrupted while running, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE state IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_chunk_done(self, job_id: str, index: int) -> None:
+        """Record that a chunk's audio file is complete."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE chunks SET done = 1 WHERE job_id = ? AND idx = ?", (job_id, index))
+            self._db.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+
+    def set_state(self, job_id: str, state: str, error: Optional[str] = None) -> None:
+        """Move a job to another state."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, error = ?, updated_at = ? WHERE id = ?", (state, error, time.time(), job_id)
+            )
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished and failed jobs last updated before a timestamp, with their files.
+
+        Returns:
+            Number of jobs deleted
+        """
+        with self._lock, self._db:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE state IN (?, ?) AND updated_at < ?", (DONE, FAILED, older_than)
+            ).fetchall()
+            self._db.executemany("DELETE FROM jobs WHERE id = ?", rows)
+        for (job_id,) in rows:
+            shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+        return len(rows)
+
+
+RenderFn = Callable[[Dict[str, Any], str, str], Awaitable[None]]
+
+
+class JobRunner:
+    """Run stored jobs on the event loop, a few at a time.
+
+    Usage:
+        runner = JobRunner(store, render=render_chunk)
+        runner.resume()
+        runner.start(store.create(chunks, "mp3", options).id)
+        await runner.close()
+    """
+
+    def __init__(self, store: JobStore, render: RenderFn, max_concurrent: int = 2) -> None:
+        """Initialize an idle runner.
+
+        Args:
+            store: Where jobs and their progress are recorded
+            render: Coroutine writing one chunk's text to a WAV path, given the job's options
+            max_concurrent: Jobs rendering at once; the rest wait their turn
+        """
+        self.store = store
+        self.render = render
+        self._slots = asyncio.Semaphore(max(1, max_concurrent))
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def start(self, job_id: str) -> None:
+        """Run (or resume) a job in the background."""
+        task = asyncio.get_running_loop().create_task(self._run(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def resume(self) -> int:
+        """Restart every job left unfinished by a previous run.
+
+        Returns:
+            Number of jobs resumed
+        """
+        job_ids = self.store.unfinished()
+        for job_id in job_ids:
+            self.start(job_id)
+        return len(job_ids)
+
+    async def close(self) -> None:
+        """Stop running jobs; they stay unfinished and resume on the next start."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str) -> None:
+        # Store calls go through worker threads so SQLite never blocks the event loop
+        async with self._slots:
+            job = await asyncio.to_thread(self.store.get, job_id)
+            if job is None or job.state not in (QUEUED, RUNNING):
+                return
+            await asyncio.to_thread(self.store.set_state, job_id, RUNNING)
+            try:
+                await self._render_chunks(job)
+                await asyncio.to_thread(self._join_chunks, job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Synthesis job {job_id} failed: {e}")
+                await asyncio.to_thread(self.store.set_state, job_id, FAILED, str(e))
+                return
+            await asyncio.to_thread(self.store.set_state, job_id, DONE)
+            logger.info(f"Synthesis job {job_id} finished ({job.chunks_total} chunks)")
+
+    async def _render_chunks(self, job: SynthesisJob) -> None:
+        """Render every chunk without a finished file, in reading order."""
+        for index, text, done in await asyncio.to_thread(self.store.chunks, job.id):
+            path = self.store.chunk_path(job.id, index)
+            if done and path.exists():
+                continue
+            await self.render(job.options, text, str(path))
+            await asyncio.to_thread(self.store.mark_chunk_done, job.id, index)
+
+    def _join_chunks(self, job: SynthesisJob) -> None:
+        """Join a job's chunk files into its result, then delete them."""
+        chunk_paths = [self.store.chunk_path(job.id, index) for index, _, _ in self.store.chunks(job.id)]
+        with tempfile.TemporaryDirectory(dir=self.store.job_dir(job.id)) as work_dir:
+            join_wav_chunks(
+                [str(path) for path in chunk_paths],
+                work_dir,
+                str(self.store.audio_path(job.id, job.output_format)),
+                job.output_format,
+            )
+        # The result holds all the audio now; keeping the chunks would double the job's disk use
+        for path in chunk_paths:
+            path.unlink(missing_ok=True)
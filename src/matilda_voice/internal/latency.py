@@ -0,0 +1,70 @@
+"""Rolling latency samples for percentile-based decisions.
+
+The engine records how long each provider takes to produce its first audio
+chunk. Hedged requests use a high percentile of these samples as the point
+after which a request is considered stalled.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Keeps the most recent latency samples per key.
+
+    Usage:
+        tracker = LatencyTracker(window=200)
+        tracker.record("openai_tts", 0.42)
+        p95 = tracker.percentile("openai_tts", 95)
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent samples kept per key
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add a latency sample."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, percent: float, min_samples: int = 1) -> Optional[float]:
+        """Return a latency percentile using the nearest-rank method.
+
+        Args:
+            key: Sample key
+            percent: Percentile between 0 and 100
+            min_samples: Fewest samples needed for a meaningful answer
+
+        Returns:
+            Latency in seconds, or None if there are fewer than min_samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = max(1, math.ceil(percent / 100 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get sample count, median and p95 per key."""
+        with self._lock:
+            keys = list(self._samples)
+        stats: Dict[str, Dict[str, float]] = {}
+        for key in keys:
+            p50 = self.percentile(key, 50)
+            p95 = self.percentile(key, 95)
+            if p50 is None or p95 is None:
+                continue
+            stats[key] = {"count": len(self._samples[key]), "p50": p50, "p95": p95}
+        return stats
@@ -0,0 +1,301 @@
+"""Prometheus text exposition for the voice server.
+
+Counters, gauges and histograms are kept in memory and rendered in the
+Prometheus text format (version 0.0.4), so any scraper can read them from
+GET /metrics without a client library or push gateway:
+
+    requests = Counter("voice_requests_total", "Requests handled", ["endpoint", "status"])
+    requests.inc(endpoint="/speak", status="200")
+    registry = MetricsRegistry([requests])
+    body = registry.render()
+
+Values that already live elsewhere (pool, cache and rate limiter counters,
+circuit-breaker state) are read when the endpoint is scraped by
+render_engine_metrics() rather than mirrored here.
+"""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers cached replies through long multi-chunk documents
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    """Format one sample line, e.g. ``voice_requests_total{endpoint="/speak"} 3``."""
+    if labels:
+        pairs = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{pairs}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+class _Metric(ABC):
+    """Base for a named metric family with a fixed set of label names."""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple("" if labels[name] is None else str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Render the sample lines of every label set."""
+
+    def render(self) -> List[str]:
+        """Render the HELP/TYPE header followed by every sample."""
+        return self.header() + self.samples()
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add a non-negative amount to the counter for the given labels."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Get the current value for the given labels (0 if never incremented)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [format_sample(self.name, self._labels(key), value) for key, value in values]
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add to the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Subtract from the gauge for the given labels."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        """Get the current value for the given labels (0 if never set)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [format_sample(self.name, self._labels(key), value) for key, value in values]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        # Per label set: [count per bucket..., count above the last bucket], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for the given labels."""
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def get_count(self, **labels: Any) -> int:
+        """Get the number of observations for the given labels."""
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+
+        lines = []
+        for key, counts, total in series:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts, strict=True):
+                cumulative += count
+                lines.append(format_sample(f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            lines.append(format_sample(f"{self.name}_sum", labels, total))
+            lines.append(format_sample(f"{self.name}_count", labels, cumulative))
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Ordered collection of metric families rendered together."""
+
+    def __init__(self, metrics: Optional[Iterable[_Metric]] = None) -> None:
+        self._metrics: List[_Metric] = list(metrics or [])
+
+    def register(self, metric: M) -> M:
+        """Add a metric family and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every family in the text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def render_engine_metrics(engine: Any) -> str:
+    """Render point-in-time engine state read from its stats accessors.
+
+    Args:
+        engine: TTSEngine whose pool, cache, coalescing, rate limiter and latency tracker are reported
+
+    Returns:
+        Text exposition of the engine and circuit-breaker families
+    """
+    from .http_retry import get_circuit_breaker_stats
+
+    registry = MetricsRegistry()
+
+    cache = engine.get_cache_stats()
+    cache_events = registry.register(Counter("voice_cache_events_total", "Audio cache lookups and writes", ["event"]))
+    for event in ("hits", "misses", "stores", "evictions"):
+        cache_events.inc(cache.get(event, 0), event=event)
+    registry.register(Gauge("voice_cache_hit_ratio", "Fraction of audio cache lookups served from cache")).set(
+        cache.get("hit_rate", 0.0)
+    )
+    registry.register(Gauge("voice_cache_entries", "Files in the audio cache")).set(cache.get("entries", 0))
+    registry.register(Gauge("voice_cache_size_bytes", "Bytes used by the audio cache")).set(cache.get("size_bytes", 0))
+
+    pool = engine.get_pool_stats()
+    pool_events = registry.register(
+        Counter("voice_provider_pool_events_total", "Provider instance lifecycle events", ["event"])
+    )
+    for event in ("created", "reused", "evicted", "closed"):
+        pool_events.inc(pool.get(event, 0), event=event)
+    pool_instances = registry.register(
+        Gauge("voice_provider_pool_instances", "Pooled provider instances", ["provider", "state"])
+    )
+    for provider, counts in pool.get("providers", {}).items():
+        for state in ("idle", "in_use"):
+            pool_instances.set(counts.get(state, 0), provider=provider, state=state)
+
+    flights = engine.get_coalescing_stats()
+    flight_requests = registry.register(
+        Counter(
+            "voice_single_flight_requests_total",
+            "Synthesis requests that ran or joined an identical in-flight request",
+            ["outcome"],
+        )
+    )
+    flight_requests.inc(flights.get("calls", 0), outcome="ran")
+    flight_requests.inc(flights.get("coalesced", 0), outcome="coalesced")
+
+    rate_requests = registry.register(
+        Counter("voice_rate_limit_requests_total", "Requests paced by the rate limiter", ["provider", "outcome"])
+    )
+    rate_wait = registry.register(
+        Counter("voice_rate_limit_wait_seconds_total", "Time spent waiting for rate limit tokens", ["provider"])
+    )
+    for provider, stats in engine.get_rate_limit_stats().items():
+        rate_requests.inc(stats.get("requests", 0), provider=provider, outcome="admitted")
+        rate_requests.inc(stats.get("delayed", 0), provider=provider, outcome="delayed")
+        rate_requests.inc(stats.get("rejected", 0), provider=provider, outcome="rejected")
+        rate_wait.inc(stats.get("wait_seconds", 0.0), provider=provider)
+
+    first_chunk = registry.register(
+        Gauge(
+            "voice_provider_first_chunk_seconds",
+            "Recent time to first audio chunk per provider",
+            ["provider", "quantile"],
+        )
+    )
+    for provider, stats in engine.get_latency_stats().items():
+        first_chunk.set(stats["p50"], provider=provider, quantile="0.5")
+        first_chunk.set(stats["p95"], provider=provider, quantile="0.95")
+
+    breaker_state = registry.register(
+        Gauge("voice_circuit_breaker_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)", ["provider"])
+    )
+    breaker_failures = registry.register(
+        Gauge("voice_circuit_breaker_failures", "Consecutive failures counted by the breaker", ["provider"])
+    )
+    for provider, stats in get_circuit_breaker_stats().items():
+        breaker_state.set(_BREAKER_STATES.get(stats["state"], 0), provider=provider)
+        breaker_failures.set(stats["failures"], provider=provider)
+
+    return registry.render()
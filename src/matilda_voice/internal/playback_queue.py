@@ -0,0 +1,309 @@
+"""Server-side playback queue for /speak.
+
+Playing through the speakers is a shared resource: two overlapping /speak
+requests either talk over each other or block a worker until the first one
+has finished. PlaybackQueue owns the speakers instead:
+
+- enqueue() returns a job id at once; jobs play one at a time, by priority
+  and then in arrival order
+- cancel() drops a queued job, or stops the one playing via its
+  AudioPlaybackManager; an interrupting job (barge-in) stops the current one
+  and plays next
+- While one job plays, the next one is synthesized (prefetched), so
+  back-to-back utterances follow each other without a synthesis gap
+- With an AudioSink, jobs are synthesized to raw PCM and fed to one
+  long-lived output instead of an ffplay process each, so the next job is
+  queued before the current one runs out and playback is gapless
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import secrets
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from ..exceptions import QueueFullError
+from .audio_sink import AudioSink
+from .audio_utils import AudioPlaybackManager, cleanup_file, get_audio_manager, iter_file_chunks
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = {"low": -1, "normal": 0, "high": 1}
+
+# Job states
+QUEUED = "queued"
+PLAYING = "playing"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "error"
+
+# With a sink, a job counts as played once this much of its audio is left,
+# so the next job's audio is queued behind it without a gap
+SINK_LEAD_SECONDS = 0.2
+
+
+@dataclass
+class SpeakJob:
+    """One utterance waiting for, or holding, the speakers."""
+
+    id: str
+    text: str
+    priority: int
+    seq: int
+    options: Dict[str, Any] = field(default_factory=dict)
+    audio_format: str = "mp3"
+    state: str = QUEUED
+    error: Optional[BaseException] = None
+    audio_path: Optional[str] = None
+    synthesis: "Optional[asyncio.Task[None]]" = None
+    done: "asyncio.Future[str]" = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+    @property
+    def sort_key(self) -> Any:
+        return (-self.priority, self.seq)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the job for API responses."""
+        result: Dict[str, Any] = {"id": self.id, "state": self.state, "text": self.text}
+        if self.error is not None:
+            result["error"] = str(self.error)
+        return result
+
+
+SynthesizeFn = Callable[[SpeakJob, str], Coroutine[Any, Any, None]]
+
+
+class PlaybackQueue:
+    """Play synthesized utterances one at a time on one event loop.
+
+    Usage:
+        queue = PlaybackQueue(synthesize=render_job, max_queued=16)
+        job = queue.enqueue("Build finished", priority=PRIORITIES["high"])
+        ...
+        queue.cancel(job.id)
+        await queue.close()
+    """
+
+    def __init__(
+        self,
+        synthesize: SynthesizeFn,
+        max_queued: int = 16,
+        manager: Optional[AudioPlaybackManager] = None,
+        on_finished: Optional[Callable[[SpeakJob], None]] = None,
+        audio_format: str = "mp3",
+        sink: Optional[AudioSink] = None,
+    ) -> None:
+        """Initialize an idle queue.
+
+        Args:
+            synthesize: Coroutine writing a job's audio to the given path
+            max_queued: Jobs allowed to wait behind the one playing
+            manager: Plays the audio; defaults to the global AudioPlaybackManager
+            on_finished: Called with every job once it has ended, in any state
+            audio_format: Format jobs are synthesized to before playback
+            sink: Long-lived PCM output to play through instead of the manager;
+                jobs are then synthesized to "pcm" and audio_format is ignored
+        """
+        self._synthesize = synthesize
+        self.max_queued = max(0, max_queued)
+        self._sink = sink
+        self._manager = manager or (get_audio_manager() if sink is None else None)
+        self._on_finished = on_finished
+        self._audio_format = "pcm" if sink is not None else audio_format
+        self._pending: List[SpeakJob] = []
+        self._current: Optional[SpeakJob] = None
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._worker: "Optional[asyncio.Task[None]]" = None
+
+    @property
+    def current(self) -> Optional[SpeakJob]:
+        """The job being synthesized for or played on the speakers."""
+        return self._current
+
+    @property
+    def pending(self) -> List[SpeakJob]:
+        """Jobs waiting to play, in playback order."""
+        return list(self._pending)
+
+    def enqueue(self, text: str, priority: int = 0, interrupt: bool = False, **options: Any) -> SpeakJob:
+        """Queue text for playback and return its job without waiting for it.
+
+        Args:
+            text: Text to speak
+            priority: Jobs with a higher priority play first (see PRIORITIES)
+            interrupt: Stop the current job and play this one next (barge-in)
+            **options: Passed to the synthesize coroutine via job.options
+
+        Raises:
+            QueueFullError: If max_queued jobs are already waiting
+        """
+        if len(self._pending) >= self.max_queued and not interrupt:
+            raise QueueFullError(f"Playback queue is full ({len(self._pending)} waiting)", self.retry_after())
+
+        seq = next(self._seq)
+        if interrupt:
+            # Ahead of everything queued, including earlier interrupting jobs
+            priority = max([priority, *(job.priority for job in self._pending)]) + 1
+        job = SpeakJob(id=secrets.token_hex(8), text=text, priority=priority, seq=seq, options=options)
+        bisect.insort(self._pending, job, key=lambda queued: queued.sort_key)
+
+        if interrupt and self._current is not None:
+            self._stop_current()
+        if self._current is not None:
+            self._prefetch()
+        self._ensure_worker()
+        self._wakeup.set()
+        return job
+
+    def position(self, job: SpeakJob) -> int:
+        """Get how many jobs play before job (0 when it is next or playing)."""
+        if job is self._current:
+            return 0
+        return self._pending.index(job) + (self._current is not None)
+
+    def cancel(self, job_id: Optional[str] = None) -> List[SpeakJob]:
+        """Cancel one job by id, or the current job when no id is given.
+
+        Returns:
+            The cancelled jobs (empty if nothing matched)
+        """
+        if job_id is None or (self._current is not None and self._current.id == job_id):
+            if self._current is None or self._current.state == CANCELLED:
+                return []
+            self._stop_current()
+            return [self._current]
+        for job in self._pending:
+            if job.id == job_id:
+                self._pending.remove(job)
+                self._finish(job, CANCELLED)
+                return [job]
+        return []
+
+    def cancel_all(self) -> List[SpeakJob]:
+        """Cancel every queued job and stop the current one."""
+        cancelled = []
+        while self._pending:
+            job = self._pending.pop()
+            self._finish(job, CANCELLED)
+            cancelled.append(job)
+        cancelled.extend(self.cancel())
+        return cancelled
+
+    def retry_after(self) -> float:
+        """Rough seconds until a place in the queue frees up."""
+        return max(1.0, float(len(self._pending)))
+
+    async def close(self) -> None:
+        """Cancel all jobs and stop the worker."""
+        self.cancel_all()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current job and the number of jobs waiting."""
+        return {"current": self._current.id if self._current else None, "queued": len(self._pending)}
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    def _stop_current(self) -> None:
+        """Cancel the current job, whether it is still synthesizing or already playing."""
+        job = self._current
+        if job is None:
+            return
+        job.state = CANCELLED
+        if job.synthesis is not None and not job.synthesis.done():
+            job.synthesis.cancel()
+        if self._sink is not None:
+            self._sink.clear()
+        else:
+            self._manager.stop_playback()  # type: ignore[union-attr]
+
+    def _prefetch(self) -> None:
+        """Start synthesizing the next job while the current one is busy."""
+        if self._pending and self._pending[0].synthesis is None:
+            self._start_synthesis(self._pending[0])
+
+    def _start_synthesis(self, job: SpeakJob) -> None:
+        job.audio_format = self._audio_format
+        fd, job.audio_path = tempfile.mkstemp(suffix=f".{self._audio_format}", prefix="voice_speak_")
+        os.close(fd)
+        job.synthesis = asyncio.get_running_loop().create_task(self._synthesize(job, job.audio_path))
+
+    async def _run(self) -> None:
+        """Play jobs until the queue stays empty."""
+        while True:
+            while not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            job = self._current = self._pending.pop(0)
+            try:
+                await self._play(job)
+                self._finish(job, CANCELLED if job.state == CANCELLED else DONE)
+            except asyncio.CancelledError:
+                self._finish(job, CANCELLED)
+                if job.state != CANCELLED or asyncio.current_task().cancelling():  # type: ignore[union-attr]
+                    raise
+            except Exception as e:
+                logger.warning(f"Speak job {job.id} failed: {e}")
+                job.error = e
+                self._finish(job, CANCELLED if job.state == CANCELLED else FAILED)
+            finally:
+                self._current = None
+
+    async def _play(self, job: SpeakJob) -> None:
+        """Synthesize (or finish prefetching) one job, then play it to the end."""
+        if job.synthesis is None:
+            self._start_synthesis(job)
+        assert job.synthesis is not None and job.audio_path is not None
+        await job.synthesis
+        if job.state == CANCELLED:
+            return
+
+        job.state = PLAYING
+        self._prefetch()
+        loop = asyncio.get_running_loop()
+        if self._sink is not None:
+            await loop.run_in_executor(None, self._feed_sink, job, self._sink)
+            await loop.run_in_executor(None, self._sink.wait, SINK_LEAD_SECONDS)
+            return
+        assert self._manager is not None
+        process = self._manager.play_with_tracking(job.audio_path)
+        await loop.run_in_executor(None, process.wait)
+
+    @staticmethod
+    def _feed_sink(job: SpeakJob, sink: AudioSink) -> None:
+        """Write a job's PCM to the sink, stopping early if the job is cancelled."""
+        assert job.audio_path is not None
+        for data in iter_file_chunks(job.audio_path):
+            if job.state == CANCELLED:
+                return
+            sink.write(data)
+
+    def _finish(self, job: SpeakJob, state: str) -> None:
+        """Settle a job: record its final state, drop its audio and report it."""
+        if job.done.done():
+            return
+        job.state = state
+        if job.synthesis is not None and not job.synthesis.done():
+            job.synthesis.cancel()
+        path = job.audio_path
+        if path is not None:
+            if job.synthesis is None or job.synthesis.done():
+                cleanup_file(path, logger)
+            else:
+                job.synthesis.add_done_callback(lambda _: cleanup_file(path, logger))
+        job.done.set_result(state)
+        if self._on_finished is not None:
+            self._on_finished(job)
@@ -0,0 +1,516 @@
+"""Managed pool of TTS provider instances.
+
+Constructing a provider is not free: Edge TTS starts a thread pool, the cloud
+providers build HTTP/SDK clients and voice caches, and the local providers load
+multi-gigabyte models. This module keeps constructed providers around so the
+engine can reuse them across requests:
+
+- Instances are keyed by provider name, provider class and a config fingerprint,
+  so a changed API key or config produces fresh instances
+- Each provider name is bounded to a maximum number of live instances
+- Instances are leased exclusively; callers block (with a timeout) when the
+  bound is reached
+- Idle instances are closed after a configurable timeout, by a daemon sweeper
+  thread while the pool holds any, so a quiet server does not keep them open
+- Providers get explicit ``warm()`` and ``close()`` lifecycle calls
+- Async callers wait for an instance on their event loop instead of a thread,
+  and providers with native async synthesis can share one instance between
+  concurrent coroutines
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple, Type
+
+from ..base import TTSProvider
+from ..exceptions import TimeoutError, TTSError
+from .config import get_config_value
+from .timings import timing_span
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, Type[TTSProvider], str]
+
+
+@dataclass
+class _IdleEntry:
+    """A provider instance waiting to be leased again."""
+
+    provider: TTSProvider
+    last_used: float
+
+
+@dataclass
+class _Bucket:
+    """Instances that share a pool key."""
+
+    idle: Deque[_IdleEntry] = field(default_factory=deque)
+    in_use: int = 0
+    # Instance currently leased in shared mode, counted once in in_use
+    shared: Optional[TTSProvider] = None
+    shared_leases: int = 0
+    shared_pending: bool = False
+
+
+class ProviderPool:
+    """Thread-safe pool of provider instances with bounded size and idle eviction.
+
+    Usage:
+        pool = ProviderPool()
+        with pool.lease("edge_tts", EdgeTTSProvider, fingerprint) as provider:
+            provider.synthesize(text, output_path, voice="en-US-JennyNeural")
+    """
+
+    def __init__(
+        self,
+        max_instances_per_provider: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_instances_per_provider: Maximum live instances per provider name
+            idle_timeout: Seconds an unused instance is kept before being closed
+            acquire_timeout: Seconds to wait for an instance when the pool is exhausted
+        """
+        self.max_instances_per_provider = max(
+            1, int(max_instances_per_provider or get_config_value("provider_pool_max_instances", 4))
+        )
+        self.idle_timeout = float(
+            idle_timeout if idle_timeout is not None else get_config_value("provider_pool_idle_timeout_seconds", 300)
+        )
+        self.acquire_timeout = float(
+            acquire_timeout
+            if acquire_timeout is not None
+            else get_config_value("provider_pool_acquire_timeout_seconds", 30)
+        )
+        self._buckets: Dict[PoolKey, _Bucket] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "evicted": 0, "closed": 0}
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+
+    def _live_count(self, name: str) -> int:
+        """Count idle and leased instances for a provider name. Caller holds the lock."""
+        return sum(len(b.idle) + b.in_use for key, b in self._buckets.items() if key[0] == name)
+
+    def _take_stale_idle(self, key: PoolKey) -> Optional[TTSProvider]:
+        """Remove one idle instance of the same provider with a different key. Caller holds the lock."""
+        for other_key, bucket in self._buckets.items():
+            if other_key[0] == key[0] and other_key != key and bucket.idle:
+                return bucket.idle.popleft().provider
+        return None
+
+    def _collect_idle_expired(self, now: float) -> List[TTSProvider]:
+        """Remove idle instances past the idle timeout. Caller holds the lock."""
+        expired: List[TTSProvider] = []
+        for key in list(self._buckets):
+            bucket = self._buckets[key]
+            while bucket.idle and now - bucket.idle[0].last_used >= self.idle_timeout:
+                expired.append(bucket.idle.popleft().provider)
+            if not bucket.idle and bucket.in_use == 0 and not bucket.shared_pending:
+                del self._buckets[key]
+        self._stats["evicted"] += len(expired)
+        return expired
+
+    def _start_sweeper(self) -> None:
+        """Start the idle sweeper thread unless it is running. Caller holds the lock."""
+        if self._sweeper is None and not self._closed:
+            self._sweeper = threading.Thread(target=self._sweep, name="voice_provider_pool_sweeper", daemon=True)
+            self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Close idle instances as they expire; exits once the pool is empty or closed."""
+        while True:
+            with self._condition:
+                if self._closed or not self._buckets:
+                    self._sweeper = None
+                    return
+                oldest = min((b.idle[0].last_used for b in self._buckets.values() if b.idle), default=None)
+            # Sleep until the oldest idle instance expires (or a full timeout if none is idle)
+            delay = self.idle_timeout if oldest is None else oldest + self.idle_timeout - time.time()
+            if self._sweeper_stop.wait(max(0.01, delay)):
+                return
+            self.evict_idle()
+
+    def _wake_async_waiters(self) -> None:
+        """Wake coroutines waiting in acquire_async so they retry. Caller holds the lock."""
+        for loop, waiter in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_set_waiter_result, waiter)
+            except RuntimeError:
+                # The waiter's loop has already been closed
+                pass
+        self._async_waiters.clear()
+
+    def _close_providers(self, providers: List[TTSProvider]) -> None:
+        """Close providers outside the pool lock, never letting one failure stop the rest."""
+        for provider in providers:
+            try:
+                provider.close()
+            except Exception:
+                logger.exception(f"Error closing provider {type(provider).__name__}")
+            with self._condition:
+                self._stats["closed"] += 1
+
+    def acquire(
+        self,
+        name: str,
+        provider_class: Type[TTSProvider],
+        fingerprint: str = "",
+        timeout: Optional[float] = None,
+    ) -> TTSProvider:
+        """Lease a provider instance, creating one if the pool allows it.
+
+        Args:
+            name: Provider registry name
+            provider_class: Provider class used to construct new instances
+            fingerprint: Config fingerprint; instances are only reused for the same value
+            timeout: Seconds to wait when the pool is exhausted (default from config)
+
+        Returns:
+            A provider instance that must be handed back with release()
+
+        Raises:
+            TimeoutError: If no instance became available before the timeout
+        """
+        key: PoolKey = (name, provider_class, fingerprint)
+        wait_timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait_timeout
+        to_close: List[TTSProvider] = []
+
+        try:
+            with self._condition:
+                if self._closed:
+                    raise TTSError("Provider pool is closed")
+
+                to_close.extend(self._collect_idle_expired(time.time()))
+
+                while True:
+                    bucket = self._buckets.setdefault(key, _Bucket())
+                    if bucket.idle:
+                        entry = bucket.idle.pop()
+                        bucket.in_use += 1
+                        self._stats["reused"] += 1
+                        return entry.provider
+
+                    if self._live_count(name) < self.max_instances_per_provider:
+                        bucket.in_use += 1
+                        break
+
+                    # Make room by retiring an idle instance built for an older config
+                    stale = self._take_stale_idle(key)
+                    if stale is not None:
+                        to_close.append(stale)
+                        continue
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out after {wait_timeout:.1f}s waiting for a {name} provider instance "
+                            f"({self.max_instances_per_provider} in use)"
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            if to_close:
+                self._close_providers(to_close)
+
+        # Construct outside the lock: model loading can take a long time
+        try:
+            provider = provider_class()
+        except BaseException:
+            with self._condition:
+                self._buckets[key].in_use -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._stats["created"] += 1
+        logger.debug(f"Created {name} provider instance for pool")
+        return provider
+
+    async def acquire_async(
+        self,
+        name: str,
+        provider_class: Type[TTSProvider],
+        fingerprint: str = "",
+        timeout: Optional[float] = None,
+        shared: bool = False,
+    ) -> TTSProvider:
+        """Lease a provider instance from a coroutine.
+
+        Instances are constructed in a worker thread, and when the pool is
+        exhausted the caller waits on its event loop rather than in a thread.
+
+        Args:
+            name: Provider registry name
+            provider_class: Provider class used to construct new instances
+            fingerprint: Config fingerprint; instances are only reused for the same value
+            timeout: Seconds to wait when the pool is exhausted (default from config)
+            shared: Share one instance between all concurrent shared leases of
+                the same key instead of leasing exclusively. Only for providers
+                whose synthesize_async may run concurrently on one instance.
+
+        Returns:
+            A provider instance that must be handed back with release(), passing
+            the same shared flag
+
+        Raises:
+            TimeoutError: If no instance became available before the timeout
+        """
+        key: PoolKey = (name, provider_class, fingerprint)
+        wait_timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait_timeout
+        loop = asyncio.get_running_loop()
+
+        if not shared:
+            return await self._acquire_exclusive_async(key, deadline, wait_timeout)
+
+        # Join the shared instance, or become the one coroutine that creates it
+        while True:
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            with self._condition:
+                if self._closed:
+                    raise TTSError("Provider pool is closed")
+                bucket = self._buckets.setdefault(key, _Bucket())
+                if bucket.shared is not None:
+                    bucket.shared_leases += 1
+                    self._stats["reused"] += 1
+                    return bucket.shared
+                if not bucket.shared_pending:
+                    bucket.shared_pending = True
+                    break
+                self._async_waiters.append((loop, waiter))
+            await self._wait_async(loop, waiter, key, deadline, wait_timeout)
+
+        try:
+            provider = await self._acquire_exclusive_async(key, deadline, wait_timeout)
+        finally:
+            with self._condition:
+                self._buckets.setdefault(key, _Bucket()).shared_pending = False
+                self._wake_async_waiters()
+
+        with self._condition:
+            bucket = self._buckets.setdefault(key, _Bucket())
+            if bucket.shared is None:
+                bucket.shared = provider
+                bucket.shared_leases = 1
+                return provider
+            # The bucket was recycled meanwhile and another coroutine installed an instance
+            bucket.shared_leases += 1
+            existing = bucket.shared
+        self.release(name, provider_class, provider, fingerprint)
+        return existing
+
+    async def _acquire_exclusive_async(self, key: PoolKey, deadline: float, wait_timeout: float) -> TTSProvider:
+        """Acquire an exclusive lease, waiting on the event loop while the pool is exhausted."""
+        name, provider_class, fingerprint = key
+        loop = asyncio.get_running_loop()
+        while True:
+            # Register before trying so a release in between is not missed
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            with self._condition:
+                self._async_waiters.append((loop, waiter))
+            try:
+                return await asyncio.to_thread(self.acquire, name, provider_class, fingerprint, 0)
+            except TimeoutError:
+                await self._wait_async(loop, waiter, key, deadline, wait_timeout)
+
+    async def _wait_async(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        waiter: "asyncio.Future[None]",
+        key: PoolKey,
+        deadline: float,
+        wait_timeout: float,
+    ) -> None:
+        """Wait for a registered waiter to be woken, raising TimeoutError past the deadline."""
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Timed out after {wait_timeout:.1f}s waiting for a {key[0]} provider instance "
+                    f"({self.max_instances_per_provider} in use)"
+                )
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            with self._condition:
+                if (loop, waiter) in self._async_waiters:
+                    self._async_waiters.remove((loop, waiter))
+
+    def release(
+        self,
+        name: str,
+        provider_class: Type[TTSProvider],
+        provider: TTSProvider,
+        fingerprint: str = "",
+        discard: bool = False,
+        shared: bool = False,
+    ) -> None:
+        """Return a leased instance to the pool.
+
+        Args:
+            name: Provider registry name used when acquiring
+            provider_class: Provider class used when acquiring
+            provider: The leased instance
+            fingerprint: Config fingerprint used when acquiring
+            discard: Close the instance instead of keeping it (e.g. after a fatal error)
+            shared: The instance was leased with acquire_async(shared=True); it
+                returns to the pool when its last shared lease is released
+        """
+        key: PoolKey = (name, provider_class, fingerprint)
+        to_close: List[TTSProvider] = []
+
+        with self._condition:
+            bucket = self._buckets.setdefault(key, _Bucket())
+            if shared and bucket.shared is provider:
+                bucket.shared_leases -= 1
+                if bucket.shared_leases > 0:
+                    return
+                bucket.shared = None
+            bucket.in_use = max(0, bucket.in_use - 1)
+            if discard or self._closed:
+                to_close.append(provider)
+            else:
+                bucket.idle.append(_IdleEntry(provider, time.time()))
+                self._start_sweeper()
+            to_close.extend(self._collect_idle_expired(time.time()))
+            self._condition.notify()
+            self._wake_async_waiters()
+
+        if to_close:
+            self._close_providers(to_close)
+
+    @contextlib.contextmanager
+    def lease(
+        self,
+        name: str,
+        provider_class: Type[TTSProvider],
+        fingerprint: str = "",
+        timeout: Optional[float] = None,
+    ) -> Iterator[TTSProvider]:
+        """Context manager wrapping acquire() and release()."""
+        with timing_span("provider_acquire"):
+            provider = self.acquire(name, provider_class, fingerprint, timeout=timeout)
+        try:
+            yield provider
+        finally:
+            self.release(name, provider_class, provider, fingerprint)
+
+    @contextlib.asynccontextmanager
+    async def lease_async(
+        self,
+        name: str,
+        provider_class: Type[TTSProvider],
+        fingerprint: str = "",
+        timeout: Optional[float] = None,
+        shared: bool = False,
+    ) -> AsyncIterator[TTSProvider]:
+        """Async context manager wrapping acquire_async() and release()."""
+        with timing_span("provider_acquire"):
+            provider = await self.acquire_async(name, provider_class, fingerprint, timeout=timeout, shared=shared)
+        try:
+            yield provider
+        finally:
+            self.release(name, provider_class, provider, fingerprint, shared=shared)
+
+    def warm(self, name: str, provider_class: Type[TTSProvider], fingerprint: str = "", count: int = 1) -> int:
+        """Pre-create and warm instances so the first request skips cold-start work.
+
+        Args:
+            name: Provider registry name
+            provider_class: Provider class
+            fingerprint: Config fingerprint
+            count: Number of instances to warm (capped by the per-provider bound)
+
+        Returns:
+            Number of instances successfully warmed
+        """
+        leased: List[TTSProvider] = []
+        warmed = 0
+        try:
+            for _ in range(max(0, min(count, self.max_instances_per_provider))):
+                provider = self.acquire(name, provider_class, fingerprint, timeout=0)
+                leased.append(provider)
+                try:
+                    provider.warm()
+                    warmed += 1
+                except TTSError as e:
+                    logger.warning(f"Could not warm {name} provider: {e}")
+        except TimeoutError:
+            # Pool already holds the maximum number of instances
+            pass
+        finally:
+            for provider in leased:
+                self.release(name, provider_class, provider, fingerprint)
+        return warmed
+
+    def evict_idle(self) -> int:
+        """Close idle instances past the idle timeout.
+
+        Returns:
+            Number of instances evicted
+        """
+        with self._condition:
+            expired = self._collect_idle_expired(time.time())
+        self._close_providers(expired)
+        return len(expired)
+
+    def close(self, name: Optional[str] = None) -> None:
+        """Close idle instances and stop pooling.
+
+        Args:
+            name: Only close instances for this provider. When None, the whole
+                pool is shut down and instances still leased are closed on release.
+        """
+        to_close: List[TTSProvider] = []
+        with self._condition:
+            if name is None:
+                self._closed = True
+                self._sweeper_stop.set()
+            for key in list(self._buckets):
+                if name is not None and key[0] != name:
+                    continue
+                bucket = self._buckets[key]
+                to_close.extend(entry.provider for entry in bucket.idle)
+                bucket.idle.clear()
+                if bucket.in_use == 0:
+                    del self._buckets[key]
+            self._condition.notify_all()
+            self._wake_async_waiters()
+        self._close_providers(to_close)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with lifetime counters and per-provider idle/in-use counts
+        """
+        with self._condition:
+            providers: Dict[str, Dict[str, int]] = {}
+            for (name, _, _), bucket in self._buckets.items():
+                counts = providers.setdefault(name, {"idle": 0, "in_use": 0})
+                counts["idle"] += len(bucket.idle)
+                counts["in_use"] += bucket.in_use
+            return {
+                **self._stats,
+                "max_instances_per_provider": self.max_instances_per_provider,
+                "providers": providers,
+            }
+
+
+def _set_waiter_result(waiter: "asyncio.Future[None]") -> None:
+    """Resolve an acquire_async waiter unless it already finished or was cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,201 @@
+"""Client-side rate limiting for provider requests.
+
+Cloud providers enforce request and character quotas; exceeding them earns a
+429 that the retry helpers then back off from, tripping the circuit breaker for
+every other caller. This module paces requests before they are sent instead:
+
+- Each provider has a requests-per-second and a characters-per-minute token
+  bucket, configured with rate_limit_<provider>_* settings (0 = unlimited);
+  buckets are rebuilt when those settings change
+- Callers reserve tokens up front and wait for their slot, so concurrent
+  callers are served in arrival order rather than racing
+- A caller whose slot is further away than the maximum wait is rejected
+  immediately with RateLimitError instead of queueing
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..exceptions import RateLimitError
+from .config import get_config_value
+from .timings import record_timing
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket that can be reserved into debt.
+
+    Reserving more tokens than are available leaves the bucket negative; the
+    returned wait is how long the caller must sleep before its tokens exist.
+    Later callers see the debt and wait behind earlier ones.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (the allowed burst)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount tokens are available, refilling first."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self._tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Consume tokens, going into debt if needed."""
+        self._tokens -= min(amount, self.capacity)
+
+
+@dataclass
+class _ProviderLimits:
+    """Buckets and counters for one provider."""
+
+    buckets: List[Tuple[TokenBucket, str]] = field(default_factory=list)
+    # (requests per second, chars per minute) from config; None when set with set_limits()
+    settings: Optional[Tuple[float, float]] = None
+    requests: int = 0
+    delayed: int = 0
+    rejected: int = 0
+    wait_seconds: float = 0.0
+
+
+class RateLimiter:
+    """Per-provider request and character rate limits.
+
+    Usage:
+        limiter = RateLimiter()
+        limiter.acquire("openai_tts", len(text))  # blocks until allowed
+        provider.synthesize(text, output_path)
+    """
+
+    def __init__(self, max_wait: Optional[float] = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_wait: Longest a caller may be queued before RateLimitError
+                (None follows rate_limit_max_wait_seconds)
+        """
+        self._max_wait = max_wait
+        self._providers: Dict[str, _ProviderLimits] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_wait(self) -> float:
+        """Longest a caller may be queued before RateLimitError."""
+        if self._max_wait is not None:
+            return float(self._max_wait)
+        return float(get_config_value("rate_limit_max_wait_seconds", 30))
+
+    def set_limits(self, provider_name: str, requests_per_second: float = 0, chars_per_minute: float = 0) -> None:
+        """Set a provider's limits, replacing configured ones (0 = unlimited).
+
+        Limits set here are kept even if the provider's settings change later.
+        """
+        limits = self._build_limits(requests_per_second, chars_per_minute)
+        with self._lock:
+            self._providers[provider_name] = limits
+
+    @staticmethod
+    def _build_limits(requests_per_second: float, chars_per_minute: float) -> _ProviderLimits:
+        limits = _ProviderLimits()
+        if requests_per_second > 0:
+            # Allow a one-second burst, and at least one request
+            limits.buckets.append((TokenBucket(requests_per_second, max(1.0, requests_per_second)), "requests"))
+        if chars_per_minute > 0:
+            limits.buckets.append((TokenBucket(chars_per_minute / 60, chars_per_minute), "chars"))
+        return limits
+
+    @staticmethod
+    def _configured_settings(provider_name: str) -> Tuple[float, float]:
+        """Read a provider's rate_limit_<provider>_* settings."""
+        return (
+            float(get_config_value(f"rate_limit_{provider_name}_requests_per_second", 0)),
+            float(get_config_value(f"rate_limit_{provider_name}_chars_per_minute", 0)),
+        )
+
+    def reserve(self, provider_name: str, chars: int = 0, max_wait: Optional[float] = None) -> float:
+        """Reserve capacity for one request without waiting.
+
+        Args:
+            provider_name: Provider registry name
+            chars: Characters the request will send
+            max_wait: Override for the maximum queueing time
+
+        Returns:
+            Seconds the caller must wait before sending
+
+        Raises:
+            RateLimitError: If the wait would exceed max_wait
+        """
+        limit = self.max_wait if max_wait is None else max_wait
+        configured = self._configured_settings(provider_name)
+        with self._lock:
+            limits = self._providers.get(provider_name)
+            if limits is None:
+                limits = self._providers[provider_name] = replace(self._build_limits(*configured), settings=configured)
+            elif limits.settings is not None and limits.settings != configured:
+                # The settings changed (config edit or reload_config()); keep the counters
+                fresh = self._build_limits(*configured)
+                limits = self._providers[provider_name] = replace(limits, buckets=fresh.buckets, settings=configured)
+            if not limits.buckets:
+                return 0.0
+
+            now = time.monotonic()
+            amounts = {"requests": 1, "chars": chars}
+            wait = max(bucket.wait_time(amounts[kind], now) for bucket, kind in limits.buckets)
+            if wait > limit:
+                limits.rejected += 1
+                raise RateLimitError(
+                    f"{provider_name} rate limit: next slot in {wait:.1f}s exceeds the {limit:.0f}s maximum wait"
+                )
+
+            for bucket, kind in limits.buckets:
+                bucket.take(amounts[kind])
+            limits.requests += 1
+            if wait > 0:
+                limits.delayed += 1
+                limits.wait_seconds += wait
+        if wait > 0:
+            logger.debug(f"Rate limiting {provider_name}: waiting {wait:.2f}s")
+        return wait
+
+    def acquire(self, provider_name: str, chars: int = 0, max_wait: Optional[float] = None) -> None:
+        """Block until a request may be sent; see reserve()."""
+        wait = self.reserve(provider_name, chars, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+            record_timing("rate_limit_wait", wait)
+
+    async def acquire_async(self, provider_name: str, chars: int = 0, max_wait: Optional[float] = None) -> None:
+        """Wait on the event loop until a request may be sent; see reserve()."""
+        wait = self.reserve(provider_name, chars, max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            record_timing("rate_limit_wait", wait)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-provider request, delay and rejection counters."""
+        with self._lock:
+            return {
+                name: {
+                    "requests": limits.requests,
+                    "delayed": limits.delayed,
+                    "rejected": limits.rejected,
+                    "wait_seconds": limits.wait_seconds,
+                }
+                for name, limits in self._providers.items()
+                if limits.buckets
+            }
@@ -0,0 +1,135 @@
+"""Admission control for synthesis work on the voice server.
+
+Without a bound, a traffic spike starts every request at once: latency climbs
+for everyone and clients give up after the provider has already been paid.
+SynthesisScheduler caps the work in progress instead:
+
+- At most max_concurrent jobs run; the rest wait in a bounded queue
+- Waiting jobs are admitted by lane priority, so interactive /speak traffic
+  overtakes queued bulk /synthesize jobs, and in arrival order within a lane
+- A request that finds the queue full is rejected at once (QueueFullError);
+  one still waiting when its deadline passes is dropped before any provider
+  call is made (DeadlineExceededError). Both carry a Retry-After estimate
+  derived from recent job durations
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Sequence
+
+from ..exceptions import DeadlineExceededError, QueueFullError
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+class SynthesisScheduler:
+    """Bounded, prioritized admission of synthesis jobs on one event loop.
+
+    Usage:
+        scheduler = SynthesisScheduler(max_concurrent=8, max_queued=32)
+        async with scheduler.slot(INTERACTIVE, timeout=10):
+            await engine.synthesize_text_async(...)
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, lanes: Sequence[str] = (INTERACTIVE, BULK)) -> None:
+        """Initialize an idle scheduler.
+
+        Args:
+            max_concurrent: Jobs allowed to run at once
+            max_queued: Jobs allowed to wait for a slot (0 = reject when busy)
+            lanes: Lane names from highest to lowest priority
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {lane: deque() for lane in lanes}
+        self._running = 0
+        self._job_seconds = 1.0  # Moving average of job durations, for Retry-After
+        self._admitted = 0
+        self._rejected = 0
+        self._expired = 0
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a slot."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def retry_after(self) -> float:
+        """Estimate seconds until a new job would be admitted."""
+        return max(1.0, math.ceil(self._job_seconds * (self.queued + 1) / self.max_concurrent))
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane: str = BULK, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Hold a job slot for the enclosed block, waiting in the lane's queue if needed.
+
+        Args:
+            lane: Priority lane (see lanes)
+            timeout: Seconds the job may wait before it is dropped (None waits indefinitely)
+
+        Raises:
+            QueueFullError: If no slot is free and the queue is full
+            DeadlineExceededError: If the timeout passed before a slot was free
+        """
+        await self._acquire(lane, timeout)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._job_seconds = 0.8 * self._job_seconds + 0.2 * (time.monotonic() - started)
+            self._release()
+
+    async def _acquire(self, lane: str, timeout: Optional[float]) -> None:
+        if self._running < self.max_concurrent and not self.queued:
+            self._running += 1
+            self._admitted += 1
+            return
+        if self.queued >= self.max_queued:
+            self._rejected += 1
+            raise QueueFullError(
+                f"Synthesis queue is full ({self._running} running, {self.queued} waiting)", self.retry_after()
+            )
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        waiters = self._waiters[lane]
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self._release()
+            if isinstance(e, asyncio.TimeoutError):
+                self._expired += 1
+                raise DeadlineExceededError(
+                    f"Request waited {timeout:.1f}s without a free synthesis slot", self.retry_after()
+                ) from None
+            raise
+        self._admitted += 1
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter by lane priority, or free it."""
+        for waiters in self._waiters.values():
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self._running -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get running and queued jobs and admission counters."""
+        return {
+            "running": self._running,
+            "max_concurrent": self.max_concurrent,
+            "queued": {lane: len(waiters) for lane, waiters in self._waiters.items()},
+            "max_queued": self.max_queued,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "expired": self._expired,
+            "job_seconds": self._job_seconds,
+        }
@@ -0,0 +1,233 @@
+"""Coalesce identical concurrent synthesis requests.
+
+Dashboards and alerting fan the same announcement out to several rooms at
+once; without coalescing every copy is a separate billed provider request.
+SingleFlight lets the first caller for a key (the leader) do the work while
+callers arriving before it finishes wait for and share its outcome:
+
+- join() / join_async() share a finished result, e.g. a synthesized file.
+  The result stays alive until every participant has released it, then an
+  optional cleanup callback disposes of it
+- join_stream() shares an async chunk stream; late subscribers replay the
+  chunks produced so far, then follow live ones
+- Errors reach every participant; a key is forgotten once its call ends,
+  so the next request starts afresh (and usually hits the audio cache)
+"""
+
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class _Call:
+    """One in-flight call and the participants holding its result."""
+
+    future: "Future[Any]" = field(default_factory=Future)
+    holders: int = 0
+    sole: bool = True  # Only the leader took part
+
+
+@dataclass
+class _Broadcast:
+    """One shared stream: chunks so far and the event loop it runs on."""
+
+    loop: asyncio.AbstractEventLoop
+    chunks: List[Any] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    subscribers: int = 0
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: "Optional[asyncio.Task[None]]" = None
+
+
+class SingleFlight:
+    """Run at most one call per key; concurrent callers share its outcome.
+
+    Usage:
+        flight = SingleFlight(cleanup=lambda path: Path(path).unlink(missing_ok=True))
+        with flight.join(key, synthesize_to_temp) as (path, shared):
+            shutil.copyfile(path, output_path)
+    """
+
+    def __init__(self, cleanup: Optional[Callable[[Any], None]] = None) -> None:
+        """Initialize an empty flight group.
+
+        Args:
+            cleanup: Called with a call's result once every participant released it
+        """
+        self._cleanup = cleanup
+        self._calls: Dict[str, _Call] = {}
+        self._streams: Dict[Tuple[int, str], _Broadcast] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+    def _enter(self, key: str) -> Tuple[_Call, bool]:
+        """Register a participant, returning its call and whether it leads."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+            else:
+                call.sole = False
+                self._coalesced += 1
+            call.holders += 1
+            return call, leader
+
+    def _finish(self, key: str, call: _Call, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome and stop new participants joining."""
+        with self._lock:
+            del self._calls[key]
+            if error is None:
+                call.future.set_result(result)
+            else:
+                call.future.set_exception(error)
+
+    def _release(self, call: _Call) -> None:
+        """Drop one participant, cleaning up after the last one."""
+        with self._lock:
+            call.holders -= 1
+            last = call.holders == 0
+        if last and self._cleanup is not None and call.future.exception() is None:
+            self._cleanup(call.future.result())
+
+    @contextlib.contextmanager
+    def join(self, key: str, fn: Callable[[], Any]) -> Iterator[Tuple[Any, bool]]:
+        """Run fn for key, or wait for the call already running it.
+
+        Args:
+            key: Identity of the work, e.g. an audio cache key
+            fn: Produces the result; only called by the leader
+
+        Yields:
+            Tuple of (result, shared); shared is False when no other caller
+            took part, so the leader may consume the result destructively
+
+        Raises:
+            Exception: Whatever fn raised, in every participant
+        """
+        call, leader = self._enter(key)
+        try:
+            if leader:
+                try:
+                    result = fn()
+                except BaseException as e:
+                    self._finish(key, call, error=e)
+                    raise
+                self._finish(key, call, result)
+            yield call.future.result(), not call.sole
+        finally:
+            self._release(call)
+
+    @contextlib.asynccontextmanager
+    async def join_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> AsyncIterator[Tuple[Any, bool]]:
+        """Async counterpart of join(); may share calls with threaded callers.
+
+        A cancelled leader fails its followers with RuntimeError rather than
+        cancelling their tasks.
+        """
+        call, leader = self._enter(key)
+        try:
+            if leader:
+                try:
+                    result = await fn()
+                except asyncio.CancelledError:
+                    self._finish(key, call, error=RuntimeError("Shared synthesis request was cancelled"))
+                    raise
+                except BaseException as e:
+                    self._finish(key, call, error=e)
+                    raise
+                self._finish(key, call, result)
+            yield await asyncio.wrap_future(call.future), not call.sole
+        finally:
+            self._release(call)
+
+    async def join_stream(self, key: str, fn: Callable[[], AsyncIterator[Any]]) -> AsyncGenerator[Any, None]:
+        """Subscribe to the stream for key, starting it if nobody else has.
+
+        The stream is produced by a task of its own, so it keeps going while
+        any subscriber is reading and is cancelled when the last one leaves.
+
+        Args:
+            key: Identity of the stream
+            fn: Creates the chunk iterator; only called for the first subscriber
+
+        Yields:
+            Every chunk of the stream, from the first one
+
+        Raises:
+            Exception: Whatever the stream raised
+        """
+        loop = asyncio.get_running_loop()
+        stream_key = (id(loop), key)
+        with self._lock:
+            broadcast = self._streams.get(stream_key)
+            if broadcast is None:
+                broadcast = self._streams[stream_key] = _Broadcast(loop)
+                broadcast.task = loop.create_task(self._produce(stream_key, broadcast, fn))
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+            broadcast.subscribers += 1
+
+        index = 0
+        try:
+            while True:
+                while index < len(broadcast.chunks):
+                    yield broadcast.chunks[index]
+                    index += 1
+                if broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    return
+                changed = broadcast.changed
+                await changed.wait()
+        finally:
+            with self._lock:
+                broadcast.subscribers -= 1
+                abandoned = broadcast.subscribers == 0 and not broadcast.done
+                if abandoned and self._streams.get(stream_key) is broadcast:
+                    del self._streams[stream_key]
+            if abandoned and broadcast.task is not None:
+                broadcast.task.cancel()
+
+    async def _produce(
+        self, stream_key: Tuple[int, str], broadcast: _Broadcast, fn: Callable[[], AsyncIterator[Any]]
+    ) -> None:
+        """Drive a shared stream, waking subscribers after every chunk."""
+        chunks = fn()
+        try:
+            async for chunk in chunks:
+                broadcast.chunks.append(chunk)
+                self._notify(broadcast)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+            with self._lock:
+                if self._streams.get(stream_key) is broadcast:
+                    del self._streams[stream_key]
+            broadcast.done = True
+            self._notify(broadcast)
+
+    @staticmethod
+    def _notify(broadcast: _Broadcast) -> None:
+        changed, broadcast.changed = broadcast.changed, asyncio.Event()
+        changed.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counts of calls run, callers coalesced into them, and calls in flight."""
+        with self._lock:
+            return {
+                "calls": self._leaders,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._streams),
+            }
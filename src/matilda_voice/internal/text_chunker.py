@@ -0,0 +1,166 @@
+"""Split long text into provider-sized chunks at natural boundaries.
+
+Cloud providers cap the size of a single request (OpenAI at 4096 characters,
+Google at 5000 bytes) and long requests are slow to first audio. The engine
+uses this module to break long input into pieces that each fit the limit,
+preferring to cut at paragraph and sentence ends, then at clause punctuation,
+then between words, and only as a last resort inside a word.
+
+TextSegmenter applies the same boundaries to text that arrives piece by piece,
+releasing each sentence or clause as soon as it is complete.
+"""
+
+import re
+from typing import Callable, Iterator, List, Optional
+
+# Boundaries from coarsest to finest; each pattern consumes the separator
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?…。！？])[\"'”’)\]]*\s+")
+_CLAUSE_BREAK = re.compile(r"(?<=[,;:])\s+|\s+(?=[—–-]\s)")
+_WHITESPACE = re.compile(r"\s+")
+
+_BOUNDARIES = (_PARAGRAPH_BREAK, _SENTENCE_END, _CLAUSE_BREAK, _WHITESPACE)
+
+
+def make_fits(max_chars: Optional[int] = None, max_bytes: Optional[int] = None) -> Callable[[str], bool]:
+    """Build a predicate telling whether text fits the given limits.
+
+    Args:
+        max_chars: Maximum length in characters (None for no limit)
+        max_bytes: Maximum length in UTF-8 bytes (None for no limit)
+
+    Returns:
+        Function returning True when a string is within both limits
+    """
+
+    def fits(text: str) -> bool:
+        if max_chars is not None and len(text) > max_chars:
+            return False
+        if max_bytes is not None and len(text.encode("utf-8")) > max_bytes:
+            return False
+        return True
+
+    return fits
+
+
+def _hard_split(text: str, fits: Callable[[str], bool]) -> Iterator[str]:
+    """Split text with no usable boundary character by character."""
+    current = ""
+    for char in text:
+        if current and not fits(current + char):
+            yield current
+            current = ""
+        current += char
+    if current:
+        yield current
+
+
+def _units(text: str, fits: Callable[[str], bool], level: int = 0) -> Iterator[str]:
+    """Yield pieces of text that each fit, split at the coarsest possible boundary."""
+    if fits(text):
+        yield text
+        return
+    if level >= len(_BOUNDARIES):
+        yield from _hard_split(text, fits)
+        return
+    for piece in _BOUNDARIES[level].split(text):
+        piece = piece.strip()
+        if piece:
+            yield from _units(piece, fits, level + 1)
+
+
+def split_text(text: str, max_chars: Optional[int] = None, max_bytes: Optional[int] = None) -> List[str]:
+    """Split text into chunks that each satisfy the size limits.
+
+    Adjacent sentences are packed greedily into the same chunk, so the number
+    of provider requests stays as small as the limits allow.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum chunk length in characters (None for no limit)
+        max_bytes: Maximum chunk length in UTF-8 bytes (None for no limit)
+
+    Returns:
+        List of non-empty chunks in reading order; a single element when the
+        whole text already fits
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    fits = make_fits(max_chars, max_bytes)
+    if fits(text):
+        return [text]
+
+    chunks: List[str] = []
+    current = ""
+    for unit in _units(text, fits):
+        candidate = f"{current} {unit}" if current else unit
+        if fits(candidate):
+            current = candidate
+        else:
+            chunks.append(current)
+            current = unit
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class TextSegmenter:
+    """Cut text arriving in fragments (e.g. LLM tokens) into speakable segments.
+
+    A segment is released as soon as it ends at a sentence boundary. Clauses
+    are released once min_clause_chars have built up, so a long sentence starts
+    playing before it is finished, and anything reaching max_chars is cut
+    between words.
+    """
+
+    def __init__(self, min_clause_chars: int = 40, max_chars: int = 400) -> None:
+        """Create an empty segmenter.
+
+        Args:
+            min_clause_chars: Shortest buffer cut at clause punctuation
+            max_chars: Longest buffer before a cut between words is forced
+        """
+        self.min_clause_chars = min_clause_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    @property
+    def pending(self) -> str:
+        """Text received but not yet released."""
+        return self._buffer
+
+    def feed(self, fragment: str) -> List[str]:
+        """Add a fragment and return the segments it completed, in order."""
+        self._buffer += fragment
+        segments: List[str] = []
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                return segments
+            segment, self._buffer = self._buffer[:cut].strip(), self._buffer[cut:].lstrip()
+            if segment:
+                segments.append(segment)
+
+    def flush(self) -> List[str]:
+        """Release whatever text is left, e.g. at the end of an utterance."""
+        segment, self._buffer = self._buffer.strip(), ""
+        return [segment] if segment else []
+
+    def _find_cut(self) -> Optional[int]:
+        """Get the end of the next segment in the buffer, or None to keep waiting."""
+        buffer = self._buffer
+        # Boundaries need the following whitespace, so "3." waits to see whether "5" follows
+        match = _SENTENCE_END.search(buffer)
+        if match:
+            return match.end()
+        if len(buffer) >= self.min_clause_chars:
+            # Skip clause breaks so early that they would leave a fragment of a few words
+            match = _CLAUSE_BREAK.search(buffer, self.min_clause_chars // 2)
+            if match:
+                return match.end()
+        if len(buffer) >= self.max_chars:
+            cut = buffer.rfind(" ", 0, self.max_chars)
+            return cut + 1 if cut > 0 else self.max_chars
+        return None
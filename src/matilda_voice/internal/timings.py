@@ -0,0 +1,215 @@
+"""Per-request stage timings for synthesis.
+
+A SynthesisTimings record collects spans (config load, provider load, cache
+lookup, network connect, time to first byte, download, ffmpeg conversion,
+file write, playback) for one request. The record is activated with
+collect_timings() and found through a context variable, so code deep in the
+pipeline can add spans without it being passed down:
+
+    timings = SynthesisTimings()
+    engine.synthesize_text("Hello", stream=False, timings=timings)
+    print(timings.to_dict()["stages"])  # {"config_load": 0.2, "synthesize": 812.5, ...}
+
+When no record is active, timing_span() and record_timing() do nothing.
+HTTP spans come from httpx's trace extension, installed on the shared
+clients by http_clients.
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+_current: "contextvars.ContextVar[Optional[SynthesisTimings]]" = contextvars.ContextVar(
+    "synthesis_timings", default=None
+)
+
+# httpcore trace steps reported as spans of their own
+_HTTP_SPANS = {
+    "connect_tcp": "connect",  # Includes DNS resolution
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "receive_response_body": "download",
+}
+
+
+@dataclass
+class TimingSpan:
+    """One timed stage, relative to the start of its request."""
+
+    name: str
+    start: float  # Seconds after the record started
+    duration: float  # Seconds
+
+
+class SynthesisTimings:
+    """Structured timing record for one synthesis request.
+
+    Spans may be added from several threads (chunk workers) and overlap;
+    stage totals sum every span with the same name.
+    """
+
+    def __init__(self, **fields: Any) -> None:
+        """Start the record.
+
+        Args:
+            **fields: Request attributes to include in the record (e.g. request_id)
+        """
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.total: Optional[float] = None
+        self.fields: Dict[str, Any] = dict(fields)
+        self.spans: List[TimingSpan] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, end: Optional[float] = None) -> None:
+        """Add a span from perf_counter() timestamps (end defaults to now)."""
+        end = time.perf_counter() if end is None else end
+        span = TimingSpan(name, start - self._start, end - start)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a span."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start)
+
+    def set(self, **fields: Any) -> None:
+        """Set request attributes such as provider, voice or cache_hit."""
+        with self._lock:
+            self.fields.update(fields)
+
+    def finish(self) -> None:
+        """Fix the total duration; later spans are still recorded."""
+        self.total = time.perf_counter() - self._start
+
+    def stages(self) -> Dict[str, float]:
+        """Get total seconds per stage, in the order stages first started."""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        for span in spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-serializable record with durations in milliseconds."""
+        total = self.total if self.total is not None else time.perf_counter() - self._start
+        with self._lock:
+            fields = dict(self.fields)
+            spans = sorted(self.spans, key=lambda span: span.start)
+        return {
+            **fields,
+            "started_at": self.started_at,
+            "total_ms": round(total * 1000, 3),
+            "stages": {name: round(seconds * 1000, 3) for name, seconds in self.stages().items()},
+            "spans": [
+                {
+                    "name": span.name,
+                    "start_ms": round(span.start * 1000, 3),
+                    "duration_ms": round(span.duration * 1000, 3),
+                }
+                for span in spans
+            ],
+        }
+
+    def format_table(self) -> str:
+        """Format stage totals as an aligned, human-readable table."""
+        record = self.to_dict()
+        lines = [f"Timings (total {record['total_ms']:.1f} ms):"]
+        for name, ms in record["stages"].items():
+            lines.append(f"  {name:<18} {ms:>10.1f} ms")
+        return "\n".join(lines)
+
+    def http_trace(self) -> "_HTTPTrace":
+        """Build an httpx trace callback that records network spans here."""
+        return _HTTPTrace(self)
+
+
+class _HTTPTrace:
+    """httpx "trace" extension turning httpcore events into spans."""
+
+    def __init__(self, timings: SynthesisTimings) -> None:
+        self.timings = timings
+        self._started: Dict[str, float] = {}
+        self._request_start: Optional[float] = None
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        stage, _, phase = event.rpartition(".")
+        step = stage.rpartition(".")[2]
+        now = time.perf_counter()
+
+        if phase == "started":
+            self._started[step] = now
+            if step == "send_request_headers":
+                self._request_start = now
+            return
+
+        start = self._started.pop(step, None)
+        if start is None:
+            return
+        if step in _HTTP_SPANS:
+            self.timings.add(_HTTP_SPANS[step], start, now)
+        elif step == "receive_response_headers" and self._request_start is not None:
+            # Request sent until response headers arrived: the provider's time to first byte
+            self.timings.add("ttfb", self._request_start, now)
+
+    async def atrace(self, event: str, info: Dict[str, Any]) -> None:
+        """Async form required by httpx.AsyncClient."""
+        self(event, info)
+
+
+def current_timings() -> Optional[SynthesisTimings]:
+    """Get the timing record active in this context, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def collect_timings(timings: Optional[SynthesisTimings]) -> Iterator[Optional[SynthesisTimings]]:
+    """Make a record current for the enclosed block and finish it on exit.
+
+    Passing None leaves any already-active record in place, so nested engine
+    calls add to the outer request's record.
+    """
+    if timings is None:
+        yield current_timings()
+        return
+
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+        timings.finish()
+
+
+@contextlib.contextmanager
+def timing_span(name: str) -> Iterator[None]:
+    """Time the enclosed block into the active record, if there is one."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.span(name):
+        yield
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a span of the given length ending now to the active record."""
+    timings = _current.get()
+    if timings is not None:
+        end = time.perf_counter()
+        timings.add(name, end - seconds, end)
+
+
+def set_timing_fields(**fields: Any) -> None:
+    """Set request attributes on the active record, if there is one."""
+    timings = _current.get()
+    if timings is not None:
+        timings.set(**fields)
@@ -38,11 +38,68 @@ class SemanticElement:
         return f"{self.type.value}{level_str}: {self.content[:50]}..."
 
 
+# =============================================================================
+# Batch Synthesis Types
+# =============================================================================
+
+
+@dataclass
+class BatchItem:
+    """One entry of a batch synthesis request."""
+
+    text: str
+    output_path: str
+    voice: Optional[str] = None
+    provider_name: Optional[str] = None
+    output_format: Optional[str] = None  # Defaults to the output path's extension
+    options: Dict[str, Any] = field(default_factory=dict)  # rate, pitch, model, ...
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch item."""
+
+    index: int
+    item: BatchItem
+    success: bool
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+# =============================================================================
+# Streaming Types
+# =============================================================================
+
+
+@dataclass
+class AudioChunk:
+    """A piece of encoded audio yielded by TTSEngine.synthesize_iter."""
+
+    data: bytes
+    index: int  # Position in the stream, starting at 0
+    format: str  # Encoding of data, e.g. "mp3" or "wav"
+    mime_type: str  # e.g. "audio/mpeg"
+    provider_name: str
+
+
 # =============================================================================
 # Provider and Voice Types
 # =============================================================================
 
 
+@dataclass
+class CatalogVoice:
+    """A voice entry in the persistent voice catalog."""
+
+    provider: str
+    name: str
+    locale: str  # e.g. "en-US", empty when the name carries none
+    gender: str  # "F", "M" or "U"
+    quality: int  # 1 (low) to 3 (high)
+    region: str  # e.g. "American", as shown in the voice browser
+
+
 class VoiceSettings(TypedDict):
     """Voice settings for TTS synthesis."""
 
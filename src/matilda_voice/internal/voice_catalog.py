@@ -0,0 +1,344 @@
+"""Persistent catalog of the voices every provider offers.
+
+Listing voices means building each provider and calling get_info(), which for
+Edge TTS and Google is a live network request. The catalog does that once and
+shares the result between processes:
+
+- Providers are queried concurrently, each time-boxed by
+  voice_catalog_provider_timeout_seconds; a slow or failing provider keeps its
+  previously indexed voices instead of holding up the others
+- The merged result is written to a JSON index (voice_catalog_path) and reused
+  until voice_catalog_ttl_seconds have passed, per provider
+- Lookups are served from in-memory dicts keyed by provider and voice name
+
+Usage:
+    catalog = VoiceCatalog(registry.keys(), engine.get_provider_info)
+    catalog.has_voice("edge_tts", "en-US-JennyNeural")
+    catalog.get_all_voices()  # {"edge_tts": [...], "openai_tts": [...]}
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from ..base import TTSProvider
+from .config import get_config_value
+from .types import CatalogVoice, ProviderInfo
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# How long a provider that failed to list its voices is left alone before retrying
+_FAILURE_RETRY_SECONDS = 300
+
+_LOCALE_PATTERN = re.compile(r"^([a-z]{2,3}-[A-Z]{2,3})(?:-|$)")
+
+
+def get_voice_catalog_path() -> Path:
+    """Get the voice index path, using XDG standard with fallback."""
+    configured = get_config_value("voice_catalog_path", "")
+    if configured:
+        return Path(configured).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "voice" / "voices.json"
+    return Path.home() / ".cache" / "voice" / "voices.json"
+
+
+def parse_locale(voice: str) -> str:
+    """Extract a locale such as "en-US" from a voice name, or "" if it has none."""
+    match = _LOCALE_PATTERN.match(voice)
+    return match.group(1) if match else ""
+
+
+def provider_info_loader(
+    load_provider_func: Callable[[str], Type[TTSProvider]],
+) -> Callable[[str], Optional[ProviderInfo]]:
+    """Adapt a provider class loader into a catalog fetch function.
+
+    Args:
+        load_provider_func: Function returning the provider class for a name
+
+    Returns:
+        Function that builds the provider and returns its get_info()
+    """
+
+    def fetch(provider_name: str) -> Optional[ProviderInfo]:
+        return load_provider_func(provider_name)().get_info()
+
+    return fetch
+
+
+class VoiceCatalog:
+    """Concurrently refreshed, disk-backed index of provider voices."""
+
+    def __init__(
+        self,
+        provider_names: Iterable[str],
+        fetch_info: Callable[[str], Optional[ProviderInfo]],
+        path: Optional[Path] = None,
+        ttl_seconds: Optional[float] = None,
+        provider_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the catalog; nothing is read or fetched until first use.
+
+        Args:
+            provider_names: Providers to index, in display order
+            fetch_info: Returns a provider's info dict (None if unavailable)
+            path: Index file (default: get_voice_catalog_path())
+            ttl_seconds: Age after which a provider's voices are fetched again
+            provider_timeout: Seconds to wait for each provider during a refresh
+        """
+        self.provider_names = list(provider_names)
+        self.fetch_info = fetch_info
+        self.path = Path(path) if path is not None else get_voice_catalog_path()
+        self.ttl_seconds = float(
+            ttl_seconds if ttl_seconds is not None else get_config_value("voice_catalog_ttl_seconds", 86400)
+        )
+        self.provider_timeout = float(
+            provider_timeout
+            if provider_timeout is not None
+            else get_config_value("voice_catalog_provider_timeout_seconds", 10)
+        )
+
+        self._voices: Dict[str, Dict[str, CatalogVoice]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def lookup(self, provider_name: str, voice: str) -> Optional[CatalogVoice]:
+        """Get a voice's catalog entry, or None if the provider does not offer it."""
+        self.ensure_fresh()
+        with self._lock:
+            return self._voices.get(provider_name, {}).get(voice)
+
+    def has_voice(self, provider_name: str, voice: str) -> bool:
+        """Check whether a provider offers a voice."""
+        return self.lookup(provider_name, voice) is not None
+
+    def get_voices(self, provider_name: str) -> List[str]:
+        """Get a provider's voice names (empty if it is unavailable)."""
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._voices.get(provider_name, {}))
+
+    def get_all_voices(self) -> Dict[str, List[str]]:
+        """Get voice names for every provider, keyed by provider name."""
+        self.ensure_fresh()
+        with self._lock:
+            return {name: list(self._voices.get(name, {})) for name in self.provider_names}
+
+    def entries(self, provider_name: Optional[str] = None) -> List[CatalogVoice]:
+        """Get catalog entries for one provider, or all of them in provider order."""
+        self.ensure_fresh()
+        names = [provider_name] if provider_name else self.provider_names
+        with self._lock:
+            return [entry for name in names for entry in self._voices.get(name, {}).values()]
+
+    # ------------------------------------------------------------------
+    # Refreshing
+    # ------------------------------------------------------------------
+
+    def ensure_fresh(self) -> None:
+        """Load the index and refresh any provider whose entries are missing or expired."""
+        if not self._loaded:
+            with self._refresh_lock:
+                if not self._loaded:
+                    self._load_index()
+                    self._loaded = True
+        if self._stale_providers():
+            self.refresh()
+
+    def _stale_providers(self) -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [
+                name
+                for name in self.provider_names
+                if now - self._fetched_at.get(name, 0.0) >= self.ttl_seconds
+                and now - self._failed_at.get(name, 0.0) >= _FAILURE_RETRY_SECONDS
+            ]
+
+    def refresh(self, provider_names: Optional[Iterable[str]] = None, force: bool = False) -> List[str]:
+        """Fetch voices from providers concurrently and update the index.
+
+        Args:
+            provider_names: Providers to refresh (default: the stale ones)
+            force: Refresh even providers whose entries have not expired
+
+        Returns:
+            Names of the providers that answered within the timeout
+        """
+        with self._refresh_lock:
+            if not self._loaded:
+                self._load_index()
+                self._loaded = True
+
+            if provider_names is not None:
+                names = list(provider_names)
+            elif force:
+                names = list(self.provider_names)
+            else:
+                names = self._stale_providers()
+            if not names:
+                return []
+
+            # Daemon threads, so a provider that never answers cannot block exit
+            workers = [
+                threading.Thread(target=self._fetch, args=(name,), name=f"voice-catalog-{name}", daemon=True)
+                for name in names
+            ]
+            for worker in workers:
+                worker.start()
+            deadline = time.monotonic() + self.provider_timeout
+            for worker in workers:
+                worker.join(max(0.0, deadline - time.monotonic()))
+
+            refreshed = []
+            now = time.time()
+            with self._lock:
+                for name, worker in zip(names, workers, strict=True):
+                    if worker.is_alive():
+                        self._failed_at[name] = now
+                        logger.warning(
+                            f"Listing voices for {name} timed out after {self.provider_timeout:.0f}s; "
+                            "using previously indexed voices"
+                        )
+                    elif name not in self._failed_at:
+                        refreshed.append(name)
+
+            if refreshed:
+                self._save_index()
+            return refreshed
+
+    def _fetch(self, provider_name: str) -> None:
+        """Fetch and index one provider's voices; runs in a worker thread."""
+        # Imported here: the voice_browser package pulls in curses and imports this module
+        from ..voice_browser.voice_analyzer import analyze_voice
+
+        try:
+            info = self.fetch_info(provider_name)
+        except Exception as e:  # Any provider failure just leaves its old entries in place
+            logger.debug(f"Could not list voices for {provider_name}: {e}")
+            info = None
+        if not info:
+            with self._lock:
+                self._failed_at[provider_name] = time.time()
+            return
+
+        voices = info.get("all_voices") or info.get("sample_voices", [])
+        if not isinstance(voices, list):
+            voices = []
+        entries = {}
+        for voice in voices:
+            if not isinstance(voice, str):
+                continue
+            quality, region, gender = analyze_voice(provider_name, voice)
+            entries[voice] = CatalogVoice(provider_name, voice, parse_locale(voice), gender, quality, region)
+
+        with self._lock:
+            self._voices[provider_name] = entries
+            self._fetched_at[provider_name] = time.time()
+            self._failed_at.pop(provider_name, None)
+        logger.debug(f"Indexed {len(entries)} voices for {provider_name}")
+
+    def clear(self) -> None:
+        """Forget all entries and delete the index file."""
+        with self._refresh_lock, self._lock:
+            self._voices.clear()
+            self._fetched_at.clear()
+            self._failed_at.clear()
+            self._loaded = True
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not delete voice index {self.path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Index file
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> None:
+        """Read the index file, ignoring it if missing or unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable voice index {self.path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+
+        providers = data.get("providers", {})
+        with self._lock:
+            for name in self.provider_names:
+                record = providers.get(name)
+                if not isinstance(record, dict):
+                    continue
+                try:
+                    entries = {v["name"]: CatalogVoice(provider=name, **v) for v in record["voices"]}
+                    fetched_at = float(record["fetched_at"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._voices[name] = entries
+                self._fetched_at[name] = fetched_at
+
+    def _save_index(self) -> None:
+        """Write the index atomically so concurrent readers never see a partial file."""
+        with self._lock:
+            providers = {
+                name: {
+                    "fetched_at": self._fetched_at[name],
+                    "voices": [
+                        {k: v for k, v in asdict(entry).items() if k != "provider"} for entry in voices.values()
+                    ],
+                }
+                for name, voices in self._voices.items()
+                if name in self._fetched_at
+            }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    json.dump({"version": INDEX_VERSION, "providers": providers}, tmp)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Voice index write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider voice counts and index ages in seconds."""
+        now = time.time()
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "providers": {
+                    name: {
+                        "voices": len(self._voices.get(name, {})),
+                        "age_seconds": now - self._fetched_at[name] if name in self._fetched_at else None,
+                    }
+                    for name in self.provider_names
+                },
+            }
@@ -1,15 +1,17 @@
 import logging
-import tempfile
 from typing import Any, Optional
 
 from ..base import TTSProvider
 from ..exceptions import AudioPlaybackError, DependencyError, ProviderError
-from ..internal.audio_utils import convert_with_cleanup, parse_bool_param
+from ..internal.audio_utils import parse_bool_param, save_audio_bytes
 from ..internal.types import ProviderInfo
 from ..voice_manager import VoiceManager
 
 
 class ChatterboxProvider(TTSProvider):
+    # One local model copy; chunks of long text are synthesized in turn
+    CONCURRENT_SYNTHESIS = False
+
     def __init__(self) -> None:
         self.tts = None
         self.logger = logging.getLogger(__name__)
@@ -33,6 +35,14 @@ class ChatterboxProvider(TTSProvider):
             except (RuntimeError, ValueError, MemoryError) as e:
                 raise ProviderError(f"Failed to load Chatterbox model: {e}") from e
 
+    def warm(self) -> None:
+        """Load the Chatterbox model ahead of the first request."""
+        self._lazy_load()
+
+    def close(self) -> None:
+        """Drop the loaded model so its memory can be reclaimed."""
+        self.tts = None
+
     def _has_cuda(self) -> bool:
         try:
             import torch  # type: ignore
@@ -119,19 +129,15 @@ class ChatterboxProvider(TTSProvider):
 
                 if self.tts is not None and output_path is not None:
                     ta.save(output_path, wav, self.tts.sr)
-            else:
-                # Convert to other formats using ffmpeg
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    wav_path = tmp.name
+            elif output_path is not None:
+                # Render the WAV in memory and pipe it through ffmpeg
+                import io
 
                 import torchaudio as ta  # type: ignore
 
-                if self.tts is not None:
-                    ta.save(wav_path, wav, self.tts.sr)
-
-                # Convert using utility function with cleanup
-                if output_path is not None:
-                    convert_with_cleanup(wav_path, output_path, output_format)
+                buffer = io.BytesIO()
+                ta.save(buffer, wav, self.tts.sr, format="wav")
+                save_audio_bytes(buffer.getvalue(), output_path, "wav", output_format)
 
     def _stream_to_speakers(self, wav_tensor: Any) -> None:
         """Stream audio tensor directly to speakers using ffplay"""
@@ -190,18 +196,7 @@ class ChatterboxProvider(TTSProvider):
     def _save_audio_data(self, audio_data: bytes, output_path: str, output_format: str) -> None:
         """Save raw audio data to file with optional format conversion"""
         try:
-            if output_format == "wav":
-                # Direct save for WAV
-                with open(output_path, "wb") as f:
-                    f.write(audio_data)
-            else:
-                # Convert to other formats using ffmpeg
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    tmp.write(audio_data)
-                    wav_path = tmp.name
-
-                # Convert using utility function with cleanup
-                convert_with_cleanup(wav_path, output_path, output_format)
+            save_audio_bytes(audio_data, output_path, "wav", output_format)
 
         except (IOError, OSError, ValueError) as e:
             self.logger.error(f"Failed to save audio data: {e}")
@@ -27,6 +27,9 @@ class CoquiProvider(TTSProvider):
     # Default model - XTTS v2 is the most capable for voice cloning
     DEFAULT_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
 
+    # One local model copy; chunks of long text are synthesized in turn
+    CONCURRENT_SYNTHESIS = False
+
     def __init__(self) -> None:
         self.tts = None
         self.logger = logging.getLogger(__name__)
@@ -61,6 +64,14 @@ class CoquiProvider(TTSProvider):
         except (RuntimeError, ValueError, MemoryError, OSError) as e:
             raise ProviderError(f"Failed to load Coqui TTS model: {e}") from e
 
+    def warm(self) -> None:
+        """Load the default Coqui model ahead of the first request."""
+        self._lazy_load()
+
+    def close(self) -> None:
+        """Drop the loaded model so its memory can be reclaimed."""
+        self.tts = None
+
     def _has_cuda(self) -> bool:
         """Check if CUDA is available for GPU acceleration."""
         try:
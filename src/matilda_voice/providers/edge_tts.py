@@ -1,22 +1,27 @@
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
 from ..base import TTSProvider
 from ..exceptions import DependencyError, NetworkError, ProviderError
 from ..internal.audio_utils import (
     StreamPlayer,
     check_audio_environment,
-    convert_with_cleanup,
     parse_bool_param,
     stream_via_tempfile,
+    transcode_chunks_async,
 )
 from ..internal.config import get_config_value
+from ..internal.iter_bridge import iterate_async_in_thread
 from ..internal.types import ProviderInfo
 
 
 class EdgeTTSProvider(TTSProvider):
+    # Each edge-tts Communicate is per call, so one instance serves concurrent awaits
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    STREAM_FORMAT = "mp3"
+
     def __init__(self) -> None:
         self.edge_tts: Optional[Any] = None
         self.logger = logging.getLogger(__name__)
@@ -33,6 +38,14 @@ class EdgeTTSProvider(TTSProvider):
             except ImportError:
                 raise DependencyError("edge-tts not installed. Please install with: pip install edge-tts") from None
 
+    def warm(self) -> None:
+        """Import edge-tts ahead of the first request."""
+        self._lazy_load()
+
+    def close(self) -> None:
+        """Shut down the executor used to run coroutines from inside event loops."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _run_async_safely(self, coro: Any) -> Any:
         """Safely run async coroutine, handling existing event loops."""
         try:
@@ -72,17 +85,10 @@ class EdgeTTSProvider(TTSProvider):
                 self.logger.debug(f"Saving MP3 directly to {output_path}")
                 await communicate.save(output_path)
             else:
-                # For other formats, save as MP3 first then convert
-                import tempfile
-
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-                    mp3_path = tmp.name
-
-                self.logger.debug(f"Saving MP3 to temporary file: {mp3_path}")
-                await communicate.save(mp3_path)
-
-                # Convert using utility function with cleanup
-                convert_with_cleanup(mp3_path, output_path, output_format)
+                # For other formats, pipe the MP3 stream through ffmpeg as it arrives
+                self.logger.debug(f"Transcoding MP3 stream to {output_format}: {output_path}")
+                audio = (chunk["data"] async for chunk in communicate.stream() if chunk.get("type") == "audio")
+                await transcode_chunks_async(audio, "mp3", output_path, output_format)
         except ConnectionError as e:
             self.logger.error(f"Network connection error during Edge TTS synthesis: {e}")
             raise NetworkError(f"Edge TTS connection failed: {e}. Check your internet connection and try again.") from e
@@ -146,7 +152,8 @@ class EdgeTTSProvider(TTSProvider):
                 self._synthesize_async(text, output_path, kwargs["voice"], kwargs["rate"], kwargs["pitch"], "mp3")
             )
 
-        stream_via_tempfile(
+        await asyncio.to_thread(
+            stream_via_tempfile,
             synthesize_func=sync_synthesize,
             text=text,
             logger=self.logger,
@@ -156,29 +163,64 @@ class EdgeTTSProvider(TTSProvider):
             pitch=pitch,
         )
 
-    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
-        self._lazy_load()
-
-        # Extract provider-specific options
+    @staticmethod
+    def _voice_options(kwargs: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Read voice, rate and pitch from synthesis options in edge-tts notation."""
         voice = kwargs.get("voice", "en-US-JennyNeural")
         rate = kwargs.get("rate", "+0%")
         pitch = kwargs.get("pitch", "+0Hz")
-        stream = parse_bool_param(kwargs.get("stream"), False)
-        output_format = kwargs.get("output_format", "mp3")
 
         # Format rate and pitch
         if not rate.endswith("%"):
             rate = f"+{rate}%" if not rate.startswith(("+", "-")) else f"{rate}%"
         if not pitch.endswith("Hz"):
             pitch = f"+{pitch}Hz" if not pitch.startswith(("+", "-")) else f"{pitch}Hz"
+        return voice, rate, pitch
+
+    def _build_coroutine(self, text: str, output_path: Optional[str], **kwargs: Any) -> Any:
+        """Parse synthesis options and return the coroutine that performs the request."""
+        self._lazy_load()
+
+        # Extract provider-specific options
+        voice, rate, pitch = self._voice_options(kwargs)
+        stream = parse_bool_param(kwargs.get("stream"), False)
+        output_format = kwargs.get("output_format", "mp3")
 
         # Stream or save based on option
         if stream:
-            self._run_async_safely(self._stream_async(text, voice, rate, pitch))
-        else:
-            if output_path is None:
-                raise ValueError("output_path is required when not streaming")
-            self._run_async_safely(self._synthesize_async(text, output_path, voice, rate, pitch, output_format))
+            return self._stream_async(text, voice, rate, pitch)
+        if output_path is None:
+            raise ValueError("output_path is required when not streaming")
+        return self._synthesize_async(text, output_path, voice, rate, pitch, output_format)
+
+    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        self._run_async_safely(self._build_coroutine(text, output_path, **kwargs))
+
+    async def synthesize_async(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize on the caller's event loop; edge-tts is natively async."""
+        await self._build_coroutine(text, output_path, **kwargs)
+
+    async def iter_audio_async(self, text: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Yield MP3 chunks from the edge-tts websocket as they arrive."""
+        self._lazy_load()
+        if self.edge_tts is None:
+            raise ProviderError("Edge TTS module not loaded")
+        voice, rate, pitch = self._voice_options(kwargs)
+
+        try:
+            communicate = self.edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
+            async for chunk in communicate.stream():
+                if chunk.get("type") == "audio" and chunk.get("data"):
+                    yield chunk["data"]
+        except (ConnectionError, OSError, RuntimeError, ValueError) as e:
+            error_str = str(e).lower()
+            if "internet" in error_str or "network" in error_str or "connection" in error_str:
+                raise NetworkError(f"Edge TTS network error: {e}. Check your internet connection and try again.") from e
+            raise ProviderError(f"Edge TTS streaming failed: {e}") from e
+
+    def iter_audio(self, text: str, **kwargs: Any) -> Iterator[bytes]:
+        """Yield MP3 chunks, driving the async edge-tts stream on a background loop."""
+        return iterate_async_in_thread(lambda: self.iter_audio_async(text, **kwargs))
 
     def get_info(self) -> Optional[ProviderInfo]:
         self._lazy_load()
@@ -1,8 +1,8 @@
 """ElevenLabs TTS provider implementation with voice cloning support."""
 
+import asyncio
 import logging
-import tempfile
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 import httpx
 
@@ -18,18 +18,34 @@ from ..exceptions import (
 from ..internal.audio_utils import (
     StreamPlayer,
     check_audio_environment,
-    convert_audio,
     parse_bool_param,
+    save_audio_bytes,
     stream_via_tempfile,
 )
 from ..internal.config import get_api_key, get_config_value, is_ssml, strip_ssml_tags
-from ..internal.http_retry import request_with_retry, stream_with_retry
+from ..internal.http_retry import (
+    async_request_with_retry,
+    async_stream_with_retry,
+    request_with_retry,
+    stream_with_retry,
+)
 from ..internal.types import ProviderInfo
 
 
 class ElevenLabsProvider(TTSProvider):
     """ElevenLabs TTS provider with premium voice cloning and custom voices."""
 
+    # Per-request character limit of the multilingual models
+    MAX_TEXT_CHARS = 5000
+
+    # Async requests share only the cached voice list
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    STREAM_FORMAT = "mp3"
+    CIRCUIT_BREAKER = "ElevenLabs"
+
+    # output_format query values; "pcm" is raw 24 kHz 16-bit mono samples
+    NATIVE_FORMATS = {"mp3": "mp3_44100_128", "pcm": "pcm_24000"}
+
     # Default ElevenLabs voices (these are always available)
     DEFAULT_VOICES = {
         "rachel": "Calm and soothing female voice",
@@ -90,6 +106,47 @@ class ElevenLabsProvider(TTSProvider):
             **kwargs,
         )
 
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Async counterpart of _make_request, awaiting the API on the event loop."""
+        api_key = get_api_key("elevenlabs")
+        if not api_key:
+            raise AuthenticationError(
+                "ElevenLabs API key not found. Set with: voice config elevenlabs_api_key YOUR_KEY"
+            )
+
+        headers = {"xi-api-key": api_key, "Content-Type": "application/json"}
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        return await async_request_with_retry(
+            method,
+            url,
+            headers=headers,
+            idempotent=idempotent,
+            provider_name="ElevenLabs",
+            **kwargs,
+        )
+
+    @staticmethod
+    def _error_detail(response: httpx.Response) -> str:
+        """Extract the error message from a failed API response."""
+        try:
+            error_detail = response.json().get("detail", {})
+            if isinstance(error_detail, dict):
+                return str(error_detail.get("message", "Unknown error"))
+            return str(error_detail)
+        except (ValueError, KeyError, AttributeError):
+            # JSON parsing failed or missing expected keys
+            return response.text
+
     def _get_available_voices(self) -> List[Dict[str, Any]]:
         """Get list of all available voices from ElevenLabs."""
         if self._voices_cache is None:
@@ -122,6 +179,10 @@ class ElevenLabsProvider(TTSProvider):
 
         return self._voices_cache
 
+    def warm(self) -> None:
+        """Fetch the voice list so name-to-ID lookups don't hit the network mid-request."""
+        self._get_available_voices()
+
     def _get_voice_id(self, voice_name: str) -> Optional[str]:
         """Get voice ID from voice name."""
         # Check if it's already a voice ID (32 char hex string)
@@ -151,29 +212,44 @@ class ElevenLabsProvider(TTSProvider):
 
         return voice_id_map.get(voice_name.lower())
 
-    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
-        """Synthesize speech using ElevenLabs API."""
-        # Extract options
-        voice = kwargs.get("voice", "rachel")  # Default voice
-        stream = parse_bool_param(kwargs.get("stream"), False)
-        output_format = kwargs.get("output_format", "wav")
-        stability = float(kwargs.get("stability", str(get_config_value("elevenlabs_default_stability"))))
-        similarity_boost = float(
-            kwargs.get("similarity_boost", str(get_config_value("elevenlabs_default_similarity_boost")))
-        )
-        style = float(kwargs.get("style", str(get_config_value("elevenlabs_default_style"))))
+    def _voice_settings(self, kwargs: Dict[str, Any]) -> Dict[str, float]:
+        """Read stability, similarity_boost and style from synthesis options."""
+        return {
+            "stability": float(kwargs.get("stability", str(get_config_value("elevenlabs_default_stability")))),
+            "similarity_boost": float(
+                kwargs.get("similarity_boost", str(get_config_value("elevenlabs_default_similarity_boost")))
+            ),
+            "style": float(kwargs.get("style", str(get_config_value("elevenlabs_default_style")))),
+        }
 
-        # Handle SSML (ElevenLabs doesn't support SSML, so strip tags)
+    def _prepare_text(self, text: str) -> str:
+        """Strip SSML, which ElevenLabs doesn't support."""
         if is_ssml(text):
             self.logger.warning("ElevenLabs doesn't support SSML. Converting to plain text.")
             text = strip_ssml_tags(text)
+        return text
 
-        # Parse voice name
+    @staticmethod
+    def _parse_voice_name(voice: str) -> str:
+        """Drop a provider prefix like "elevenlabs:rachel"."""
         if ":" in voice:
-            # Format like "elevenlabs:rachel"
             _, voice_name = voice.split(":", 1)
-        else:
-            voice_name = voice
+            return voice_name
+        return voice
+
+    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech using ElevenLabs API."""
+        # Extract options
+        voice_name = self._parse_voice_name(kwargs.get("voice", "rachel"))  # Default voice
+        stream = parse_bool_param(kwargs.get("stream"), False)
+        output_format = kwargs.get("output_format", "wav")
+        settings = self._voice_settings(kwargs)
+        stability = settings["stability"]
+        similarity_boost = settings["similarity_boost"]
+        style = settings["style"]
+
+        # Handle SSML (ElevenLabs doesn't support SSML, so strip tags)
+        text = self._prepare_text(text)
 
         # Get voice ID
         voice_id = self._get_voice_id(voice_name)
@@ -196,44 +272,23 @@ class ElevenLabsProvider(TTSProvider):
                 }
 
                 self.logger.info(f"Generating speech with ElevenLabs voice '{voice_name}' (ID: {voice_id})")
+                audio_format, api_format = self.native_encoding(output_format)
 
                 # Make synthesis request (idempotent=False to avoid duplicate charges)
-                response = self._make_request("POST", f"/text-to-speech/{voice_id}", json=payload, idempotent=False)
+                response = self._make_request(
+                    "POST",
+                    f"/text-to-speech/{voice_id}",
+                    json=payload,
+                    params={"output_format": api_format},
+                    idempotent=False,
+                )
 
                 if response.status_code != 200:
                     # Use standardized HTTP error mapping
-                    try:
-                        error_detail = response.json().get("detail", {})
-                        if isinstance(error_detail, dict):
-                            detail_text = error_detail.get("message", "Unknown error")
-                        else:
-                            detail_text = str(error_detail)
-                    except (ValueError, KeyError, AttributeError):
-                        # JSON parsing failed or missing expected keys
-                        detail_text = response.text
-
-                    raise map_http_error(response.status_code, detail_text, "ElevenLabs")
+                    raise map_http_error(response.status_code, self._error_detail(response), "ElevenLabs")
 
-                # Save audio content to temporary file
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-                    tmp_path = tmp_file.name
-                    tmp_file.write(response.content)
-
-                # Convert to desired format if needed
-                if output_format == "mp3":
-                    # Direct save
-                    if output_path is not None:
-                        import shutil
-
-                        shutil.move(tmp_path, output_path)
-                else:
-                    # Convert using ffmpeg
-                    if output_path is not None:
-                        convert_audio(tmp_path, output_path, output_format)
-                    # Clean up temp file
-                    import os
-
-                    os.unlink(tmp_path)
+                if output_path is not None:
+                    save_audio_bytes(response.content, output_path, audio_format, output_format)
 
         except httpx.RequestError as e:
             if "response" in locals():
@@ -244,6 +299,114 @@ class ElevenLabsProvider(TTSProvider):
         except (IOError, OSError, ValueError, RuntimeError) as e:
             raise ProviderError(f"ElevenLabs TTS synthesis failed: {e}") from e
 
+    def _require_voice_id(self, voice_name: str) -> str:
+        """Resolve a voice name to its ID, raising VoiceNotFoundError if unknown."""
+        voice_id = self._get_voice_id(voice_name)
+        if not voice_id:
+            raise VoiceNotFoundError(
+                f"Voice '{voice_name}' not found. Use voice voices elevenlabs to see available voices."
+            )
+        return voice_id
+
+    async def _require_voice_id_async(self, voice_name: str) -> str:
+        """Resolve a voice ID without blocking the loop on the first voice list fetch."""
+        if self._voices_cache is None:
+            return await asyncio.to_thread(self._require_voice_id, voice_name)
+        return self._require_voice_id(voice_name)
+
+    def _stream_request(self, text: str, voice_id: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the keyword arguments for a POST to the streaming endpoint."""
+        api_key = get_api_key("elevenlabs")
+        if not api_key:
+            raise AuthenticationError(
+                "ElevenLabs API key not found. Set with: voice config elevenlabs_api_key YOUR_KEY"
+            )
+        return {
+            "url": f"{self.base_url}/text-to-speech/{voice_id}/stream",
+            "params": {"output_format": self.native_encoding(kwargs.get("output_format"))[1]},
+            "headers": {"xi-api-key": api_key, "Content-Type": "application/json"},
+            "json": {
+                "text": self._prepare_text(text),
+                "model_id": "eleven_monolingual_v1",
+                "voice_settings": self._voice_settings(kwargs),
+            },
+        }
+
+    def iter_audio(self, text: str, **kwargs: Any) -> Iterator[bytes]:
+        """Yield chunks from the /stream endpoint as they arrive (MP3 unless output_format is native)."""
+        voice_id = self._require_voice_id(self._parse_voice_name(kwargs.get("voice", "rachel")))
+        request = self._stream_request(text, voice_id, kwargs)
+        url = request.pop("url")
+
+        try:
+            with stream_with_retry("POST", url, idempotent=False, provider_name="ElevenLabs", **request) as response:
+                if response.status_code != 200:
+                    response.read()
+                    raise map_http_error(response.status_code, self._error_detail(response), "ElevenLabs")
+                yield from response.iter_bytes(chunk_size=get_config_value("http_streaming_chunk_size"))
+        except httpx.RequestError as e:
+            raise NetworkError(f"ElevenLabs network error: {e}") from e
+
+    async def iter_audio_async(self, text: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Yield chunks from the /stream endpoint on the event loop."""
+        voice_id = await self._require_voice_id_async(self._parse_voice_name(kwargs.get("voice", "rachel")))
+        request = self._stream_request(text, voice_id, kwargs)
+        url = request.pop("url")
+
+        try:
+            async with async_stream_with_retry(
+                "POST", url, idempotent=False, provider_name="ElevenLabs", **request
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise map_http_error(response.status_code, self._error_detail(response), "ElevenLabs")
+                async for chunk in response.aiter_bytes(chunk_size=get_config_value("http_streaming_chunk_size")):
+                    yield chunk
+        except httpx.RequestError as e:
+            raise NetworkError(f"ElevenLabs network error: {e}") from e
+
+    async def synthesize_async(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech by awaiting the ElevenLabs API on the event loop.
+
+        Streaming to speakers is tied to the local audio device and runs in a
+        worker thread as synthesize().
+        """
+        if parse_bool_param(kwargs.get("stream"), False):
+            await super().synthesize_async(text, output_path, **kwargs)
+            return
+        if output_path is None:
+            raise ValueError("output_path is required when not streaming")
+
+        voice_name = self._parse_voice_name(kwargs.get("voice", "rachel"))
+        output_format = kwargs.get("output_format", "wav")
+        settings = self._voice_settings(kwargs)
+        text = self._prepare_text(text)
+
+        voice_id = await self._require_voice_id_async(voice_name)
+
+        payload = {"text": text, "model_id": "eleven_monolingual_v1", "voice_settings": settings}
+        audio_format, api_format = self.native_encoding(output_format)
+        self.logger.info(f"Generating speech with ElevenLabs voice '{voice_name}' (ID: {voice_id})")
+
+        try:
+            response = await self._make_request_async(
+                "POST",
+                f"/text-to-speech/{voice_id}",
+                json=payload,
+                params={"output_format": api_format},
+                idempotent=False,
+            )
+            if response.status_code != 200:
+                raise map_http_error(response.status_code, self._error_detail(response), "ElevenLabs")
+
+            # Writing and ffmpeg conversion block, so keep them off the loop
+            await asyncio.to_thread(save_audio_bytes, response.content, output_path, audio_format, output_format)
+
+        except httpx.RequestError as e:
+            raise NetworkError(f"ElevenLabs network error: {e}") from e
+        except (IOError, OSError, ValueError, RuntimeError) as e:
+            raise ProviderError(f"ElevenLabs TTS synthesis failed: {e}") from e
+
     def _stream_realtime(
         self, text: str, voice_id: str, voice_name: str, stability: float, similarity_boost: float, style: float
     ) -> None:
@@ -392,6 +555,6 @@ class ElevenLabsProvider(TTSProvider):
                     "quality": "Premium (voice cloning available)",
                 },
                 "pricing": "Starting at $5/month (subscription required)",
-                "output_format": "MP3 (converted to other formats via ffmpeg)",
+                "output_format": "MP3 or PCM (others converted via ffmpeg)",
             },
         )
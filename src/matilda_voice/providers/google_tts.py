@@ -1,9 +1,10 @@
 """Google Cloud TTS provider implementation."""
 
+import asyncio
 import base64
 import logging
 import tempfile
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -16,15 +17,25 @@ from ..exceptions import (
     QuotaError,
     map_http_error,
 )
-from ..internal.audio_utils import convert_audio, stream_audio_file
+from ..internal.audio_utils import save_audio_bytes, stream_audio_file
 from ..internal.config import get_api_key, get_config_value, is_ssml
-from ..internal.http_retry import request_with_retry
+from ..internal.http_retry import async_request_with_retry, request_with_retry
 from ..internal.types import ProviderInfo
 
 
 class GoogleTTSProvider(TTSProvider):
     """Google Cloud TTS provider with 380+ voices and full SSML support."""
 
+    # synthesize requests are limited to 5000 bytes of input
+    MAX_TEXT_BYTES = 5000
+
+    # The async client and REST calls are safe to share between requests
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    CIRCUIT_BREAKER = "Google Cloud TTS"
+
+    # audioEncoding values; LINEAR16 responses carry a WAV header
+    NATIVE_FORMATS = {"wav": "LINEAR16", "mp3": "MP3", "opus": "OGG_OPUS"}
+
     # Sample voices (a subset of available voices)
     SAMPLE_VOICES = {
         "en-US-Neural2-A": "US English, Neural2, Female",
@@ -48,6 +59,9 @@ class GoogleTTSProvider(TTSProvider):
         self.base_url = "https://texttospeech.googleapis.com/v1"
         self._client: Optional[Any] = None
         self._auth_method: Optional[str] = None
+        self._credentials_info: Optional[Dict[str, Any]] = None
+        self._async_client: Optional[Any] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _get_client(self) -> Any:
         """Get Google Cloud TTS client, supporting both API key and service account auth."""
@@ -72,6 +86,7 @@ class GoogleTTSProvider(TTSProvider):
 
                     credentials_info = json.loads(api_key)
                     self._client = texttospeech.TextToSpeechClient.from_service_account_info(credentials_info)
+                    self._credentials_info = credentials_info
                     self._auth_method = "service_account"
                 except ImportError:
                     raise DependencyError(
@@ -88,6 +103,7 @@ class GoogleTTSProvider(TTSProvider):
 
                     credentials_info = json.loads("{" + api_key + "}")
                     self._client = texttospeech.TextToSpeechClient.from_service_account_info(credentials_info)
+                    self._credentials_info = credentials_info
                     self._auth_method = "service_account"
                 except ImportError:
                     raise DependencyError(
@@ -102,6 +118,43 @@ class GoogleTTSProvider(TTSProvider):
 
         return self._client
 
+    def warm(self) -> None:
+        """Resolve the auth method and build the client ahead of the first request."""
+        self._get_client()
+
+    def close(self) -> None:
+        """Close the service account client transport, if one was created."""
+        if self._client is not None:
+            transport = getattr(self._client, "transport", None)
+            if transport is not None and hasattr(transport, "close"):
+                try:
+                    transport.close()
+                except (RuntimeError, OSError) as e:
+                    self.logger.debug(f"Error closing Google TTS transport: {e}")
+            self._client = None
+        # The async client's channel belongs to its event loop and cannot be
+        # closed from here; dropping it lets the channel be collected
+        self._async_client = None
+        self._async_client_loop = None
+
+    def _get_async_client(self) -> Any:
+        """Get the async service account client for the running event loop.
+
+        Returns:
+            TextToSpeechAsyncClient, or None when API key auth is in use
+        """
+        self._get_client()
+        if self._auth_method != "service_account" or self._credentials_info is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from google.cloud import texttospeech  # type: ignore
+
+            self._async_client = texttospeech.TextToSpeechAsyncClient.from_service_account_info(self._credentials_info)
+            self._async_client_loop = loop
+        return self._async_client
+
     def _make_request(
         self,
         method: str,
@@ -141,6 +194,82 @@ class GoogleTTSProvider(TTSProvider):
             **kwargs,
         )
 
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Async counterpart of _make_request, awaiting the REST API on the event loop."""
+        api_key = get_api_key("google")
+        if not api_key:
+            raise AuthenticationError("Google Cloud API key not found. Set with: voice config google_api_key YOUR_KEY")
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        params = {"key": api_key}
+        if "params" in kwargs:
+            params.update(kwargs.pop("params"))
+
+        return await async_request_with_retry(
+            method,
+            url,
+            params=params,
+            idempotent=idempotent,
+            provider_name="Google Cloud TTS",
+            **kwargs,
+        )
+
+    @staticmethod
+    def _error_detail(response: httpx.Response) -> str:
+        """Extract the error message from a failed REST response."""
+        try:
+            error_detail = response.json()
+            if "error" in error_detail:
+                return str(error_detail["error"].get("message", "Unknown error"))
+            return "Unknown error"
+        except (ValueError, KeyError, AttributeError):
+            # JSON parsing failed or missing expected keys
+            return response.text
+
+    def _parse_voice(self, voice: str) -> Tuple[str, str]:
+        """Split a voice setting into (voice_name, language_code).
+
+        "google:en-US-Neural2-A" and "en-US-Neural2-A" both give
+        ("en-US-Neural2-A", "en-US").
+        """
+        if ":" in voice:
+            _, voice_name = voice.split(":", 1)
+        else:
+            voice_name = voice
+
+        parts = voice_name.split("-")
+        if len(parts) >= 2:
+            return voice_name, f"{parts[0]}-{parts[1]}"
+        self.logger.warning(f"Could not parse language from voice '{voice_name}', using en-US")
+        return voice_name, "en-US"
+
+    @staticmethod
+    def _rest_payload(
+        text: str,
+        use_ssml: bool,
+        voice_name: str,
+        language_code: str,
+        speaking_rate: float,
+        pitch: float,
+        encoding: str = "LINEAR16",
+    ) -> Dict[str, Any]:
+        """Build the REST synthesize request body for one of the NATIVE_FORMATS encodings."""
+        return {
+            "input": {"ssml" if use_ssml else "text": text},
+            "voice": {"languageCode": language_code, "name": voice_name},
+            "audioConfig": {
+                "audioEncoding": encoding,
+                "speakingRate": speaking_rate,
+                "pitch": pitch,
+            },
+        }
+
     def get_info(self) -> ProviderInfo:
         """Get provider information and capabilities."""
         api_key = get_api_key("google")
@@ -187,7 +316,7 @@ class GoogleTTSProvider(TTSProvider):
                 "quality": "Highest (Neural2, WaveNet, Standard voices)",
             },
             "pricing": "$4 per 1M characters (WaveNet/Neural2), $0.4/1M (Standard)",
-            "output_format": "WAV 16kHz (converted to other formats via ffmpeg)",
+            "output_format": "WAV, MP3 or Opus (others converted via ffmpeg)",
         }
 
     def _get_all_voices(self) -> List[str]:
@@ -238,20 +367,11 @@ class GoogleTTSProvider(TTSProvider):
         # Auto-detect SSML
         use_ssml = is_ssml(text)
 
-        # Parse voice name
-        if ":" in voice:
-            # Format like "google:en-US-Neural2-A"
-            _, voice_name = voice.split(":", 1)
-        else:
-            voice_name = voice
+        # Parse voice name and language code (e.g., "en-US-Neural2-A" -> "en-US")
+        voice_name, language_code = self._parse_voice(voice)
 
-        # Extract language code from voice name (e.g., "en-US-Neural2-A" -> "en-US")
-        parts = voice_name.split("-")
-        if len(parts) >= 2:
-            language_code = f"{parts[0]}-{parts[1]}"
-        else:
-            language_code = "en-US"
-            self.logger.warning(f"Could not parse language from voice '{voice_name}', using en-US")
+        # Request the output format itself when Google can encode it; ffplay gets WAV
+        audio_format, encoding = self.native_encoding("wav" if stream else output_format)
 
         self.logger.info(f"Generating speech with Google voice '{voice_name}'")
         if use_ssml:
@@ -273,7 +393,7 @@ class GoogleTTSProvider(TTSProvider):
                 voice_selection = texttospeech.VoiceSelectionParams(language_code=language_code, name=voice_name)
 
                 audio_config = texttospeech.AudioConfig(
-                    audio_encoding=texttospeech.AudioEncoding.LINEAR16,  # WAV format
+                    audio_encoding=texttospeech.AudioEncoding[encoding],
                     speaking_rate=speaking_rate,
                     pitch=pitch,
                 )
@@ -288,15 +408,7 @@ class GoogleTTSProvider(TTSProvider):
 
             else:
                 # Use REST API with API key
-                payload = {
-                    "input": {"ssml" if use_ssml else "text": text},
-                    "voice": {"languageCode": language_code, "name": voice_name},
-                    "audioConfig": {
-                        "audioEncoding": "LINEAR16",  # WAV format
-                        "speakingRate": speaking_rate,
-                        "pitch": pitch,
-                    },
-                }
+                payload = self._rest_payload(text, use_ssml, voice_name, language_code, speaking_rate, pitch, encoding)
 
                 response = self._make_request(
                     "POST",
@@ -308,49 +420,25 @@ class GoogleTTSProvider(TTSProvider):
 
                 if response.status_code != 200:
                     # Use standardized HTTP error mapping
-                    try:
-                        error_detail = response.json()
-                        if "error" in error_detail:
-                            detail_text = error_detail["error"].get("message", "Unknown error")
-                        else:
-                            detail_text = "Unknown error"
-                    except (ValueError, KeyError, AttributeError):
-                        # JSON parsing failed or missing expected keys
-                        detail_text = response.text
-
-                    raise map_http_error(response.status_code, detail_text, "Google Cloud TTS")
+                    raise map_http_error(response.status_code, self._error_detail(response), "Google Cloud TTS")
 
                 # Get audio content from response
                 response_data = response.json()
                 audio_content = base64.b64decode(response_data["audioContent"])
                 self.logger.info("Synthesis completed via API key")
 
-            # Save audio content to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-                tmp_file.write(audio_content)
-
             if stream:
-                # Stream the audio
+                # ffplay reads the audio from a temporary file
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+                    tmp_path = tmp_file.name
+                    tmp_file.write(audio_content)
                 stream_audio_file(tmp_path)
                 # Clean up temp file
                 import os
 
                 os.unlink(tmp_path)
-            else:
-                # Convert and save to final output path
-                if output_path is not None:
-                    if output_format.lower() != "wav":
-                        convert_audio(tmp_path, output_path, output_format)
-                        # Clean up temp file
-                        import os
-
-                        os.unlink(tmp_path)
-                    else:
-                        # For WAV, just move the file
-                        import shutil
-
-                        shutil.move(tmp_path, output_path)
+            elif output_path is not None:
+                save_audio_bytes(audio_content, output_path, audio_format, output_format.lower())
 
         except httpx.RequestError as e:
             error_str = str(e).lower()
@@ -368,3 +456,69 @@ class GoogleTTSProvider(TTSProvider):
                 raise QuotaError(f"Google Cloud quota/billing issue: {e}") from e
             else:
                 raise ProviderError(f"Google TTS synthesis failed: {e}") from e
+
+    async def synthesize_async(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech by awaiting Google Cloud TTS on the event loop.
+
+        Uses TextToSpeechAsyncClient for service accounts and the async REST
+        API for API keys. Streaming to speakers is tied to the local audio
+        device and runs in a worker thread as synthesize().
+        """
+        if str(kwargs.get("stream", "false")).lower() in ("true", "1", "yes"):
+            await super().synthesize_async(text, output_path, **kwargs)
+            return
+        if output_path is None:
+            raise ValueError("output_path is required when not streaming")
+
+        voice_name, language_code = self._parse_voice(kwargs.get("voice", "en-US-Neural2-A"))
+        output_format = kwargs.get("output_format", "wav")
+        speaking_rate = float(kwargs.get("speaking_rate", "1.0"))
+        pitch = float(kwargs.get("pitch", "0.0"))
+        use_ssml = is_ssml(text)
+        audio_format, encoding = self.native_encoding(output_format)
+
+        self.logger.info(f"Generating speech with Google voice '{voice_name}'")
+
+        try:
+            client = self._get_async_client()
+            if client is not None:
+                from google.cloud import texttospeech  # type: ignore
+
+                synthesis_input = (
+                    texttospeech.SynthesisInput(ssml=text) if use_ssml else texttospeech.SynthesisInput(text=text)
+                )
+                response = await client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=texttospeech.VoiceSelectionParams(language_code=language_code, name=voice_name),
+                    audio_config=texttospeech.AudioConfig(
+                        audio_encoding=texttospeech.AudioEncoding[encoding],
+                        speaking_rate=speaking_rate,
+                        pitch=pitch,
+                    ),
+                )
+                audio_content = response.audio_content
+            else:
+                response = await self._make_request_async(
+                    "POST",
+                    "/text:synthesize",
+                    idempotent=False,
+                    json=self._rest_payload(text, use_ssml, voice_name, language_code, speaking_rate, pitch, encoding),
+                    headers={"Content-Type": "application/json"},
+                )
+                if response.status_code != 200:
+                    raise map_http_error(response.status_code, self._error_detail(response), "Google Cloud TTS")
+                audio_content = base64.b64decode(response.json()["audioContent"])
+
+            # Writing and ffmpeg conversion block, so keep them off the loop
+            await asyncio.to_thread(save_audio_bytes, audio_content, output_path, audio_format, output_format)
+
+        except httpx.RequestError as e:
+            raise NetworkError(f"Google Cloud TTS request failed: {e}") from e
+        except (ImportError, IOError, OSError, ValueError, RuntimeError) as e:
+            error_str = str(e).lower()
+            if "authentication" in error_str or "api_key" in error_str or "credentials" in error_str:
+                raise AuthenticationError(f"Google Cloud authentication failed: {e}") from e
+            elif "quota" in error_str or "billing" in error_str:
+                raise QuotaError(f"Google Cloud quota/billing issue: {e}") from e
+            else:
+                raise ProviderError(f"Google TTS synthesis failed: {e}") from e
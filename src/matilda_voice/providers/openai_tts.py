@@ -1,30 +1,44 @@
 """OpenAI TTS provider implementation."""
 
+import asyncio
 import logging
-import tempfile
-from typing import Any, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, cast
 
 from ..base import TTSProvider
 from ..exceptions import (
     AuthenticationError,
     DependencyError,
+    ProviderError,
     classify_and_raise,
 )
 from ..internal.audio_utils import (
     StreamingPlayer,
     check_audio_environment,
-    convert_audio,
     parse_bool_param,
+    save_audio_bytes,
     stream_via_tempfile,
+    transcode_chunks,
 )
 from ..internal.config import get_api_key, get_config_value, is_ssml, strip_ssml_tags
-from ..internal.http_retry import call_with_retry
+from ..internal.http_clients import get_async_http_client, get_http_client
+from ..internal.http_retry import async_call_with_retry, call_with_retry, get_circuit_breaker
 from ..internal.types import ProviderInfo
 
 
 class OpenAITTSProvider(TTSProvider):
     """OpenAI TTS API provider with 6 high-quality voices."""
 
+    # The speech endpoint rejects input longer than this
+    MAX_TEXT_CHARS = 4096
+
+    # The AsyncOpenAI client multiplexes concurrent requests
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    STREAM_FORMAT = "mp3"
+    CIRCUIT_BREAKER = "OpenAI"
+
+    # response_format values; "pcm" is raw 24 kHz 16-bit mono samples
+    NATIVE_FORMATS = {"mp3": "mp3", "wav": "wav", "opus": "opus", "aac": "aac", "flac": "flac", "pcm": "pcm"}
+
     # Available OpenAI TTS voices
     VOICES = {
         "alloy": "Balanced and versatile voice",
@@ -38,10 +52,12 @@ class OpenAITTSProvider(TTSProvider):
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self._client = None
+        self._async_client: Optional[Any] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def _get_retry_exceptions(self) -> tuple[type[BaseException], ...]:
+    def _get_retry_exceptions(self) -> tuple[type[Exception], ...]:
         """Return OpenAI-specific retryable exceptions if available."""
-        retry_exceptions: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+        retry_exceptions: tuple[type[Exception], ...] = (ConnectionError, TimeoutError)
         try:
             from openai import APIConnectionError, APITimeoutError, RateLimitError  # type: ignore
 
@@ -62,16 +78,49 @@ class OpenAITTSProvider(TTSProvider):
             if not api_key:
                 raise AuthenticationError("OpenAI API key not found. Set with: voice config openai_api_key YOUR_KEY")
 
-            self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=api_key, http_client=get_http_client("OpenAI"))
 
         return self._client
 
-    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
-        """Synthesize speech using OpenAI TTS API."""
-        # Extract options
+    def _get_async_client(self) -> Any:
+        """Get the AsyncOpenAI client for the running event loop, initializing if needed.
+
+        The client's connection pool belongs to the loop it was first used on,
+        so a new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            try:
+                from openai import AsyncOpenAI  # type: ignore
+            except ImportError:
+                raise DependencyError("OpenAI library not installed. Install with: pip install openai") from None
+
+            api_key = get_api_key("openai")
+            if not api_key:
+                raise AuthenticationError("OpenAI API key not found. Set with: voice config openai_api_key YOUR_KEY")
+
+            self._async_client = AsyncOpenAI(api_key=api_key, http_client=get_async_http_client("OpenAI"))
+            self._async_client_loop = loop
+
+        return self._async_client
+
+    def warm(self) -> None:
+        """Create the OpenAI client ahead of the first request."""
+        self._get_client()
+
+    def close(self) -> None:
+        """Drop the OpenAI clients.
+
+        Their HTTP connections belong to the shared pool in http_clients,
+        which outlives provider instances and is closed on engine shutdown.
+        """
+        self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+
+    def _prepare_input(self, text: str, kwargs: Dict[str, Any]) -> Tuple[str, str]:
+        """Return the (text, voice) to send, stripping SSML and validating the voice."""
         voice = kwargs.get("voice", "nova")  # Default to nova voice
-        stream = parse_bool_param(kwargs.get("stream"), False)
-        output_format = kwargs.get("output_format", "wav")
 
         # Handle SSML (OpenAI doesn't support SSML, so strip tags)
         if is_ssml(text):
@@ -82,6 +131,14 @@ class OpenAITTSProvider(TTSProvider):
         if voice not in self.VOICES:
             self.logger.warning(f"Unknown OpenAI voice '{voice}', using 'nova'")
             voice = "nova"
+        return text, voice
+
+    def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech using OpenAI TTS API."""
+        # Extract options
+        text, voice = self._prepare_input(text, kwargs)
+        stream = parse_bool_param(kwargs.get("stream"), False)
+        output_format = (kwargs.get("output_format") or "wav").lower()
 
         try:
             if stream:
@@ -92,6 +149,7 @@ class OpenAITTSProvider(TTSProvider):
                 if output_path is None:
                     raise ValueError("output_path is required when not streaming")
                 client = self._get_client()
+                audio_format, response_format = self.native_encoding(output_format)
 
                 # Generate speech
                 self.logger.info(f"Generating speech with OpenAI voice '{voice}'")
@@ -102,31 +160,61 @@ class OpenAITTSProvider(TTSProvider):
                         model="tts-1",  # or "tts-1-hd" for higher quality
                         voice=voice,
                         input=text,
-                        response_format="mp3",  # OpenAI outputs MP3
+                        response_format=response_format,
                     ),
                     idempotent=False,
                     provider_name="OpenAI",
                     retry_on=self._get_retry_exceptions(),
                 )
 
-                # Save to temporary MP3 file first
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-                    tmp_path = tmp_file.name
-                    response.stream_to_file(tmp_path)
+                if audio_format == output_format:
+                    response.stream_to_file(output_path)
+                else:
+                    # No native encoding; pipe the body through ffmpeg as it downloads
+                    transcode_chunks(response.iter_bytes(), audio_format, output_path, output_format)
 
-                # Convert to desired format if needed
-                if output_format == "mp3":
-                    # Direct save
-                    import shutil
+        except ImportError:
+            raise DependencyError(
+                "OpenAI library not installed. Install with: pip install goobits-matilda-voice[openai]"
+            ) from None
+        except (ValueError, RuntimeError, AttributeError, TypeError) as e:
+            classify_and_raise(e, "OpenAI")
 
-                    shutil.move(tmp_path, output_path)
-                else:
-                    # Convert using ffmpeg
-                    convert_audio(tmp_path, output_path, output_format)
-                    # Clean up temp file
-                    import os
+    async def synthesize_async(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Synthesize speech with the AsyncOpenAI client.
 
-                    os.unlink(tmp_path)
+        Saving awaits the API on the event loop. Streaming to speakers is tied
+        to the local audio device and runs in a worker thread as synthesize().
+        """
+        if parse_bool_param(kwargs.get("stream"), False):
+            await super().synthesize_async(text, output_path, **kwargs)
+            return
+        if output_path is None:
+            raise ValueError("output_path is required when not streaming")
+
+        text, voice = self._prepare_input(text, kwargs)
+        output_format = (kwargs.get("output_format") or "wav").lower()
+        audio_format, response_format = self.native_encoding(output_format)
+
+        try:
+            client = self._get_async_client()
+            self.logger.info(f"Generating speech with OpenAI voice '{voice}'")
+
+            response = await async_call_with_retry(
+                lambda: client.audio.speech.create(
+                    model="tts-1",
+                    voice=voice,
+                    input=text,
+                    response_format=response_format,
+                ),
+                idempotent=False,
+                provider_name="OpenAI",
+                retry_on=self._get_retry_exceptions(),
+            )
+            audio_data = await response.aread()
+
+            # Writing and ffmpeg conversion block, so keep them off the loop
+            await asyncio.to_thread(save_audio_bytes, audio_data, output_path, audio_format, output_format)
 
         except ImportError:
             raise DependencyError(
@@ -135,6 +223,57 @@ class OpenAITTSProvider(TTSProvider):
         except (ValueError, RuntimeError, AttributeError, TypeError) as e:
             classify_and_raise(e, "OpenAI")
 
+    def iter_audio(self, text: str, **kwargs: Any) -> Iterator[bytes]:
+        """Yield chunks from a streaming speech response as they arrive (MP3 unless output_format is native)."""
+        text, voice = self._prepare_input(text, kwargs)
+        _, response_format = self.native_encoding(kwargs.get("output_format"))
+        breaker = get_circuit_breaker("OpenAI")
+        if not breaker.allow_request():
+            raise ProviderError("OpenAI circuit breaker is open; request blocked")
+
+        try:
+            client = self._get_client()
+            with client.audio.speech.with_streaming_response.create(
+                model="tts-1", voice=voice, input=text, response_format=response_format
+            ) as response:
+                breaker.record_success()
+                yield from response.iter_bytes(chunk_size=get_config_value("http_streaming_chunk_size"))
+        except ImportError:
+            raise DependencyError(
+                "OpenAI library not installed. Install with: pip install goobits-matilda-voice[openai]"
+            ) from None
+        except self._get_retry_exceptions() as e:
+            breaker.record_failure()
+            classify_and_raise(e, "OpenAI")
+        except (ValueError, RuntimeError, AttributeError, TypeError) as e:
+            classify_and_raise(e, "OpenAI")
+
+    async def iter_audio_async(self, text: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Yield chunks from the AsyncOpenAI streaming response on the event loop."""
+        text, voice = self._prepare_input(text, kwargs)
+        _, response_format = self.native_encoding(kwargs.get("output_format"))
+        breaker = get_circuit_breaker("OpenAI")
+        if not breaker.allow_request():
+            raise ProviderError("OpenAI circuit breaker is open; request blocked")
+
+        try:
+            client = self._get_async_client()
+            async with client.audio.speech.with_streaming_response.create(
+                model="tts-1", voice=voice, input=text, response_format=response_format
+            ) as response:
+                breaker.record_success()
+                async for chunk in response.iter_bytes(chunk_size=get_config_value("http_streaming_chunk_size")):
+                    yield chunk
+        except ImportError:
+            raise DependencyError(
+                "OpenAI library not installed. Install with: pip install goobits-matilda-voice[openai]"
+            ) from None
+        except self._get_retry_exceptions() as e:
+            breaker.record_failure()
+            classify_and_raise(e, "OpenAI")
+        except (ValueError, RuntimeError, AttributeError, TypeError) as e:
+            classify_and_raise(e, "OpenAI")
+
     def _stream_realtime(self, text: str, voice: str) -> None:
         """Stream TTS audio in real-time with minimal latency."""
         self.logger.debug(f"Starting OpenAI TTS streaming with voice: {voice}")
@@ -212,6 +351,6 @@ class OpenAITTSProvider(TTSProvider):
                     "quality": "High (tts-1 model)",
                 },
                 "pricing": "$15 per 1M characters",
-                "output_format": "MP3 (converted to other formats via ffmpeg)",
+                "output_format": "MP3, WAV, Opus, AAC, FLAC or PCM (others converted via ffmpeg)",
             },
         )
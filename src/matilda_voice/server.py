@@ -14,26 +14,84 @@ Usage:
 import argparse
 import asyncio
 import base64
+import functools
+import itertools
 import json
 import logging
+import math
 import os
 import secrets
+import struct
 import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, ParamSpec, TypeVar, Union
 
 from aiohttp import web
+from aiohttp.typedefs import Handler
 from aiohttp.web import Request, Response
 
+from .exceptions import OverloadedError, QueueFullError
+from .internal.audio_sink import create_audio_sink
+from .internal.audio_utils import AUDIO_MIME_TYPES
+from .internal.config import get_config_value
+from .internal.http_clients import aclose_http_clients
+from .internal.jobs import DONE as JOB_DONE
+from .internal.jobs import JobRunner, JobStore, extract_document_text
+from .internal.metrics import CONTENT_TYPE, Counter, Gauge, Histogram, MetricsRegistry, render_engine_metrics
+from .internal.playback_queue import DONE, PRIORITIES, PlaybackQueue, SpeakJob
+from .internal.scheduler import BULK, INTERACTIVE, SynthesisScheduler
 from .internal.security import get_allowed_origins
+from .internal.text_chunker import TextSegmenter, split_text
+from .internal.timings import SynthesisTimings, collect_timings
 from .internal.token_storage import get_or_create_token
+from .internal.types import AudioChunk
 
 logger = logging.getLogger(__name__)
+timings_logger = logging.getLogger(f"{__name__}.timings")
+
+# Request metrics exposed on GET /metrics
+METRICS = MetricsRegistry()
+HTTP_REQUESTS = METRICS.register(
+    Counter("voice_http_requests_total", "HTTP requests handled", ["endpoint", "method", "status"])
+)
+HTTP_IN_FLIGHT = METRICS.register(
+    Gauge("voice_http_requests_in_flight", "HTTP requests currently being handled", ["endpoint"])
+)
+SYNTHESIS_REQUESTS = METRICS.register(
+    Counter("voice_synthesis_requests_total", "Synthesis requests", ["endpoint", "provider", "voice", "status"])
+)
+SYNTHESIS_DURATION = METRICS.register(
+    Histogram("voice_synthesis_duration_seconds", "Synthesis request latency", ["endpoint", "provider", "voice"])
+)
+SYNTHESIS_FIRST_BYTE = METRICS.register(
+    Histogram(
+        "voice_synthesis_first_byte_seconds",
+        "Time from request start to the provider's first response byte",
+        ["endpoint", "provider"],
+    )
+)
+SYNTHESIZED_BYTES = METRICS.register(
+    Counter("voice_synthesized_bytes_total", "Audio bytes returned to clients", ["endpoint", "provider"])
+)
+EXECUTOR_QUEUE_DEPTH = METRICS.register(
+    Gauge("voice_executor_queue_depth", "Blocking jobs waiting for a server worker thread")
+)
+SCHEDULER_RUNNING = METRICS.register(Gauge("voice_scheduler_running_jobs", "Synthesis jobs holding a slot"))
+SCHEDULER_QUEUED = METRICS.register(Gauge("voice_scheduler_queued_jobs", "Synthesis jobs waiting for a slot", ["lane"]))
+SCHEDULER_REJECTED = METRICS.register(
+    Counter("voice_scheduler_rejected_total", "Synthesis requests turned away by admission control", ["reason"])
+)
+SPEAK_QUEUED = METRICS.register(Gauge("voice_speak_queue_depth", "/speak jobs waiting behind the one playing"))
 
 # Security: API Token Management
 API_TOKEN = get_or_create_token()
 
 
 @web.middleware
-async def auth_middleware(request: Request, handler):
+async def auth_middleware(request: Request, handler: Handler) -> web.StreamResponse:
     """Middleware to enforce token authentication."""
     # Allow public endpoints
     if request.path in ["/", "/health", "/providers"]:
@@ -57,11 +115,34 @@ async def auth_middleware(request: Request, handler):
     return await handler(request)
 
 
+@web.middleware
+async def metrics_middleware(request: Request, handler: Handler) -> web.StreamResponse:
+    """Count requests by route and track how many are in flight."""
+    resource = request.match_info.route.resource
+    endpoint = resource.canonical if resource is not None else "unmatched"
+    status = 500
+
+    HTTP_IN_FLIGHT.inc(endpoint=endpoint)
+    try:
+        response = await handler(request)
+        status = response.status
+        return response
+    except web.HTTPException as e:
+        status = e.status
+        raise
+    finally:
+        HTTP_IN_FLIGHT.dec(endpoint=endpoint)
+        HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=str(status))
+
+
 # CORS headers for browser/cross-origin access
 ALLOWED_ORIGINS = get_allowed_origins()
 
 
-def add_cors_headers(response: Response, request: Request = None) -> Response:
+R = TypeVar("R", bound=web.StreamResponse)
+
+
+def add_cors_headers(response: R, request: Optional[Request] = None) -> R:
     """Add CORS headers to response.
 
     Only sets Access-Control-Allow-Origin when:
@@ -84,6 +165,78 @@ def add_cors_headers(response: Response, request: Request = None) -> Response:
     return response
 
 
+def log_timings(timings: SynthesisTimings) -> None:
+    """Write a request's timing record to the server log as one JSON line."""
+    if get_config_value("server_log_timings"):
+        timings_logger.info(json.dumps(timings.to_dict(), default=str))
+
+
+def observe_synthesis(timings: SynthesisTimings) -> None:
+    """Record a finished synthesis request in the request metrics."""
+    fields = timings.fields
+    endpoint = fields.get("endpoint", "")
+    provider = fields.get("provider") or ""
+    status = fields.get("status", "")
+    # Only voices a provider accepted become label values, so bad input cannot grow the series
+    voice = (fields.get("voice") or "") if status == "ok" else ""
+
+    SYNTHESIS_REQUESTS.inc(endpoint=endpoint, provider=provider, voice=voice, status=status)
+    if timings.total is not None:
+        SYNTHESIS_DURATION.observe(timings.total, endpoint=endpoint, provider=provider, voice=voice)
+    first_byte = first_byte_seconds(timings)
+    if first_byte is not None:
+        SYNTHESIS_FIRST_BYTE.observe(first_byte, endpoint=endpoint, provider=provider)
+    if fields.get("bytes"):
+        SYNTHESIZED_BYTES.inc(fields["bytes"], endpoint=endpoint, provider=provider)
+
+
+def first_byte_seconds(timings: SynthesisTimings) -> Optional[float]:
+    """Get seconds from the start of a request until its first response byte arrived."""
+    ends = [span.start + span.duration for span in timings.spans if span.name == "ttfb"]
+    return min(ends) if ends else None
+
+
+def queue_timeout(data: Dict[str, Any]) -> float:
+    """Get how long a request may wait for a synthesis slot, from its deadline_ms field.
+
+    Raises:
+        ValueError: If deadline_ms is not a number
+    """
+    deadline_ms = data.get("deadline_ms")
+    if deadline_ms is None:
+        return float(get_config_value("server_queue_timeout_seconds"))
+    try:
+        return max(0.0, float(deadline_ms) / 1000)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid 'deadline_ms' field") from e
+
+
+def record_rejection(error: OverloadedError) -> str:
+    """Count a request turned away by admission control and return the reason label."""
+    reason = "queue_full" if isinstance(error, QueueFullError) else "deadline"
+    SCHEDULER_REJECTED.inc(reason=reason)
+    return reason
+
+
+def overloaded_response(error: OverloadedError, request: Request, count: bool = True) -> Response:
+    """Build the 429 (queue full) or 503 (deadline passed) response for a turned-away request.
+
+    Args:
+        error: Why the request was turned away
+        request: The request, for CORS headers
+        count: Whether to count the rejection (False if it was counted already)
+    """
+    reason = "queue_full" if isinstance(error, QueueFullError) else "deadline"
+    if count:
+        record_rejection(error)
+    retry_after = int(math.ceil(error.retry_after))
+    response = web.json_response(
+        {"error": str(error), "retry_after": retry_after}, status=429 if reason == "queue_full" else 503
+    )
+    response.headers["Retry-After"] = str(retry_after)
+    return add_cors_headers(response, request)
+
+
 async def handle_options(request: Request) -> Response:
     """Handle CORS preflight requests."""
     return add_cors_headers(Response(status=200), request)
@@ -96,18 +249,28 @@ async def handle_health(request: Request) -> Response:
 
 async def handle_speak(request: Request) -> Response:
     """
-    Synthesize and play text-to-speech.
+    Queue text to be synthesized and played on the server's speakers.
+
+    Jobs play one at a time, by priority and then in arrival order. The next
+    job is synthesized while the current one plays.
 
     POST /speak
     {
         "text": "Hello world",
         "voice": "edge_tts:en-US-AriaNeural",  // optional
-        "provider": "edge_tts"                  // optional (inferred from voice)
+        "provider": "edge_tts",                 // optional (inferred from voice)
+        "priority": "high",                     // optional: low, normal (default) or high
+        "interrupt": true,                      // optional: stop the current job and play this next
+        "wait": true,                           // optional: respond once playback has ended
+        "deadline_ms": 5000                     // optional: give up unless synthesis started by then
     }
 
-    Response:
+    Response (202, or 200 with "wait"):
     {
         "success": true,
+        "id": "4f9c2b7a1e0d3c58",
+        "state": "queued",
+        "position": 1,
         "text": "Hello world",
         "voice": "edge_tts:en-US-AriaNeural"
     }
@@ -123,28 +286,114 @@ async def handle_speak(request: Request) -> Response:
 
     voice = data.get("voice")
     provider = data.get("provider")
+    priority = PRIORITIES.get(data.get("priority", "normal"))
+    if priority is None:
+        return add_cors_headers(web.json_response({"error": "Invalid 'priority' field"}, status=400), request)
+    try:
+        wait_timeout = queue_timeout(data)
+    except ValueError as e:
+        return add_cors_headers(web.json_response({"error": str(e)}, status=400), request)
+    timings = SynthesisTimings(endpoint="/speak", status="error")
 
+    speak_queue: PlaybackQueue = request.app["speak_queue"]
     try:
-        # Import here to avoid circular imports
-        from .app_hooks import on_speak
+        job = speak_queue.enqueue(
+            text,
+            priority,
+            interrupt=bool(data.get("interrupt")),
+            voice=voice,
+            provider=provider,
+            wait_timeout=wait_timeout,
+            timings=timings,
+        )
+    except QueueFullError as e:
+        timings.set(status="rejected")
+        log_timings(timings)
+        observe_synthesis(timings)
+        return overloaded_response(e, request)
+
+    result = {"success": True, "id": job.id, "state": job.state, "text": text, "voice": voice}
+    if not data.get("wait"):
+        result["position"] = speak_queue.position(job)
+        return add_cors_headers(web.json_response(result, status=202), request)
+
+    # A client that disconnects while waiting leaves its job queued
+    state = await asyncio.shield(job.done)
+    if isinstance(job.error, OverloadedError):
+        return overloaded_response(job.error, request, count=False)
+    if job.error is not None:
+        return add_cors_headers(web.json_response({"error": str(job.error), "id": job.id}, status=500), request)
+    result.update(success=state == DONE, state=state)
+    return add_cors_headers(web.json_response(result), request)
+
+
+async def handle_speak_cancel(request: Request) -> Response:
+    """
+    Cancel queued or playing /speak jobs.
 
-        # Run synthesis (this plays audio)
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: on_speak(text=text, voice=voice, provider=provider))
+    POST /speak/cancel
+    {"id": "4f9c2b7a1e0d3c58"}  // one job; without a body, the job playing now
+    {"all": true}               // every job, queued or playing
 
-        result = {
-            "success": True,
-            "text": text,
-            "voice": voice,
-        }
-        return add_cors_headers(web.json_response(result), request)
+    Response:
+    {
+        "success": true,
+        "cancelled": ["4f9c2b7a1e0d3c58"]
+    }
+    """
+    data: Dict[str, Any] = {}
+    if request.can_read_body:
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            return add_cors_headers(web.json_response({"error": "Invalid JSON"}, status=400), request)
+
+    speak_queue: PlaybackQueue = request.app["speak_queue"]
+    if data.get("all"):
+        cancelled = speak_queue.cancel_all()
+    else:
+        cancelled = speak_queue.cancel(data.get("id"))
+    if data.get("id") and not cancelled:
+        return add_cors_headers(web.json_response({"error": f"No queued job '{data['id']}'"}, status=404), request)
+
+    result = {"success": True, "cancelled": [job.id for job in cancelled]}
+    return add_cors_headers(web.json_response(result), request)
+
+
+async def render_speak_job(scheduler: SynthesisScheduler, job: SpeakJob, output_path: str) -> None:
+    """Synthesize a queued /speak job to output_path, holding an interactive synthesis slot."""
+    from .hooks.utils import get_engine, handle_provider_shortcuts
+
+    options = job.options
+    timings: SynthesisTimings = options["timings"]
+    engine = get_engine()
+    queued_at = time.perf_counter()
+    async with scheduler.slot(INTERACTIVE, options["wait_timeout"]):
+        timings.add("queue_wait", queued_at)
+        await engine.synthesize_text_async(
+            job.text,
+            output_path,
+            provider_name=handle_provider_shortcuts(options["provider"]),
+            voice=options["voice"],
+            stream=False,
+            output_format=job.audio_format,
+            timings=timings,
+        )
 
-    except Exception as e:
-        logger.exception("Failed to handle speak request")
-        return add_cors_headers(web.json_response({"error": str(e)}, status=500), request)
+
+def finish_speak_job(job: SpeakJob) -> None:
+    """Log and count a /speak job once it has played, failed or been cancelled."""
+    timings: SynthesisTimings = job.options["timings"]
+    if isinstance(job.error, OverloadedError):
+        record_rejection(job.error)
+        timings.set(status="rejected")
+    elif job.error is None:
+        timings.set(status="ok" if job.state == DONE else job.state)
+    log_timings(timings)
+    observe_synthesis(timings)
 
 
-async def handle_synthesize(request: Request) -> Response:
+async def handle_synthesize(request: Request) -> web.StreamResponse:
     """
     Synthesize text and return audio data (no playback).
 
@@ -153,7 +402,8 @@ async def handle_synthesize(request: Request) -> Response:
         "text": "Hello world",
         "voice": "edge_tts:en-US-AriaNeural",  // optional
         "provider": "edge_tts",                 // optional
-        "format": "wav"                         // optional: wav, mp3
+        "format": "wav",                        // optional: wav, mp3
+        "deadline_ms": 30000                    // optional: give up unless started by then
     }
 
     Response:
@@ -163,7 +413,16 @@ async def handle_synthesize(request: Request) -> Response:
         "format": "wav",
         "text": "Hello world"
     }
+
+    With an "Accept: audio/*" header the audio is streamed instead, as for
+    POST /synthesize/stream.
+
+    When the server is saturated the response is 429 (queue full) or 503
+    (deadline passed while queued), with a Retry-After header.
     """
+    if wants_raw_audio(request):
+        return await stream_synthesis(request, "/synthesize")
+
     try:
         data = await request.json()
     except json.JSONDecodeError:
@@ -176,32 +435,40 @@ async def handle_synthesize(request: Request) -> Response:
     voice = data.get("voice")
     provider = data.get("provider")
     audio_format = data.get("format", "wav")
+    try:
+        wait_timeout = queue_timeout(data)
+    except ValueError as e:
+        return add_cors_headers(web.json_response({"error": str(e)}, status=400), request)
+    timings = SynthesisTimings(endpoint="/synthesize", status="error")
 
     try:
-        from .app_hooks import on_save
+        from .hooks.utils import get_engine, handle_provider_shortcuts
 
         # Create temp file for audio
         with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", delete=False) as tmp:
             tmp_path = tmp.name
 
         try:
-            # Run synthesis to file
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: on_save(
-                    text=text,
-                    output=tmp_path,
+            # Run synthesis to file; network providers are awaited without a thread
+            engine = get_engine()
+            queued_at = time.perf_counter()
+            async with request.app["scheduler"].slot(BULK, wait_timeout):
+                timings.add("queue_wait", queued_at)
+                await engine.synthesize_text_async(
+                    text,
+                    output_path=tmp_path,
+                    provider_name=handle_provider_shortcuts(provider),
                     voice=voice,
-                    provider=provider,
-                    format=audio_format,
-                ),
-            )
+                    stream=False,
+                    output_format=audio_format,
+                    timings=timings,
+                )
+            timings.set(status="ok")
 
             # Read audio file and encode as base64
-            with open(tmp_path, "rb") as f:
-                audio_data = f.read()
+            audio_data = await asyncio.to_thread(Path(tmp_path).read_bytes)
             audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+            timings.set(bytes=len(audio_data))
 
             result = {
                 "success": True,
@@ -217,9 +484,455 @@ async def handle_synthesize(request: Request) -> Response:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    except OverloadedError as e:
+        timings.set(status="rejected")
+        return overloaded_response(e, request)
     except Exception as e:
         logger.exception("Failed to handle synthesize request")
         return add_cors_headers(web.json_response({"error": str(e)}, status=500), request)
+    finally:
+        log_timings(timings)
+        observe_synthesis(timings)
+
+
+async def handle_synthesize_stream(request: Request) -> web.StreamResponse:
+    """
+    Synthesize text and stream the raw audio as it is produced.
+
+    POST /synthesize/stream
+    {
+        "text": "Hello world",
+        "voice": "edge_tts:en-US-AriaNeural",  // optional
+        "provider": "edge_tts",                 // optional
+        "format": "mp3"                         // optional: defaults to the provider's native format
+    }
+
+    Response: audio bytes with chunked transfer encoding; Content-Type gives
+    the format. Errors before the first chunk return a JSON error body.
+    """
+    return await stream_synthesis(request, "/synthesize/stream")
+
+
+def wants_raw_audio(request: Request) -> bool:
+    """Check whether the client's Accept header asks for audio rather than JSON."""
+    accepted = [part.split(";")[0].strip().lower() for part in request.headers.get("Accept", "").split(",")]
+    return any(media_type.startswith("audio/") for media_type in accepted)
+
+
+def format_for_accept(request: Request) -> Optional[str]:
+    """Get the audio format named by the Accept header, or None for audio/* or no preference."""
+    for part in request.headers.get("Accept", "").split(","):
+        media_type = part.split(";")[0].strip().lower()
+        for audio_format, mime_type in AUDIO_MIME_TYPES.items():
+            if media_type == mime_type:
+                return audio_format
+    return None
+
+
+async def stream_synthesis(request: Request, endpoint: str) -> web.StreamResponse:
+    """Forward provider chunks to the client as they arrive, without a tempfile or base64."""
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return add_cors_headers(web.json_response({"error": "Invalid JSON"}, status=400), request)
+
+    text = data.get("text")
+    if not text:
+        return add_cors_headers(web.json_response({"error": "Missing 'text' field"}, status=400), request)
+
+    voice = data.get("voice")
+    provider = data.get("provider")
+    # None streams the provider's native encoding, which needs no conversion
+    audio_format = data.get("format") or format_for_accept(request)
+    try:
+        wait_timeout = queue_timeout(data)
+    except ValueError as e:
+        return add_cors_headers(web.json_response({"error": str(e)}, status=400), request)
+    timings = SynthesisTimings(endpoint=endpoint, status="error")
+    response: Optional[web.StreamResponse] = None
+    # Provider chunks, then None at the end or the exception that stopped synthesis
+    pending: "asyncio.Queue[Union[AudioChunk, BaseException, None]]" = asyncio.Queue(
+        maxsize=max(1, int(get_config_value("server_stream_buffer_chunks")))
+    )
+
+    async def produce() -> None:
+        """Read the provider into pending while holding a bulk slot.
+
+        A client that falls behind by a full buffer pauses synthesis, and
+        keeps the slot, until it reads more. One that keeps up within the
+        buffer lets the slot go as soon as synthesis finishes.
+        """
+        from .hooks.utils import get_engine, handle_provider_shortcuts
+
+        try:
+            queued_at = time.perf_counter()
+            async with request.app["scheduler"].slot(BULK, wait_timeout):
+                timings.add("queue_wait", queued_at)
+                with collect_timings(timings):
+                    chunks = get_engine().synthesize_iter_async(
+                        text, provider_name=handle_provider_shortcuts(provider), voice=voice, output_format=audio_format
+                    )
+                    try:
+                        async for chunk in chunks:
+                            await pending.put(chunk)
+                    finally:
+                        await chunks.aclose()
+            await pending.put(None)
+        except Exception as e:
+            await pending.put(e)
+
+    async def next_chunk() -> Optional[AudioChunk]:
+        """Return the next chunk, None at the end, or raise what stopped synthesis."""
+        item = await pending.get()
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    producer = asyncio.create_task(produce())
+    try:
+        # Wait for the first chunk so a failed request still gets a JSON error
+        first = await next_chunk()
+
+        response = web.StreamResponse(status=200)
+        response.content_type = first.mime_type if first else "application/octet-stream"
+        response.enable_chunked_encoding()
+        if first is not None:
+            response.headers["X-Audio-Format"] = first.format
+            timings.set(provider=first.provider_name, voice=voice)
+        await add_cors_headers(response, request).prepare(request)
+
+        sent = 0
+        chunk = first
+        while chunk is not None:
+            await response.write(chunk.data)
+            sent += len(chunk.data)
+            chunk = await next_chunk()
+        await response.write_eof()
+        timings.set(status="ok", bytes=sent)
+        return response
+
+    except OverloadedError as e:
+        timings.set(status="rejected")
+        return overloaded_response(e, request)
+    except Exception as e:
+        if isinstance(e, ConnectionResetError) and response is not None:
+            logger.info(f"Client disconnected from {endpoint} stream")
+            timings.set(status="disconnected")
+            return response
+        if response is not None and response.prepared:
+            # Headers are already sent, so the client sees a truncated body
+            logger.exception("Streaming synthesize request failed mid-stream")
+            raise
+        logger.exception("Failed to handle streaming synthesize request")
+        return add_cors_headers(web.json_response({"error": str(e)}, status=500), request)
+    finally:
+        # Stops synthesis if the client went away mid-stream
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        log_timings(timings)
+        observe_synthesis(timings)
+
+
+class SpeakSession:
+    """One /ws/speak connection: text fragments in, ordered audio frames out.
+
+    Completed segments are dispatched to the provider as soon as the
+    segmenter releases them, up to server_ws_segment_concurrency at a time,
+    while a single sender forwards their audio in segment order.
+    """
+
+    def __init__(self, ws: web.WebSocketResponse, scheduler: SynthesisScheduler) -> None:
+        self.ws = ws
+        self.scheduler = scheduler
+        self.options: Dict[str, Any] = {}
+        self.segmenter = TextSegmenter(
+            get_config_value("server_ws_clause_min_chars"), get_config_value("server_ws_max_segment_chars")
+        )
+        self.utterance = 0
+        self.segment = 0
+        self.seq = 0
+        # Segment chunk queues and end-of-utterance markers, in the order they must be sent
+        self.outbox: "asyncio.Queue[Union[Dict[str, Any], asyncio.Queue[Any]]]" = asyncio.Queue()
+        self.slots = asyncio.Semaphore(max(1, int(get_config_value("server_ws_segment_concurrency"))))
+        self.tasks: "set[asyncio.Task[None]]" = set()
+
+    async def run(self) -> None:
+        """Read client messages until the socket closes, then stop outstanding work."""
+        sender = asyncio.create_task(self.send_loop())
+        try:
+            async for message in self.ws:
+                if message.type != web.WSMsgType.TEXT:
+                    continue
+                try:
+                    self.handle(json.loads(message.data))
+                except (json.JSONDecodeError, AttributeError, TypeError):
+                    await self.ws.send_json({"type": "error", "error": "Messages must be JSON objects"})
+        finally:
+            sender.cancel()
+            for task in self.tasks:
+                task.cancel()
+            await asyncio.gather(sender, *self.tasks, return_exceptions=True)
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        """Apply one client message."""
+        kind = message.get("type", "text")
+        if kind == "start":
+            self.options = {key: message.get(key) for key in ("voice", "provider", "format")}
+        elif kind == "text":
+            for segment in self.segmenter.feed(str(message.get("text", ""))):
+                self.dispatch(segment)
+        elif kind == "end":
+            for segment in self.segmenter.flush():
+                self.dispatch(segment)
+            self.outbox.put_nowait({"type": "end", "utterance": self.utterance, "segments": self.segment})
+            self.utterance += 1
+            self.segment = 0
+
+    def dispatch(self, text: str) -> None:
+        """Start synthesizing a segment; its chunks are queued for the sender."""
+        chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+        header = {"type": "segment", "utterance": self.utterance, "segment": self.segment, "text": text}
+        chunks.put_nowait(header)
+        self.outbox.put_nowait(chunks)
+        self.segment += 1
+
+        task = asyncio.create_task(self.synthesize(text, header, chunks))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def synthesize(self, text: str, header: Dict[str, Any], chunks: "asyncio.Queue[Any]") -> None:
+        """Synthesize one segment into its queue, ending with None or the error."""
+        from .hooks.utils import get_engine, handle_provider_shortcuts
+
+        timings = SynthesisTimings(endpoint="/ws/speak", status="error")
+        try:
+            queued_at = time.perf_counter()
+            async with self.slots, self.scheduler.slot(INTERACTIVE, get_config_value("server_queue_timeout_seconds")):
+                timings.add("queue_wait", queued_at)
+                with collect_timings(timings):
+                    async for chunk in get_engine().synthesize_iter_async(
+                        text,
+                        provider_name=handle_provider_shortcuts(self.options.get("provider")),
+                        voice=self.options.get("voice"),
+                        output_format=self.options.get("format"),
+                    ):
+                        timings.set(provider=chunk.provider_name, voice=self.options.get("voice"))
+                        chunks.put_nowait(chunk)
+            timings.set(status="ok")
+            chunks.put_nowait(None)
+        except OverloadedError as e:
+            record_rejection(e)
+            timings.set(status="rejected")
+            chunks.put_nowait({**header, "type": "error", "error": str(e), "retry_after": e.retry_after})
+            chunks.put_nowait(None)
+        except Exception as e:
+            logger.exception("Failed to synthesize websocket segment")
+            chunks.put_nowait({**header, "type": "error", "error": str(e)})
+            chunks.put_nowait(None)
+        finally:
+            log_timings(timings)
+            observe_synthesis(timings)
+
+    async def send_loop(self) -> None:
+        """Send queued audio frames and markers in order, numbering the frames."""
+        while True:
+            item = await self.outbox.get()
+            if isinstance(item, dict):
+                await self.ws.send_json(item)
+                continue
+            while (entry := await item.get()) is not None:
+                if isinstance(entry, dict):
+                    await self.ws.send_json(entry)
+                    continue
+                await self.ws.send_bytes(struct.pack(">I", self.seq) + entry.data)
+                self.seq += 1
+
+
+async def handle_ws_speak(request: Request) -> web.WebSocketResponse:
+    """
+    Stream text in and synthesized audio out over a websocket.
+
+    GET /ws/speak (websocket upgrade)
+
+    Client messages (JSON text frames):
+        {"type": "start", "voice": "...", "provider": "...", "format": "mp3"}  // optional
+        {"type": "text", "text": "Hello wor"}  // any number of fragments
+        {"type": "end"}                         // end of utterance: flush the rest
+
+    Server messages:
+        {"type": "segment", "utterance": 0, "segment": 0, "text": "Hello world."}
+        <binary frame>: 4-byte big-endian sequence number, then audio bytes
+        {"type": "error", "utterance": 0, "segment": 1, "error": "..."}
+        {"type": "end", "utterance": 0, "segments": 2}
+
+    Fragments are cut at sentence (or long clause) boundaries and each
+    segment is sent to the provider immediately; audio always arrives in
+    segment order.
+    """
+    ws = web.WebSocketResponse(heartbeat=30)
+    await ws.prepare(request)
+    await SpeakSession(ws, request.app["scheduler"]).run()
+    return ws
+
+
+async def handle_create_job(request: Request) -> Response:
+    """
+    Start a background synthesis job for long text or a whole document.
+
+    POST /jobs
+    {
+        "text": "Chapter one...",               // or "document"
+        "document": "# Report\n...",            // markdown, HTML or JSON source
+        "doc_format": "auto",                   // optional: markdown, html, json
+        "voice": "edge_tts:en-US-AriaNeural",   // optional
+        "provider": "edge_tts",                 // optional
+        "format": "mp3"                         // optional: result format (default mp3)
+    }
+
+    Response (202, Location: /jobs/{id}):
+    {
+        "id": "4f9c2b7a1e0d3c58",
+        "state": "queued",
+        "chunks_total": 12,
+        "chunks_done": 0,
+        ...
+    }
+    """
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return add_cors_headers(web.json_response({"error": "Invalid JSON"}, status=400), request)
+
+    text = data.get("text")
+    document = data.get("document")
+    if not text and not document:
+        return add_cors_headers(web.json_response({"error": "Missing 'text' or 'document' field"}, status=400), request)
+    audio_format = data.get("format", "mp3")
+    if audio_format not in AUDIO_MIME_TYPES:
+        return add_cors_headers(
+            web.json_response({"error": f"Unsupported format '{audio_format}'"}, status=400), request
+        )
+
+    store: JobStore = request.app["job_store"]
+    try:
+        from .hooks.utils import get_engine, handle_provider_shortcuts
+
+        if not text:
+            text = await asyncio.to_thread(
+                extract_document_text, document, data.get("doc_format", "auto"), store.jobs_dir / "documents"
+            )
+            if not text:
+                return add_cors_headers(web.json_response({"error": "No text found in document"}, status=400), request)
+
+        engine = get_engine()
+        provider, voice = engine.resolve_provider_and_voice(
+            handle_provider_shortcuts(data.get("provider")), data.get("voice")
+        )
+        # Job chunks are the unit of resumption; each also respects the provider's request limit
+        chunks = [
+            piece
+            for part in split_text(text, max_chars=get_config_value("jobs_chunk_chars")) or [text]
+            for piece in engine.split_for_provider(provider, part)
+        ]
+        job = await asyncio.to_thread(store.create, chunks, audio_format, {"provider": provider, "voice": voice})
+        request.app["job_runner"].start(job.id)
+
+        response = web.json_response(job.to_dict(), status=202)
+        response.headers["Location"] = f"/jobs/{job.id}"
+        return add_cors_headers(response, request)
+
+    except Exception as e:
+        logger.exception("Failed to create synthesis job")
+        return add_cors_headers(web.json_response({"error": str(e)}, status=500), request)
+
+
+async def handle_get_job(request: Request) -> Response:
+    """
+    Report a synthesis job's progress.
+
+    GET /jobs/{id}
+
+    Response:
+    {
+        "id": "4f9c2b7a1e0d3c58",
+        "state": "running",           // queued, running, done or error
+        "chunks_total": 12,
+        "chunks_done": 5,
+        "progress": 0.417,
+        "audio_url": "/jobs/4f9c2b7a1e0d3c58/audio"  // once done
+    }
+    """
+    # The job store is SQLite; keep its calls, and any wait on its lock, off the event loop
+    job = await asyncio.to_thread(request.app["job_store"].get, request.match_info["job_id"])
+    if job is None:
+        return add_cors_headers(web.json_response({"error": "Job not found"}, status=404), request)
+
+    result = job.to_dict()
+    if job.state == JOB_DONE:
+        result["audio_url"] = f"/jobs/{job.id}/audio"
+    return add_cors_headers(web.json_response(result), request)
+
+
+async def handle_get_job_audio(request: Request) -> web.StreamResponse:
+    """
+    Download a finished synthesis job's audio.
+
+    GET /jobs/{id}/audio
+
+    Response: the audio file, or 409 while the job has not finished
+    """
+    store: JobStore = request.app["job_store"]
+    job = await asyncio.to_thread(store.get, request.match_info["job_id"])
+    if job is None:
+        return add_cors_headers(web.json_response({"error": "Job not found"}, status=404), request)
+    if job.state != JOB_DONE:
+        result = {"error": f"Job is {job.state}", "state": job.state}
+        return add_cors_headers(web.json_response(result, status=409), request)
+
+    response = web.FileResponse(
+        store.audio_path(job.id, job.output_format),
+        headers={"Content-Type": AUDIO_MIME_TYPES.get(job.output_format, "application/octet-stream")},
+    )
+    return add_cors_headers(response, request)
+
+
+async def render_job_chunk(scheduler: SynthesisScheduler, options: Dict[str, Any], text: str, output_path: str) -> None:
+    """Synthesize one chunk of a /jobs job to WAV, holding a bulk synthesis slot.
+
+    Jobs have no client waiting on them, so a full queue delays the chunk
+    instead of failing the job: it is retried with exponential backoff up to
+    jobs_queue_retries times, after which the QueueFullError fails the job.
+    """
+    from .hooks.utils import get_engine
+
+    engine = get_engine()
+    retries = max(0, int(get_config_value("jobs_queue_retries")))
+    backoff_max = float(get_config_value("jobs_queue_backoff_max_seconds"))
+    for attempt in itertools.count():
+        timings = SynthesisTimings(endpoint="/jobs", status="error")
+        queued_at = time.perf_counter()
+        try:
+            async with scheduler.slot(BULK):
+                timings.add("queue_wait", queued_at)
+                await engine.synthesize_text_async(
+                    text,
+                    output_path,
+                    provider_name=options["provider"],
+                    voice=options["voice"],
+                    stream=False,
+                    output_format="wav",
+                    timings=timings,
+                )
+            timings.set(status="ok")
+            return
+        except QueueFullError as e:
+            timings.set(status="rejected")
+            if attempt >= retries:
+                raise
+            await asyncio.sleep(min(backoff_max, max(e.retry_after, 2.0**attempt)))
+        finally:
+            log_timings(timings)
+            observe_synthesis(timings)
 
 
 async def handle_providers(request: Request) -> Response:
@@ -266,17 +979,152 @@ async def handle_reload(request: Request) -> Response:
         return add_cors_headers(web.json_response({"error": str(e)}, status=500), request)
 
 
+async def handle_metrics(request: Request) -> Response:
+    """
+    Report request, cache, pool and provider health metrics.
+
+    GET /metrics
+
+    Response: Prometheus text exposition format
+    """
+    executor = request.app.get("executor")
+    if executor is not None:
+        EXECUTOR_QUEUE_DEPTH.set(executor.queue_depth)
+    scheduler_stats = request.app["scheduler"].get_stats()
+    SCHEDULER_RUNNING.set(scheduler_stats["running"])
+    SPEAK_QUEUED.set(request.app["speak_queue"].get_stats()["queued"])
+    for lane, queued in scheduler_stats["queued"].items():
+        SCHEDULER_QUEUED.set(queued, lane=lane)
+
+    body = METRICS.render()
+    try:
+        from .hooks.utils import get_engine
+
+        body += render_engine_metrics(get_engine())
+    except Exception:
+        logger.exception("Failed to collect engine metrics")
+
+    return Response(body=body.encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that counts submitted work no worker thread has picked up yet."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Submitted calls waiting for a worker thread."""
+        with self._waiting_lock:
+            return self._waiting
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> "Future[T]":
+        def run() -> T:
+            with self._waiting_lock:
+                self._waiting -= 1
+            return fn(*args, **kwargs)
+
+        with self._waiting_lock:
+            self._waiting += 1
+        try:
+            return super().submit(run)
+        except BaseException:
+            with self._waiting_lock:
+                self._waiting -= 1
+            raise
+
+
+async def start_executor(app: web.Application) -> None:
+    """Run blocking synthesis work on an executor the server can report on."""
+    executor = CountingExecutor(thread_name_prefix="voice_server")
+    asyncio.get_running_loop().set_default_executor(executor)
+    app["executor"] = executor  # String key: web.AppKey needs aiohttp 3.9
+
+
+async def start_speak_queue(app: web.Application) -> None:
+    """Create the /speak playback queue on the server's event loop."""
+    sink_name = get_config_value("server_speak_sink")
+    app["speak_sink"] = create_audio_sink(sink_name) if sink_name else None
+    app["speak_queue"] = PlaybackQueue(
+        synthesize=functools.partial(render_speak_job, app["scheduler"]),
+        max_queued=get_config_value("server_speak_queue_size"),
+        on_finished=finish_speak_job,
+        sink=app["speak_sink"],
+    )
+
+
+async def stop_speak_queue(app: web.Application) -> None:
+    """Stop playback and drop queued /speak jobs when the server shuts down."""
+    await app["speak_queue"].close()
+    if app["speak_sink"] is not None:
+        await asyncio.to_thread(app["speak_sink"].close)
+
+
+async def start_job_runner(app: web.Application) -> None:
+    """Open the job store, purge expired jobs and resume unfinished ones."""
+    store = JobStore()
+    store.purge(time.time() - get_config_value("jobs_retention_seconds"))
+    runner = JobRunner(
+        store,
+        render=functools.partial(render_job_chunk, app["scheduler"]),
+        max_concurrent=get_config_value("jobs_max_concurrent"),
+    )
+    app["job_store"] = store
+    app["job_runner"] = runner
+    resumed = runner.resume()
+    if resumed:
+        logger.info(f"Resumed {resumed} unfinished synthesis jobs")
+
+
+async def stop_job_runner(app: web.Application) -> None:
+    """Pause running jobs (they resume on the next start) and close the job store."""
+    await app["job_runner"].close()
+    app["job_store"].close()
+
+
+async def close_engine(app: web.Application) -> None:
+    """Close pooled provider instances and HTTP clients when the server shuts down."""
+    from .core import _tts_engine
+
+    await aclose_http_clients()
+    if _tts_engine is not None:
+        await asyncio.get_running_loop().run_in_executor(None, _tts_engine.close)
+
+
 def create_app() -> web.Application:
     """Create the aiohttp application."""
-    app = web.Application(middlewares=[auth_middleware])
+    app = web.Application(middlewares=[metrics_middleware, auth_middleware])
+    app.on_startup.append(start_executor)
+    app["scheduler"] = SynthesisScheduler(
+        get_config_value("server_max_concurrent_jobs"), get_config_value("server_max_queued_jobs")
+    )
+    app.on_startup.append(start_speak_queue)
+    app.on_startup.append(start_job_runner)
+    app.on_cleanup.append(stop_speak_queue)
+    app.on_cleanup.append(stop_job_runner)
+    app.on_cleanup.append(close_engine)
 
     # Routes
     app.router.add_route("OPTIONS", "/{path:.*}", handle_options)
     app.router.add_get("/health", handle_health)
     app.router.add_get("/", handle_health)
     app.router.add_post("/speak", handle_speak)
+    app.router.add_post("/speak/cancel", handle_speak_cancel)
     app.router.add_post("/synthesize", handle_synthesize)
+    app.router.add_post("/synthesize/stream", handle_synthesize_stream)
+    app.router.add_get("/ws/speak", handle_ws_speak)
+    app.router.add_post("/jobs", handle_create_job)
+    app.router.add_get("/jobs/{job_id}", handle_get_job)
+    app.router.add_get("/jobs/{job_id}/audio", handle_get_job_audio)
     app.router.add_post("/reload", handle_reload)
+    app.router.add_get("/metrics", handle_metrics)
 
     return app
 
@@ -286,9 +1134,15 @@ def run_server(host: str = "0.0.0.0", port: int = 8771):
     app = create_app()
 
     print(f"Starting Voice server on http://{host}:{port}")
-    print("  POST /speak      - Synthesize and play audio")
+    print("  POST /speak      - Queue audio for playback")
+    print("  POST /speak/cancel - Cancel queued or playing audio")
     print("  POST /synthesize - Synthesize and return audio data")
+    print("  POST /synthesize/stream - Stream raw audio as it is synthesized")
+    print("  GET  /ws/speak   - Websocket: stream text in, audio frames out")
+    print("  POST /jobs       - Start a background job for long text or a document")
+    print("  GET  /jobs/{id}  - Job progress (/jobs/{id}/audio: the result)")
     print("  GET  /providers  - List available providers")
+    print("  GET  /metrics    - Prometheus metrics")
     print("  GET  /health     - Health check")
     print()
 
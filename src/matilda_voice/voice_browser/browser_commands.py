@@ -4,18 +4,23 @@ This module provides the main entry point functions for launching
 and managing the voice browser interface.
 """
 
-import logging
 import sys
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 import click
 
-from ..exceptions import AuthenticationError, DependencyError, ProviderLoadError, ProviderNotFoundError
+from ..internal.voice_catalog import VoiceCatalog, provider_info_loader
 from .browser_ui import VoiceBrowser
-from .voice_analyzer import analyze_voice
 
 
-def interactive_voice_browser(providers_registry: Dict[str, Any], load_provider_func: Callable) -> None:
+def _build_catalog(providers_registry: Dict[str, Any], load_provider_func: Callable) -> VoiceCatalog:
+    """Build a voice catalog that loads providers with load_provider_func."""
+    return VoiceCatalog(providers_registry.keys(), provider_info_loader(load_provider_func))
+
+
+def interactive_voice_browser(
+    providers_registry: Dict[str, Any], load_provider_func: Callable, catalog: Optional[VoiceCatalog] = None
+) -> None:
     """Launch the interactive voice browser with curses-based UI.
 
     Creates and runs a VoiceBrowser instance that provides a comprehensive
@@ -25,6 +30,7 @@ def interactive_voice_browser(providers_registry: Dict[str, Any], load_provider_
     Args:
         providers_registry: Dictionary mapping provider names to module paths
         load_provider_func: Function to dynamically load provider classes
+        catalog: Voice catalog to list voices from (default: one built from load_provider_func)
 
     Returns:
         None - Function runs until user exits the browser
@@ -32,37 +38,29 @@ def interactive_voice_browser(providers_registry: Dict[str, Any], load_provider_
     Raises:
         Exception: If curses initialization fails or terminal is incompatible
     """
-    browser = VoiceBrowser(providers_registry, load_provider_func)
+    browser = VoiceBrowser(providers_registry, load_provider_func, catalog)
     browser.run()
 
 
-def show_browser_snapshot(providers_registry: Dict[str, str], load_provider_func: Callable) -> None:
+def show_browser_snapshot(
+    providers_registry: Dict[str, str], load_provider_func: Callable, catalog: Optional[VoiceCatalog] = None
+) -> None:
     """Show a snapshot of what the browser would display."""
     click.echo("=== TTS VOICE BROWSER SNAPSHOT ===\n")
 
     # Load all voices exactly like the browser does
+    catalog = catalog or _build_catalog(providers_registry, load_provider_func)
     all_voices = []
-    voice_cache = {}
 
     click.echo("Loading voices from providers...")
     for provider_name in providers_registry.keys():
-        try:
-            provider_class = load_provider_func(provider_name)
-            provider = provider_class()
-            info = provider.get_info()
-            if info:
-                voices = info.get("all_voices") or info.get("sample_voices", [])
-                click.echo(f"  {provider_name}: {len(voices)} voices")
-                for voice in voices:
-                    quality, region, gender = analyze_voice(provider_name, voice)
-                    all_voices.append((provider_name, voice, quality, region, gender))
-                    voice_cache[f"{provider_name}:{voice}"] = (quality, region, gender)
-        except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError) as e:
-            click.echo(f"  {provider_name}: SKIPPED ({e})")
-            continue
-        except (ImportError, AttributeError, RuntimeError) as e:
-            click.echo(f"  {provider_name}: ERROR ({e})")
-            continue
+        entries = catalog.entries(provider_name)
+        if entries:
+            click.echo(f"  {provider_name}: {len(entries)} voices")
+        else:
+            click.echo(f"  {provider_name}: SKIPPED (unavailable)")
+        for entry in entries:
+            all_voices.append((provider_name, entry.name, entry.quality, entry.region, entry.gender))
 
     click.echo(f"\nTotal voices loaded: {len(all_voices)}")
 
@@ -140,51 +138,39 @@ def show_browser_snapshot(providers_registry: Dict[str, str], load_provider_func
     click.echo(install_msg)
 
 
-def handle_voices_command(args: tuple, providers_registry: Dict[str, str], load_provider_func: Callable) -> None:
+def handle_voices_command(
+    args: tuple,
+    providers_registry: Dict[str, str],
+    load_provider_func: Callable,
+    catalog: Optional[VoiceCatalog] = None,
+) -> None:
     """Handle voices subcommand."""
-    logger = logging.getLogger(__name__)
+    catalog = catalog or _build_catalog(providers_registry, load_provider_func)
 
     # Check for snapshot option
     if len(args) > 0 and args[0] == "--snapshot":
-        show_browser_snapshot(providers_registry, load_provider_func)
+        show_browser_snapshot(providers_registry, load_provider_func, catalog)
         return
 
     # Parse language filter argument
-    language_filter = None
-    if len(args) > 0:
-        language_filter = args[0].lower()
+    language_filter = args[0].lower() if args else ""
 
     if len(args) == 0:
         # voice voices - launch interactive browser
         if sys.stdout.isatty():
             # Terminal environment - use interactive browser
-            interactive_voice_browser(providers_registry, load_provider_func)
+            interactive_voice_browser(providers_registry, load_provider_func, catalog)
         else:
             # Non-terminal (pipe/script) - use simple list
             click.echo("Available voices from all providers:")
             click.echo()
 
-            for provider_name in providers_registry.keys():
-                try:
-                    provider_class = load_provider_func(provider_name)
-                    provider = provider_class()
-                    info = provider.get_info()
-
-                    # Use all_voices if available, fallback to sample_voices
-                    voices = info.get("all_voices") or info.get("sample_voices", [])
-
-                    if voices:
-                        click.echo(f"  {provider_name.upper()}:")
-                        for voice in voices:
-                            click.echo(f"  - {voice}")
-
-                except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError):
-                    # Skip providers that can't be loaded (missing dependencies, etc.)
-                    continue
-                except (ImportError, AttributeError, RuntimeError) as e:
-                    # Log unexpected errors but continue with other providers
-                    logger.warning(f"Unexpected error loading provider {provider_name}: {e}")
-                    continue
+            # Providers that can't be loaded (missing dependencies, etc.) have no voices
+            for provider_name, voices in catalog.get_all_voices().items():
+                if voices:
+                    click.echo(f"  {provider_name.upper()}:")
+                    for voice in voices:
+                        click.echo(f"  - {voice}")
     else:
         # Language filtering mode: voice voices en, voice voices english, etc.
         click.echo(f"Voices for language: {language_filter}")
@@ -193,99 +179,71 @@ def handle_voices_command(args: tuple, providers_registry: Dict[str, str], load_
         # English language patterns
         if language_filter in ["en", "english", "eng"]:
             # Show only English voices
-            for provider_name in providers_registry.keys():
-                try:
-                    provider_class = load_provider_func(provider_name)
-                    provider = provider_class()
-                    info = provider.get_info()
-
-                    voices = info.get("all_voices") or info.get("sample_voices", [])
-                    english_voices = []
-
-                    if provider_name == "openai" or provider_name == "elevenlabs":
-                        # OpenAI and ElevenLabs voices are English by default
-                        english_voices = voices
-                    else:
-                        # Filter for English voices (en-*)
-                        english_voices = [v for v in voices if v.startswith("en-")]
-
-                    if english_voices:
-                        click.echo(f"\n  {provider_name.upper()} (English):")
-
-                        # Group by region for better organization
-                        regions: Dict[str, list] = {}
-                        for voice in english_voices:
-                            if provider_name in ["openai", "elevenlabs"]:
-                                region = "General"
-                            else:
-                                # Extract region from voice name (e.g., en-US-*, en-GB-*)
-                                parts = voice.split("-")
-                                if len(parts) >= 2:
-                                    region_code = f"{parts[0]}-{parts[1]}"
-                                    region_map = {
-                                        "en-US": "US English",
-                                        "en-GB": "British English",
-                                        "en-IE": "Irish English",
-                                        "en-AU": "Australian English",
-                                        "en-CA": "Canadian English",
-                                        "en-IN": "Indian English",
-                                        "en-ZA": "South African English",
-                                        "en-NZ": "New Zealand English",
-                                        "en-SG": "Singapore English",
-                                        "en-HK": "Hong Kong English",
-                                        "en-PH": "Philippine English",
-                                        "en-KE": "Kenyan English",
-                                        "en-NG": "Nigerian English",
-                                        "en-TZ": "Tanzanian English",
-                                    }
-                                    region = region_map.get(region_code, region_code)
-                                else:
-                                    region = "Other"
-
-                            if region not in regions:
-                                regions[region] = []
-                            regions[region].append(voice)
-
-                        # Display grouped by region
-                        for region, region_voices in regions.items():
-                            if len(regions) > 1:
-                                click.echo(f"   {region}:")
-                                for voice in sorted(region_voices):
-                                    click.echo(f"     - {voice}")
+            for provider_name, voices in catalog.get_all_voices().items():
+                english_voices = []
+
+                if provider_name == "openai" or provider_name == "elevenlabs":
+                    # OpenAI and ElevenLabs voices are English by default
+                    english_voices = voices
+                else:
+                    # Filter for English voices (en-*)
+                    english_voices = [v for v in voices if v.startswith("en-")]
+
+                if english_voices:
+                    click.echo(f"\n  {provider_name.upper()} (English):")
+
+                    # Group by region for better organization
+                    regions: Dict[str, list] = {}
+                    for voice in english_voices:
+                        if provider_name in ["openai", "elevenlabs"]:
+                            region = "General"
+                        else:
+                            # Extract region from voice name (e.g., en-US-*, en-GB-*)
+                            parts = voice.split("-")
+                            if len(parts) >= 2:
+                                region_code = f"{parts[0]}-{parts[1]}"
+                                region_map = {
+                                    "en-US": "US English",
+                                    "en-GB": "British English",
+                                    "en-IE": "Irish English",
+                                    "en-AU": "Australian English",
+                                    "en-CA": "Canadian English",
+                                    "en-IN": "Indian English",
+                                    "en-ZA": "South African English",
+                                    "en-NZ": "New Zealand English",
+                                    "en-SG": "Singapore English",
+                                    "en-HK": "Hong Kong English",
+                                    "en-PH": "Philippine English",
+                                    "en-KE": "Kenyan English",
+                                    "en-NG": "Nigerian English",
+                                    "en-TZ": "Tanzanian English",
+                                }
+                                region = region_map.get(region_code, region_code)
                             else:
-                                for voice in sorted(region_voices):
-                                    click.echo(f"   - {voice}")
-
-                except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError):
-                    # Skip providers that can't be loaded (missing dependencies, etc.)
-                    continue
-                except (ImportError, AttributeError, RuntimeError) as e:
-                    # Log unexpected errors but continue with other providers
-                    logger.warning(f"Unexpected error loading provider {provider_name}: {e}")
-                    continue
+                                region = "Other"
+
+                        if region not in regions:
+                            regions[region] = []
+                        regions[region].append(voice)
+
+                    # Display grouped by region
+                    for region, region_voices in regions.items():
+                        if len(regions) > 1:
+                            click.echo(f"   {region}:")
+                            for voice in sorted(region_voices):
+                                click.echo(f"     - {voice}")
+                        else:
+                            for voice in sorted(region_voices):
+                                click.echo(f"   - {voice}")
         else:
             # Generic language filtering
-            for provider_name in providers_registry.keys():
-                try:
-                    provider_class = load_provider_func(provider_name)
-                    provider = provider_class()
-                    info = provider.get_info()
-
-                    voices = info.get("all_voices") or info.get("sample_voices", [])
-                    filtered_voices = [v for v in voices if language_filter in v.lower()]
-
-                    if filtered_voices:
-                        click.echo(f"\n  {provider_name.upper()}:")
-                        for voice in filtered_voices:
-                            click.echo(f"  - {voice}")
-
-                except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError):
-                    # Skip providers that can't be loaded (missing dependencies, etc.)
-                    continue
-                except (ImportError, AttributeError, RuntimeError) as e:
-                    # Log unexpected errors but continue with other providers
-                    logger.warning(f"Unexpected error loading provider {provider_name}: {e}")
-                    continue
+            for provider_name, voices in catalog.get_all_voices().items():
+                filtered_voices = [v for v in voices if language_filter in v.lower()]
+
+                if filtered_voices:
+                    click.echo(f"\n  {provider_name.upper()}:")
+                    for voice in filtered_voices:
+                        click.echo(f"  - {voice}")
 
 
 __all__ = [
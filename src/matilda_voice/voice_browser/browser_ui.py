@@ -13,24 +13,27 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 
-from ..exceptions import AuthenticationError, DependencyError, ProviderLoadError, ProviderNotFoundError
 from ..internal.audio_utils import AudioPlaybackManager, cleanup_file
 from ..internal.config import set_setting
-from .voice_analyzer import analyze_voice
+from ..internal.voice_catalog import VoiceCatalog, provider_info_loader
 
 
 class VoiceBrowser:
     """Interactive voice browser with filtering and preview capabilities."""
 
-    def __init__(self, providers_registry: Dict[str, Any], load_provider_func: Any) -> None:
+    def __init__(
+        self, providers_registry: Dict[str, Any], load_provider_func: Any, catalog: Optional[VoiceCatalog] = None
+    ) -> None:
         """Initialize the voice browser.
 
         Args:
             providers_registry: Dictionary of available providers
             load_provider_func: Function to load a provider by name
+            catalog: Voice catalog to list voices from (default: one built from load_provider_func)
         """
         self.providers_registry = providers_registry
         self.load_provider = load_provider_func
+        self.catalog = catalog or VoiceCatalog(providers_registry.keys(), provider_info_loader(load_provider_func))
         self.logger = logging.getLogger(__name__)
 
         # Browser state
@@ -79,26 +82,13 @@ class VoiceBrowser:
         self.voice_cache: Dict[str, Tuple[int, str, str]] = {}
 
     def load_voices(self) -> None:
-        """Load all available voices from providers."""
+        """Load all available voices from the voice catalog."""
         self.all_voices = []
         self.voice_cache = {}
 
-        for provider_name in self.providers_registry.keys():
-            try:
-                provider_class = self.load_provider(provider_name)
-                provider = provider_class()
-                info = provider.get_info()
-                if info:
-                    voices = info.get("all_voices") or info.get("sample_voices", [])
-                    for voice in voices:
-                        quality, region, gender = analyze_voice(provider_name, voice)
-                        self.all_voices.append((provider_name, voice, quality, region, gender))
-                        self.voice_cache[f"{provider_name}:{voice}"] = (quality, region, gender)
-            except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError):
-                continue
-            except (ImportError, AttributeError, RuntimeError) as e:
-                self.logger.warning(f"Error loading provider {provider_name}: {e}")
-                continue
+        for entry in self.catalog.entries():
+            self.all_voices.append((entry.provider, entry.name, entry.quality, entry.region, entry.gender))
+            self.voice_cache[f"{entry.provider}:{entry.name}"] = (entry.quality, entry.region, entry.gender)
 
     def filter_voices(self) -> List[Tuple[str, str, int, str, str]]:
         """Apply current filters to voice list."""
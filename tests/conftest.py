@@ -1131,3 +1131,43 @@ def cleanup_temp_files():
                 shutil.rmtree(file)
         except Exception:
             pass
+
+
+@pytest.fixture(autouse=True)
+def isolate_engine_state(tmp_path, monkeypatch):
+    """Drop the global engine and its pooled providers so mocks never leak between tests.
+
+    The audio cache is pointed at a per-test directory for the same reason.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    yield
+    from matilda_voice import core
+
+    if core._tts_engine is not None:
+        core._tts_engine.close()
+        core._tts_engine = None
+
+
+@pytest.fixture
+def make_engine():
+    """Build TTSEngines serving test provider classes, with the audio cache off.
+
+    Usage:
+        engine = make_engine(slow=SlowProvider)
+
+    Every engine built is closed after the test.
+    """
+    from matilda_voice.core import TTSEngine
+
+    engines = []
+
+    def factory(**provider_classes: type) -> TTSEngine:
+        engine = TTSEngine({name: "unused" for name in provider_classes})
+        engine._loaded_providers.update(provider_classes)
+        engine._audio_cache.enabled = False
+        engines.append(engine)
+        return engine
+
+    yield factory
+    for engine in engines:
+        engine.close()
@@ -0,0 +1,240 @@
+"""Tests for the async synthesis path.
+
+These tests cover:
+- The default TTSProvider.synthesize_async running synthesize() off the loop
+- Async pool leases: waiting on the loop and sharing one instance
+- TTSEngine.synthesize_text_async concurrency, chunking and caching
+- async_request_with_retry retry behaviour
+"""
+
+import asyncio
+import threading
+import wave
+
+import httpx
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.internal.audio_cache import AudioCache
+from matilda_voice.internal.http_retry import async_request_with_retry, get_circuit_breaker
+from matilda_voice.internal.provider_pool import ProviderPool
+
+
+class ThreadProvider(TTSProvider):
+    """Sync-only provider recording which thread synthesized."""
+
+    thread_ids: list = []
+
+    def synthesize(self, text, output_path, **kwargs):
+        ThreadProvider.thread_ids.append(threading.get_ident())
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+
+class AsyncProvider(TTSProvider):
+    """Native async provider tracking how many requests are in flight."""
+
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    MAX_TEXT_CHARS = 20
+    calls = 0
+    active = 0
+    peak = 0
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise AssertionError("the async path must not call synthesize()")
+
+    async def synthesize_async(self, text, output_path, **kwargs):
+        AsyncProvider.calls += 1
+        AsyncProvider.active += 1
+        AsyncProvider.peak = max(AsyncProvider.peak, AsyncProvider.active)
+        try:
+            await asyncio.sleep(0.02)
+            if kwargs.get("output_format") == "wav":
+                with wave.open(output_path, "wb") as out:
+                    out.setnchannels(1)
+                    out.setsampwidth(1)
+                    out.setframerate(8000)
+                    out.writeframes(text.encode("ascii"))
+            else:
+                with open(output_path, "wb") as f:
+                    f.write(text.encode())
+        finally:
+            AsyncProvider.active -= 1
+
+
+class ExclusiveProvider(AsyncProvider):
+    """Async provider whose instances must not be shared."""
+
+    CONCURRENT_ASYNC_SYNTHESIS = False
+
+
+@pytest.fixture
+def engine(make_engine):
+    AsyncProvider.calls = AsyncProvider.active = AsyncProvider.peak = 0
+    # "async" is a keyword, so the providers are passed as a mapping
+    return make_engine(**{"async": AsyncProvider, "exclusive": ExclusiveProvider, "thread": ThreadProvider})
+
+
+class TestDefaultSynthesizeAsync:
+    """Test the base class fallback."""
+
+    def test_runs_sync_synthesize_in_worker_thread(self, tmp_path):
+        """Providers without a native implementation are awaited via a thread."""
+        ThreadProvider.thread_ids = []
+        output = tmp_path / "out.wav"
+
+        asyncio.run(ThreadProvider().synthesize_async("hello", str(output)))
+
+        assert output.read_bytes() == b"hello"
+        assert ThreadProvider.thread_ids != [threading.get_ident()]
+
+
+class TestAsyncPoolLeases:
+    """Test ProviderPool.acquire_async."""
+
+    def test_shared_lease_reuses_one_instance(self):
+        """Concurrent shared leases get the same instance, released after the last one."""
+        pool = ProviderPool(max_instances_per_provider=1)
+
+        async def run():
+            first = await pool.acquire_async("async", AsyncProvider, shared=True)
+            second = await pool.acquire_async("async", AsyncProvider, shared=True)
+            assert first is second
+            pool.release("async", AsyncProvider, first, shared=True)
+            assert pool.get_stats()["providers"]["async"]["in_use"] == 1
+            pool.release("async", AsyncProvider, second, shared=True)
+
+        asyncio.run(run())
+        stats = pool.get_stats()
+        assert stats["created"] == 1
+        assert stats["providers"]["async"] == {"idle": 1, "in_use": 0}
+        pool.close()
+
+    def test_exclusive_waiter_is_woken_by_release(self):
+        """An exhausted pool makes coroutines wait until an instance is released."""
+        pool = ProviderPool(max_instances_per_provider=1, acquire_timeout=5)
+
+        async def run():
+            held = await pool.acquire_async("exclusive", ExclusiveProvider)
+            waiter = asyncio.create_task(pool.acquire_async("exclusive", ExclusiveProvider))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            pool.release("exclusive", ExclusiveProvider, held)
+            assert await asyncio.wait_for(waiter, 1) is held
+
+        asyncio.run(run())
+        pool.close()
+
+
+class TestSynthesizeTextAsync:
+    """Test TTSEngine.synthesize_text_async."""
+
+    def test_concurrent_requests_share_one_instance(self, engine, tmp_path):
+        """Many requests to a native async provider run at once without extra instances."""
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    engine.synthesize_text_async(
+                        f"item {i}",
+                        str(tmp_path / f"{i}.mp3"),
+                        provider_name="async",
+                        stream=False,
+                        output_format="mp3",
+                    )
+                    for i in range(25)
+                )
+            )
+
+        paths = asyncio.run(run())
+
+        assert paths == [str(tmp_path / f"{i}.mp3") for i in range(25)]
+        assert AsyncProvider.peak == 25
+        assert engine.get_pool_stats()["created"] == 1
+
+    def test_exclusive_provider_respects_pool_bound(self, engine, tmp_path):
+        """Providers that cannot share an instance queue for the pool's instances."""
+        engine._provider_pool = ProviderPool(max_instances_per_provider=2)
+
+        async def run():
+            await asyncio.gather(
+                *(
+                    engine.synthesize_text_async(
+                        f"hi {i}",
+                        str(tmp_path / f"{i}.mp3"),
+                        provider_name="exclusive",
+                        stream=False,
+                        output_format="mp3",
+                    )
+                    for i in range(6)
+                )
+            )
+
+        asyncio.run(run())
+
+        assert AsyncProvider.calls == 6
+        assert AsyncProvider.peak <= 2
+
+    def test_long_text_is_chunked_and_joined_in_order(self, engine, tmp_path):
+        """Chunks are awaited concurrently and reassembled in reading order."""
+        output = str(tmp_path / "long.wav")
+        text = "One two three. Four five six. Seven eight nine."
+
+        asyncio.run(
+            engine.synthesize_text_async(text, output, provider_name="async", stream=False, output_format="wav")
+        )
+
+        with wave.open(output, "rb") as joined:
+            assert joined.readframes(joined.getnframes()) == b"One two three.Four five six.Seven eight nine."
+        assert AsyncProvider.calls == 3
+
+    def test_repeat_request_is_served_from_cache(self, engine, tmp_path):
+        """The async path reads and fills the same audio cache as synthesize_text."""
+        engine._audio_cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+
+        async def run():
+            for name in ("first", "second"):
+                await engine.synthesize_text_async(
+                    "cached", str(tmp_path / f"{name}.mp3"), provider_name="async", stream=False, output_format="mp3"
+                )
+
+        asyncio.run(run())
+
+        assert AsyncProvider.calls == 1
+        assert (tmp_path / "second.mp3").read_bytes() == b"cached"
+
+
+class TestAsyncRequestWithRetry:
+    """Test async_request_with_retry."""
+
+    def test_retries_transient_status_then_succeeds(self, monkeypatch):
+        """Idempotent requests back off and retry on 503."""
+        responses = iter([503, 200])
+        transport = httpx.MockTransport(lambda request: httpx.Response(next(responses)))
+        monkeypatch.setattr("matilda_voice.internal.http_retry.calculate_backoff", lambda *args: 0)
+
+        async def run():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await async_request_with_retry(
+                    "GET", "https://example.test/voices", client=client, provider_name="AsyncRetryTest"
+                )
+
+        assert asyncio.run(run()).status_code == 200
+        assert get_circuit_breaker("AsyncRetryTest")._state == "closed"
+
+    def test_non_idempotent_request_is_not_retried(self):
+        """Synthesis requests return the error response instead of paying twice."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await async_request_with_retry(
+                    "POST", "https://example.test/tts", client=client, idempotent=False, provider_name="AsyncRetryTest2"
+                )
+
+        assert asyncio.run(run()).status_code == 500
+        assert len(calls) == 1
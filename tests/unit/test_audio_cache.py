@@ -0,0 +1,176 @@
+"""Tests for the synthesized-audio cache.
+
+These tests cover:
+- Key derivation from provider, voice, format, options, normalized text and config
+- Hits, misses and atomic stores
+- TTL expiry and LRU eviction under a size budget
+- TTSEngine serving repeated requests without calling the provider
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal import audio_cache
+from matilda_voice.internal.audio_cache import AudioCache, normalize_text
+
+
+class CountingProvider(TTSProvider):
+    """Provider that writes the text as bytes and counts synthesize calls."""
+
+    calls = 0
+
+    def synthesize(self, text, output_path, **kwargs):
+        CountingProvider.calls += 1
+        with open(output_path, "wb") as f:
+            f.write(f"{kwargs.get('voice')}:{text}".encode())
+
+
+def make_audio(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_whitespace_is_normalized(self):
+        """Formatting-only text differences share a key."""
+        cache = AudioCache(cache_dir="unused", enabled=True)
+        assert normalize_text("  Build   finished\n") == "Build finished"
+        assert cache.make_key("openai_tts", "Build finished") == cache.make_key("openai_tts", " Build\tfinished ")
+
+    def test_audio_options_change_key(self):
+        """Voice, format and provider options produce distinct keys."""
+        cache = AudioCache(cache_dir="unused", enabled=True)
+        base = cache.make_key("openai_tts", "hi", voice="nova", output_format="mp3", rate="+0%")
+
+        assert base != cache.make_key("openai_tts", "hi", voice="alloy", output_format="mp3", rate="+0%")
+        assert base != cache.make_key("openai_tts", "hi", voice="nova", output_format="wav", rate="+0%")
+        assert base != cache.make_key("openai_tts", "hi", voice="nova", output_format="mp3", rate="+10%")
+        assert base != cache.make_key("elevenlabs", "hi", voice="nova", output_format="mp3", rate="+0%")
+
+    def test_delivery_options_do_not_change_key(self):
+        """stream and debug describe delivery, not audio content."""
+        cache = AudioCache(cache_dir="unused", enabled=True)
+        assert cache.make_key("edge_tts", "hi", stream=True, debug=True) == cache.make_key("edge_tts", "hi")
+
+    def test_config_change_changes_key(self, monkeypatch):
+        """Provider defaults read from config (model, stability, ...) select a different entry."""
+        cache = AudioCache(cache_dir="unused", enabled=True)
+        monkeypatch.setattr(audio_cache, "get_config_snapshot", lambda: SimpleNamespace(fingerprint="a"))
+        before = cache.make_key("elevenlabs", "hi", voice="rachel")
+        monkeypatch.setattr(audio_cache, "get_config_snapshot", lambda: SimpleNamespace(fingerprint="b"))
+
+        assert before != cache.make_key("elevenlabs", "hi", voice="rachel")
+
+
+class TestAudioCache:
+    """Test AudioCache storage and eviction."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """A stored entry is copied to the requested output path."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+        key = cache.make_key("edge_tts", "hello")
+        output = str(tmp_path / "out.mp3")
+
+        assert cache.get(key, output) is False
+        cache.put(key, make_audio(tmp_path, "src.mp3", 100))
+        assert cache.get(key, output) is True
+        assert os.path.getsize(output) == 100
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+        assert stats["entries"] == 1
+
+    def test_stats_keep_running_totals(self, tmp_path, monkeypatch):
+        """After the first scan, get_stats() tracks entries and bytes without walking the directory."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+        cache.put(cache.make_key("edge_tts", "one"), make_audio(tmp_path, "a", 10))
+        assert cache.get_stats()["entries"] == 1
+
+        def no_scan():
+            raise AssertionError("cache directory rescanned")
+
+        monkeypatch.setattr(cache, "_scan", no_scan)
+        cache.put(cache.make_key("edge_tts", "two"), make_audio(tmp_path, "b", 20))
+        cache.put(cache.make_key("edge_tts", "two"), make_audio(tmp_path, "c", 30))
+        stats = cache.get_stats()
+
+        assert (stats["entries"], stats["size_bytes"]) == (2, 40)
+
+    def test_no_temp_files_left_after_store(self, tmp_path):
+        """Atomic writes leave only the final entry behind."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+        cache.put(cache.make_key("edge_tts", "hello"), make_audio(tmp_path, "src.mp3", 10))
+
+        assert [p.name.startswith(".tmp-") for p in (tmp_path / "cache").iterdir()] == [False]
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Entries older than the TTL are removed on lookup."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+        key = cache.make_key("edge_tts", "hello")
+        entry = cache.put(key, make_audio(tmp_path, "src.mp3", 10))
+        old = time.time() - 120
+        os.utime(entry, (old, old))
+
+        assert cache.lookup(key) is None
+        assert not entry.exists()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        """When over budget, the least recently used entry is evicted first."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=250 / (1024 * 1024), ttl_seconds=60, enabled=True)
+        first = cache.make_key("edge_tts", "first")
+        second = cache.make_key("edge_tts", "second")
+        third = cache.make_key("edge_tts", "third")
+
+        cache.put(first, make_audio(tmp_path, "a", 100))
+        cache.put(second, make_audio(tmp_path, "b", 100))
+        past = time.time() - 30
+        os.utime(cache.lookup(second), (past, time.time()))
+        assert cache.lookup(first) is not None
+
+        cache.put(third, make_audio(tmp_path, "c", 100))
+
+        assert cache.lookup(first) is not None
+        assert cache.lookup(third) is not None
+        assert cache.lookup(second) is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disabled_cache_never_stores(self, tmp_path):
+        """A disabled cache misses without touching disk."""
+        cache = AudioCache(cache_dir=tmp_path / "cache", enabled=False)
+        key = cache.make_key("edge_tts", "hello")
+
+        assert cache.put(key, make_audio(tmp_path, "src.mp3", 10)) is None
+        assert cache.lookup(key) is None
+        assert not (tmp_path / "cache").exists()
+
+
+class TestEngineAudioCache:
+    """Test TTSEngine integration with the audio cache."""
+
+    def test_repeat_save_skips_provider(self, tmp_path):
+        """The second identical request is served from disk."""
+        CountingProvider.calls = 0
+        engine = TTSEngine({"counting": "unused"})
+        engine._loaded_providers["counting"] = CountingProvider
+        engine._audio_cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+
+        first = str(tmp_path / "first.wav")
+        second = str(tmp_path / "second.wav")
+        engine.synthesize_text("Deploy done", first, provider_name="counting", voice="a", stream=False)
+        engine.synthesize_text("Deploy  done", second, provider_name="counting", voice="a", stream=False)
+
+        assert CountingProvider.calls == 1
+        assert open(second, "rb").read() == b"a:Deploy done"
+        assert engine.get_cache_stats()["hits"] == 1
+
+        engine.synthesize_text("Deploy done", second, provider_name="counting", voice="b", stream=False)
+        assert CountingProvider.calls == 2
+        engine.close()
@@ -0,0 +1,160 @@
+"""Tests for the persistent audio sink.
+
+These tests cover:
+- Buffers reaching the output in write order
+- clear() dropping queued audio and silencing the output
+- FfplaySink keeping one ffplay process across utterances
+- PlaybackQueue feeding consecutive jobs into one sink
+"""
+
+import asyncio
+import threading
+import wave
+
+from matilda_voice.internal import audio_sink
+from matilda_voice.internal.audio_sink import AudioSink, FfplaySink, FileSink, NullSink, create_audio_sink
+from matilda_voice.internal.audio_utils import PCM_SAMPLE_RATE
+from matilda_voice.internal.playback_queue import DONE, PlaybackQueue
+
+
+class GatedSink(AudioSink):
+    """Sink whose output blocks until released, recording what it was given."""
+
+    REALTIME = False
+
+    def __init__(self):
+        super().__init__()
+        self.output = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.stops = 0
+
+    def _output(self, pcm):
+        self.started.set()
+        self.release.wait(5)
+        self.output.append(pcm)
+
+    def _stop_output(self):
+        self.stops += 1
+
+
+class FakeFfplay:
+    """ffplay stand-in reading PCM from stdin."""
+
+    def __init__(self):
+        self.stdin = self
+        self.received = b""
+        self.killed = False
+
+    def write(self, data):
+        self.received += data
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def poll(self):
+        return 0 if self.killed else None
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self, timeout=None):
+        return 0
+
+
+class TestAudioSink:
+    """Test AudioSink and its outputs."""
+
+    def test_file_sink_writes_buffers_in_order(self, tmp_path):
+        """Buffers are joined in write order into a 24 kHz mono WAV."""
+        path = tmp_path / "out.wav"
+        sink = FileSink(str(path), max_buffers=2)
+        for index in range(10):
+            sink.write(bytes([index]) * 4)
+        assert sink.wait(timeout=5)
+        sink.close()
+
+        with wave.open(str(path), "rb") as f:
+            assert (f.getframerate(), f.getnchannels(), f.getsampwidth()) == (PCM_SAMPLE_RATE, 1, 2)
+            assert f.readframes(f.getnframes()) == b"".join(bytes([index]) * 4 for index in range(10))
+
+    def test_clear_drops_queued_audio(self):
+        """clear() stops the output and discards buffers that were not output yet."""
+        sink = GatedSink()
+        sink.write(b"playing")
+        assert sink.started.wait(5)
+        sink.write(b"queued")
+        sink.clear()
+        sink.release.set()
+        sink.write(b"after")
+        assert sink.wait(timeout=5)
+        sink.close()
+
+        # The buffer already handed over is silenced by _stop_output(); the queued one never reaches it
+        assert sink.stops == 1
+        assert sink.output == [b"playing", b"after"]
+        assert sink.remaining() == 0.0
+
+    def test_ffplay_sink_reuses_one_process(self, monkeypatch):
+        """Consecutive utterances share one ffplay; a clear() kills it and the next write starts another."""
+        processes = []
+
+        def spawn(logger=None, format_args=None):
+            processes.append(FakeFfplay())
+            return processes[-1]
+
+        monkeypatch.setattr(audio_sink, "create_ffplay_process", spawn)
+        monkeypatch.setattr(FfplaySink, "REALTIME", False)
+        sink = FfplaySink()
+        sink.write(b"one")
+        sink.write(b"two")
+        sink.wait(timeout=5)
+        sink.clear()
+        sink.write(b"three")
+        sink.wait(timeout=5)
+        sink.close()
+
+        assert len(processes) == 2
+        assert processes[0].received == b"onetwo" and processes[0].killed
+        assert processes[1].received == b"three"
+
+    def test_create_audio_sink(self, tmp_path):
+        """Sinks are created from their configured names."""
+        assert isinstance(create_audio_sink("null"), NullSink)
+        assert isinstance(create_audio_sink("ffplay"), FfplaySink)
+        assert create_audio_sink(f"file:{tmp_path / 'a.wav'}").path == str(tmp_path / "a.wav")
+        try:
+            create_audio_sink("speakers")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown sink names must be rejected")
+
+
+class TestPlaybackQueueSink:
+    """Test PlaybackQueue playing through a sink."""
+
+    def test_jobs_play_back_to_back_into_one_sink(self):
+        """Each job's PCM is fed to the same sink, in queue order, as pcm."""
+        sink = NullSink()
+        formats = []
+
+        async def synthesize(job, output_path):
+            formats.append(job.audio_format)
+            with open(output_path, "wb") as f:
+                f.write(job.text.encode())
+
+        async def run():
+            queue = PlaybackQueue(synthesize=synthesize, sink=sink)
+            jobs = [queue.enqueue(text) for text in ("one", "two", "three")]
+            results = [await job.done for job in jobs]
+            await queue.close()
+            return results
+
+        assert asyncio.run(run()) == [DONE, DONE, DONE]
+        sink.close()
+        assert formats == ["pcm", "pcm", "pcm"]
+        assert sink.bytes_written == len("onetwothree")
@@ -6,14 +6,29 @@ helpers that don't require external audio systems or mocks. They test:
 - Path handling and validation
 - Command argument construction
 - Error handling for file operations
+- Piped format conversion (with `cat` standing in for ffmpeg)
+- The streaming jitter buffer's pre-roll, coalescing and backpressure
+- Caching of the audio environment probe
 """
 
+import asyncio
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from matilda_voice.internal.audio_utils import cleanup_file
+import pytest
+
+from matilda_voice.exceptions import DependencyError, ProviderError
+from matilda_voice.internal import audio_utils
+from matilda_voice.internal.audio_utils import (
+    JitterBuffer,
+    StreamingPlayer,
+    cleanup_file,
+    iter_transcoded,
+    transcode_chunks,
+)
 
 
 class TestCleanupFile:
@@ -385,3 +400,214 @@ class TestErrorScenarios:
             # Final cleanup (should be no-op if already cleaned)
             for temp_file in temp_files:
                 cleanup_file(temp_file)
+
+
+class TestPipedTranscoding:
+    """Test transcode_chunks and iter_transcoded without intermediate files."""
+
+    @pytest.fixture
+    def passthrough(self, monkeypatch):
+        """Replace ffmpeg with a shell copying stdin to the output unchanged."""
+
+        def command(source_format, output_format, output):
+            if output == "pipe:1":
+                return ["cat"]
+            return ["sh", "-c", 'cat > "$0"', output]
+
+        monkeypatch.setattr(audio_utils, "_transcode_command", command)
+
+    def test_chunks_are_piped_to_output(self, passthrough, tmp_path):
+        """Every chunk reaches the converter in order."""
+        output = tmp_path / "out.wav"
+        transcode_chunks(iter([b"RIFF", b"", b"data"]), "mp3", str(output), "wav")
+        assert output.read_bytes() == b"RIFFdata"
+
+    def test_iter_transcoded_yields_converter_output(self, passthrough):
+        """Output is read from the converter's stdout while input is fed."""
+        chunks = [bytes([i]) * 1000 for i in range(5)]
+        assert b"".join(iter_transcoded(iter(chunks), "mp3", "ogg", chunk_size=512)) == b"".join(chunks)
+
+    def test_iter_transcoded_reraises_source_errors(self, passthrough):
+        """An error from the source stream surfaces to the reader."""
+
+        def failing():
+            yield b"partial"
+            raise ConnectionError("provider went away")
+
+        with pytest.raises(ConnectionError):
+            list(iter_transcoded(failing(), "mp3", "ogg"))
+
+    def test_converter_failure_raises_provider_error(self, monkeypatch, tmp_path):
+        """A non-zero exit status is reported as a conversion failure."""
+        monkeypatch.setattr(audio_utils, "_transcode_command", lambda *args: ["sh", "-c", "cat > /dev/null; exit 3"])
+        with pytest.raises(ProviderError, match="status 3"):
+            transcode_chunks([b"data"], "mp3", str(tmp_path / "out.ogg"), "ogg")
+
+    def test_missing_ffmpeg_raises_dependency_error(self, monkeypatch, tmp_path):
+        """A missing ffmpeg binary is a dependency problem, not a provider failure."""
+        monkeypatch.setattr(audio_utils, "_transcode_command", lambda *args: ["voice-no-such-ffmpeg"])
+        with pytest.raises(DependencyError):
+            transcode_chunks([b"data"], "mp3", str(tmp_path / "out.ogg"), "ogg")
+
+
+class FakePipe:
+    """ffplay stdin stand-in recording each write, optionally failing after some."""
+
+    def __init__(self, fail_after=None):
+        self.writes = []
+        self.fail_after = fail_after
+
+    def write(self, data):
+        if self.fail_after is not None and len(self.writes) >= self.fail_after:
+            raise BrokenPipeError()
+        self.writes.append(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestJitterBuffer:
+    """Test JitterBuffer and StreamingPlayer's writer thread."""
+
+    def test_pre_roll_then_coalesced_reads(self):
+        """Nothing is returned before the start threshold; then chunks are joined up to the write size."""
+        buffer = JitterBuffer(max_bytes=1024, start_threshold=3)
+        got = []
+        reader = threading.Thread(target=lambda: got.append(buffer.get(10)))
+        reader.start()
+        buffer.put(b"aaaa")
+        buffer.put(b"bbbb")
+        reader.join(0.1)
+        assert reader.is_alive()
+
+        buffer.put(b"cccc")
+        reader.join(5)
+        buffer.close()
+        assert got == [b"aaaabbbb"]
+        assert buffer.get(10) == b"cccc"
+        assert buffer.get(10) == b""
+
+    def test_full_buffer_applies_backpressure(self):
+        """put() waits while the buffer is full and resumes once the writer takes audio."""
+        buffer = JitterBuffer(max_bytes=8, start_threshold=1)
+        assert buffer.put(b"12345678")
+        assert not buffer.put(b"9", block=False)
+        writer = threading.Thread(target=lambda: buffer.put(b"9"))
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()
+
+        assert buffer.get(4) == b"12345678"
+        writer.join(5)
+        assert buffer.buffered_bytes() == 1
+        buffer.abort()
+        assert not buffer.put(b"x")
+
+    def test_player_writes_all_audio_through_buffer(self, monkeypatch):
+        """Every chunk reaches ffplay in order, in fewer and larger writes."""
+        pipe = FakePipe()
+        process = Mock(stdin=pipe, stderr=None)
+        process.wait.return_value = 0
+        monkeypatch.setattr(audio_utils, "create_ffplay_process", lambda **kwargs: process)
+        chunks = [bytes([i]) * 100 for i in range(50)]
+
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        player = StreamingPlayer("Test", start_threshold=3, buffer_bytes=400)
+        player.write_size = 1000
+        asyncio.run(player.play_chunks_async(source()))
+
+        assert b"".join(pipe.writes) == b"".join(chunks)
+        assert len(pipe.writes) < len(chunks)
+        assert player.chunk_count == 50 and player.bytes_written == 5000
+
+    def test_player_stops_reading_when_ffplay_exits(self, monkeypatch):
+        """A broken pipe on the writer thread stops the stream instead of blocking the reader."""
+        process = Mock(stdin=FakePipe(fail_after=1), stderr=None)
+        process.poll.return_value = 1
+        process.wait.return_value = 1
+        monkeypatch.setattr(audio_utils, "create_ffplay_process", lambda **kwargs: process)
+
+        def source():
+            for _ in range(1000):
+                yield b"x" * 100
+
+        player = StreamingPlayer("Test", start_threshold=1, buffer_bytes=200)
+        player.write_size = 100
+        player.play_chunks(source())
+
+        assert player.chunk_count < 1000
+        assert player.bytes_written == 100
+
+    def test_play_alias_streams_chunks(self, monkeypatch):
+        """play() is the older name of play_chunks(), still used by several providers."""
+        pipe = FakePipe()
+        process = Mock(stdin=pipe, stderr=None)
+        process.wait.return_value = 0
+        monkeypatch.setattr(audio_utils, "create_ffplay_process", lambda **kwargs: process)
+
+        audio_utils.StreamPlayer("Test").play(iter([b"audio"]))
+
+        assert pipe.writes == [b"audio"]
+
+
+class TestAudioEnvironmentCache:
+    """Test that check_audio_environment() reuses its probe."""
+
+    @pytest.fixture
+    def probes(self, monkeypatch):
+        """Count probes, starting from an empty cache."""
+        calls = []
+
+        def probe():
+            calls.append(os.environ.get("PULSE_SERVER"))
+            return {"available": True, "reason": "probe", "pulse_available": False, "alsa_available": True}
+
+        monkeypatch.setattr(audio_utils, "_probe_audio_environment", probe)
+        monkeypatch.delenv("PULSE_SERVER", raising=False)
+        audio_utils.invalidate_audio_environment()
+        yield calls
+        audio_utils.invalidate_audio_environment()
+
+    def test_probe_is_reused_until_invalidated(self, probes):
+        """Repeated checks share one probe; invalidation or refresh=True probes again."""
+        first = audio_utils.check_audio_environment()
+        first["available"] = False  # Callers get a copy
+        assert audio_utils.check_audio_environment()["available"]
+        assert len(probes) == 1
+
+        audio_utils.invalidate_audio_environment()
+        audio_utils.check_audio_environment()
+        audio_utils.check_audio_environment(refresh=True)
+        assert len(probes) == 3
+
+    def test_probe_expires_and_follows_pulse_server(self, probes, monkeypatch):
+        """A stale result or a changed PULSE_SERVER triggers a new probe."""
+        audio_utils.check_audio_environment()
+        monkeypatch.setenv("PULSE_SERVER", "unix:/run/pulse/native")
+        audio_utils.check_audio_environment()
+        monkeypatch.setattr(audio_utils, "get_config_value", lambda key, default=None: 0)
+        audio_utils.check_audio_environment()
+        assert probes == [None, "unix:/run/pulse/native", "unix:/run/pulse/native"]
+
+    def test_probe_runs_without_the_lock(self, monkeypatch):
+        """Other checks are not blocked by a slow probe, and a probe overtaken by invalidation is dropped."""
+        lock_free = []
+
+        def probe():
+            lock_free.append(audio_utils._audio_environment_lock.acquire(blocking=False))
+            audio_utils._audio_environment_lock.release()
+            audio_utils.invalidate_audio_environment()
+            return {"available": True, "reason": "probe", "pulse_available": False, "alsa_available": True}
+
+        monkeypatch.setattr(audio_utils, "_probe_audio_environment", probe)
+        audio_utils.invalidate_audio_environment()
+
+        assert audio_utils.check_audio_environment()["available"]
+        assert lock_free == [True]
+        assert audio_utils._audio_environment is None
@@ -0,0 +1,143 @@
+"""Tests for batch synthesis.
+
+These tests cover:
+- TTSEngine.synthesize_batch ordering, failure isolation and per-provider limits
+- JSONL manifest parsing and the on_batch hook
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.exceptions import ProviderError
+from matilda_voice.hooks import batch as batch_hooks
+from matilda_voice.internal.types import BatchItem
+
+
+class SlowProvider(TTSProvider):
+    """Provider that tracks concurrent calls and fails on request."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def synthesize(self, text, output_path, **kwargs):
+        with SlowProvider.lock:
+            SlowProvider.active += 1
+            SlowProvider.peak = max(SlowProvider.peak, SlowProvider.active)
+        try:
+            time.sleep(0.02)
+            if text == "fail":
+                raise ProviderError("simulated failure")
+            if text == "bug":
+                raise KeyError("simulated provider bug")
+            with open(output_path, "wb") as f:
+                f.write(text.encode())
+        finally:
+            with SlowProvider.lock:
+                SlowProvider.active -= 1
+
+
+@pytest.fixture
+def engine(make_engine):
+    SlowProvider.active = 0
+    SlowProvider.peak = 0
+    return make_engine(slow=SlowProvider)
+
+
+class TestSynthesizeBatch:
+    """Test TTSEngine.synthesize_batch."""
+
+    def test_results_keep_input_order_and_isolate_failures(self, engine, tmp_path):
+        """A failing item is reported without stopping the others."""
+        items = [
+            BatchItem(text=text, output_path=str(tmp_path / f"{i}.wav"), provider_name="slow")
+            for i, text in enumerate(["one", "fail", "three"])
+        ]
+        seen = []
+
+        results = engine.synthesize_batch(items, max_workers=3, on_result=seen.append)
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.success for r in results] == [True, False, True]
+        assert "simulated failure" in results[1].error
+        assert (tmp_path / "2.wav").read_bytes() == b"three"
+        assert len(seen) == 3
+
+    def test_unexpected_exception_fails_only_its_item(self, engine, tmp_path):
+        """An exception outside the TTS error hierarchy does not abort the batch."""
+        items = [
+            BatchItem(text=text, output_path=str(tmp_path / f"{i}.wav"), provider_name="slow")
+            for i, text in enumerate(["one", "bug", "three"])
+        ]
+
+        results = engine.synthesize_batch(items, max_workers=1)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "simulated provider bug" in results[1].error
+
+    def test_provider_concurrency_is_bounded(self, engine, tmp_path):
+        """No more than provider_concurrency items hit one provider at once."""
+        items = [
+            BatchItem(text=f"item {i}", output_path=str(tmp_path / f"{i}.wav"), provider_name="slow") for i in range(8)
+        ]
+
+        results = engine.synthesize_batch(items, max_workers=8, provider_concurrency=2)
+
+        assert all(r.success for r in results)
+        assert SlowProvider.peak <= 2
+
+
+class TestBatchHook:
+    """Test manifest parsing and on_batch."""
+
+    def test_manifest_parsing(self, tmp_path):
+        """Fields map onto BatchItem; extras become provider options."""
+        manifest = tmp_path / "prompts.jsonl"
+        manifest.write_text(
+            "# comment\n"
+            + json.dumps({"text": "Hi", "output": "hi.mp3", "provider": "@openai", "rate": "+10%"})
+            + "\n\n"
+            + json.dumps({"text": "Bye", "format": "wav"})
+            + "\n"
+        )
+
+        items = batch_hooks._parse_manifest(manifest, str(tmp_path / "out"), None, "nova")
+
+        assert items[0].output_path == str(tmp_path / "out" / "hi.mp3")
+        assert items[0].provider_name == "openai_tts"
+        assert items[0].voice == "nova"
+        assert items[0].options == {"rate": "+10%"}
+        assert items[1].output_path == str(tmp_path / "out" / "00002.wav")
+        assert items[1].output_format == "wav"
+
+    def test_manifest_errors_name_the_line(self, tmp_path):
+        """Invalid lines are reported with their line number."""
+        manifest = tmp_path / "bad.jsonl"
+        manifest.write_text('{"text": "ok"}\n{"output": "x.mp3"}\n')
+
+        with pytest.raises(ValueError, match="bad.jsonl:2"):
+            batch_hooks._parse_manifest(manifest, None, None, None)
+
+    def test_on_batch_reports_summary(self, engine, tmp_path, monkeypatch, capsys):
+        """The hook runs the batch and returns non-zero when an item failed."""
+        manifest = tmp_path / "prompts.jsonl"
+        manifest.write_text(
+            json.dumps({"text": "good", "output": "good.wav", "provider": "slow"})
+            + "\n"
+            + json.dumps({"text": "fail", "output": "bad.wav", "provider": "slow"})
+            + "\n"
+        )
+        monkeypatch.setattr(batch_hooks, "get_engine", lambda: engine)
+
+        exit_code = batch_hooks.on_batch(
+            manifest=str(manifest), output_dir=str(tmp_path), format=None, voice=None, workers=2, json=True, debug=False
+        )
+
+        summary = json.loads(capsys.readouterr().out)
+        assert exit_code == 1
+        assert summary["succeeded"] == 1
+        assert summary["failed"] == 1
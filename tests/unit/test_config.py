@@ -6,14 +6,22 @@ external dependencies or mocks. They test core business logic for:
 - Voice setting parsing and provider auto-detection
 - API key validation
 - SSML detection and processing
+- The shared configuration snapshot and its revalidation
 """
 
+import json
+
 from matilda_voice.internal.config import (
     CONFIG_DEFAULTS,
     _parse_env_value,
+    get_config_snapshot,
     get_config_value,
+    get_setting,
     is_ssml,
+    load_config,
     parse_voice_setting,
+    reload_config,
+    save_config,
     strip_ssml_tags,
     validate_api_key,
 )
@@ -415,3 +423,60 @@ class TestConfigDefaults:
     def test_get_config_value_unknown_key(self):
         """Test getting unknown configuration key returns None."""
         assert get_config_value("completely_unknown_key_12345") is None
+
+
+class TestConfigSnapshot:
+    """Test the mtime-validated configuration snapshot."""
+
+    def test_unchanged_files_reuse_snapshot(self, tmp_path, monkeypatch):
+        """Repeated reads share one snapshot instead of re-parsing the files."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        (tmp_path / "voice").mkdir()
+        (tmp_path / "voice" / "config.json").write_text(json.dumps({"voice": "openai_tts:nova"}))
+
+        first = get_config_snapshot()
+        assert load_config()["voice"] == "openai_tts:nova"
+        assert get_config_snapshot() is first
+
+    def test_edited_files_are_picked_up(self, tmp_path, monkeypatch):
+        """Changing either config file rebuilds the snapshot on the next read."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        config_dir = tmp_path / "voice"
+        config_dir.mkdir()
+        json_path = config_dir / "config.json"
+        toml_path = config_dir / "config.toml"
+        json_path.write_text(json.dumps({"voice": "openai_tts:nova"}))
+        toml_path.write_text("[long_text]\nchunk_chars = 500\n")
+        assert get_config_value("long_text_chunk_chars") == 500
+
+        json_path.write_text(json.dumps({"voice": "edge_tts:en-US-JennyNeural"}))
+        toml_path.write_text("[long_text]\nchunk_chars = 750\n")
+
+        assert get_setting("voice") == "edge_tts:en-US-JennyNeural"
+        assert get_config_value("long_text_chunk_chars") == 750
+
+    def test_returned_config_does_not_alias_snapshot(self, tmp_path, monkeypatch):
+        """Mutating a loaded config leaves the shared snapshot untouched."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        config = load_config()
+        config["voice"] = "changed"
+        config["document_parsing"]["cache_enabled"] = False
+
+        assert load_config()["voice"] != "changed"
+        assert load_config()["document_parsing"]["cache_enabled"] is True
+
+    def test_save_and_reload_refresh_snapshot(self, tmp_path, monkeypatch):
+        """save_config and reload_config make new values visible immediately."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        assert save_config({"rate": "+10%"})
+        assert get_setting("rate") == "+10%"
+
+        monkeypatch.setenv("TTS_LONG_TEXT_MAX_CONCURRENCY", "7")
+        reload_config()
+        try:
+            assert get_config_value("long_text_max_concurrency") == 7
+        finally:
+            monkeypatch.delenv("TTS_LONG_TEXT_MAX_CONCURRENCY")
+            reload_config()
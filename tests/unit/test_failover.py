@@ -0,0 +1,136 @@
+"""Tests for multi-provider failover.
+
+These tests cover:
+- Parsing failover chains
+- Falling back when a provider fails, and skipping providers whose circuit is open
+- Failover for the async and streaming APIs
+"""
+
+import asyncio
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.exceptions import NetworkError, ProviderError, VoiceNotFoundError
+from matilda_voice.internal import http_retry
+from matilda_voice.internal.config import parse_failover_chain, reload_config
+
+
+class DownProvider(TTSProvider):
+    """Provider whose API is unreachable."""
+
+    CIRCUIT_BREAKER = "FailoverTestDown"
+    STREAM_FORMAT = "mp3"
+    calls = 0
+
+    def synthesize(self, text, output_path, **kwargs):
+        DownProvider.calls += 1
+        raise NetworkError("connection refused")
+
+    def iter_audio(self, text, **kwargs):
+        DownProvider.calls += 1
+        raise NetworkError("connection refused")
+        yield b""
+
+
+class BackupProvider(TTSProvider):
+    """Provider that records the voice it was asked for."""
+
+    STREAM_FORMAT = "mp3"
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(f"{kwargs.get('voice')}:{text}".encode())
+
+    def iter_audio(self, text, **kwargs):
+        yield f"{kwargs.get('voice')}:{text}".encode()
+
+
+class PickyProvider(TTSProvider):
+    """Provider rejecting the request itself."""
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise VoiceNotFoundError("no such voice")
+
+
+@pytest.fixture
+def engine(monkeypatch, make_engine):
+    DownProvider.calls = 0
+    http_retry._circuit_breakers.pop("FailoverTestDown", None)
+    monkeypatch.setenv("TTS_FAILOVER_CHAIN", "down:alpha -> backup:beta")
+    reload_config()
+    yield make_engine(down=DownProvider, backup=BackupProvider, picky=PickyProvider)
+    monkeypatch.delenv("TTS_FAILOVER_CHAIN")
+    reload_config()
+
+
+class TestParseFailoverChain:
+    """Test parse_failover_chain."""
+
+    def test_arrow_and_list_forms(self):
+        """Arrow strings, comma strings and lists parse to the same entries."""
+        expected = [("elevenlabs", "rachel"), ("openai_tts", "nova"), ("edge_tts", None)]
+
+        assert parse_failover_chain("elevenlabs:rachel -> openai_tts:nova -> edge_tts") == expected
+        assert parse_failover_chain("elevenlabs:rachel, openai_tts:nova, edge_tts") == expected
+        assert parse_failover_chain(["elevenlabs:rachel", "openai_tts:nova", "edge_tts"]) == expected
+        assert parse_failover_chain("") == []
+
+
+class TestFailover:
+    """Test TTSEngine failover routing."""
+
+    def test_failing_provider_falls_back_with_chain_voice(self, engine, tmp_path):
+        """A provider error moves on to the next chain entry and its voice."""
+        output = tmp_path / "out.mp3"
+
+        engine.synthesize_text("hi", str(output), provider_name="down", stream=False, output_format="mp3")
+
+        assert output.read_bytes() == b"beta:hi"
+        assert engine.get_failover_chain("down", "alpha") == [("down", "alpha"), ("backup", "beta")]
+
+    def test_open_circuit_is_skipped_without_a_call(self, engine, tmp_path):
+        """A provider known to be down is not dispatched to at all."""
+        breaker = http_retry.get_circuit_breaker("FailoverTestDown")
+        for _ in range(5):
+            breaker.record_failure()
+
+        engine.synthesize_text("hi", str(tmp_path / "out.mp3"), provider_name="down", stream=False)
+
+        assert DownProvider.calls == 0
+        assert engine.is_provider_tripped("down")
+
+    def test_all_tripped_fails_fast(self, engine, monkeypatch, tmp_path):
+        """When every provider is tripped the request fails immediately."""
+        monkeypatch.setattr(engine, "is_provider_tripped", lambda name: True)
+
+        with pytest.raises(ProviderError, match="failover chain"):
+            engine.synthesize_text("hi", str(tmp_path / "out.mp3"), provider_name="down", stream=False)
+
+    def test_request_errors_do_not_fail_over(self, engine, tmp_path):
+        """Errors about the request itself are raised from the first provider."""
+        with pytest.raises(VoiceNotFoundError):
+            engine.synthesize_text("hi", str(tmp_path / "out.mp3"), provider_name="picky", stream=False)
+
+    def test_async_failover(self, engine, tmp_path):
+        """synthesize_text_async follows the same chain."""
+        output = tmp_path / "out.mp3"
+
+        asyncio.run(engine.synthesize_text_async("hi", str(output), provider_name="down", stream=False))
+
+        assert output.read_bytes() == b"beta:hi"
+
+    def test_stream_fails_over_before_first_chunk(self, engine):
+        """synthesize_iter switches provider when the first one fails to start."""
+        chunks = list(engine.synthesize_iter("hi", provider_name="down"))
+
+        assert [(c.data, c.provider_name) for c in chunks] == [(b"beta:hi", "backup")]
+        assert DownProvider.calls == 1
+
+    def test_async_stream_fails_over(self, engine):
+        """synthesize_iter_async switches provider the same way."""
+
+        async def run():
+            return [c async for c in engine.synthesize_iter_async("hi", provider_name="down")]
+
+        assert [c.provider_name for c in asyncio.run(run())] == ["backup"]
@@ -0,0 +1,193 @@
+"""Tests for hedged streaming requests.
+
+These tests cover:
+- LatencyTracker percentiles
+- Deriving the hedge deadline from observed first-chunk latency
+- Racing a stalled provider against its backup and cancelling the loser
+- Closing the async HTTP clients of the private loop behind synthesize_iter
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.exceptions import NetworkError
+from matilda_voice.internal import http_clients
+from matilda_voice.internal.config import reload_config
+from matilda_voice.internal.latency import LatencyTracker
+
+
+class TimedProvider(TTSProvider):
+    """Async streaming provider whose first chunk arrives after a set delay."""
+
+    STREAM_FORMAT = "mp3"
+    first_chunk_delay = 0.0
+    fail = False
+    started = 0
+    cancelled = 0
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise AssertionError("streaming tests must not fall back to files")
+
+    async def iter_audio_async(self, text, **kwargs):
+        type(self).started += 1
+        try:
+            await asyncio.sleep(self.first_chunk_delay)
+        except asyncio.CancelledError:
+            type(self).cancelled += 1
+            raise
+        if self.fail:
+            raise NetworkError("stalled connection reset")
+        yield f"{self.name}:{text}".encode()
+
+
+class PrimaryProvider(TimedProvider):
+    name = "primary"
+
+
+class BackupProvider(TimedProvider):
+    name = "backup"
+
+
+@pytest.fixture
+def engine(monkeypatch, make_engine):
+    for cls in (PrimaryProvider, BackupProvider):
+        cls.first_chunk_delay, cls.fail, cls.started, cls.cancelled = 0.0, False, 0, 0
+    monkeypatch.setenv("TTS_FAILOVER_CHAIN", "primary -> backup")
+    reload_config()
+    engine = make_engine(primary=PrimaryProvider, backup=BackupProvider)
+    monkeypatch.setattr(engine, "get_hedge_delay", lambda name: 0.05)
+    yield engine
+    monkeypatch.delenv("TTS_FAILOVER_CHAIN")
+    reload_config()
+
+
+def collect(engine, **kwargs):
+    async def run():
+        return [c async for c in engine.synthesize_iter_async("hi", provider_name="primary", **kwargs)]
+
+    return asyncio.run(run())
+
+
+class TestLatencyTracker:
+    """Test LatencyTracker."""
+
+    def test_nearest_rank_percentile(self):
+        """Percentiles come from the recorded window."""
+        tracker = LatencyTracker(window=100)
+        for ms in range(1, 101):
+            tracker.record("p", ms / 1000)
+
+        assert tracker.percentile("p", 95) == 0.095
+        assert tracker.percentile("p", 50) == 0.05
+        assert tracker.percentile("p", 95, min_samples=101) is None
+        assert tracker.percentile("missing", 95) is None
+
+    def test_window_keeps_recent_samples(self):
+        """Old samples fall out of the window."""
+        tracker = LatencyTracker(window=2)
+        for seconds in (9.0, 1.0, 2.0):
+            tracker.record("p", seconds)
+
+        assert tracker.percentile("p", 100) == 2.0
+
+
+class TestHedgeDelay:
+    """Test TTSEngine.get_hedge_delay."""
+
+    def test_default_until_enough_samples_then_percentile(self, monkeypatch):
+        """The deadline follows the observed p95 once enough samples exist."""
+        engine = TTSEngine({})
+        monkeypatch.setattr(
+            "matilda_voice.core.get_config_value",
+            lambda key, default=None: {
+                "hedging_percentile": 95,
+                "hedging_min_samples": 3,
+                "hedging_default_delay_seconds": 1.5,
+                "hedging_min_delay_seconds": 0.25,
+            }[key],
+        )
+
+        assert engine.get_hedge_delay("p") == 1.5
+        for seconds in (0.1, 0.2, 0.8):
+            engine._latency.record("p", seconds)
+        assert engine.get_hedge_delay("p") == 0.8
+
+        engine._latency = LatencyTracker()
+        for _ in range(3):
+            engine._latency.record("p", 0.01)
+        assert engine.get_hedge_delay("p") == 0.25
+
+
+class TestHedgedStreams:
+    """Test hedged synthesize_iter/synthesize_iter_async."""
+
+    def test_stalled_primary_loses_to_backup(self, engine):
+        """The backup starts after the deadline and the stalled primary is cancelled."""
+        PrimaryProvider.first_chunk_delay = 5.0
+
+        start = time.monotonic()
+        chunks = collect(engine, hedge=True)
+
+        assert time.monotonic() - start < 2.0
+        assert [c.data for c in chunks] == [b"backup:hi"]
+        assert PrimaryProvider.cancelled == 1
+
+    def test_fast_primary_is_not_hedged(self, engine):
+        """No backup request is sent when the primary answers within the deadline."""
+        chunks = collect(engine, hedge=True)
+
+        assert [c.provider_name for c in chunks] == ["primary"]
+        assert BackupProvider.started == 0
+
+    def test_primary_wins_if_it_starts_first(self, engine):
+        """A late primary still wins over an even slower backup."""
+        PrimaryProvider.first_chunk_delay = 0.1
+        BackupProvider.first_chunk_delay = 5.0
+
+        chunks = collect(engine, hedge=True)
+
+        assert [c.provider_name for c in chunks] == ["primary"]
+        assert BackupProvider.cancelled == 1
+
+    def test_failed_hedged_primary_uses_backup(self, engine):
+        """If the stalled primary errors, the backup's stream is used."""
+        PrimaryProvider.first_chunk_delay = 0.1
+        PrimaryProvider.fail = True
+        BackupProvider.first_chunk_delay = 0.2
+
+        assert [c.provider_name for c in collect(engine, hedge=True)] == ["backup"]
+
+    def test_hedging_is_opt_in(self, engine):
+        """Without hedging a slow primary is simply awaited."""
+        PrimaryProvider.first_chunk_delay = 0.1
+
+        assert [c.provider_name for c in collect(engine)] == ["primary"]
+        assert BackupProvider.started == 0
+
+    def test_sync_iterator_hedges(self, engine):
+        """synthesize_iter races providers on a private loop."""
+        PrimaryProvider.first_chunk_delay = 5.0
+
+        chunks = list(engine.synthesize_iter("hi", provider_name="primary", hedge=True))
+
+        assert [c.provider_name for c in chunks] == ["backup"]
+
+    def test_sync_hedged_stream_closes_its_http_clients(self, engine, monkeypatch):
+        """Async HTTP clients opened on the private hedging loop are closed along with it."""
+        opened = []
+        iter_audio_async = TimedProvider.iter_audio_async
+
+        async def open_client(self, text, **kwargs):
+            opened.append(http_clients.get_async_http_client(self.name))
+            async for data in iter_audio_async(self, text, **kwargs):
+                yield data
+
+        monkeypatch.setattr(TimedProvider, "iter_audio_async", open_client)
+
+        list(engine.synthesize_iter("hi", provider_name="primary", hedge=True))
+
+        assert opened and all(client.is_closed for client in opened)
@@ -0,0 +1,97 @@
+"""Tests for the shared keep-alive HTTP clients.
+
+These tests cover:
+- One reusable client per provider, recreated after shutdown
+- Async clients kept per event loop
+- The retry helpers sending through the shared clients
+"""
+
+import asyncio
+
+import httpx
+
+from matilda_voice.internal import http_clients, http_retry
+from matilda_voice.internal.http_clients import (
+    aclose_http_clients,
+    close_http_clients,
+    get_async_http_client,
+    get_http_client,
+)
+
+
+class TestSharedClients:
+    """Test the client registry."""
+
+    def test_client_is_reused_per_provider(self):
+        """Repeated lookups return one client per provider name."""
+        first = get_http_client("ClientTestA")
+
+        assert get_http_client("ClientTestA") is first
+        assert get_http_client("ClientTestB") is not first
+        close_http_clients()
+
+    def test_closed_clients_are_recreated(self):
+        """Shutdown closes clients; the next lookup opens a fresh one."""
+        first = get_http_client("ClientTestA")
+        close_http_clients()
+
+        assert first.is_closed
+        second = get_http_client("ClientTestA")
+        assert second is not first and not second.is_closed
+        close_http_clients()
+
+    def test_async_clients_are_per_loop(self):
+        """Each event loop gets its own AsyncClient, closed by aclose_http_clients."""
+
+        async def lookup():
+            client = get_async_http_client("ClientTestA")
+            assert get_async_http_client("ClientTestA") is client
+            return client
+
+        async def lookup_and_close():
+            client = await lookup()
+            await aclose_http_clients()
+            return client
+
+        first = asyncio.run(lookup())
+        second = asyncio.run(lookup_and_close())
+
+        assert first is not second
+        assert second.is_closed
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """Enabling HTTP/2 without the h2 package keeps HTTP/1.1 instead of failing."""
+        monkeypatch.setattr(http_clients, "get_config_value", lambda key: True)
+        monkeypatch.setattr(http_clients.importlib.util, "find_spec", lambda name: None)
+
+        assert http_clients._http2_available() is False
+
+
+class TestRetryHelpersUseSharedClient:
+    """Test that request helpers default to the provider's client."""
+
+    def test_request_with_retry_uses_provider_client(self, monkeypatch):
+        """Requests without an explicit client go through get_http_client."""
+        requested = []
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        monkeypatch.setattr(http_retry, "get_http_client", lambda name: requested.append(name) or client)
+
+        for _ in range(2):
+            assert (
+                http_retry.request_with_retry("GET", "https://example.test/", provider_name="SharedTest").status_code
+                == 200
+            )
+
+        assert requested == ["SharedTest", "SharedTest"]
+        client.close()
+
+    def test_stream_with_retry_uses_provider_client(self, monkeypatch):
+        """Streams without an explicit client go through get_http_client."""
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"audio")))
+        monkeypatch.setattr(http_retry, "get_http_client", lambda name: client)
+
+        with http_retry.stream_with_retry("POST", "https://example.test/", provider_name="SharedTest") as response:
+            assert response.read() == b"audio"
+
+        assert not client.is_closed
+        client.close()
@@ -0,0 +1,214 @@
+"""Tests for persistent synthesis jobs.
+
+These tests cover:
+- JobStore recording jobs and chunk progress in SQLite
+- JobRunner resuming an interrupted job from its first unfinished chunk
+- JobRunner keeping SQLite calls off the event loop and deleting joined chunks
+- POST /jobs, GET /jobs/{id} and GET /jobs/{id}/audio on the voice server
+"""
+
+import asyncio
+import threading
+import wave
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from matilda_voice import core
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal.jobs import DONE, QUEUED, RUNNING, JobRunner, JobStore
+
+TOKEN = "test-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+def write_wav(path, text):
+    """Write one 8-bit sample per character, so joined audio reveals chunk order."""
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(1)
+        f.setframerate(8000)
+        f.writeframes(text.encode())
+
+
+def read_wav(path):
+    with wave.open(str(path), "rb") as f:
+        return f.readframes(f.getnframes()).decode()
+
+
+class TestJobRunner:
+    """Test JobStore and JobRunner."""
+
+    def test_interrupted_job_resumes_from_unfinished_chunk(self, tmp_path):
+        """Chunks finished before a shutdown are not rendered again after a restart."""
+        rendered = []
+        stall = asyncio.Event()
+
+        async def render(options, text, output_path):
+            if text == "c" and not stall.is_set():
+                await asyncio.Event().wait()  # Interrupted mid-chunk
+            rendered.append(text)
+            write_wav(output_path, text)
+
+        async def first_run():
+            store = JobStore(tmp_path)
+            job = store.create(["a", "b", "c"], "wav", {"voice": "nova"})
+            runner = JobRunner(store, render)
+            runner.start(job.id)
+            while store.get(job.id).chunks_done < 2:
+                await asyncio.sleep(0.01)
+            await runner.close()
+            store.close()
+            return job.id
+
+        async def second_run(job_id):
+            stall.set()
+            store = JobStore(tmp_path)
+            interrupted = store.get(job_id)
+            runner = JobRunner(store, render)
+            assert runner.resume() == 1
+            while store.get(job_id).state != DONE:
+                await asyncio.sleep(0.01)
+            store.close()
+            return interrupted
+
+        job_id = asyncio.run(first_run())
+        interrupted = asyncio.run(second_run(job_id))
+
+        assert interrupted.state == RUNNING and interrupted.chunks_done == 2
+        assert rendered == ["a", "b", "c"]
+        assert read_wav(tmp_path / job_id / "audio.wav") == "abc"
+        # Chunk files are deleted once they have been joined
+        assert [path.name for path in (tmp_path / job_id).iterdir()] == ["audio.wav"]
+
+    def test_store_calls_run_off_the_event_loop(self, tmp_path):
+        """The runner reaches SQLite from worker threads, never from the loop thread."""
+        threads = []
+
+        class RecordingStore(JobStore):
+            def get(self, job_id):
+                threads.append(threading.get_ident())
+                return super().get(job_id)
+
+            def set_state(self, job_id, state, error=None):
+                threads.append(threading.get_ident())
+                super().set_state(job_id, state, error)
+
+            def mark_chunk_done(self, job_id, index):
+                threads.append(threading.get_ident())
+                super().mark_chunk_done(job_id, index)
+
+        async def render(options, text, output_path):
+            write_wav(output_path, text)
+
+        async def run():
+            store = RecordingStore(tmp_path)
+            job = store.create(["a", "b"], "wav", {})
+            threads.clear()
+            runner = JobRunner(store, render)
+            runner.start(job.id)
+            await asyncio.gather(*runner._tasks)
+            recorded = list(threads)
+            state = store.get(job.id).state
+            store.close()
+            return state, recorded
+
+        state, recorded = asyncio.run(run())
+
+        assert state == DONE
+        assert recorded and threading.get_ident() not in recorded
+
+    def test_purge_keeps_unfinished_jobs(self, tmp_path):
+        """Only finished or failed jobs are purged, together with their files."""
+        store = JobStore(tmp_path)
+        queued = store.create(["a"], "wav", {})
+        done = store.create(["b"], "wav", {})
+        store.set_state(done.id, DONE)
+
+        assert store.purge(older_than=float("inf")) == 1
+        assert store.get(done.id) is None
+        assert not (tmp_path / done.id).exists()
+        assert store.get(queued.id).state == QUEUED
+        store.close()
+
+
+class WavProvider(TTSProvider):
+    """Provider writing the text as WAV samples."""
+
+    MAX_TEXT_CHARS = 25
+
+    def synthesize(self, text, output_path, **kwargs):
+        write_wav(output_path, text)
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    engine = TTSEngine({"wav": "unused"})
+    engine._loaded_providers["wav"] = WavProvider
+    engine._audio_cache.enabled = False
+
+    from matilda_voice import server
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(server, "API_TOKEN", TOKEN)
+    monkeypatch.setattr(core, "_tts_engine", engine)
+    yield server
+    engine.close()
+
+
+class TestJobEndpoints:
+    """Test the /jobs endpoints."""
+
+    def run_job(self, server, body):
+        """Create a job, poll it until it ends, then fetch its audio."""
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                created = await client.post("/jobs", json=body, headers=HEADERS)
+                job = await created.json()
+                while job["state"] in ("queued", "running"):
+                    await asyncio.sleep(0.01)
+                    job = await (await client.get(f"/jobs/{job['id']}", headers=HEADERS)).json()
+                audio = await client.get(f"/jobs/{job['id']}/audio", headers=HEADERS)
+                return created, job, audio.status, audio.headers.get("Content-Type"), await audio.read()
+
+        return asyncio.run(scenario())
+
+    def test_text_job_is_chunked_and_joined(self, server, tmp_path):
+        """Long text is split at provider limits and the result is served once done."""
+        text = "First sentence here. Second sentence here. Third one."
+        created, job, status, content_type, audio = self.run_job(
+            server, {"text": text, "provider": "wav", "format": "wav"}
+        )
+
+        assert created.status == 202
+        assert created.headers["Location"] == f"/jobs/{job['id']}"
+        assert job["state"] == "done" and job["chunks_total"] == job["chunks_done"] == 3
+        assert job["audio_url"] == f"/jobs/{job['id']}/audio"
+        assert status == 200 and content_type == "audio/wav"
+        joined = read_wav(tmp_path / "voice" / "jobs" / job["id"] / "audio.wav")
+        assert joined == "First sentence here.Second sentence here.Third one."
+        assert audio.startswith(b"RIFF")
+
+    def test_document_job_speaks_extracted_text(self, server, tmp_path):
+        """Documents are parsed to text before they are chunked."""
+        _, job, status, _, _ = self.run_job(
+            server, {"document": "# Title\n\nBody text.", "doc_format": "markdown", "provider": "wav", "format": "wav"}
+        )
+
+        assert job["state"] == "done" and status == 200
+        spoken = read_wav(tmp_path / "voice" / "jobs" / job["id"] / "audio.wav")
+        assert "Title" in spoken and "Body text." in spoken
+
+    def test_unknown_job_and_bad_requests(self, server):
+        """Unknown ids are 404; requests without text or with an unknown format are 400."""
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                missing = await client.get("/jobs/nope", headers=HEADERS)
+                empty = await client.post("/jobs", json={"provider": "wav"}, headers=HEADERS)
+                bad_format = await client.post("/jobs", json={"text": "hi", "format": "../x"}, headers=HEADERS)
+                return missing.status, empty.status, bad_format.status
+
+        assert asyncio.run(scenario()) == (404, 400, 400)
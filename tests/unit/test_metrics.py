@@ -0,0 +1,154 @@
+"""Tests for Prometheus metrics exposition.
+
+These tests cover:
+- Counter, gauge and histogram rendering in the text format
+- Engine stats and circuit-breaker state rendered at scrape time
+- GET /metrics on the voice server reporting synthesis requests
+"""
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from matilda_voice import core
+from matilda_voice.base import TTSProvider
+from matilda_voice.internal.http_retry import get_circuit_breaker
+from matilda_voice.internal.metrics import Counter, Gauge, Histogram, MetricsRegistry, render_engine_metrics
+
+TOKEN = "test-token"
+
+
+class BytesProvider(TTSProvider):
+    """Provider that writes the text as the audio."""
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+
+@pytest.fixture
+def engine(make_engine):
+    return make_engine(bytes=BytesProvider)
+
+
+@pytest.fixture
+def server(monkeypatch, engine):
+    monkeypatch.setenv("MATILDA_API_TOKEN", TOKEN)
+    from matilda_voice import server
+
+    monkeypatch.setattr(server, "API_TOKEN", TOKEN)
+    monkeypatch.setattr(core, "_tts_engine", engine)
+    return server
+
+
+class TestMetricTypes:
+    """Test the metric primitives."""
+
+    def test_counter_and_gauge_samples(self):
+        """Samples carry escaped labels and integral values render without a decimal point."""
+        requests = Counter("requests_total", "Requests", ["endpoint"])
+        requests.inc(endpoint="/speak")
+        requests.inc(2, endpoint='/say "hi"')
+        in_flight = Gauge("in_flight", "In flight")
+        in_flight.set(1.5)
+
+        text = MetricsRegistry([requests, in_flight]).render()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{endpoint="/speak"} 1' in text
+        assert 'requests_total{endpoint="/say \\"hi\\""} 2' in text
+        assert "in_flight 1.5" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Each bucket counts every observation at or below its bound."""
+        latency = Histogram("latency_seconds", "Latency", ["provider"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            latency.observe(value, provider="edge_tts")
+
+        lines = latency.render()
+
+        assert 'latency_seconds_bucket{provider="edge_tts",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{provider="edge_tts",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{provider="edge_tts",le="+Inf"} 3' in lines
+        assert 'latency_seconds_count{provider="edge_tts"} 3' in lines
+        assert 'latency_seconds_sum{provider="edge_tts"} 2.55' in lines
+
+    def test_wrong_labels_are_rejected(self):
+        """Label names must match the family's declared labels."""
+        with pytest.raises(ValueError):
+            Counter("requests_total", "Requests", ["endpoint"]).inc(status="200")
+
+
+class TestEngineMetrics:
+    """Test metrics read from engine stats."""
+
+    def test_engine_families_rendered(self, engine):
+        """Cache, pool and circuit-breaker state appear in the exposition."""
+        get_circuit_breaker("MetricsTestProvider").record_failure()
+
+        text = render_engine_metrics(engine)
+
+        assert "voice_cache_hit_ratio 0" in text
+        assert 'voice_cache_events_total{event="hits"} 0' in text
+        assert 'voice_provider_pool_events_total{event="created"} 0' in text
+        assert 'voice_circuit_breaker_state{provider="MetricsTestProvider"} 0' in text
+        assert 'voice_circuit_breaker_failures{provider="MetricsTestProvider"} 1' in text
+
+
+class TestMetricsEndpoint:
+    """Test GET /metrics on the voice server."""
+
+    def test_synthesis_requests_are_reported(self, server):
+        """A /synthesize call shows up in request, latency and byte metrics."""
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                headers = {"Authorization": f"Bearer {TOKEN}"}
+                response = await client.post(
+                    "/synthesize", json={"text": "Hello", "provider": "bytes", "format": "mp3"}, headers=headers
+                )
+                assert response.status == 200
+
+                unauthorized = await client.get("/metrics")
+                assert unauthorized.status == 401
+
+                response = await client.get("/metrics", headers=headers)
+                return response.status, response.headers["Content-Type"], await response.text()
+
+        status, content_type, text = asyncio.run(scenario())
+
+        assert status == 200
+        assert content_type.startswith("text/plain")
+        assert 'voice_synthesis_requests_total{endpoint="/synthesize",provider="bytes",voice="",status="ok"}' in text
+        assert 'voice_synthesis_duration_seconds_count{endpoint="/synthesize",provider="bytes",voice=""}' in text
+        assert 'voice_synthesized_bytes_total{endpoint="/synthesize",provider="bytes"} 5' in text
+        assert 'voice_http_requests_total{endpoint="/metrics",method="GET",status="401"}' in text
+        assert 'voice_http_requests_in_flight{endpoint="/metrics"} 1' in text
+        assert "voice_executor_queue_depth 0" in text
+        assert "voice_cache_hit_ratio" in text
+
+
+class TestCountingExecutor:
+    """Test the server executor's queue depth."""
+
+    def test_queue_depth_counts_work_not_yet_started(self):
+        """Calls waiting behind a busy worker are counted until a thread picks them up."""
+        from matilda_voice.server import CountingExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+        executor = CountingExecutor(max_workers=1)
+        busy = executor.submit(lambda: started.set() or release.wait(5))
+        started.wait(5)
+        waiting = [executor.submit(lambda: None) for _ in range(3)]
+        depth = executor.queue_depth
+        release.set()
+        busy.result()
+        for future in waiting:
+            future.result()
+        executor.shutdown()
+
+        assert depth == 3
+        assert executor.queue_depth == 0
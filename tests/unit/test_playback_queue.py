@@ -0,0 +1,200 @@
+"""Tests for the /speak playback queue.
+
+These tests cover:
+- Jobs playing one at a time, by priority and then in arrival order
+- Prefetching the next job while the current one plays
+- Cancellation and barge-in stopping the current playback
+- POST /speak returning a job id at once, and POST /speak/cancel
+"""
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from matilda_voice import core
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal.playback_queue import CANCELLED, DONE, PRIORITIES, PlaybackQueue
+
+TOKEN = "test-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+class FakeProcess:
+    """ffplay stand-in that plays until it is released or terminated."""
+
+    def __init__(self):
+        self.finished = threading.Event()
+
+    def wait(self, timeout=None):
+        self.finished.wait(timeout)
+        return 0
+
+
+class FakeManager:
+    """AudioPlaybackManager stand-in recording what was played."""
+
+    def __init__(self):
+        self.played = []
+        self.process = None
+
+    def play_with_tracking(self, audio_path, timeout=None):
+        with open(audio_path) as f:
+            self.played.append(f.read())
+        self.process = FakeProcess()
+        return self.process
+
+    def stop_playback(self):
+        if self.process is None or self.process.finished.is_set():
+            return False
+        self.process.finished.set()
+        return True
+
+    async def finish(self):
+        """Wait until something plays, then let it end."""
+        while self.process is None or self.process.finished.is_set():
+            await asyncio.sleep(0.01)
+        self.process.finished.set()
+
+
+def make_queue(manager, synthesized, delay=0.0):
+    async def synthesize(job, output_path):
+        synthesized.append(job.text)
+        await asyncio.sleep(delay)
+        with open(output_path, "w") as f:
+            f.write(job.text)
+
+    return PlaybackQueue(synthesize=synthesize, max_queued=3, manager=manager)
+
+
+class TestPlaybackQueue:
+    """Test PlaybackQueue."""
+
+    def test_jobs_play_in_priority_order_and_next_is_prefetched(self):
+        """A high-priority job overtakes queued ones; whichever job is next is synthesized during playback."""
+        manager = FakeManager()
+        synthesized = []
+
+        async def run():
+            queue = make_queue(manager, synthesized)
+            first = queue.enqueue("first")
+            await asyncio.sleep(0.05)
+            queue.enqueue("normal")
+            queue.enqueue("urgent", priority=PRIORITIES["high"])
+            await asyncio.sleep(0.05)
+            prefetched = list(synthesized)
+            for _ in range(3):
+                await manager.finish()
+            await asyncio.sleep(0.05)
+            await queue.close()
+            return first, prefetched
+
+        first, prefetched = asyncio.run(run())
+
+        assert manager.played == ["first", "urgent", "normal"]
+        assert prefetched == ["first", "normal", "urgent"]
+        assert first.done.result() == DONE
+
+    def test_cancel_and_barge_in(self):
+        """Cancelling drops a queued job; an interrupting job stops the current one and plays next."""
+        manager = FakeManager()
+        synthesized = []
+
+        async def run():
+            queue = make_queue(manager, synthesized)
+            playing = queue.enqueue("playing")
+            dropped = queue.enqueue("dropped")
+            queue.enqueue("later")
+            await asyncio.sleep(0.05)
+            assert queue.cancel(dropped.id) == [dropped]
+            queue.enqueue("barge in", interrupt=True)
+            await asyncio.sleep(0.05)
+            await manager.finish()
+            await manager.finish()
+            await asyncio.sleep(0.05)
+            await queue.close()
+            return playing, dropped
+
+        playing, dropped = asyncio.run(run())
+
+        assert manager.played == ["playing", "barge in", "later"]
+        assert playing.done.result() == CANCELLED
+        assert dropped.done.result() == CANCELLED
+
+
+class QuickProvider(TTSProvider):
+    """Provider writing the text as its audio."""
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "w") as f:
+            f.write(text)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    engine = TTSEngine({"quick": "unused"})
+    engine._loaded_providers["quick"] = QuickProvider
+    engine._audio_cache.enabled = False
+
+    from matilda_voice import server
+    from matilda_voice.internal import playback_queue
+
+    manager = FakeManager()
+    monkeypatch.setattr(server, "API_TOKEN", TOKEN)
+    monkeypatch.setattr(core, "_tts_engine", engine)
+    monkeypatch.setattr(playback_queue, "get_audio_manager", lambda: manager)
+    yield server, manager
+    engine.close()
+
+
+class TestSpeakEndpoints:
+    """Test POST /speak and POST /speak/cancel."""
+
+    def test_speak_returns_job_and_cancel_stops_it(self, server):
+        """/speak answers before playback ends; /speak/cancel stops the job playing."""
+        server, manager = server
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                first = await client.post("/speak", json={"text": "one", "provider": "quick"}, headers=HEADERS)
+                second = await client.post("/speak", json={"text": "two", "provider": "quick"}, headers=HEADERS)
+                while not manager.played:
+                    await asyncio.sleep(0.01)
+                cancel = await client.post("/speak/cancel", headers=HEADERS)
+                missing = await client.post("/speak/cancel", json={"id": "nope"}, headers=HEADERS)
+                waited = client.post(
+                    "/speak", json={"text": "three", "provider": "quick", "wait": True}, headers=HEADERS
+                )
+                waited = asyncio.ensure_future(waited)
+                await manager.finish()
+                await manager.finish()
+                return (
+                    (first.status, await first.json()),
+                    await second.json(),
+                    await cancel.json(),
+                    missing.status,
+                    await (await waited).json(),
+                )
+
+        (status, first), second, cancel, missing, waited = asyncio.run(scenario())
+
+        assert status == 202
+        assert first["state"] == "queued" and first["position"] == 0
+        assert second["position"] == 1
+        assert cancel == {"success": True, "cancelled": [first["id"]]}
+        assert missing == 404
+        assert waited["success"] is True and waited["state"] == "done"
+        assert manager.played == ["one", "two", "three"]
+
+    def test_invalid_priority_is_rejected(self, server):
+        """Unknown priority names are rejected before anything is queued."""
+        server, _ = server
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                response = await client.post("/speak", json={"text": "hi", "priority": "urgent"}, headers=HEADERS)
+                return response.status
+
+        assert asyncio.run(scenario()) == 400
@@ -0,0 +1,149 @@
+"""Tests for the provider instance pool.
+
+These tests cover the pooling behaviour used by TTSEngine:
+- Instance reuse across leases
+- Config fingerprint separation
+- Per-provider instance bounds and acquire timeouts
+- Idle eviction and lifecycle hooks
+"""
+
+import threading
+import time
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.exceptions import TimeoutError
+from matilda_voice.internal.provider_pool import ProviderPool
+
+
+class RecordingProvider(TTSProvider):
+    """Provider that records lifecycle calls."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        RecordingProvider.instances += 1
+        self.warmed = False
+        self.closed = False
+
+    def synthesize(self, text, output_path, **kwargs):
+        pass
+
+    def warm(self) -> None:
+        self.warmed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    RecordingProvider.instances = 0
+
+
+class TestProviderPool:
+    """Test ProviderPool leasing and lifecycle."""
+
+    def test_lease_reuses_instance(self):
+        """A released instance is handed out again instead of constructing a new one."""
+        pool = ProviderPool(max_instances_per_provider=2, idle_timeout=60, acquire_timeout=1)
+
+        with pool.lease("edge_tts", RecordingProvider, "fp") as first:
+            pass
+        with pool.lease("edge_tts", RecordingProvider, "fp") as second:
+            pass
+
+        assert first is second
+        assert RecordingProvider.instances == 1
+        assert pool.get_stats()["reused"] == 1
+
+    def test_fingerprint_change_creates_new_instance(self):
+        """Instances built for an older config are not reused and get retired when room is needed."""
+        pool = ProviderPool(max_instances_per_provider=1, idle_timeout=60, acquire_timeout=1)
+
+        with pool.lease("openai_tts", RecordingProvider, "old") as old:
+            pass
+        with pool.lease("openai_tts", RecordingProvider, "new") as new:
+            pass
+
+        assert old is not new
+        assert old.closed is True
+        assert new.closed is False
+
+    def test_bounded_instances_times_out(self):
+        """Acquiring beyond the per-provider bound waits and then raises TimeoutError."""
+        pool = ProviderPool(max_instances_per_provider=1, idle_timeout=60, acquire_timeout=0.05)
+        provider = pool.acquire("google_tts", RecordingProvider, "fp")
+
+        with pytest.raises(TimeoutError):
+            pool.acquire("google_tts", RecordingProvider, "fp")
+
+        pool.release("google_tts", RecordingProvider, provider, "fp")
+
+    def test_waiter_receives_released_instance(self):
+        """A blocked acquire is woken up by a release."""
+        pool = ProviderPool(max_instances_per_provider=1, idle_timeout=60, acquire_timeout=2)
+        provider = pool.acquire("edge_tts", RecordingProvider, "fp")
+        result = {}
+
+        def waiter():
+            result["provider"] = pool.acquire("edge_tts", RecordingProvider, "fp")
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        pool.release("edge_tts", RecordingProvider, provider, "fp")
+        thread.join(timeout=2)
+
+        assert result["provider"] is provider
+
+    def test_idle_instances_are_evicted_and_closed(self):
+        """Instances idle past the timeout are closed."""
+        pool = ProviderPool(max_instances_per_provider=2, idle_timeout=0, acquire_timeout=1)
+        with pool.lease("edge_tts", RecordingProvider, "fp") as provider:
+            pass
+
+        assert provider.closed is True
+        assert pool.get_stats()["providers"] == {}
+
+    def test_idle_instances_are_swept_without_further_leases(self):
+        """An idle instance is closed after the timeout even if the pool sees no more traffic."""
+        pool = ProviderPool(max_instances_per_provider=2, idle_timeout=0.05, acquire_timeout=1)
+        with pool.lease("edge_tts", RecordingProvider, "fp") as provider:
+            pass
+
+        deadline = time.monotonic() + 5
+        while not provider.closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert provider.closed is True
+        assert pool.get_stats()["evicted"] == 1
+        pool.close()
+
+    def test_warm_and_close(self):
+        """warm() pre-creates warmed instances and close() shuts them down."""
+        pool = ProviderPool(max_instances_per_provider=3, idle_timeout=60, acquire_timeout=1)
+
+        assert pool.warm("coqui", RecordingProvider, "fp", count=2) == 2
+        assert pool.get_stats()["providers"]["coqui"] == {"idle": 2, "in_use": 0}
+
+        with pool.lease("coqui", RecordingProvider, "fp") as provider:
+            assert provider.warmed is True
+
+        pool.close()
+        assert provider.closed is True
+        assert pool.get_stats()["providers"] == {}
+
+    def test_failed_construction_frees_slot(self):
+        """A provider constructor failure does not leak a slot."""
+
+        class BrokenProvider(RecordingProvider):
+            def __init__(self) -> None:
+                raise RuntimeError("boom")
+
+        pool = ProviderPool(max_instances_per_provider=1, idle_timeout=60, acquire_timeout=0.05)
+        with pytest.raises(RuntimeError):
+            pool.acquire("chatterbox", BrokenProvider, "fp")
+
+        with pool.lease("chatterbox", RecordingProvider, "fp") as provider:
+            assert isinstance(provider, RecordingProvider)
@@ -0,0 +1,123 @@
+"""Tests for the provider rate limiter.
+
+These tests cover:
+- Request and character token buckets
+- Queueing order and rejection past the maximum wait
+- Limits from configuration, following config changes, and engine integration
+"""
+
+import asyncio
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.exceptions import RateLimitError
+from matilda_voice.internal.config import reload_config
+from matilda_voice.internal.rate_limiter import RateLimiter
+
+
+class EchoProvider(TTSProvider):
+    """Provider writing the text to the output file."""
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+
+class TestRateLimiter:
+    """Test RateLimiter reservations."""
+
+    def test_request_rate_allows_burst_then_queues(self):
+        """A one-second burst is free; later callers wait in arrival order."""
+        limiter = RateLimiter(max_wait=10)
+        limiter.set_limits("p", requests_per_second=2)
+
+        waits = [limiter.reserve("p") for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.5, abs=0.05)
+        assert waits[3] == pytest.approx(1.0, abs=0.05)
+
+    def test_character_quota_rejects_past_max_wait(self):
+        """A request that could only run after the maximum wait fails fast."""
+        limiter = RateLimiter(max_wait=10)
+        limiter.set_limits("p", chars_per_minute=60)
+
+        assert limiter.reserve("p", chars=60) == 0.0
+        with pytest.raises(RateLimitError, match="maximum wait"):
+            limiter.reserve("p", chars=30)
+        assert limiter.reserve("p", chars=5) == pytest.approx(5.0, abs=0.1)
+
+        stats = limiter.get_stats()["p"]
+        assert (stats["requests"], stats["delayed"], stats["rejected"]) == (2, 1, 1)
+
+    def test_unlimited_provider_never_waits(self):
+        """Providers without limits pass straight through and report no stats."""
+        limiter = RateLimiter()
+
+        assert all(limiter.reserve("free", chars=10_000) == 0.0 for _ in range(50))
+        assert limiter.get_stats() == {}
+
+    def test_limits_come_from_config(self, monkeypatch):
+        """rate_limit_<provider>_* settings configure the buckets."""
+        monkeypatch.setenv("TTS_RATE_LIMIT_OPENAI_TTS_REQUESTS_PER_SECOND", "1")
+        reload_config()
+        try:
+            limiter = RateLimiter(max_wait=10)
+            assert limiter.reserve("openai_tts") == 0.0
+            assert limiter.reserve("openai_tts") == pytest.approx(1.0, abs=0.05)
+        finally:
+            monkeypatch.delenv("TTS_RATE_LIMIT_OPENAI_TTS_REQUESTS_PER_SECOND")
+            reload_config()
+
+    def test_config_changes_rebuild_buckets(self, monkeypatch):
+        """Edited settings apply without a restart; limits set with set_limits() stay pinned."""
+        monkeypatch.setenv("TTS_RATE_LIMIT_OPENAI_TTS_REQUESTS_PER_SECOND", "1")
+        reload_config()
+        try:
+            limiter = RateLimiter(max_wait=10)
+            limiter.set_limits("pinned", requests_per_second=1)
+            limiter.reserve("openai_tts")
+            limiter.reserve("pinned")
+
+            monkeypatch.delenv("TTS_RATE_LIMIT_OPENAI_TTS_REQUESTS_PER_SECOND")
+            reload_config()
+
+            assert limiter.reserve("openai_tts") == 0.0
+            assert limiter.reserve("openai_tts") == 0.0
+            assert limiter.reserve("pinned") == pytest.approx(1.0, abs=0.05)
+        finally:
+            monkeypatch.delenv("TTS_RATE_LIMIT_OPENAI_TTS_REQUESTS_PER_SECOND", raising=False)
+            reload_config()
+
+
+class TestEngineRateLimiting:
+    """Test that the engine paces provider calls."""
+
+    @pytest.fixture
+    def engine(self):
+        engine = TTSEngine({"echo": "unused"})
+        engine._loaded_providers["echo"] = EchoProvider
+        engine._audio_cache.enabled = False
+        engine._rate_limiter.set_limits("echo", requests_per_second=50)
+        yield engine
+        engine.close()
+
+    def test_sync_and_async_requests_are_counted(self, engine, tmp_path):
+        """Every provider request goes through the limiter."""
+        for i in range(3):
+            engine.synthesize_text("hi", str(tmp_path / f"{i}.wav"), provider_name="echo", stream=False)
+        asyncio.run(engine.synthesize_text_async("hi", str(tmp_path / "a.wav"), provider_name="echo", stream=False))
+
+        assert engine.get_rate_limit_stats()["echo"]["requests"] == 4
+
+    def test_rejection_surfaces_as_rate_limit_error(self, engine, tmp_path):
+        """A request that cannot be scheduled in time is not sent."""
+        engine._rate_limiter.set_limits("echo", chars_per_minute=10)
+
+        engine.synthesize_text("x" * 10, str(tmp_path / "first.wav"), provider_name="echo", stream=False)
+
+        with pytest.raises(RateLimitError):
+            engine.synthesize_text("y" * 10, str(tmp_path / "second.wav"), provider_name="echo", stream=False)
+        assert not (tmp_path / "second.wav").exists()
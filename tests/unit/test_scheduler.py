@@ -0,0 +1,230 @@
+"""Tests for server admission control.
+
+These tests cover:
+- Concurrency limits, the bounded wait queue and queue deadlines
+- Priority of the interactive lane over queued bulk work
+- 429 and 503 responses with Retry-After from the voice server
+- Streams giving up their slot once synthesis ends, within a bounded buffer
+- Bounded job retries
+"""
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from matilda_voice import core
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.exceptions import DeadlineExceededError, QueueFullError
+from matilda_voice.internal.scheduler import BULK, INTERACTIVE, SynthesisScheduler
+
+TOKEN = "test-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+class TestSynthesisScheduler:
+    """Test SynthesisScheduler."""
+
+    def test_queued_interactive_jobs_overtake_bulk_jobs(self):
+        """When a slot frees up, waiting interactive jobs start before earlier bulk jobs."""
+        scheduler = SynthesisScheduler(max_concurrent=1, max_queued=10)
+        order = []
+
+        async def job(name, lane):
+            async with scheduler.slot(lane):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            first = asyncio.create_task(job("running", BULK))
+            await asyncio.sleep(0)
+            waiting = [asyncio.create_task(job("bulk", BULK))]
+            await asyncio.sleep(0)
+            waiting.append(asyncio.create_task(job("interactive", INTERACTIVE)))
+            await asyncio.gather(first, *waiting)
+
+        asyncio.run(run())
+
+        assert order == ["running", "interactive", "bulk"]
+        assert scheduler.get_stats()["running"] == 0
+
+    def test_full_queue_and_deadline_are_rejected(self):
+        """A full queue rejects at once; a queued job whose deadline passes gives up its place."""
+        scheduler = SynthesisScheduler(max_concurrent=1, max_queued=1)
+
+        async def run():
+            release = asyncio.Event()
+
+            async def hold():
+                async with scheduler.slot(BULK):
+                    await release.wait()
+
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(scheduler.slot(BULK, timeout=0.05).__aenter__())
+            await asyncio.sleep(0)
+
+            with pytest.raises(QueueFullError) as full:
+                async with scheduler.slot(INTERACTIVE):
+                    pass
+            with pytest.raises(DeadlineExceededError):
+                await waiter
+            assert scheduler.queued == 0
+
+            release.set()
+            await holder
+            return full.value
+
+        error = asyncio.run(run())
+
+        assert error.retry_after >= 1
+        stats = scheduler.get_stats()
+        assert (stats["running"], stats["rejected"], stats["expired"]) == (0, 1, 1)
+
+
+class BlockingProvider(TTSProvider):
+    """Provider that holds its slot until released."""
+
+    release: asyncio.Event
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise NotImplementedError
+
+    async def synthesize_async(self, text, output_path, **kwargs):
+        await BlockingProvider.release.wait()
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+
+class LargeStreamProvider(TTSProvider):
+    """Provider streaming more audio than socket buffers hold."""
+
+    STREAM_FORMAT = "mp3"
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    CHUNK = b"x" * 256 * 1024
+    CHUNKS = 32
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise NotImplementedError
+
+    async def iter_audio_async(self, text, **kwargs):
+        for _ in range(self.CHUNKS):
+            yield self.CHUNK
+
+
+@pytest.fixture
+def server(monkeypatch):
+    engine = TTSEngine({"blocking": "unused", "large": "unused"})
+    engine._loaded_providers.update({"blocking": BlockingProvider, "large": LargeStreamProvider})
+    engine._audio_cache.enabled = False
+
+    from matilda_voice import server
+
+    monkeypatch.setattr(server, "API_TOKEN", TOKEN)
+    monkeypatch.setattr(core, "_tts_engine", engine)
+    yield server
+    engine.close()
+
+
+class TestServerAdmission:
+    """Test admission control on the voice server."""
+
+    def test_saturated_server_returns_429_and_503(self, server):
+        """Requests beyond the queue get 429; queued requests past their deadline get 503."""
+
+        async def scenario():
+            BlockingProvider.release = asyncio.Event()
+            app = server.create_app()
+            app["scheduler"] = SynthesisScheduler(max_concurrent=1, max_queued=1)
+            async with TestClient(TestServer(app)) as client:
+
+                def synthesize(text, **extra):
+                    body = {"text": text, "provider": "blocking", "format": "mp3", **extra}
+                    return asyncio.create_task(client.post("/synthesize", json=body, headers=HEADERS))
+
+                running = synthesize("one")
+                await asyncio.sleep(0.05)
+                queued = synthesize("two", deadline_ms=100)
+                await asyncio.sleep(0.01)
+                rejected = await synthesize("three")
+                expired = await queued
+                BlockingProvider.release.set()
+                done = await running
+                return [
+                    (response.status, response.headers.get("Retry-After")) for response in (rejected, expired, done)
+                ]
+
+        rejected, expired, done = asyncio.run(scenario())
+
+        assert rejected[0] == 429 and int(rejected[1]) >= 1
+        assert expired[0] == 503 and int(expired[1]) >= 1
+        assert done == (200, None)
+
+    def stream_to_stalled_client(self, server, monkeypatch, buffer_chunks):
+        """Start a large stream without reading it, then try a second one.
+
+        Returns (running jobs while the first client stalls, first status and
+        size once read, second status).
+        """
+        get_config_value = server.get_config_value
+        monkeypatch.setattr(
+            server,
+            "get_config_value",
+            lambda key, default=None: buffer_chunks if key == "server_stream_buffer_chunks" else get_config_value(key),
+        )
+
+        async def scenario():
+            app = server.create_app()
+            scheduler = app["scheduler"] = SynthesisScheduler(max_concurrent=1, max_queued=0)
+            async with TestClient(TestServer(app)) as client:
+                body = {"text": "hi", "provider": "large"}
+                slow = await client.post("/synthesize/stream", json=body, headers=HEADERS)
+                for _ in range(50):
+                    if scheduler.get_stats()["running"] == 0:
+                        break
+                    await asyncio.sleep(0.01)
+                running = scheduler.get_stats()["running"]
+                second = await client.post("/synthesize/stream", json=body, headers=HEADERS)
+                await second.read()
+                return running, slow.status, len(await slow.read()), second.status
+
+        return asyncio.run(scenario())
+
+    def test_stream_releases_slot_before_slow_client_finishes(self, server, monkeypatch):
+        """Audio that fits in the stream buffer does not keep the synthesis slot while the client reads."""
+        running, slow_status, slow_bytes, second_status = self.stream_to_stalled_client(server, monkeypatch, 64)
+
+        assert running == 0
+        assert (slow_status, slow_bytes) == (200, len(LargeStreamProvider.CHUNK) * LargeStreamProvider.CHUNKS)
+        assert second_status == 200
+
+    def test_stalled_client_keeps_slot_once_buffer_is_full(self, server, monkeypatch):
+        """A client that falls a full buffer behind pauses synthesis instead of growing server memory."""
+        running, slow_status, slow_bytes, second_status = self.stream_to_stalled_client(server, monkeypatch, 2)
+
+        assert running == 1
+        assert second_status == 429
+        assert (slow_status, slow_bytes) == (200, len(LargeStreamProvider.CHUNK) * LargeStreamProvider.CHUNKS)
+
+    def test_job_chunk_gives_up_after_queue_retries(self, server, monkeypatch):
+        """A job chunk that keeps finding the queue full fails instead of retrying forever."""
+        values = {"jobs_queue_retries": 2, "jobs_queue_backoff_max_seconds": 0}
+        get_config_value = server.get_config_value
+        monkeypatch.setattr(
+            server, "get_config_value", lambda key, default=None: values.get(key, get_config_value(key))
+        )
+
+        class FullScheduler:
+            attempts = 0
+
+            def slot(self, lane):
+                self.attempts += 1
+                raise QueueFullError("queue is full", 1.0)
+
+        scheduler = FullScheduler()
+        options = {"provider": "blocking", "voice": None}
+        with pytest.raises(QueueFullError):
+            asyncio.run(server.render_job_chunk(scheduler, options, "hi", "unused.wav"))
+
+        assert scheduler.attempts == 3
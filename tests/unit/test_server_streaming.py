@@ -0,0 +1,208 @@
+"""Tests for streaming audio responses from the voice server.
+
+These tests cover:
+- POST /synthesize/stream forwarding provider chunks with chunked encoding
+- The Accept: audio/* variant of POST /synthesize
+- JSON errors for requests that fail before the first chunk
+- The /ws/speak websocket turning text fragments into ordered audio frames
+"""
+
+import asyncio
+import struct
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from matilda_voice import core
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal import audio_utils
+
+TOKEN = "test-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+class StreamingProvider(TTSProvider):
+    """Provider yielding one chunk per word in its native format."""
+
+    STREAM_FORMAT = "mp3"
+    CONCURRENT_ASYNC_SYNTHESIS = True
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(f"{kwargs.get('output_format')}:{text}".encode())
+
+    async def iter_audio_async(self, text, **kwargs):
+        # Earlier segments are slower, so out-of-order completion would show up
+        delay = 0.05 if text.startswith("First") else 0
+        for word in text.split():
+            await asyncio.sleep(delay)
+            yield word.encode()
+
+
+class FailingProvider(TTSProvider):
+    """Provider whose stream fails before producing audio."""
+
+    STREAM_FORMAT = "mp3"
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise ValueError("boom")
+
+    async def iter_audio_async(self, text, **kwargs):
+        raise ValueError("boom")
+        yield b""
+
+
+@pytest.fixture
+def server(monkeypatch):
+    engine = TTSEngine({"streaming": "unused", "failing": "unused"})
+    engine._loaded_providers.update({"streaming": StreamingProvider, "failing": FailingProvider})
+    engine._audio_cache.enabled = False
+
+    from matilda_voice import server
+
+    monkeypatch.setattr(server, "API_TOKEN", TOKEN)
+    monkeypatch.setattr(core, "_tts_engine", engine)
+    yield server
+    engine.close()
+
+
+def post(server, path, body, headers=None):
+    """POST a JSON body and return (status, headers, raw body)."""
+
+    async def scenario():
+        async with TestClient(TestServer(server.create_app())) as client:
+            response = await client.post(path, json=body, headers={**HEADERS, **(headers or {})})
+            return response.status, response.headers, await response.read()
+
+    return asyncio.run(scenario())
+
+
+class TestSynthesizeStream:
+    """Test POST /synthesize/stream."""
+
+    def test_native_chunks_are_streamed_raw(self, server):
+        """Provider chunks arrive unencoded, in order, with chunked transfer encoding."""
+        status, headers, body = post(server, "/synthesize/stream", {"text": "one two three", "provider": "streaming"})
+
+        assert status == 200
+        assert headers["Content-Type"] == "audio/mpeg"
+        assert headers["Transfer-Encoding"] == "chunked"
+        assert headers["X-Audio-Format"] == "mp3"
+        assert body == b"onetwothree"
+
+    def test_non_native_format_falls_back_to_file(self, server):
+        """A format the provider cannot stream is synthesized, then streamed."""
+        status, headers, body = post(
+            server, "/synthesize/stream", {"text": "hello", "provider": "streaming", "format": "m4a"}
+        )
+
+        assert status == 200
+        assert headers["Content-Type"] == "audio/mp4"
+        assert body == b"m4a:hello"
+
+    def test_failure_before_first_chunk_returns_json(self, server):
+        """Errors raised before any audio is sent still produce a JSON error response."""
+        status, headers, body = post(server, "/synthesize/stream", {"text": "hello", "provider": "failing"})
+
+        assert status == 500
+        assert headers["Content-Type"].startswith("application/json")
+        assert b"boom" in body
+
+    def test_missing_text_is_rejected(self, server):
+        """Requests without text are rejected before synthesis starts."""
+        status, _, _ = post(server, "/synthesize/stream", {"provider": "streaming"})
+
+        assert status == 400
+
+
+class TestSynthesizeAccept:
+    """Test content negotiation on POST /synthesize."""
+
+    def test_accept_audio_streams_raw_audio(self, server):
+        """Accept: audio/* switches /synthesize from base64 JSON to raw audio."""
+        status, headers, body = post(
+            server, "/synthesize", {"text": "one two", "provider": "streaming"}, {"Accept": "audio/*"}
+        )
+
+        assert status == 200
+        assert headers["Content-Type"] == "audio/mpeg"
+        assert body == b"onetwo"
+
+    def test_specific_audio_type_selects_format(self, server, monkeypatch):
+        """A concrete audio media type picks the output format when none is given."""
+        # cat stands in for ffmpeg converting the native MP3 stream
+        monkeypatch.setattr(audio_utils, "_transcode_command", lambda *args: ["cat"])
+        status, headers, body = post(
+            server, "/synthesize", {"text": "hi", "provider": "streaming"}, {"Accept": "audio/wav"}
+        )
+
+        assert status == 200
+        assert headers["Content-Type"] == "audio/wav"
+        assert body == b"hi"
+
+    def test_json_remains_the_default(self, server):
+        """Without an audio Accept header the response is still base64 JSON."""
+        status, headers, _ = post(server, "/synthesize", {"text": "hi", "provider": "streaming", "format": "mp3"})
+
+        assert status == 200
+        assert headers["Content-Type"].startswith("application/json")
+
+
+class TestWebSocketSpeak:
+    """Test the /ws/speak websocket."""
+
+    def converse(self, server, messages):
+        """Send JSON messages, then collect server messages up to the last end marker."""
+
+        async def scenario():
+            async with TestClient(TestServer(server.create_app())) as client:
+                ws = await client.ws_connect("/ws/speak", headers=HEADERS)
+                for message in messages:
+                    await ws.send_json(message)
+                received = []
+                ends = sum(1 for message in messages if message.get("type") == "end")
+                while ends:
+                    message = await ws.receive(timeout=5)
+                    if message.type.name == "BINARY":
+                        received.append(struct.unpack(">I", message.data[:4]) + (message.data[4:],))
+                    else:
+                        received.append(message.json())
+                        ends -= received[-1]["type"] == "end"
+                await ws.close()
+                return received
+
+        return asyncio.run(scenario())
+
+    def test_fragments_become_ordered_audio_frames(self, server):
+        """Segments are cut at sentence ends and their audio is numbered in order."""
+        received = self.converse(
+            server,
+            [
+                {"type": "start", "provider": "streaming"},
+                {"type": "text", "text": "First sen"},
+                {"type": "text", "text": "tence. Second"},
+                {"type": "text", "text": " one"},
+                {"type": "end"},
+            ],
+        )
+
+        assert received == [
+            {"type": "segment", "utterance": 0, "segment": 0, "text": "First sentence."},
+            (0, b"First"),
+            (1, b"sentence."),
+            {"type": "segment", "utterance": 0, "segment": 1, "text": "Second one"},
+            (2, b"Second"),
+            (3, b"one"),
+            {"type": "end", "utterance": 0, "segments": 2},
+        ]
+
+    def test_segment_errors_are_reported_in_place(self, server):
+        """A failed segment yields an error marker and the utterance still ends."""
+        received = self.converse(
+            server, [{"type": "start", "provider": "failing"}, {"type": "text", "text": "Hi."}, {"type": "end"}]
+        )
+
+        assert received[0] == {"type": "segment", "utterance": 0, "segment": 0, "text": "Hi."}
+        assert received[1]["type"] == "error" and "boom" in received[1]["error"]
+        assert received[2] == {"type": "end", "utterance": 0, "segments": 1}
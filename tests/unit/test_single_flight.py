@@ -0,0 +1,178 @@
+"""Tests for coalescing identical concurrent synthesis requests.
+
+These tests cover:
+- SingleFlight sharing results and errors between threads and coroutines
+- Cleanup after the last participant and shared streams
+- TTSEngine running one provider call for identical concurrent saves and streams
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.internal.single_flight import SingleFlight
+
+
+class SlowProvider(TTSProvider):
+    """Provider that takes long enough for identical requests to overlap."""
+
+    STREAM_FORMAT = "mp3"
+    CONCURRENT_ASYNC_SYNTHESIS = True
+    calls = 0
+
+    def synthesize(self, text, output_path, **kwargs):
+        SlowProvider.calls += 1
+        time.sleep(0.1)
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+    async def synthesize_async(self, text, output_path, **kwargs):
+        SlowProvider.calls += 1
+        await asyncio.sleep(0.1)
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+    async def iter_audio_async(self, text, **kwargs):
+        SlowProvider.calls += 1
+        for word in text.split():
+            await asyncio.sleep(0.02)
+            yield word.encode()
+
+
+@pytest.fixture
+def engine(make_engine):
+    SlowProvider.calls = 0
+    return make_engine(slow=SlowProvider)
+
+
+class TestSingleFlight:
+    """Test the SingleFlight primitive."""
+
+    def test_concurrent_threads_share_one_call(self):
+        """Callers arriving while the leader runs get its result; cleanup runs once, last."""
+        cleaned = []
+        flight = SingleFlight(cleanup=cleaned.append)
+        started = threading.Event()
+        calls = []
+        results = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "audio"
+
+        def caller():
+            with flight.join("key", work) as outcome:
+                results.append(outcome)
+                assert cleaned == []
+
+        leader = threading.Thread(target=caller)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [("audio", True)] * 4
+        assert cleaned == ["audio"]
+        assert flight.get_stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+    def test_sole_caller_is_not_shared_and_errors_reach_everyone(self):
+        """A lone leader may consume its result; a failed call fails every participant."""
+        flight = SingleFlight()
+        with flight.join("key", lambda: "audio") as outcome:
+            assert outcome == ("audio", False)
+
+        async def fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("provider down")
+
+        async def caller():
+            async with flight.join_async("bad", fail):
+                pass
+
+        async def run():
+            return await asyncio.gather(caller(), caller(), return_exceptions=True)
+
+        errors = asyncio.run(run())
+
+        assert [type(error) for error in errors] == [ValueError, ValueError]
+        assert flight.get_stats()["calls"] == 2
+
+    def test_stream_subscribers_replay_and_follow(self):
+        """A late subscriber gets the chunks already produced, then the live ones."""
+        flight = SingleFlight()
+        produced = []
+
+        async def chunks():
+            for index in range(4):
+                produced.append(index)
+                await asyncio.sleep(0.02)
+                yield index
+
+        async def subscribe(delay):
+            await asyncio.sleep(delay)
+            return [chunk async for chunk in flight.join_stream("key", chunks)]
+
+        async def run():
+            return await asyncio.gather(subscribe(0), subscribe(0.05))
+
+        first, late = asyncio.run(run())
+
+        assert first == late == [0, 1, 2, 3]
+        assert produced == [0, 1, 2, 3]
+
+
+class TestEngineCoalescing:
+    """Test coalescing in TTSEngine."""
+
+    def test_identical_saves_make_one_provider_call(self, engine, tmp_path, monkeypatch):
+        """Concurrent identical saves share one synthesis and each gets its own file."""
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(shared_dir))
+        outputs = [str(tmp_path / f"{i}.mp3") for i in range(4)]
+
+        def save(path):
+            engine.synthesize_text("Alert", path, provider_name="slow", stream=False, output_format="mp3")
+
+        threads = [threading.Thread(target=save, args=(path,)) for path in outputs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert SlowProvider.calls == 1
+        assert [open(path, "rb").read() for path in outputs] == [b"Alert"] * 4
+        assert not list(shared_dir.iterdir())
+
+    def test_identical_async_saves_and_streams_coalesce(self, engine, tmp_path):
+        """Async saves share one call, and identical streams share one provider stream."""
+
+        async def run():
+            saves = [
+                engine.synthesize_text_async(
+                    "Alert", str(tmp_path / f"{i}.mp3"), provider_name="slow", stream=False, output_format="mp3"
+                )
+                for i in range(3)
+            ]
+            await asyncio.gather(*saves)
+
+            async def collect():
+                return [chunk.data async for chunk in engine.synthesize_iter_async("Fire drill", provider_name="slow")]
+
+            return await asyncio.gather(collect(), collect(), collect())
+
+        streams = asyncio.run(run())
+
+        assert SlowProvider.calls == 2
+        assert streams == [[b"Fire", b"drill"]] * 3
+        assert engine.get_coalescing_stats()["coalesced"] == 4
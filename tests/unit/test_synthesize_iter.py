@@ -0,0 +1,269 @@
+"""Tests for the streaming chunk API.
+
+These tests cover:
+- TTSEngine.synthesize_iter with native provider streams and the file fallback
+- Negotiating natively encoded formats, and piping other formats through ffmpeg
+- Filling and serving the audio cache from a stream
+- TTSEngine.synthesize_iter_async
+- The thread/event-loop iterator bridges
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.internal import audio_utils
+from matilda_voice.internal.audio_cache import AudioCache
+from matilda_voice.internal.iter_bridge import iterate_async_in_thread, iterate_in_thread
+from matilda_voice.providers.openai_tts import OpenAITTSProvider
+
+
+class StreamingProvider(TTSProvider):
+    """Provider yielding one chunk per word in its native format."""
+
+    STREAM_FORMAT = "mp3"
+    NATIVE_FORMATS = {"mp3": "mp3", "opus": "opus"}
+    MAX_TEXT_CHARS = 12
+    streamed = 0
+    requested = []
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(f"{kwargs.get('output_format')}:{text}".encode())
+
+    def iter_audio(self, text, **kwargs):
+        StreamingProvider.streamed += 1
+        StreamingProvider.requested.append(kwargs.get("output_format"))
+        for word in text.split():
+            yield word.encode()
+
+    async def iter_audio_async(self, text, **kwargs):
+        StreamingProvider.streamed += 1
+        StreamingProvider.requested.append(kwargs.get("output_format"))
+        for word in text.split():
+            await asyncio.sleep(0)
+            yield word.encode()
+
+
+class ContainerProvider(StreamingProvider):
+    """Streaming provider that can also encode WAV, whose files cannot be concatenated."""
+
+    NATIVE_FORMATS = {"mp3": "mp3", "wav": "wav"}
+
+
+class FileProvider(TTSProvider):
+    """Provider without a native stream."""
+
+    def synthesize(self, text, output_path, **kwargs):
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+
+
+@pytest.fixture
+def passthrough(monkeypatch):
+    """Replace ffmpeg with cat, so transcoded streams carry the provider's bytes unchanged."""
+    monkeypatch.setattr(audio_utils, "_transcode_command", lambda *args: ["cat"])
+
+
+@pytest.fixture
+def engine(make_engine):
+    StreamingProvider.streamed = 0
+    StreamingProvider.requested = []
+    return make_engine(streaming=StreamingProvider, container=ContainerProvider, file=FileProvider)
+
+
+class TestSynthesizeIter:
+    """Test TTSEngine.synthesize_iter."""
+
+    def test_native_stream_yields_provider_chunks(self, engine):
+        """Chunks come straight from iter_audio, across text chunks, with running indexes."""
+        chunks = list(engine.synthesize_iter("one two. three four.", provider_name="streaming"))
+
+        assert [c.data for c in chunks] == [b"one", b"two.", b"three", b"four."]
+        assert [c.index for c in chunks] == [0, 1, 2, 3]
+        assert {(c.format, c.mime_type, c.provider_name) for c in chunks} == {("mp3", "audio/mpeg", "streaming")}
+        assert StreamingProvider.streamed == 2
+
+    def test_native_format_is_requested_from_provider(self, engine):
+        """A format the provider encodes itself is streamed without conversion."""
+        chunks = list(engine.synthesize_iter("one two", provider_name="streaming", output_format="opus"))
+
+        assert [c.data for c in chunks] == [b"one", b"two"]
+        assert {(c.format, c.mime_type) for c in chunks} == {("opus", "audio/ogg")}
+        assert StreamingProvider.requested == ["opus"]
+
+    def test_other_format_is_transcoded_from_stream(self, engine, passthrough):
+        """A format without a native encoding is piped through ffmpeg from the native stream."""
+        chunks = list(engine.synthesize_iter("one two", provider_name="streaming", output_format="wav"))
+
+        assert b"".join(c.data for c in chunks) == b"onetwo"
+        assert chunks[0].mime_type == "audio/wav"
+        assert StreamingProvider.requested == ["mp3"]
+
+    def test_native_format_match_ignores_case(self, tmp_path, monkeypatch):
+        """An upper-case native format is saved as returned, not sent through ffmpeg."""
+
+        class Response:
+            def stream_to_file(self, path):
+                with open(path, "wb") as f:
+                    f.write(b"native")
+
+        requested = []
+        provider = OpenAITTSProvider()
+        provider._client = SimpleNamespace(
+            audio=SimpleNamespace(
+                speech=SimpleNamespace(
+                    create=lambda **kwargs: requested.append(kwargs["response_format"]) or Response()
+                )
+            )
+        )
+        monkeypatch.setattr("matilda_voice.providers.openai_tts.transcode_chunks", pytest.fail)
+        output = tmp_path / "out.wav"
+
+        provider.synthesize("hello", str(output), output_format="WAV")
+
+        assert requested == ["wav"]
+        assert output.read_bytes() == b"native"
+
+    def test_multi_part_container_is_converted_from_stream(self, engine, passthrough):
+        """Text split into several requests streams a native WAV only when it fits in one part."""
+        list(engine.synthesize_iter("one two", provider_name="container", output_format="wav"))
+        assert StreamingProvider.requested == ["wav"]
+
+        StreamingProvider.requested = []
+        chunks = list(engine.synthesize_iter("one two three four five", provider_name="container", output_format="wav"))
+
+        # Each part arrives as MP3 and one ffmpeg pipe writes a single WAV, not one file per part
+        assert len(StreamingProvider.requested) > 1 and set(StreamingProvider.requested) == {"mp3"}
+        assert b"".join(c.data for c in chunks) == b"onetwothreefourfive"
+        assert {c.format for c in chunks} == {"wav"}
+
+    def test_unpipeable_format_falls_back_to_file(self, engine):
+        """A format ffmpeg cannot write to a pipe is synthesized to a file first."""
+        chunks = list(engine.synthesize_iter("hello", provider_name="streaming", output_format="m4a"))
+
+        assert b"".join(c.data for c in chunks) == b"m4a:hello"
+        assert chunks[0].mime_type == "audio/mp4"
+        assert StreamingProvider.streamed == 0
+
+    def test_provider_without_stream_is_chunked_from_file(self, engine, monkeypatch):
+        """Non-streaming providers are read back in http_streaming_chunk_size pieces."""
+        monkeypatch.setattr("matilda_voice.internal.audio_utils.get_config_value", lambda key, default=None: 4)
+
+        chunks = list(engine.synthesize_iter("abcdefghij", provider_name="file"))
+
+        assert [c.data for c in chunks] == [b"abcd", b"efgh", b"ij"]
+        assert chunks[0].format == "wav"
+
+    def test_completed_stream_fills_cache(self, engine, tmp_path):
+        """A fully consumed stream is cached and replayed without the provider."""
+        engine._audio_cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+
+        first = b"".join(c.data for c in engine.synthesize_iter("cache me", provider_name="streaming"))
+        second = b"".join(c.data for c in engine.synthesize_iter("cache me", provider_name="streaming"))
+
+        assert first == second == b"cacheme"
+        assert StreamingProvider.streamed == 1
+
+    def test_abandoned_stream_is_not_cached(self, engine, tmp_path):
+        """Partial audio from a closed iterator never reaches the cache."""
+        engine._audio_cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+
+        stream = engine.synthesize_iter("cache me", provider_name="streaming")
+        next(stream)
+        stream.close()
+
+        assert engine.get_cache_stats()["entries"] == 0
+        assert engine.get_pool_stats()["providers"]["streaming"]["in_use"] == 0
+
+
+class TestSynthesizeIterAsync:
+    """Test TTSEngine.synthesize_iter_async."""
+
+    def test_native_async_stream(self, engine):
+        """The async iterator reads iter_audio_async on the loop."""
+
+        async def run():
+            return [c async for c in engine.synthesize_iter_async("one two", provider_name="streaming")]
+
+        chunks = asyncio.run(run())
+
+        assert [c.data for c in chunks] == [b"one", b"two"]
+        assert [c.index for c in chunks] == [0, 1]
+
+    def test_async_stream_is_transcoded(self, engine, passthrough):
+        """The async iterator pipes non-native formats through ffmpeg on the loop."""
+
+        async def run():
+            return [
+                c
+                async for c in engine.synthesize_iter_async("one two", provider_name="streaming", output_format="flac")
+            ]
+
+        chunks = asyncio.run(run())
+
+        assert b"".join(c.data for c in chunks) == b"onetwo"
+        assert chunks[0].format == "flac"
+        assert StreamingProvider.requested == ["mp3"]
+
+    def test_async_multi_part_container_is_converted_from_stream(self, engine, passthrough):
+        """The async iterator also avoids joining separately encoded WAV parts."""
+
+        async def run():
+            text = "one two three four five"
+            return [c async for c in engine.synthesize_iter_async(text, provider_name="container", output_format="wav")]
+
+        chunks = asyncio.run(run())
+
+        assert set(StreamingProvider.requested) == {"mp3"}
+        assert b"".join(c.data for c in chunks) == b"onetwothreefourfive"
+
+    def test_async_fallback_reads_file(self, engine):
+        """Providers without a native stream go through synthesize_text_async."""
+
+        async def run():
+            return [c async for c in engine.synthesize_iter_async("hello", provider_name="file", output_format="mp3")]
+
+        chunks = asyncio.run(run())
+
+        assert b"".join(c.data for c in chunks) == b"hello"
+        assert chunks[0].mime_type == "audio/mpeg"
+
+
+class TestIterBridge:
+    """Test the iterator bridge helpers."""
+
+    def test_iterate_in_thread_runs_next_off_the_loop(self):
+        """Each item of a blocking iterator is produced in a worker thread."""
+        threads = []
+
+        def produce():
+            for i in range(3):
+                threads.append(threading.get_ident())
+                yield i
+
+        async def run():
+            return [item async for item in iterate_in_thread(produce())]
+
+        assert asyncio.run(run()) == [0, 1, 2]
+        assert threading.get_ident() not in threads
+
+    def test_iterate_async_in_thread_closes_early(self):
+        """Closing the blocking side closes the async generator on its loop."""
+        closed = threading.Event()
+
+        async def produce():
+            try:
+                for i in range(10):
+                    yield i
+            finally:
+                closed.set()
+
+        stream = iterate_async_in_thread(produce)
+        assert [next(stream), next(stream)] == [0, 1]
+        stream.close()
+
+        assert closed.is_set()
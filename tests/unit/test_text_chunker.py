@@ -0,0 +1,153 @@
+"""Tests for long-text chunking and reassembly.
+
+These tests cover:
+- Splitting at paragraph, sentence, clause and word boundaries
+- Character and UTF-8 byte limits
+- Gapless WAV concatenation and streaming helpers
+- TTSEngine synthesizing long text in chunks and joining them in order
+"""
+
+import threading
+import wave
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal.audio_utils import concatenate_wav_files, iter_wav_stream
+from matilda_voice.internal.text_chunker import TextSegmenter, split_text
+
+
+def write_wav(path, frames: bytes, rate: int = 8000) -> None:
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(1)
+        out.setframerate(rate)
+        out.writeframes(frames)
+
+
+class WavProvider(TTSProvider):
+    """Provider rendering each character of the text as one 8-bit sample."""
+
+    MAX_TEXT_CHARS = 20
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def synthesize(self, text, output_path, **kwargs):
+        with WavProvider.lock:
+            WavProvider.active += 1
+            WavProvider.peak = max(WavProvider.peak, WavProvider.active)
+        try:
+            assert len(text) <= self.MAX_TEXT_CHARS
+            write_wav(output_path, text.encode("ascii"))
+        finally:
+            with WavProvider.lock:
+                WavProvider.active -= 1
+
+
+class TestSplitText:
+    """Test split_text boundary selection."""
+
+    def test_short_text_is_single_chunk(self):
+        """Text within the limit is returned unchanged."""
+        assert split_text("  Hello there.  ", max_chars=100) == ["Hello there."]
+        assert split_text("anything", max_chars=None, max_bytes=None) == ["anything"]
+        assert split_text("   ") == []
+
+    def test_splits_at_sentence_ends(self):
+        """Whole sentences are packed greedily into chunks."""
+        text = "First one. Second one! Third one? Fourth one."
+        assert split_text(text, max_chars=24) == ["First one. Second one!", "Third one? Fourth one."]
+
+    def test_paragraph_breaks_are_boundaries(self):
+        """Paragraphs that do not fit together become separate chunks."""
+        assert split_text("Intro line\n\nBody line", max_chars=12) == ["Intro line", "Body line"]
+
+    def test_long_sentence_splits_at_clauses_then_words(self):
+        """A sentence over the limit is cut at commas before falling back to words."""
+        assert split_text("alpha beta, gamma delta", max_chars=12) == ["alpha beta,", "gamma delta"]
+        assert split_text("alpha beta gamma delta", max_chars=11) == ["alpha beta", "gamma delta"]
+
+    def test_unbroken_text_is_hard_split(self):
+        """Text without boundaries is still bounded."""
+        assert split_text("abcdefghij", max_chars=4) == ["abcd", "efgh", "ij"]
+
+    def test_byte_limit_counts_utf8(self):
+        """The byte limit accounts for multi-byte characters."""
+        chunks = split_text("héllo wörld ñandú", max_bytes=8)
+        assert all(len(chunk.encode("utf-8")) <= 8 for chunk in chunks)
+        assert " ".join(chunks) == "héllo wörld ñandú"
+
+
+class TestWavJoining:
+    """Test WAV concatenation helpers."""
+
+    def test_concatenate_preserves_samples(self, tmp_path):
+        """Joined audio is the exact sample sequence of the inputs."""
+        write_wav(tmp_path / "a.wav", b"\x01\x02")
+        write_wav(tmp_path / "b.wav", b"\x03")
+        concatenate_wav_files([str(tmp_path / "a.wav"), str(tmp_path / "b.wav")], str(tmp_path / "out.wav"))
+
+        with wave.open(str(tmp_path / "out.wav"), "rb") as joined:
+            assert joined.readframes(10) == b"\x01\x02\x03"
+
+    def test_wav_stream_has_one_header(self, tmp_path):
+        """The streamed form carries a single header followed by all samples."""
+        write_wav(tmp_path / "a.wav", b"\x01\x02")
+        write_wav(tmp_path / "b.wav", b"\x03")
+        data = b"".join(iter_wav_stream([str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]))
+
+        assert data.startswith(b"RIFF")
+        assert data.count(b"RIFF") == 1
+        assert data[44:] == b"\x01\x02\x03"
+
+
+class TestEngineChunking:
+    """Test chunked synthesis through TTSEngine."""
+
+    def test_long_text_is_chunked_and_joined_in_order(self, tmp_path, monkeypatch):
+        """Chunks are synthesized concurrently and reassembled in reading order."""
+        monkeypatch.setenv("TTS_LONG_TEXT_MAX_CONCURRENCY", "3")
+        from matilda_voice.internal.config import reload_config
+
+        reload_config()
+        try:
+            WavProvider.peak = 0
+            engine = TTSEngine({"wav": "unused"})
+            engine._loaded_providers["wav"] = WavProvider
+            engine._audio_cache.enabled = False
+
+            text = "One two three. Four five six. Seven eight nine. Ten eleven twelve."
+            output = str(tmp_path / "long.wav")
+            engine.synthesize_text(text, output, provider_name="wav", stream=False, output_format="wav")
+
+            with wave.open(output, "rb") as joined:
+                samples = joined.readframes(joined.getnframes()).decode("ascii")
+            assert samples == "One two three.Four five six.Seven eight nine.Ten eleven twelve."
+            assert 1 <= WavProvider.peak <= 3
+            engine.close()
+        finally:
+            monkeypatch.delenv("TTS_LONG_TEXT_MAX_CONCURRENCY")
+            reload_config()
+
+
+class TestTextSegmenter:
+    """Test incremental segmentation of streamed text."""
+
+    def test_sentences_are_released_when_complete(self):
+        """A sentence is released once whitespace follows its final punctuation."""
+        segmenter = TextSegmenter()
+
+        assert segmenter.feed("Hello wor") == []
+        assert segmenter.feed("ld. It costs 3.") == ["Hello world."]
+        assert segmenter.feed("5 dollars.") == []
+        assert segmenter.feed(" Bye") == ["It costs 3.5 dollars."]
+        assert segmenter.flush() == ["Bye"]
+        assert segmenter.pending == ""
+
+    def test_long_clauses_and_runs_are_cut(self):
+        """Clause punctuation cuts long sentences; text without any is cut between words."""
+        segmenter = TextSegmenter(min_clause_chars=20, max_chars=30)
+
+        assert segmenter.feed("Short, then a much longer clause, ") == ["Short, then a much longer clause,"]
+        assert segmenter.feed("word " * 7) == ["word word word word word word"]
+        assert segmenter.pending == "word "
@@ -0,0 +1,155 @@
+"""Tests for per-request synthesis timings.
+
+These tests cover:
+- Stage spans recorded by synthesize_text and synthesize_text_async
+- Spans from chunk worker threads reaching the request's record
+- Translating httpcore trace events into network spans
+- Timing helpers doing nothing when no record is active
+"""
+
+import asyncio
+import json
+import wave
+
+import httpx
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.internal.audio_cache import AudioCache
+from matilda_voice.internal.http_clients import _trace_request
+from matilda_voice.internal.timings import SynthesisTimings, collect_timings, current_timings, timing_span
+
+
+class FileProvider(TTSProvider):
+    """Provider that writes the text as the audio."""
+
+    CONCURRENT_SYNTHESIS = True
+    MAX_TEXT_CHARS = 20
+
+    def synthesize(self, text, output_path, **kwargs):
+        if kwargs.get("output_format") == "wav":
+            with wave.open(output_path, "wb") as out:
+                out.setnchannels(1)
+                out.setsampwidth(1)
+                out.setframerate(8000)
+                out.writeframes(text.encode("ascii"))
+        else:
+            with open(output_path, "wb") as f:
+                f.write(text.encode())
+
+
+@pytest.fixture
+def engine(make_engine):
+    return make_engine(file=FileProvider)
+
+
+class TestEngineTimings:
+    """Test the timing record filled by the engine."""
+
+    def test_synthesize_text_records_stages(self, engine, tmp_path):
+        """A saved synthesis reports its pipeline stages and request attributes."""
+        timings = SynthesisTimings(request_id="abc")
+
+        engine.synthesize_text("Hello", str(tmp_path / "out.mp3"), provider_name="file", stream=False, timings=timings)
+
+        record = timings.to_dict()
+        assert {"config_load", "provider_load", "preprocess", "provider_acquire", "synthesize"} <= set(record["stages"])
+        assert record["request_id"] == "abc"
+        assert record["provider"] == "file"
+        assert record["cache_hit"] is False
+        assert record["chunks"] == 1
+        assert record["total_ms"] >= record["stages"]["synthesize"]
+        json.dumps(record)
+
+    def test_cache_hit_skips_synthesis(self, engine, tmp_path):
+        """Requests served from the audio cache are marked and have no synthesize span."""
+        engine._audio_cache = AudioCache(cache_dir=tmp_path / "cache", max_size_mb=1, ttl_seconds=60, enabled=True)
+        engine.synthesize_text("Hello", str(tmp_path / "a.mp3"), provider_name="file", stream=False)
+
+        timings = SynthesisTimings()
+        engine.synthesize_text("Hello", str(tmp_path / "b.mp3"), provider_name="file", stream=False, timings=timings)
+
+        assert timings.fields["cache_hit"] is True
+        assert "cache_lookup" in timings.stages()
+        assert "synthesize" not in timings.stages()
+
+    def test_chunk_workers_report_to_request_record(self, engine, tmp_path):
+        """Spans from the chunk thread pool land in the caller's record."""
+        timings = SynthesisTimings()
+        text = "One two three. Four five six. Seven eight nine."
+
+        engine.synthesize_text(
+            text, str(tmp_path / "out.wav"), provider_name="file", stream=False, output_format="wav", timings=timings
+        )
+
+        assert timings.fields["chunks"] == 3
+        assert [span.name for span in timings.spans].count("synthesize") == 3
+        assert "file_write" in timings.stages()
+
+    def test_async_synthesis_records_stages(self, engine, tmp_path):
+        """The async path fills the record across awaits and worker threads."""
+        timings = SynthesisTimings()
+
+        asyncio.run(
+            engine.synthesize_text_async(
+                "Hello", str(tmp_path / "out.mp3"), provider_name="file", stream=False, timings=timings
+            )
+        )
+
+        assert {"config_load", "provider_acquire", "synthesize"} <= set(timings.stages())
+        assert timings.total is not None
+
+
+class TestHTTPTrace:
+    """Test network spans from httpcore trace events."""
+
+    def test_trace_events_become_spans(self):
+        """Connect, TLS, time to first byte and download are recorded."""
+        timings = SynthesisTimings()
+        trace = timings.http_trace()
+
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "connection.start_tls.started",
+            "connection.start_tls.complete",
+            "http11.send_request_headers.started",
+            "http11.send_request_headers.complete",
+            "http11.receive_response_headers.started",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.started",
+            "http11.receive_response_body.complete",
+        ):
+            trace(event, {})
+
+        assert list(timings.stages()) == ["connect", "tls", "ttfb", "download"]
+
+    def test_request_hook_attaches_trace_only_when_active(self):
+        """Shared clients trace requests only while a record is collecting."""
+        request = httpx.Request("GET", "https://example.test/")
+        _trace_request(request)
+        assert "trace" not in request.extensions
+
+        with collect_timings(SynthesisTimings()):
+            _trace_request(request)
+        assert callable(request.extensions["trace"])
+
+
+class TestTimingHelpers:
+    """Test the context helpers."""
+
+    def test_helpers_are_inert_without_record(self):
+        """timing_span is a no-op and nothing is current outside collect_timings."""
+        with timing_span("anything"):
+            pass
+        assert current_timings() is None
+
+    def test_format_table_lists_stages(self):
+        """The CLI summary shows each stage on its own line."""
+        timings = SynthesisTimings()
+        with collect_timings(timings), timing_span("convert"):
+            pass
+
+        table = timings.format_table()
+        assert table.startswith("Timings (total")
+        assert "convert" in table
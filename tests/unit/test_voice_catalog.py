@@ -0,0 +1,155 @@
+"""Tests for the persistent voice catalog.
+
+These tests cover:
+- Concurrent, time-boxed provider queries
+- Persisting the index and reusing it until the TTL expires
+- Keeping previous entries when a provider fails
+- TTSEngine.validate_voice and get_all_voices reading from the catalog
+"""
+
+import json
+import threading
+import time
+
+from matilda_voice.core import TTSEngine
+from matilda_voice.internal.voice_catalog import VoiceCatalog, get_voice_catalog_path, parse_locale
+from matilda_voice.voice_browser.voice_analyzer import analyze_voice
+
+VOICES = {
+    "edge_tts": ["en-US-JennyNeural", "en-GB-RyanNeural"],
+    "openai_tts": ["nova", "alloy"],
+}
+
+
+class FakeFetcher:
+    """Fetch function returning canned provider info and counting calls."""
+
+    def __init__(self, voices=None, delays=None, failing=()):
+        self.voices = voices or VOICES
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, provider_name):
+        with self.lock:
+            self.calls.append(provider_name)
+        time.sleep(self.delays.get(provider_name, 0))
+        if provider_name in self.failing:
+            raise RuntimeError("provider down")
+        return {"name": provider_name, "all_voices": list(self.voices.get(provider_name, []))}
+
+
+def make_catalog(tmp_path, fetcher, **kwargs):
+    kwargs.setdefault("ttl_seconds", 3600)
+    kwargs.setdefault("provider_timeout", 5)
+    return VoiceCatalog(list(VOICES), fetcher, path=tmp_path / "voices.json", **kwargs)
+
+
+class TestVoiceCatalog:
+    """Test VoiceCatalog."""
+
+    def test_entries_carry_analyzed_metadata(self, tmp_path):
+        """Each voice is indexed with locale, gender, quality and region."""
+        catalog = make_catalog(tmp_path, FakeFetcher())
+
+        entry = catalog.lookup("edge_tts", "en-GB-RyanNeural")
+
+        assert entry.locale == "en-GB"
+        assert (entry.quality, entry.region, entry.gender) == analyze_voice("edge_tts", "en-GB-RyanNeural")
+        assert catalog.has_voice("openai_tts", "nova")
+        assert not catalog.has_voice("openai_tts", "en-GB-RyanNeural")
+        assert catalog.get_all_voices() == VOICES
+
+    def test_providers_are_queried_concurrently(self, tmp_path):
+        """A refresh takes about as long as the slowest provider, not the sum."""
+        fetcher = FakeFetcher(delays={"edge_tts": 0.3, "openai_tts": 0.3})
+        catalog = make_catalog(tmp_path, fetcher)
+
+        start = time.monotonic()
+        catalog.get_all_voices()
+
+        assert time.monotonic() - start < 0.55
+        assert sorted(fetcher.calls) == ["edge_tts", "openai_tts"]
+
+    def test_slow_provider_is_time_boxed(self, tmp_path):
+        """A provider past the timeout is skipped while the others are served."""
+        catalog = make_catalog(tmp_path, FakeFetcher(delays={"edge_tts": 2}), provider_timeout=0.2)
+
+        start = time.monotonic()
+        voices = catalog.get_all_voices()
+
+        assert time.monotonic() - start < 1
+        assert voices == {"edge_tts": [], "openai_tts": VOICES["openai_tts"]}
+
+    def test_index_is_reused_by_other_processes_until_ttl(self, tmp_path):
+        """A new catalog answers from the index file without querying providers."""
+        make_catalog(tmp_path, FakeFetcher()).get_all_voices()
+        data = json.loads((tmp_path / "voices.json").read_text())
+        assert set(data["providers"]) == set(VOICES)
+
+        fetcher = FakeFetcher()
+        assert make_catalog(tmp_path, fetcher).has_voice("edge_tts", "en-US-JennyNeural")
+        assert fetcher.calls == []
+
+        expired = make_catalog(tmp_path, fetcher, ttl_seconds=0)
+        expired.get_all_voices()
+        assert sorted(fetcher.calls) == ["edge_tts", "openai_tts"]
+
+    def test_failed_refresh_keeps_previous_entries(self, tmp_path):
+        """A provider that errors keeps the voices it had in the index."""
+        make_catalog(tmp_path, FakeFetcher()).get_all_voices()
+
+        fetcher = FakeFetcher(failing={"edge_tts"})
+        catalog = make_catalog(tmp_path, fetcher)
+
+        assert catalog.refresh(force=True) == ["openai_tts"]
+        assert catalog.get_voices("edge_tts") == VOICES["edge_tts"]
+
+    def test_failed_provider_is_not_retried_on_every_lookup(self, tmp_path):
+        """Unavailable providers are left alone instead of being queried per lookup."""
+        fetcher = FakeFetcher(failing={"edge_tts"})
+        catalog = make_catalog(tmp_path, fetcher)
+
+        for _ in range(3):
+            catalog.has_voice("openai_tts", "nova")
+
+        assert fetcher.calls.count("edge_tts") == 1
+
+    def test_corrupt_index_is_ignored(self, tmp_path):
+        """An unreadable index file is treated as empty and rewritten."""
+        (tmp_path / "voices.json").write_text("{not json")
+        catalog = make_catalog(tmp_path, FakeFetcher())
+
+        assert catalog.has_voice("openai_tts", "alloy")
+        assert json.loads((tmp_path / "voices.json").read_text())["version"] == 1
+
+    def test_parse_locale(self):
+        """Locales are read from the start of BCP 47 style voice names."""
+        assert parse_locale("en-US-JennyNeural") == "en-US"
+        assert parse_locale("cmn-CN-Wavenet-A") == "cmn-CN"
+        assert parse_locale("nova") == ""
+
+
+class TestEngineVoiceCatalog:
+    """Test TTSEngine voice lookups backed by the catalog."""
+
+    def test_validate_voice_uses_catalog(self, tmp_path):
+        """validate_voice parses provider shortcuts and looks the voice up in the index."""
+        engine = TTSEngine({"edge_tts": "unused", "openai_tts": "unused"})
+        fetcher = FakeFetcher()
+        engine._voice_catalog = make_catalog(tmp_path, fetcher)
+
+        assert engine.validate_voice("edge_tts:en-US-JennyNeural")
+        assert engine.validate_voice("nova", provider_name="openai_tts")
+        assert not engine.validate_voice("edge_tts:missing")
+        assert not engine.validate_voice("missing")
+        assert engine.get_all_voices() == VOICES
+        assert len(fetcher.calls) == 2
+        engine.close()
+
+    def test_default_index_lives_in_xdg_cache(self, tmp_path, monkeypatch):
+        """Without voice_catalog_path the index goes under $XDG_CACHE_HOME/voice."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_voice_catalog_path() == tmp_path / "voice" / "voices.json"